@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Motion-effect benchmark: frames/s per preset of utils/ffmpeg_enhancements.
+
+For every preset (ken_burns, zoom_in, pan_left, ..., typewriter) the table
+reports:
+
+    render     MotionEffect frame production alone (no FFmpeg), frames/s
+    frames     render_effect() with the frame engine, end to end, frames/s
+    zoompan    render_effect() with the original zoompan graph, frames/s
+    speedup    frames / zoompan
+
+The source is a deterministic 1920x1080 card (or --image). The encode
+columns need ffmpeg on PATH and are skipped without it (or with
+--render-only).
+
+Usage:
+    python -m benchmarks.effects_bench                   # 6s clips
+    python -m benchmarks.effects_bench --seconds 30
+    python -m benchmarks.effects_bench --presets ken_burns,pan_left
+    python -m benchmarks.effects_bench --render-only
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from utils.ffmpeg_enhancements import FPS, FRAME_SIZE, PRESETS, MotionEffect, render_effect
+
+
+def _draw_source(path: Path) -> None:
+    """A project-graphic-like fixture with fine detail (shows resampling cost and jitter)."""
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', FRAME_SIZE, (10, 14, 24))
+    draw = ImageDraw.Draw(img)
+    for y in range(0, FRAME_SIZE[1], 6):
+        draw.line([(0, y), (FRAME_SIZE[0], y)], fill=(14, 20 + y // 30, 34 + y // 20))
+    for i in range(40):
+        x = 60 + (i % 8) * 230
+        y = 80 + (i // 8) * 190
+        draw.rectangle([x, y, x + 200, y + 150], outline=(0, 212, 255), width=3)
+        draw.text((x + 16, y + 16), f"card {i:02d}", fill=(255, 255, 255))
+    img.save(path)
+
+
+def _render_fps(image: Path, preset: str, frames: int) -> float:
+    effect = MotionEffect(str(image), preset, frames, seed=1)
+    effect.prepare()
+    slot = bytearray(FRAME_SIZE[0] * FRAME_SIZE[1] * 3)
+    start = time.perf_counter()
+    for n in range(frames):
+        effect(n, slot)
+    return frames / (time.perf_counter() - start)
+
+
+def _encode_fps(image: Path, preset: str, seconds: float, engine: str, out: Path) -> Optional[float]:
+    start = time.perf_counter()
+    try:
+        render_effect(preset, str(image), str(out), seconds, engine=engine, seed=1)
+    except Exception as e:
+        print(f"   ⚠️  {preset} ({engine}) failed: {e}")
+        return None
+    return int(seconds * FPS) / (time.perf_counter() - start)
+
+
+def run(image: Path, workdir: Path, presets: List[str], seconds: float, encode: bool) -> List[Dict]:
+    frames = int(seconds * FPS)
+    rows = []
+    for preset in presets:
+        print(f"   {preset}...")
+        row = {"preset": preset, "render": _render_fps(image, preset, frames)}
+        if encode:
+            row["frames"] = _encode_fps(image, preset, seconds, "frames", workdir / f"{preset}_frames.mp4")
+            row["zoompan"] = _encode_fps(image, preset, seconds, "zoompan", workdir / f"{preset}_zoompan.mp4")
+        rows.append(row)
+    return rows
+
+
+def _fmt(value: Optional[float]) -> str:
+    return f"{value:8.1f}" if value else f"{'-':>8}"
+
+
+def print_table(rows: List[Dict], encode: bool) -> None:
+    header = f"  {'preset':<18} {'render':>8}"
+    if encode:
+        header += f" {'frames':>8} {'zoompan':>8} {'speedup':>8}"
+    print(header + "   (frames/s)")
+    for r in rows:
+        line = f"  {r['preset']:<18} {_fmt(r['render'])}"
+        if encode:
+            speedup = r['frames'] / r['zoompan'] if r.get('frames') and r.get('zoompan') else None
+            line += f" {_fmt(r['frames'])} {_fmt(r['zoompan'])} " + \
+                    (f"{speedup:7.1f}x" if speedup else f"{'-':>8}")
+        print(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Motion-effect frames/s benchmark")
+    parser.add_argument('--seconds', type=float, default=6.0, help='Clip length (default: 6)')
+    parser.add_argument('--presets', default=",".join(PRESETS), help='Comma-separated presets')
+    parser.add_argument('--image', help='Source image (default: a generated 1920x1080 card)')
+    parser.add_argument('--render-only', action='store_true', help='Skip the FFmpeg encode columns')
+    parser.add_argument('--keep', action='store_true', help='Keep the temporary work dir')
+    args = parser.parse_args(argv)
+
+    presets = [p.strip() for p in args.presets.split(",") if p.strip()]
+    unknown = [p for p in presets if p not in PRESETS]
+    if unknown:
+        parser.error(f"unknown presets: {', '.join(unknown)}")
+    encode = not args.render_only and shutil.which('ffmpeg') is not None
+    if not encode and not args.render_only:
+        print("⚠️  ffmpeg not found - reporting frame production only")
+
+    workdir = Path(tempfile.mkdtemp(prefix="effects_bench_"))
+    try:
+        image = Path(args.image) if args.image else workdir / "source.png"
+        if not args.image:
+            _draw_source(image)
+        print(f"🧪 Motion-effect benchmark ({args.seconds:g}s clips, {FPS} fps) in {workdir}")
+        rows = run(image, workdir, presets, args.seconds, encode)
+    finally:
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print("\n📊 Motion effects")
+    print_table(rows, encode)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
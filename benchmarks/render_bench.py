@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Offline render benchmark for the longform/shorts render path.
+
+Builds a synthetic episode from benchmarks/fixtures (posts_data.json and an
+API-key-free config.json), draws deterministic fixture screenshots and short
+cards, and synthesizes silent narration through MockLLMClient - no network,
+no API keys. Then times each renderer at 1, 5 and 15 projects:
+
+    scroll      _render_github_scroll_ffmpeg   (per project)
+    intro       _render_intro_ffmpeg
+    segment     _render_segment_ffmpeg         (title card + scroll + mux)
+    transition  _render_fade_transition
+    shorts      assemble_shorts
+    concat      concatenate_segments           (final longform)
+
+Every run is appended to benchmarks/results/history.json together with the
+git commit and ffmpeg version, and compared against the previous entry with
+the same sizes, so a slower render path shows up on every change.
+
+Usage:
+    python -m benchmarks.render_bench                  # 1, 5, 15 projects
+    python -m benchmarks.render_bench --sizes 1,5      # quicker
+    python -m benchmarks.render_bench --keep           # keep the work dir
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+HISTORY_FILE = Path(__file__).resolve().parent / "results" / "history.json"
+
+DEFAULT_SIZES = (1, 5, 15)
+REGRESSION_THRESHOLD = 0.15  # Flag stages >15% slower than the previous run
+WORDS_PER_SECOND = 2.6       # Narration pace used for the silent audio
+
+sys.path.insert(0, str(REPO_ROOT))
+
+from services.llm_clients import MockLLMClient
+
+
+class SilentAudioClient(MockLLMClient):
+    """
+    MockLLMClient that writes real (silent) MP3s whose length follows the
+    script's word count, so ffprobe/mux steps behave like a real episode.
+    """
+
+    def generate_speech(self, text: str, voice_id: Optional[str] = None,
+                        output_path: Optional[str] = None) -> Optional[bytes]:
+        if not output_path:
+            return super().generate_speech(text, voice_id)
+        duration = max(4.0, len(text.split()) / WORDS_PER_SECOND)
+        subprocess.run([
+            'ffmpeg', '-y', '-f', 'lavfi',
+            '-i', 'anullsrc=channel_layout=mono:sample_rate=32000',
+            '-t', f"{duration:.2f}", '-c:a', 'libmp3lame', '-b:a', '64k',
+            output_path,
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        with open(output_path, 'rb') as f:
+            return f.read()
+
+
+# ---------------------------------------------------------------------- #
+# Fixtures
+# ---------------------------------------------------------------------- #
+def _draw_screenshot(path: Path, seed: int, width: int = 1280, height: int = 4200) -> None:
+    """A deterministic GitHub-page-like image: header, text lines and code blocks."""
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    img = Image.new('RGB', (width, height), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, width, 64], fill=(36, 41, 47))
+    y = 120
+    while y < height - 80:
+        if rng.random() < 0.2:
+            block_h = rng.randint(120, 320)
+            draw.rectangle([80, y, width - 80, y + block_h], fill=(246, 248, 250), outline=(208, 215, 222))
+            for line_y in range(y + 16, y + block_h - 16, 22):
+                draw.rectangle([100, line_y, 100 + rng.randint(200, width - 260), line_y + 10],
+                               fill=(rng.randint(80, 200), rng.randint(80, 160), rng.randint(120, 220)))
+            y += block_h + 40
+        else:
+            draw.rectangle([80, y, 80 + rng.randint(300, width - 200), y + 12], fill=(87, 96, 106))
+            y += 30
+    img.save(path)
+
+
+def _draw_short_card(path: Path, name: str) -> None:
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', (1080, 1920), (8, 12, 20))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([80, 760, 1000, 1160], outline=(0, 212, 255), width=6)
+    draw.text((120, 940), name, fill=(255, 255, 255))
+    img.save(path)
+
+
+def build_episode(projects: List[Dict], assets: Path, shorts_dir: Path) -> None:
+    """Create screenshots, short cards and silent narration for every fixture project."""
+    audio = SilentAudioClient()
+    for i, project in enumerate(projects):
+        pid = project['id']
+        project['screenshot_path'] = str(assets / f"{pid}_github.png")
+        project['audio_path'] = str(assets / f"{pid}_audio.mp3")
+        project['short_img_path'] = str(shorts_dir / f"{pid}_short.png")
+        _draw_screenshot(Path(project['screenshot_path']), seed=i)
+        _draw_short_card(Path(project['short_img_path']), project['name'])
+        audio.generate_speech(project['script_text'], output_path=project['audio_path'])
+
+
+# ---------------------------------------------------------------------- #
+# Benchmark
+# ---------------------------------------------------------------------- #
+class StageClock:
+    """Accumulates wall time per stage."""
+
+    def __init__(self):
+        self.times: Dict[str, float] = {}
+
+    def time(self, stage: str):
+        clock = self
+
+        class _Timer:
+            def __enter__(self):
+                self.start = time.perf_counter()
+
+            def __exit__(self, *exc):
+                clock.times[stage] = clock.times.get(stage, 0.0) + time.perf_counter() - self.start
+                return False
+
+        return _Timer()
+
+
+def _clear_renders(assets: Path) -> None:
+    """Remove cached segments so every size renders from scratch."""
+    for pattern in ("seg_*.mp4", "tmp_*", "bench_*.mp4", "trans_fade.mp4"):
+        for path in assets.glob(pattern):
+            path.unlink()
+
+
+def run_size(va, projects: List[Dict], n: int) -> Dict[str, float]:
+    """Render an n-project episode and return seconds per stage."""
+    suite = va.VideoSuiteAutomated.__new__(va.VideoSuiteAutomated)  # renderers need no API clients
+    suite.projects = [dict(p) for p in projects[:n]]
+    suite.shorts_selection = suite.projects
+    suite.deep_dive_selection = []
+    suite.video_settings = {}
+
+    assets = Path(va.OUTPUT_FOLDER)
+    _clear_renders(assets)
+    clock = StageClock()
+    random.seed(0)
+
+    with clock.time("scroll"):
+        for project in suite.projects:
+            _, scroll_dur = suite._segment_durations(project['audio_path'])
+            suite._render_github_scroll_ffmpeg(project['screenshot_path'],
+                                               assets / f"bench_scroll_{project['id']}.mp4",
+                                               duration=scroll_dur)
+
+    intro_audio = assets / "bench_intro_audio.mp3"
+    SilentAudioClient().generate_speech(
+        "Welcome back to the channel. " * 4, output_path=str(intro_audio))
+    intro = assets / "seg_intro.mp4"
+    with clock.time("intro"):
+        suite._render_intro_ffmpeg("Benchmark Episode: Fifteen Projects", str(intro_audio), intro)
+
+    segments = []
+    with clock.time("segment"):
+        for i, project in enumerate(suite.projects):
+            segments.append(str(suite._render_segment_ffmpeg(project, i, project['audio_path'])))
+
+    transition = assets / "trans_fade.mp4"
+    with clock.time("transition"):
+        suite._render_fade_transition(transition, 1.0)
+
+    with clock.time("shorts"):
+        suite.assemble_shorts()
+
+    segment_files = [str(intro)]
+    for i, seg in enumerate(segments):
+        segment_files.append(seg)
+        if i < len(segments) - 1:
+            segment_files.append(str(transition))
+    with clock.time("concat"):
+        suite.concatenate_segments(segment_files, str(assets / f"bench_longform_{n}.mp4"))
+
+    clock.times["total"] = sum(clock.times.values())
+    return {stage: round(seconds, 3) for stage, seconds in clock.times.items()}
+
+
+# ---------------------------------------------------------------------- #
+# History
+# ---------------------------------------------------------------------- #
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _ffmpeg_version() -> str:
+    try:
+        out = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, check=True).stdout
+        return out.splitlines()[0]
+    except Exception:
+        return "unknown"
+
+
+def load_history(path: Path = HISTORY_FILE) -> List[Dict]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def save_history(entry: Dict, path: Path = HISTORY_FILE) -> None:
+    history = load_history(path) + [entry]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, 'w') as f:
+        json.dump(history, f, indent=2)
+    os.replace(tmp, path)
+
+
+def compare(entry: Dict, previous: Optional[Dict], threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """Print the results table with deltas; return the regressed (size, stage) labels."""
+    regressions = []
+    for size, stages in entry["results"].items():
+        before = (previous or {}).get("results", {}).get(size, {})
+        print(f"\n  {size} project(s)")
+        for stage, seconds in stages.items():
+            delta = ""
+            if stage in before and before[stage] > 0:
+                change = (seconds - before[stage]) / before[stage]
+                delta = f"  {change:+.0%} vs {previous['commit']}"
+                if change > threshold and seconds - before[stage] > 0.5:
+                    delta += "  ⚠️ regression"
+                    regressions.append(f"{size}:{stage}")
+            print(f"    {stage:<11} {seconds:8.2f}s{delta}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline render benchmark")
+    parser.add_argument('--sizes', default=",".join(map(str, DEFAULT_SIZES)),
+                        help='Comma-separated project counts (default: 1,5,15)')
+    parser.add_argument('--history', default=str(HISTORY_FILE), help='History JSON file')
+    parser.add_argument('--no-save', action='store_true', help="Don't append to the history")
+    parser.add_argument('--keep', action='store_true', help='Keep the temporary work dir')
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    with open(FIXTURES / "posts_data.json", 'r') as f:
+        projects = json.load(f)
+    if max(sizes) > len(projects):
+        parser.error(f"fixtures only have {len(projects)} projects")
+
+    history_path = Path(args.history).resolve()
+    workdir = Path(tempfile.mkdtemp(prefix="render_bench_"))
+    shutil.copy(FIXTURES / "config.json", workdir / "config.json")
+    # video_automated reads config.json and creates its folders relative to the cwd
+    os.environ["DELIVERY_DATE"] = "bench"
+    os.environ["LLM_CACHE_DISABLE"] = "1"
+    cwd = os.getcwd()
+    os.chdir(workdir)
+
+    try:
+        from components.video import video_automated as va
+
+        print(f"🧪 Render benchmark in {workdir}")
+        start = time.perf_counter()
+        build_episode(projects, Path(va.OUTPUT_FOLDER).resolve(), Path(va.SHORTS_FOLDER).resolve())
+        print(f"   Fixtures ready in {time.perf_counter() - start:.1f}s")
+
+        results = {}
+        for n in sizes:
+            print(f"\n⏱️  Rendering {n}-project episode...")
+            results[str(n)] = run_size(va, projects, n)
+    finally:
+        os.chdir(cwd)
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    entry = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "host": platform.node(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "ffmpeg": _ffmpeg_version(),
+        "results": results,
+    }
+    previous = next((e for e in reversed(load_history(history_path))
+                     if set(e.get("results", {})) == set(results)), None)
+
+    print("\n📊 Render benchmark")
+    regressions = compare(entry, previous)
+    if not args.no_save:
+        save_history(entry, history_path)
+        print(f"\n💾 Appended to {history_path}")
+    if regressions:
+        print(f"\n⚠️  {len(regressions)} stage(s) regressed: {', '.join(regressions)}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
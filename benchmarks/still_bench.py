@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Still-segment encoder benchmark: GOP-repeat fast path vs -loop 1.
+
+Encodes a fixture card with each still-segment profile the pipeline uses,
+once through services/still_segment.encode_still's fast path and once
+through the classic `-loop 1 ... -tune stillimage` command, and prints
+wall time, speedup and the frame count of both outputs (they must agree
+to within a frame):
+
+    profile            what uses it
+    title              4s title clip (30 fps, fast/CRF 18, scale+pad)
+    outro              5s branding card with silence (24 fps, stillimage)
+    static-segment     narrated static project segment (24 fps, stillimage)
+    extend             title card extended when there is no screenshot
+
+Usage:
+    python -m benchmarks.still_bench                 # 45s narrated segment
+    python -m benchmarks.still_bench --seconds 90
+    python -m benchmarks.still_bench --repeat 3      # best of 3
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from services.still_segment import STILL_ARGS, encode_still
+
+TITLE_ARGS = ('-c:v', 'libx264', '-preset', 'fast', '-crf', '18')
+TITLE_VF = ('scale=1920:1080:force_original_aspect_ratio=decrease,'
+            'pad=1920:1080:(ow-iw)/2:(oh-ih)/2,format=yuv420p')
+
+
+def _draw_card(path: Path) -> None:
+    """A title-card-like fixture: gradient, panels and text blocks."""
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', (1920, 1080), (8, 12, 20))
+    draw = ImageDraw.Draw(img)
+    for y in range(1080):
+        draw.line([(0, y), (1920, y)], fill=(8, 12 + y // 40, 20 + y // 18))
+    draw.rectangle([120, 200, 1800, 880], outline=(0, 212, 255), width=6)
+    for i in range(12):
+        draw.rectangle([180, 260 + i * 48, 180 + 90 * (i + 3), 284 + i * 48], fill=(200, 210, 230))
+    img.save(path)
+
+
+def _silent_audio(path: Path, seconds: float) -> None:
+    subprocess.run([
+        'ffmpeg', '-y', '-f', 'lavfi', '-i', 'anullsrc=channel_layout=mono:sample_rate=32000',
+        '-t', f"{seconds:.2f}", '-c:a', 'libmp3lame', '-b:a', '64k', str(path),
+    ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+
+def _frame_count(path: Path) -> int:
+    out = subprocess.run([
+        'ffprobe', '-v', 'error', '-select_streams', 'v:0', '-count_packets',
+        '-show_entries', 'stream=nb_read_packets', '-of', 'csv=p=0', str(path),
+    ], capture_output=True, text=True).stdout.strip()
+    return int(out) if out.isdigit() else -1
+
+
+def profiles(card: Path, audio: Path, seconds: float) -> Dict[str, Dict]:
+    return {
+        "title": dict(duration=4, fps=30, video_args=TITLE_ARGS, vf=TITLE_VF),
+        "outro": dict(duration=5, fps=24, video_args=STILL_ARGS, silence_rate=48000),
+        "static-segment": dict(duration=seconds, fps=24, video_args=STILL_ARGS, audio_path=str(audio),
+                               audio_args=('-c:a', 'aac', '-b:a', '192k')),
+        "extend": dict(duration=seconds - 4, fps=30, video_args=TITLE_ARGS,
+                       vf='scale=1920:1080,format=yuv420p'),
+    }
+
+
+def run(workdir: Path, seconds: float, repeat: int) -> List[Dict]:
+    card = workdir / "card.png"
+    audio = workdir / "narration.mp3"
+    _draw_card(card)
+    _silent_audio(audio, seconds)
+
+    rows = []
+    for name, kwargs in profiles(card, audio, seconds).items():
+        row = {"profile": name, "seconds": kwargs["duration"]}
+        for label, fast in (("loop", False), ("fast", True)):
+            out = workdir / f"{name}_{label}.mp4"
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                encode_still(card, out, fast=fast, **kwargs)
+                best = min(best, time.perf_counter() - start)
+            row[label] = best
+            row[f"{label}_frames"] = _frame_count(out)
+        row["speedup"] = row["loop"] / row["fast"] if row["fast"] else 0.0
+        rows.append(row)
+    return rows
+
+
+def _mismatch(row: Dict) -> bool:
+    return abs(row['fast_frames'] - row['loop_frames']) > 1
+
+
+def print_table(rows: List[Dict]) -> None:
+    print(f"\n  {'profile':<16} {'length':>7} {'-loop 1':>9} {'fast':>9} {'speedup':>8}  frames")
+    for r in rows:
+        frames = f"{r['fast_frames']}" if not _mismatch(r) \
+            else f"{r['fast_frames']} vs {r['loop_frames']} ⚠️"
+        print(f"  {r['profile']:<16} {r['seconds']:>6.0f}s {r['loop']:>8.2f}s {r['fast']:>8.2f}s "
+              f"{r['speedup']:>7.1f}x  {frames}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Still-segment encoder benchmark")
+    parser.add_argument('--seconds', type=float, default=45.0,
+                        help='Narrated segment length (default: 45)')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per encode, best kept')
+    parser.add_argument('--keep', action='store_true', help='Keep the temporary work dir')
+    args = parser.parse_args(argv)
+
+    workdir = Path(tempfile.mkdtemp(prefix="still_bench_"))
+    try:
+        print(f"🧪 Still-segment benchmark in {workdir}")
+        rows = run(workdir, args.seconds, max(1, args.repeat))
+    finally:
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print("\n📊 Still-segment encode")
+    print_table(rows)
+    mismatched = [r['profile'] for r in rows if _mismatch(r)]
+    if mismatched:
+        print(f"\n⚠️  Frame count differs for: {', '.join(mismatched)}")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Process-pool batch rendering for Pillow cards.
+
+Pillow drawing is CPU-bound and holds the GIL for most of a card. Cards
+rendered from executor threads all share one core: horizontal and vertical
+project graphics, title cards, and the social templates rendered in a loop.
+CardRenderer hands each card to a worker process instead:
+
+    renderer = get_card_renderer()
+    results = renderer.render([CardJob(create_project_graphic, (name, url, path), label=name), ...])
+    print(card_summary(results))
+
+    path = await renderer.render_async(create_shorts_graphic, name, url, path)
+    path = renderer.call(render_title_card_image, project, OUTPUT_FOLDER)
+
+Card functions must be module-level (pickled by reference) and return the
+output path. Workers start from a forkserver (spawn where unavailable), not
+a fork of the threaded pipeline; each runs the renderer's preload hooks once
+(e.g. codestream_graphics.preload_fonts), so no card pays for font discovery.
+Every result carries the card's render time inside the worker.
+
+Worker count: env CARD_WORKERS, else pipeline.card_workers in config.json,
+else the CPU count (at most 4). 0 renders in the calling process, as does
+profiling (PROFILE_STAGES=1 / --profile) so the cards show up in the
+per-stage flamegraphs.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from core.profiling import profiling_enabled
+from core.settings import setting
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class CardJob:
+    """One card: fn(*args, **kwargs) -> output path."""
+    fn: Callable
+    args: tuple = ()
+    kwargs: Dict = field(default_factory=dict)
+    label: str = ""
+
+
+@dataclass
+class CardResult:
+    label: str
+    path: Optional[str] = None
+    seconds: float = 0.0             # Render time inside the worker
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def card_workers(config_path: str = "config.json") -> int:
+    """Worker processes for card rendering (0 = render in-process)."""
+    if profiling_enabled():
+        # The stage profiler only samples this process
+        return 0
+    env = os.environ.get('CARD_WORKERS', '').strip()
+    if env.isdigit():
+        return int(env)
+    default = min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    try:
+        return max(0, int(setting('pipeline', 'card_workers', default, config_path)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _init_worker(preload: Sequence[Callable]) -> None:
+    for hook in preload:
+        try:
+            hook()
+        except Exception as e:
+            print(f"⚠️  Card worker preload {getattr(hook, '__name__', hook)} failed: {e}")
+
+
+def _run_card(fn: Callable, args: tuple, kwargs: Dict):
+    """Worker: (path, seconds, error). Errors travel as text so any exception survives pickling."""
+    start = time.perf_counter()
+    try:
+        path = fn(*args, **kwargs)
+        return (str(path) if path is not None else None), time.perf_counter() - start, None
+    except Exception as e:
+        detail = traceback.format_exc(limit=3)
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}\n{detail}"
+
+
+class CardRenderer:
+    """
+    Args:
+        workers: Worker processes (default: card_workers()); 0 renders in-process
+        preload: Callables run once in each worker before its first card
+    """
+
+    def __init__(self, workers: Optional[int] = None, preload: Iterable[Callable] = ()):
+        self.workers = card_workers() if workers is None else max(0, workers)
+        self.preload = tuple(preload)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._preloaded = False
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers == 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                # Fresh interpreters: the initializer's preload hooks load the
+                # card modules and fonts in each worker, so nothing is gained
+                # by forking the threaded pipeline process
+                methods = multiprocessing.get_all_start_methods()
+                ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx,
+                                                 initializer=_init_worker, initargs=(self.preload,))
+            return self._pool
+
+    def _run_local(self, job: CardJob) -> CardResult:
+        with self._lock:
+            if not self._preloaded:
+                _init_worker(self.preload)
+                self._preloaded = True
+        path, seconds, error = _run_card(job.fn, job.args, job.kwargs)
+        return CardResult(job.label, path, seconds, error)
+
+    def _fallback(self, job: CardJob, result: Future) -> None:
+        """Drop a broken pool and render the card in this process."""
+        self.shutdown()
+        result.set_result(self._run_local(job))
+
+    def submit(self, job: CardJob) -> "Future[CardResult]":
+        """Queue one card; the future resolves to its CardResult."""
+        result: Future = Future()
+        pool = self._get_pool()
+        if pool is None:
+            result.set_result(self._run_local(job))
+            return result
+
+        def done(f: Future) -> None:
+            try:
+                path, seconds, error = f.result()
+                result.set_result(CardResult(job.label, path, seconds, error))
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM): render this card here, but not on the
+                # executor's management thread that runs this callback
+                threading.Thread(target=self._fallback, args=(job, result),
+                                 name=f"card-fallback-{job.label}", daemon=True).start()
+            except Exception as e:
+                result.set_result(CardResult(job.label, error=f"{type(e).__name__}: {e}"))
+
+        try:
+            pool.submit(_run_card, job.fn, job.args, job.kwargs).add_done_callback(done)
+        except (BrokenProcessPool, RuntimeError):
+            # Pool already broken or shut down
+            self._fallback(job, result)
+        return result
+
+    def render(self, jobs: Iterable[CardJob]) -> List[CardResult]:
+        """Render a batch in parallel; results are in job order."""
+        futures = [self.submit(job) for job in jobs]
+        return [f.result() for f in futures]
+
+    def call(self, fn: Callable, *args, label: str = "", **kwargs) -> str:
+        """Render one card and wait for it; raises RuntimeError if it failed."""
+        return self._unwrap(self.submit(CardJob(fn, args, kwargs, label or fn.__name__)).result())
+
+    async def render_async(self, fn: Callable, *args, label: str = "", **kwargs) -> str:
+        """call() for coroutines: awaits the worker without tying up a thread."""
+        job = CardJob(fn, args, kwargs, label or fn.__name__)
+        if self.workers == 0:
+            # In-process: keep the event loop free
+            result = await asyncio.get_running_loop().run_in_executor(None, self._run_local, job)
+        else:
+            result = await asyncio.wrap_future(self.submit(job))
+        return self._unwrap(result)
+
+    @staticmethod
+    def _unwrap(result: CardResult) -> str:
+        if not result.ok:
+            raise RuntimeError(f"Card {result.label} failed: {result.error}")
+        return result.path
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def card_summary(results: Sequence[CardResult]) -> str:
+    """One line per card plus the total, for batch logs."""
+    lines = [f"🎨 {len(results)} cards, {sum(r.seconds for r in results):.2f}s render time"]
+    for r in results:
+        status = f"{r.seconds:6.2f}s  {r.path}" if r.ok else f"failed: {r.error.splitlines()[0]}"
+        lines.append(f"   {r.label:<28} {status}")
+    return "\n".join(lines)
+
+
+_RENDERER: Optional[CardRenderer] = None
+_RENDERER_LOCK = threading.Lock()
+
+
+def get_card_renderer() -> CardRenderer:
+    """Process-wide renderer for the project, shorts and title cards."""
+    global _RENDERER
+    with _RENDERER_LOCK:
+        if _RENDERER is None:
+            from components.graphics import codestream_graphics, title_card
+            _RENDERER = CardRenderer(preload=(codestream_graphics.preload_fonts,
+                                              title_card.preload_fonts))
+        return _RENDERER
@@ -1,24 +1,113 @@
 """
 Branding and Graphics Generator for OpenSourceScribes Videos
 Creates intro/outro cards and handles text overlays
+
+Cards are cached by content: the key hashes the branding config, the title,
+the card size, the resolved font and BRANDING_TEMPLATE_VERSION, so only a
+new episode title (or a branding change) renders anything. The static
+segments encoded from the outro and subscribe cards are cached alongside
+them (cached_segment()), keyed on the card, audio and duration.
+
+Cached files are copied to the caller's output path: the video assemblers
+delete their segments after concatenation, and the cache must survive that.
+Bump BRANDING_TEMPLATE_VERSION when a card's layout changes.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import os
+import shutil
+from pathlib import Path
 
-def create_intro_card(config, episode_title=None, output_path="assets/intro_card.png"):
-    """Create branded intro card"""
-    # Create 1920x1080 image
-    img = Image.new('RGB', (1920, 1080), color='#1a1a2e')
+from components.graphics.fonts import font_path, get_font
+from core.metrics import record_cache_hit
+from core.task_cache import RENDERER_VERSION, compute_key, file_digest
+
+BRANDING_TEMPLATE_VERSION = "2026.10.1"
+CARD_SIZE = (1920, 1080)
+CACHE_DIR = Path("assets/cache/branding")
+MAX_CACHE_ENTRIES = 64
+
+
+def _store(src, cached: Path) -> None:
+    """Copy src into the cache atomically (a reader never sees a partial file)."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_name(cached.name + ".tmp")
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, cached)
+    entries = sorted(CACHE_DIR.glob("*-*.*"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[MAX_CACHE_ENTRIES:]:
+        stale.unlink(missing_ok=True)
+
+
+def _place(cached: Path, output_path) -> str:
+    """Copy a cache entry to output_path, marking it recently used."""
+    os.utime(cached)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(cached, output_path)
+    return str(output_path)
+
+
+def card_key(kind, config, title=None, size=CARD_SIZE):
+    """Content key for one card: everything that changes its pixels."""
+    return compute_key(f"{kind}-card", {
+        "branding": config.get('branding', {}),
+        "title": title,
+        "size": list(size),
+        "font": font_path('sans'),
+        "template": BRANDING_TEMPLATE_VERSION,
+    })
+
+
+def _cached_card(kind, config, title, output_path, draw):
+    cached = CACHE_DIR / f"{card_key(kind, config, title)}.png"
+    if cached.exists():
+        record_cache_hit()
+        print(f"♻️  Cached {kind} card: {output_path}")
+        return _place(cached, output_path)
+
+    img = draw()
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    img.save(output_path)
+    _store(output_path, cached)
+    print(f"✅ Created {kind} card: {output_path}")
+    return output_path
+
+
+def cached_segment(kind, card_path, output_path, encode, duration=None, audio_path=None, profile=""):
+    """
+    Static branding segment (outro, subscribe) from the encode cache.
+
+    encode() renders the segment to output_path on a miss and returns its
+    path. The key covers the card and audio contents, the duration, and
+    `profile`, which names the caller's encode settings, so call sites with
+    different frame rates or sample rates never share an entry.
+    """
+    cached = CACHE_DIR / (compute_key(f"{kind}-segment", {
+        "card": file_digest(str(card_path)),
+        "audio": file_digest(str(audio_path)) if audio_path else None,
+        "duration": duration,
+        "profile": profile,
+        "renderer": RENDERER_VERSION,
+    }) + ".mp4")
+    if cached.exists():
+        record_cache_hit()
+        print(f"♻️  Cached {kind} segment: {output_path}")
+        return _place(cached, output_path)
+
+    result = encode()
+    if result and os.path.exists(result):
+        _store(result, cached)
+    return result
+
+
+def _draw_intro_card(config, episode_title=None):
+    """Branded intro card: channel name plus optional episode title"""
+    img = Image.new('RGB', CARD_SIZE, color='#1a1a2e')
     draw = ImageDraw.Draw(img)
     
-    # Try to use a nice font, fallback to default
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 120)
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
+    # Shared font registry (Helvetica on macOS, DejaVu/Liberation on Linux)
+    title_font = get_font('sans', 120)
+    subtitle_font = get_font('sans', 60)
     
     # Draw channel name
     channel_name = config['branding']['channel_name']
@@ -27,7 +116,7 @@ def create_intro_card(config, episode_title=None, output_path="assets/intro_card
     bbox = draw.textbbox((0, 0), channel_name, font=title_font)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
-    x = (1920 - text_width) // 2
+    x = (CARD_SIZE[0] - text_width) // 2
     y = 400
     
     # Draw text with shadow for depth
@@ -38,37 +127,27 @@ def create_intro_card(config, episode_title=None, output_path="assets/intro_card
     if episode_title:
         bbox = draw.textbbox((0, 0), episode_title, font=subtitle_font)
         text_width = bbox[2] - bbox[0]
-        x = (1920 - text_width) // 2
+        x = (CARD_SIZE[0] - text_width) // 2
         y = 600
         draw.text((x, y), episode_title, font=subtitle_font, fill='#ffffff')
     
-    # Save
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    img.save(output_path)
-    print(f"✅ Created intro card: {output_path}")
-    return output_path
+    return img
 
-def create_outro_card(config, output_path="assets/outro_card.png"):
-    """Create branded outro card with subscribe prompt"""
-    # Create 1920x1080 image
-    img = Image.new('RGB', (1920, 1080), color='#1a1a2e')
+def _draw_outro_card(config):
+    """Branded outro card with subscribe prompt"""
+    img = Image.new('RGB', CARD_SIZE, color='#1a1a2e')
     draw = ImageDraw.Draw(img)
     
-    # Try to use a nice font
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 100)
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 50)
-        small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40)
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    # Shared font registry (Helvetica on macOS, DejaVu/Liberation on Linux)
+    title_font = get_font('sans', 100)
+    subtitle_font = get_font('sans', 50)
+    small_font = get_font('sans', 40)
     
     # Main message
     message = "Thanks for Watching!"
     bbox = draw.textbbox((0, 0), message, font=title_font)
     text_width = bbox[2] - bbox[0]
-    x = (1920 - text_width) // 2
+    x = (CARD_SIZE[0] - text_width) // 2
     y = 300
     draw.text((x, y), message, font=title_font, fill='#16c79a')
     
@@ -76,7 +155,7 @@ def create_outro_card(config, output_path="assets/outro_card.png"):
     subscribe = "Subscribe to OpenSourceScribes"
     bbox = draw.textbbox((0, 0), subscribe, font=subtitle_font)
     text_width = bbox[2] - bbox[0]
-    x = (1920 - text_width) // 2
+    x = (CARD_SIZE[0] - text_width) // 2
     y = 500
     draw.text((x, y), subscribe, font=subtitle_font, fill='#ffffff')
     
@@ -90,35 +169,26 @@ def create_outro_card(config, output_path="assets/outro_card.png"):
     for social in socials:
         bbox = draw.textbbox((0, 0), social, font=small_font)
         text_width = bbox[2] - bbox[0]
-        x = (1920 - text_width) // 2
+        x = (CARD_SIZE[0] - text_width) // 2
         draw.text((x, social_y), social, font=small_font, fill='#cccccc')
         social_y += 60
     
-    # Save
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    img.save(output_path)
-    print(f"✅ Created outro card: {output_path}")
-    return output_path
+    return img
 
-def create_subscribe_card(config, output_path="assets/subscribe_card.png"):
-    """Create a dedicated Subscribe call-to-action card"""
-    # Create 1920x1080 image
-    img = Image.new('RGB', (1920, 1080), color='#1a1a2e')
+def _draw_subscribe_card(config):
+    """Dedicated Subscribe call-to-action card"""
+    img = Image.new('RGB', CARD_SIZE, color='#1a1a2e')
     draw = ImageDraw.Draw(img)
     
-    # Try to use a nice font
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 110)
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
+    # Shared font registry (Helvetica on macOS, DejaVu/Liberation on Linux)
+    title_font = get_font('sans', 110)
+    subtitle_font = get_font('sans', 60)
     
     # Draw simple, bold message
     message = "Enjoying these tools?"
     bbox = draw.textbbox((0, 0), message, font=subtitle_font)
     text_width = bbox[2] - bbox[0]
-    x = (1920 - text_width) // 2
+    x = (CARD_SIZE[0] - text_width) // 2
     y = 350
     draw.text((x, y), message, font=subtitle_font, fill='#cccccc')
     
@@ -126,7 +196,7 @@ def create_subscribe_card(config, output_path="assets/subscribe_card.png"):
     bbox = draw.textbbox((0, 0), cta, font=title_font)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
-    x = (1920 - text_width) // 2
+    x = (CARD_SIZE[0] - text_width) // 2
     y = 500
     
     # Draw simple button background
@@ -140,15 +210,24 @@ def create_subscribe_card(config, output_path="assets/subscribe_card.png"):
     sub = "for more Open Source discoveries"
     bbox = draw.textbbox((0, 0), sub, font=subtitle_font)
     text_width = bbox[2] - bbox[0]
-    x = (1920 - text_width) // 2
+    x = (CARD_SIZE[0] - text_width) // 2
     y = 700
     draw.text((x, y), sub, font=subtitle_font, fill='#cccccc')
     
-    # Save
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    img.save(output_path)
-    print(f"✅ Created subscribe card: {output_path}")
-    return output_path
+    return img
+
+def create_intro_card(config, episode_title=None, output_path="assets/intro_card.png"):
+    """Create branded intro card"""
+    return _cached_card('intro', config, episode_title, output_path,
+                        lambda: _draw_intro_card(config, episode_title))
+
+def create_outro_card(config, output_path="assets/outro_card.png"):
+    """Create branded outro card with subscribe prompt"""
+    return _cached_card('outro', config, None, output_path, lambda: _draw_outro_card(config))
+
+def create_subscribe_card(config, output_path="assets/subscribe_card.png"):
+    """Create a dedicated Subscribe call-to-action card"""
+    return _cached_card('subscribe', config, None, output_path, lambda: _draw_subscribe_card(config))
 
 if __name__ == "__main__":
     # Test the card generation
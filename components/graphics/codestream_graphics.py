@@ -2,16 +2,32 @@
 Code Stream Branded Graphics Generator
 Implements full brand identity with glow effects, grid patterns, and data flow aesthetic
 Designed for use with Google Antigravity for real-time development and iteration
+
+Cards are layered: the gradient, grid, data-flow and glow layers depend only
+on the card size and a variant seed, so they are rendered once per process
+into a pool (BACKGROUND_VARIANTS per size) and each card copies one and draws
+its text on top. A project always maps to the same variant. Fonts come from
+the shared registry (components/graphics/fonts.py) and the stats cache is
+loaded once per process, so instances are cheap.
 """
 
 import os
 import json
 import requests
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from pathlib import Path
 from datetime import datetime, timedelta
 import re
 import random
+import threading
+import zlib
+
+from components.graphics.fonts import get_font, preload, premeasure, wrap_words
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Code Stream Brand Colors
 COLORS = {
@@ -24,21 +40,84 @@ COLORS = {
     'soft_gray': (204, 204, 204),        # #CCCCCC - Secondary text
 }
 
+# (family, size) per text style, from components/graphics/fonts.py
+CARD_FONTS = {
+    'title': ('sans-bold', 140),
+    'label': ('sans-bold', 50),
+    'stats': ('sans-bold', 45),
+    'description': ('sans-bold', 32),
+    'tag': ('sans-bold', 28),
+}
+SHORTS_FONTS = {
+    'title': ('sans-bold', 80),
+    'description': ('sans', 48),
+    'stats': ('sans', 42),
+}
+FIXED_LABELS = {'label': ["Tool:", "Stars", "Forks", "Language"]}
+
 STATS_CACHE_FILE = "github_stats_cache.json"
 CACHE_EXPIRY_HOURS = 24
 
+# Pre-rendered backgrounds kept per card size
+BACKGROUND_VARIANTS = 6
+ALL_LAYERS = ('grid', 'flow', 'glow')
+# zlib level for card PNGs: they are decoded once by FFmpeg, so favour
+# encode speed (level 6 spends most of a card's time in deflate)
+PNG_COMPRESS_LEVEL = 1
+
+_BACKGROUNDS = {}            # (width, height, variant, layers) -> RGB image
+_SHARED = {}                 # stats cache, loaded once per process
+_LOCK = threading.RLock()
+
+
+def vertical_gradient(height, top, bottom, intensity, reverse=False):
+    """
+    1px-wide column blending `top` towards `bottom` by `intensity`, one
+    colour per row (truncated like int()).
+    """
+    if np is not None:
+        ratio = np.arange(height, dtype=np.float64) / height
+        if reverse:
+            ratio = 1 - ratio
+        start = np.array(top, dtype=np.float64)
+        delta = np.array(bottom, dtype=np.float64) - start
+        rows = (start + delta * (ratio * intensity)[:, None]).astype(np.uint8)
+        return Image.fromarray(rows[:, None, :], 'RGB')
+
+    column = Image.new('RGB', (1, height))
+    pixels = []
+    for y in range(height):
+        ratio = 1 - (y / height) if reverse else y / height
+        pixels.append(tuple(int(a + (b - a) * ratio * intensity) for a, b in zip(top, bottom)))
+    column.putdata(pixels)
+    return column
+
+
+def variant_for(name):
+    """Stable background variant for a project name."""
+    return zlib.crc32(name.lower().encode('utf-8')) % BACKGROUND_VARIANTS
+
+
+def _shared(key, loader):
+    with _LOCK:
+        if key not in _SHARED:
+            _SHARED[key] = loader()
+        return _SHARED[key]
+
+
 class CodeStreamGraphics:
     """Code Stream branded graphics generator"""
     
-    def __init__(self, output_dir="assets"):
+    def __init__(self, output_dir="assets", width=1920, height=1080):
         self.output_dir = output_dir
-        self.width = 1920
-        self.height = 1080
-        self.stats_cache = self._load_stats_cache()
+        self.width = width
+        self.height = height
+        self.stats_cache = _shared('stats_cache', self._load_stats_cache)
         self.fonts = self._load_fonts()
         os.makedirs(output_dir, exist_ok=True)
     
-    def _load_stats_cache(self):
+    @staticmethod
+    def _load_stats_cache():
         """Load cached GitHub stats"""
         if os.path.exists(STATS_CACHE_FILE):
             try:
@@ -49,9 +128,13 @@ class CodeStreamGraphics:
         return {}
     
     def _save_stats_cache(self):
-        """Save GitHub stats cache"""
-        with open(STATS_CACHE_FILE, 'w') as f:
-            json.dump(self.stats_cache, f, indent=2)
+        """Save GitHub stats cache (merged with the file: card workers save concurrently)"""
+        merged = self._load_stats_cache()
+        merged.update(self.stats_cache)
+        tmp = f"{STATS_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(merged, f, indent=2)
+        os.replace(tmp, STATS_CACHE_FILE)
     
     def _is_cache_valid(self, cached_entry):
         """Check if cached entry is still fresh"""
@@ -60,40 +143,10 @@ class CodeStreamGraphics:
         cached_time = datetime.fromisoformat(cached_entry['timestamp'])
         return datetime.now() - cached_time < timedelta(hours=CACHE_EXPIRY_HOURS)
     
-    def _load_fonts(self):
-        """Load fonts with cross-platform fallback"""
-        fonts = {}
-        font_sizes = {
-            'title': 140,
-            'label': 50,
-            'stats': 45,
-            'description': 32,
-            'tag': 28,
-        }
-        
-        font_candidates = [
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "C:\\Windows\\Fonts\\arial.ttf",
-        ]
-        
-        available_font = None
-        for font_path in font_candidates:
-            if os.path.exists(font_path):
-                available_font = font_path
-                break
-        
-        for style, size in font_sizes.items():
-            try:
-                if available_font:
-                    fonts[style] = ImageFont.truetype(available_font, size)
-                else:
-                    fonts[style] = ImageFont.load_default()
-            except:
-                fonts[style] = ImageFont.load_default()
-        
-        return fonts
+    @staticmethod
+    def _load_fonts():
+        """Card fonts from the shared registry"""
+        return {style: get_font(family, size) for style, (family, size) in CARD_FONTS.items()}
     
     def get_github_stats(self, github_url):
         """Fetch GitHub stats with caching"""
@@ -126,8 +179,10 @@ class CodeStreamGraphics:
                     'timestamp': datetime.now().isoformat()
                 }
                 
-                self.stats_cache[cache_key] = {'data': stats, 'timestamp': datetime.now().isoformat()}
-                self._save_stats_cache()
+                # The cache dict is shared by every instance (and executor thread)
+                with _LOCK:
+                    self.stats_cache[cache_key] = {'data': stats, 'timestamp': datetime.now().isoformat()}
+                    self._save_stats_cache()
                 
                 print(f"✅ Fetched fresh stats for {cache_key}")
                 return stats
@@ -144,125 +199,111 @@ class CodeStreamGraphics:
             return f"{num/1000:.1f}k"
         return str(num)
     
-    def create_base_image(self):
+    def create_base_image(self, rng=random):
         """Create base image with Code Stream aesthetic - now with varied gradients"""
-        # Start with Deep Blue background
-        img = Image.new('RGB', (self.width, self.height), color=COLORS['deep_blue'])
-        
         # Randomize gradient intensity and direction
-        gradient_intensity = random.uniform(0.2, 0.5)  # Was fixed at 0.3
-        reverse_gradient = random.choice([True, False])
-        
-        draw = ImageDraw.Draw(img)
-        
-        for y in range(self.height):
-            if reverse_gradient:
-                # Reverse: purple to blue
-                ratio = 1 - (y / self.height)
-            else:
-                # Normal: blue to purple
-                ratio = y / self.height
-            
-            r = int(COLORS['deep_blue'][0] + (COLORS['dark_purple'][0] - COLORS['deep_blue'][0]) * ratio * gradient_intensity)
-            g = int(COLORS['deep_blue'][1] + (COLORS['dark_purple'][1] - COLORS['deep_blue'][1]) * ratio * gradient_intensity)
-            b = int(COLORS['deep_blue'][2] + (COLORS['dark_purple'][2] - COLORS['deep_blue'][2]) * ratio * gradient_intensity)
-            draw.line([(0, y), (self.width, y)], fill=(r, g, b))
-        
-        return img
+        gradient_intensity = rng.uniform(0.2, 0.5)  # Was fixed at 0.3
+        reverse_gradient = rng.choice([True, False])
+        
+        # Reverse: purple to blue; normal: blue to purple
+        column = vertical_gradient(self.height, COLORS['deep_blue'], COLORS['dark_purple'],
+                                   gradient_intensity, reverse_gradient)
+        # Every row is one colour: stretch the 1px column sideways
+        return column.resize((self.width, self.height), Image.NEAREST)
     
-    def add_grid_pattern(self, img):
+    def add_grid_pattern(self, img, rng=random):
         """Add Code Stream grid pattern with randomized spacing and optional skip"""
         overlay = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(overlay)
         
         # Randomize grid spacing
-        grid_spacing = random.choice([60, 80, 100, 120])
+        grid_spacing = rng.choice([60, 80, 100, 120])
         
         # Randomize accent color (sometimes teal, sometimes green, sometimes purple mix)
-        color_choice = random.choice(['teal', 'green', 'purple'])
+        color_choice = rng.choice(['teal', 'green', 'purple'])
         if color_choice == 'teal':
-            grid_color = (*COLORS['electric_teal'], random.randint(25, 50))
+            grid_color = (*COLORS['electric_teal'], rng.randint(25, 50))
         elif color_choice == 'green':
-            grid_color = (*COLORS['electric_green'], random.randint(25, 50))
+            grid_color = (*COLORS['electric_green'], rng.randint(25, 50))
         else:  # purple - mix of blue and teal
             grid_color = (int((COLORS['deep_blue'][0] + COLORS['electric_teal'][0])/2),
                          int((COLORS['deep_blue'][1] + COLORS['electric_teal'][1])/2),
                          int((COLORS['deep_blue'][2] + COLORS['electric_teal'][2])/2),
-                         random.randint(25, 50))
+                         rng.randint(25, 50))
         
         # Randomly decide to skip grid pattern entirely for cleaner look (30% chance)
-        if random.random() < 0.3:
-            return Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
+        if rng.random() < 0.3:
+            return img
         
         # Horizontal grid lines
         for y in range(0, self.height, grid_spacing):
             # Randomly skip some lines for variety (20% chance per line)
-            if random.random() > 0.2:
+            if rng.random() > 0.2:
                 draw.line([(0, y), (self.width, y)], fill=grid_color, width=1)
         
         # Vertical grid lines
         for x in range(0, self.width, grid_spacing):
             # Randomly skip some lines for variety (20% chance per line)
-            if random.random() > 0.2:
+            if rng.random() > 0.2:
                 draw.line([(x, 0), (x, self.height)], fill=grid_color, width=1)
         
         # Add circuit nodes at some grid intersections
-        node_size = random.randint(3, 6)
+        node_size = rng.randint(3, 6)
         for y in range(0, self.height, grid_spacing * 2):
             for x in range(0, self.width, grid_spacing * 2):
                 # 40% chance to add a node at each intersection
-                if random.random() < 0.4:
+                if rng.random() < 0.4:
                     draw.ellipse([(x - node_size, y - node_size), (x + node_size, y + node_size)], 
                                 fill=grid_color)
         
         return Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
     
-    def add_data_flow_lines(self, img):
+    def add_data_flow_lines(self, img, rng=random):
         """Add diagonal data flow lines with randomized spacing and optional skip"""
         overlay = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(overlay)
         
         # Randomize flow line spacing
-        flow_spacing = random.choice([150, 200, 250])
+        flow_spacing = rng.choice([150, 200, 250])
         
         # Randomize flow line color
-        color_choice = random.choice(['teal', 'green'])
+        color_choice = rng.choice(['teal', 'green'])
         if color_choice == 'teal':
-            flow_color = (*COLORS['electric_teal'], random.randint(30, 60))
+            flow_color = (*COLORS['electric_teal'], rng.randint(30, 60))
         else:
-            flow_color = (*COLORS['electric_green'], random.randint(30, 60))
+            flow_color = (*COLORS['electric_green'], rng.randint(30, 60))
         
         # Randomly decide to skip flow lines entirely (40% chance)
-        if random.random() < 0.4:
-            return Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
+        if rng.random() < 0.4:
+            return img
         
         # Diagonal lines flowing top-left to bottom-right
         for i in range(-self.height, self.width, flow_spacing):
             # Randomly skip some lines (25% chance)
-            if random.random() > 0.25:
+            if rng.random() > 0.25:
                 draw.line(
                     [(i, 0), (i + self.height, self.height)],
                     fill=flow_color,
-                    width=random.randint(1, 3)
+                    width=rng.randint(1, 3)
                 )
         
         return Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
     
-    def add_glow_accents(self, img):
+    def add_glow_accents(self, img, rng=random):
         """Add horizontal glow lines at top and bottom with randomized colors"""
         overlay = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(overlay)
         
         # Randomize glow color (teal or green)
-        glow_choice = random.choice(['teal', 'green'])
+        glow_choice = rng.choice(['teal', 'green'])
         if glow_choice == 'teal':
             glow_base_color = COLORS['electric_teal']
         else:
             glow_base_color = COLORS['electric_green']
         
         # Randomly decide glow position
-        top_glow_y = random.randint(80, 120)
-        bottom_glow_y = random.randint(920, 980)
+        top_glow_y = rng.randint(80, 120)
+        bottom_glow_y = rng.randint(920, 980)
         
         # Top glow accent
         for i in range(6):
@@ -277,14 +318,14 @@ class CodeStreamGraphics:
             draw.line([(0, bottom_glow_y + i), (self.width, bottom_glow_y + i)], fill=glow_color, width=2)
         
         # Add random decorative glow orbs (1-3 orbs)
-        num_orbs = random.randint(1, 3)
+        num_orbs = rng.randint(1, 3)
         for _ in range(num_orbs):
-            orb_x = random.randint(200, self.width - 200)
-            orb_y = random.randint(200, self.height - 200)
-            orb_size = random.randint(100, 200)
+            orb_x = rng.randint(200, self.width - 200)
+            orb_y = rng.randint(200, self.height - 200)
+            orb_size = rng.randint(100, 200)
             
             # Random orb color
-            orb_color_choice = random.choice(['teal', 'green', 'purple'])
+            orb_color_choice = rng.choice(['teal', 'green', 'purple'])
             if orb_color_choice == 'teal':
                 orb_color = COLORS['electric_teal']
             elif orb_color_choice == 'green':
@@ -307,6 +348,27 @@ class CodeStreamGraphics:
         
         return Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
     
+    def background(self, variant=0, layers=ALL_LAYERS):
+        """
+        Copy of the pre-rendered background for this card size and variant,
+        rendering it into the pool on first use.
+        """
+        key = (self.width, self.height, variant % BACKGROUND_VARIANTS, tuple(layers))
+        with _LOCK:
+            cached = _BACKGROUNDS.get(key)
+        if cached is None:
+            rng = random.Random(f"{key}")
+            img = self.create_base_image(rng)
+            if 'grid' in layers:
+                img = self.add_grid_pattern(img, rng)
+            if 'flow' in layers:
+                img = self.add_data_flow_lines(img, rng)
+            if 'glow' in layers:
+                img = self.add_glow_accents(img, rng)
+            with _LOCK:
+                cached = _BACKGROUNDS.setdefault(key, img)
+        return cached.copy()
+    
     def draw_text_with_glow(self, draw, text, position, font, glow_color, text_color, glow_offset=3):
         """Draw text with glow effect"""
         x, y = position
@@ -319,30 +381,9 @@ class CodeStreamGraphics:
         draw.text((x, y), text, font=font, fill=text_color)
     
     def wrap_text(self, text, max_width, font):
-        """Wrap text to fit within max width"""
-        if not text:
-            return []
-        
-        wrapped = []
-        words = text.split()
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = self.fonts['description'].getbbox(test_line)
-            line_width = bbox[2] - bbox[0]
-            
-            if line_width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    wrapped.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            wrapped.append(' '.join(current_line))
-        
-        return wrapped
+        """Wrap description text to fit within max width"""
+        family, size = CARD_FONTS['description']
+        return wrap_words(text, family, size, max_width)
     
     def create_project_graphic(self, project_name, github_url, output_path=None):
         """Create Code Stream branded project graphic"""
@@ -359,14 +400,8 @@ class CodeStreamGraphics:
             self._create_fallback_graphic(project_name, output_path)
             return output_path
         
-        # Create base image
-        img = self.create_base_image()
-        
-        # Add patterns
-        img = self.add_grid_pattern(img)
-        img = self.add_data_flow_lines(img)
-        img = self.add_glow_accents(img)
-        
+        # Pooled background; only the text layer is drawn per project
+        img = self.background(variant_for(project_name))
         draw = ImageDraw.Draw(img)
         
         # Draw "Tool:" label
@@ -481,17 +516,52 @@ class CodeStreamGraphics:
                 tag_x += tag_width + 15
         
         # Save
-        img.save(output_path)
+        img.save(output_path, compress_level=PNG_COMPRESS_LEVEL)
         print(f"✅ Code Stream graphic saved: {output_path}")
         
         return output_path
     
+    @staticmethod
+    def _load_shorts_fonts():
+        """Fonts for the vertical Shorts card"""
+        return {style: get_font(family, size) for style, (family, size) in SHORTS_FONTS.items()}
+    
+    def create_vertical_graphic(self, project_name, github_url, output_path):
+        """Create vertical Shorts graphic (use an instance sized 1080x1920)"""
+        fonts = self._load_shorts_fonts()
+        stats = self.get_github_stats(github_url)
+        
+        img = self.background(variant_for(project_name))
+        draw = ImageDraw.Draw(img)
+        
+        margin = 80
+        title_y = 300
+        
+        draw.text((margin, title_y), project_name, font=fonts['title'], fill=COLORS['white'])
+        
+        if stats:
+            y_offset = title_y + 150
+            stats_text = f"⭐ {stats.get('stars', 'N/A')} | 🔄 {stats.get('forks', 'N/A')} forks"
+            draw.text((margin, y_offset), stats_text, font=fonts['stats'], fill=COLORS['electric_teal'])
+            y_offset += 80
+            
+            if stats.get('description'):
+                family, size = SHORTS_FONTS['description']
+                lines = wrap_words(stats['description'], family, size, self.width - 2 * margin)
+                
+                for i, line in enumerate(lines[:3]):
+                    draw.text((margin, y_offset + i * 70), line, font=fonts['description'], fill=COLORS['soft_gray'])
+        
+        branding_y = self.height - 200
+        draw.text((margin, branding_y), "Open Source Scribes", font=fonts['description'], fill=COLORS['electric_green'])
+        draw.text((self.width - 250, branding_y), "#Shorts", font=fonts['stats'], fill=COLORS['electric_teal'])
+        
+        img.save(output_path, compress_level=PNG_COMPRESS_LEVEL)
+        return output_path
+    
     def _create_fallback_graphic(self, project_name, output_path):
         """Create fallback graphic when API fails"""
-        img = self.create_base_image()
-        img = self.add_grid_pattern(img)
-        img = self.add_glow_accents(img)
-        
+        img = self.background(variant_for(project_name), layers=('grid', 'glow'))
         draw = ImageDraw.Draw(img)
         
         # Draw project name
@@ -514,17 +584,31 @@ class CodeStreamGraphics:
             COLORS['electric_teal']
         )
         
-        img.save(output_path)
+        img.save(output_path, compress_level=PNG_COMPRESS_LEVEL)
         print(f"✅ Fallback Code Stream graphic: {output_path}")
 
 
+def preload_fonts():
+    """Open the card fonts, measure the fixed labels and load the stats cache (card worker initializer)."""
+    preload(list(CARD_FONTS.values()) + list(SHORTS_FONTS.values()))
+    for style, labels in FIXED_LABELS.items():
+        premeasure(labels, *CARD_FONTS[style])
+    _shared('stats_cache', CodeStreamGraphics._load_stats_cache)
+
+
 # Simple wrapper function for backward compatibility
 def create_project_graphic(project_name, github_url, output_path):
     """Create a Code Stream branded graphic"""
-    generator = CodeStreamGraphics()
+    generator = CodeStreamGraphics(output_dir=Path(output_path).parent)
     return generator.create_project_graphic(project_name, github_url, output_path)
 
 
+def create_shorts_graphic(project_name, github_url, output_path):
+    """Create a vertical (1080x1920) Shorts graphic"""
+    generator = CodeStreamGraphics(output_dir=Path(output_path).parent, width=1080, height=1920)
+    return generator.create_vertical_graphic(project_name, github_url, output_path)
+
+
 if __name__ == "__main__":
     # Test with sample projects
     test_projects = [
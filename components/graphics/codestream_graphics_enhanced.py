@@ -7,11 +7,13 @@ For integration with Ideogram, Midjourney, Flux.1, or similar services
 import os
 import json
 import requests
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from pathlib import Path
 from datetime import datetime, timedelta
 import re
 
+from components.graphics.fonts import get_font, wrap_words
+
 # Enhanced Code Stream Brand Colors (updated for 2026)
 COLORS = {
     'deep_blue': (10, 22, 40),           # #0a1628 - Primary background
@@ -25,6 +27,16 @@ COLORS = {
     'hot_pink': (255, 20, 147),          # #FF1493 - New accent for highlights
 }
 
+# (family, size) per text style, from components/graphics/fonts.py
+CARD_FONTS = {
+    'title': ('sans-bold', 120),           # Slightly smaller for text with presenter
+    'label': ('sans-bold', 45),
+    'stats': ('sans-bold', 40),
+    'description': ('sans-bold', 28),
+    'tag': ('sans-bold', 24),
+    'watermark': ('sans-bold', 32),
+}
+
 STATS_CACHE_FILE = "github_stats_cache.json"
 CACHE_EXPIRY_HOURS = 24
 
@@ -63,40 +75,8 @@ class EnhancedCodeStreamGraphics:
         return datetime.now() - cached_time < timedelta(hours=CACHE_EXPIRY_HOURS)
     
     def _load_fonts(self):
-        """Load fonts with cross-platform fallback"""
-        fonts = {}
-        font_sizes = {
-            'title': 120,           # Slightly smaller for text with presenter
-            'label': 45,
-            'stats': 40,
-            'description': 28,
-            'tag': 24,
-            'watermark': 32,
-        }
-        
-        font_candidates = [
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "C:\\Windows\\Fonts\\arial.ttf",
-        ]
-        
-        available_font = None
-        for font_path in font_candidates:
-            if os.path.exists(font_path):
-                available_font = font_path
-                break
-        
-        for style, size in font_sizes.items():
-            try:
-                if available_font:
-                    fonts[style] = ImageFont.truetype(available_font, size)
-                else:
-                    fonts[style] = ImageFont.load_default()
-            except:
-                fonts[style] = ImageFont.load_default()
-        
-        return fonts
+        """Card fonts from the shared registry"""
+        return {style: get_font(family, size) for style, (family, size) in CARD_FONTS.items()}
     
     def get_github_stats(self, github_url):
         """Fetch GitHub stats with caching"""
@@ -235,30 +215,9 @@ class EnhancedCodeStreamGraphics:
         draw.text((x, y), text, font=font, fill=text_color)
     
     def wrap_text(self, text, max_width, font):
-        """Wrap text to fit within max width"""
-        if not text:
-            return []
-        
-        wrapped = []
-        words = text.split()
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = self.fonts['description'].getbbox(test_line)
-            line_width = bbox[2] - bbox[0]
-            
-            if line_width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    wrapped.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            wrapped.append(' '.join(current_line))
-        
-        return wrapped
+        """Wrap description text to fit within max width"""
+        family, size = CARD_FONTS['description']
+        return wrap_words(text, family, size, max_width)
     
     def create_ai_presenter_prompt(self, project_name, project_type="web", style="professional"):
         """
@@ -0,0 +1,167 @@
+"""
+Process-wide font registry shared by every Pillow renderer.
+
+Renderers ask for a family and a size instead of probing font paths:
+
+    from components.graphics.fonts import get_font, text_width, wrap_words
+
+    title = get_font('sans-bold', 96)
+    width = text_width("// OPEN SOURCE", 'mono', 30)
+    lines = wrap_words(description, 'sans-bold', 32, max_width=1700)
+
+Each family is resolved to a file once per process. The lookup order is:
+  1. an override in config.json ("fonts": {"sans-bold": "/path/to/font.ttf"})
+  2. the candidate files below (macOS, then Linux, then Windows)
+  3. fontconfig (fc-match)
+Only if all three fail does the family fall back to Pillow's bitmap font.
+FreeTypeFont objects are cached per (family, size). String widths are
+cached per (family, size, text), so repeated labels and the words of
+wrapped text are measured once. premeasure() warms that cache with the
+labels a renderer knows it will draw.
+"""
+
+import functools
+import os
+import subprocess
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from PIL import ImageFont
+
+from core.settings import setting
+
+FAMILIES: Dict[str, List[str]] = {
+    'sans': [
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/System/Library/Fonts/HelveticaNeue.ttc",
+        "/Library/Fonts/Arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans.ttf",
+        "C:\\Windows\\Fonts\\arial.ttf",
+    ],
+    'sans-bold': [
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/System/Library/Fonts/HelveticaNeue.ttc",
+        "/Library/Fonts/Arial Bold.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
+        "C:\\Windows\\Fonts\\arialbd.ttf",
+    ],
+    'mono': [
+        "/System/Library/Fonts/Menlo.ttc",
+        "/System/Library/Fonts/Courier.ttc",
+        "/Library/Fonts/Courier New.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeMono.ttf",
+        "/usr/share/fonts/TTF/DejaVuSansMono.ttf",
+        "C:\\Windows\\Fonts\\consola.ttf",
+    ],
+    'mono-bold': [
+        "/System/Library/Fonts/Menlo.ttc",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeMonoBold.ttf",
+        "/usr/share/fonts/TTF/DejaVuSansMono-Bold.ttf",
+        "C:\\Windows\\Fonts\\consolab.ttf",
+    ],
+}
+
+# fontconfig patterns for families none of the candidates matched
+_FC_PATTERNS = {
+    'sans': 'sans-serif',
+    'sans-bold': 'sans-serif:bold',
+    'mono': 'monospace',
+    'mono-bold': 'monospace:bold',
+}
+
+_lock = threading.Lock()
+_paths: Dict[str, Optional[str]] = {}
+
+
+def _fc_match(family: str) -> Optional[str]:
+    pattern = _FC_PATTERNS.get(family)
+    if not pattern:
+        return None
+    try:
+        result = subprocess.run(['fc-match', '-f', '%{file}', pattern],
+                                capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    path = result.stdout.strip()
+    return path if result.returncode == 0 and path.lower().endswith(('.ttf', '.otf', '.ttc')) else None
+
+
+def font_path(family: str) -> Optional[str]:
+    """File backing `family`, resolved once per process (None = bitmap fallback)."""
+    with _lock:
+        if family in _paths:
+            return _paths[family]
+    override = setting('fonts', family)
+    candidates = ([override] if override else []) + FAMILIES.get(family, [])
+    path = next((p for p in candidates if os.path.exists(p)), None) or _fc_match(family)
+    if path is None:
+        print(f"⚠️  No font found for '{family}', using Pillow's default bitmap font")
+    with _lock:
+        _paths.setdefault(family, path)
+        return _paths[family]
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(family: str, size: int):
+    """Cached FreeTypeFont for (family, size); Pillow's default font if unresolved."""
+    path = font_path(family)
+    if path:
+        try:
+            return ImageFont.truetype(path, int(size))
+        except OSError as e:
+            print(f"⚠️  Could not load {path} ({e})")
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=65536)
+def text_width(text: str, family: str, size: int) -> float:
+    """Advance width of `text` in pixels (same as ImageDraw.textlength)."""
+    return get_font(family, size).getlength(text)
+
+
+def premeasure(strings: Iterable[str], family: str, size: int) -> None:
+    """Warm the width cache with labels a renderer is about to draw."""
+    for s in strings:
+        text_width(s, family, size)
+
+
+def wrap_words(text: str, family: str, size: int, max_width: float) -> List[str]:
+    """
+    Greedy word wrap to max_width pixels. Widths come from the per-word
+    cache and add up along the line, so a description costs one
+    measurement per distinct word instead of one per growing prefix.
+    """
+    if not text:
+        return []
+    space = text_width(' ', family, size)
+    lines: List[str] = []
+    current: List[str] = []
+    width = 0.0
+    for word in text.split():
+        w = text_width(word, family, size)
+        candidate = width + (space if current else 0) + w
+        if current and candidate > max_width:
+            lines.append(' '.join(current))
+            current, width = [word], w
+        else:
+            current.append(word)
+            width = candidate
+    if current:
+        lines.append(' '.join(current))
+    return lines
+
+
+def preload(specs: Iterable) -> None:
+    """Open (family, size) fonts up front, e.g. in a card worker initializer."""
+    for family, size in specs:
+        get_font(family, size)
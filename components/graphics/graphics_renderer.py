@@ -2,12 +2,12 @@
 Graphics Renderer - Concrete implementation of IGraphicsRenderer
 Handles rendering of title cards, screenshots, and visual elements.
 """
-import os
 import textwrap
 from pathlib import Path
 from typing import Optional, Dict
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
+from components.graphics.fonts import get_font
 from interfaces.interfaces import IGraphicsRenderer, IGitHubClient, IFFmpegExecutor
 
 
@@ -95,24 +95,12 @@ class GraphicsRenderer(IGraphicsRenderer):
             draw.line([(cx, cy), (cx + dx*s, cy)], fill=GREEN, width=2)
             draw.line([(cx, cy), (cx, cy + dy*s)], fill=GREEN, width=2)
         
-        # Load fonts
-        mono_fonts = [
-            '/System/Library/Fonts/Menlo.ttc',
-            '/System/Library/Fonts/Courier.ttc',
-            '/Library/Fonts/Courier New.ttf'
-        ]
-        bold_fonts = [
-            '/System/Library/Fonts/HelveticaNeue.ttc',
-            '/System/Library/Fonts/Helvetica.ttc',
-            '/Library/Fonts/Arial Bold.ttf',
-            '/Library/Fonts/Arial.ttf'
-        ]
-        
-        f_label = self._try_font(mono_fonts, 30)
-        f_name = self._try_font(bold_fonts, 96)
-        f_desc = self._try_font(mono_fonts, 32)
-        f_stats = self._try_font(mono_fonts, 30)
-        f_tag = self._try_font(mono_fonts, 26)
+        # Fonts (shared registry)
+        f_label = get_font('mono', 30)
+        f_name = get_font('sans-bold', 96)
+        f_desc = get_font('mono', 32)
+        f_stats = get_font('mono', 30)
+        f_tag = get_font('mono', 26)
         
         # "// OPEN SOURCE" label
         label = "// OPEN SOURCE"
@@ -124,7 +112,7 @@ class GraphicsRenderer(IGraphicsRenderer):
         nw = draw.textlength(name, font=f_name)
         if nw > W - 120:
             scale = (W - 120) / nw
-            f_name = self._try_font(bold_fonts, int(96 * scale))
+            f_name = get_font('sans-bold', int(96 * scale))
             nw = draw.textlength(name, font=f_name)
         name_y = 220
         draw.text(((W - nw) / 2, name_y), name, fill=WHITE, font=f_name)
@@ -189,7 +177,8 @@ class GraphicsRenderer(IGraphicsRenderer):
     
     def capture_screenshot(self, github_url: str) -> Optional[Path]:
         """
-        Capture GitHub repository screenshot using external script.
+        Capture GitHub repository screenshot, reusing the cached capture
+        while the repo is unchanged (see services.github_screenshot).
         
         Args:
             github_url: GitHub repository URL
@@ -197,40 +186,11 @@ class GraphicsRenderer(IGraphicsRenderer):
         Returns:
             Path to screenshot or None if failed
         """
-        import subprocess
-        import sys
+        from services.github_screenshot import ensure_screenshot
         
-        # Use external github_screenshot.py script
         try:
-            result = subprocess.run(
-                [sys.executable, "github_screenshot.py", github_url],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=os.path.dirname(os.path.abspath(__file__))
-            )
-            
-            # Parse output path from script stdout
-            screenshot_path = None
-            for line in result.stdout.splitlines():
-                if line.startswith("Screenshot saved to:"):
-                    screenshot_path = line.split(":", 1)[1].strip()
-                    break
-            
-            # If no explicit path, derive expected path
-            if not screenshot_path:
-                import re
-                match = re.search(r"github\.com/([^/]+)/([^/]+)", github_url)
-                if match:
-                    slug = f"{match.group(1)}_{match.group(2).rstrip('/')}".lower().replace("-", "_")
-                    screenshot_path = f"assets/screenshots/{slug}_github.png"
-            
-            # Verify file exists
-            if screenshot_path and os.path.exists(screenshot_path):
-                return Path(screenshot_path)
-            
-            return None
-            
+            path, _ = ensure_screenshot(github_url)
+            return path if path and path.exists() else None
         except Exception as e:
             print(f"⚠️  Screenshot capture failed: {e}")
             return None
@@ -266,9 +226,9 @@ class GraphicsRenderer(IGraphicsRenderer):
         forks = project.get('forks', 0) or 0
         
         # Fonts
-        font_large = self._try_font(['/System/Library/Fonts/Helvetica.ttc'], 48)
-        font_medium = self._try_font(['/System/Library/Fonts/Helvetica.ttc'], 28)
-        font_small = self._try_font(['/System/Library/Fonts/Helvetica.ttc'], 20)
+        font_large = get_font('sans', 48)
+        font_medium = get_font('sans', 28)
+        font_small = get_font('sans', 20)
         
         # Repository name
         draw.text((20, header_height + 20), repo_name, fill=BLACK, font=font_large)
@@ -301,15 +261,6 @@ class GraphicsRenderer(IGraphicsRenderer):
         img.save(str(fallback_path))
         
         return fallback_path
-    
-    def _try_font(self, font_paths, size):
-        """Try to load a font, fall back to default if all fail."""
-        for font_path in font_paths:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except Exception:
-                pass
-        return ImageFont.load_default()
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -325,7 +276,7 @@ class VideoSuiteAutomated:
         # ❌ Direct GitHub API calls embedded
         # ❌ Hard to test graphics separately
         # ❌ Can't reuse graphics generation
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
         W, H = 1920, 1080
         # ... 200+ lines of graphics code ...
 
@@ -0,0 +1,117 @@
+"""
+Codestream-aesthetic title card shown at the start of each longform segment.
+
+Module-level so the card can be rendered in a CardRenderer worker process
+(components/graphics/batch_renderer.py). Fonts come from the shared registry
+(components/graphics/fonts.py); preload_fonts() opens the sizes every card uses.
+"""
+
+import textwrap
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from components.graphics.fonts import get_font, preload, premeasure, text_width
+
+LABEL = "// OPEN SOURCE"
+
+
+def preload_fonts() -> None:
+    """Open the fixed title card fonts (card worker initializer)."""
+    preload([('mono', 30), ('sans-bold', 96), ('mono', 32), ('mono', 26)])
+    premeasure([LABEL], 'mono', 30)
+
+
+def render_title_card_image(project: dict, output_folder="assets") -> Path:
+    """Generate a 1920x1080 codestream-aesthetic title card PNG via PIL."""
+    W, H = 1920, 1080
+    BG    = (8,   12,  20)
+    TEAL  = (0,   212, 255)
+    GREEN = (0,   255, 136)
+    WHITE = (255, 255, 255)
+    GRAY  = (136, 153, 170)
+    GOLD  = (255, 215, 0)
+
+    img  = Image.new('RGB', (W, H), BG)
+    draw = ImageDraw.Draw(img)
+
+    # Subtle grid
+    grid = (*TEAL, 15)
+    overlay = Image.new('RGBA', (W, H), (0, 0, 0, 0))
+    od = ImageDraw.Draw(overlay)
+    for x in range(0, W, 60):
+        od.line([(x, 0), (x, H)], fill=grid, width=1)
+    for y in range(0, H, 60):
+        od.line([(0, y), (W, y)], fill=grid, width=1)
+    img.paste(Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB'))
+    draw = ImageDraw.Draw(img)
+
+    # Top bar
+    draw.rectangle([(0, 0), (W, 3)], fill=TEAL)
+
+    # Corner accents
+    s = 40
+    for cx, cy, dx, dy in [(0,0,1,1),(W-1,0,-1,1),(0,H-1,1,-1),(W-1,H-1,-1,-1)]:
+        draw.line([(cx, cy), (cx + dx*s, cy)], fill=GREEN, width=2)
+        draw.line([(cx, cy), (cx, cy + dy*s)], fill=GREEN, width=2)
+
+    f_label = get_font('mono', 30)
+    f_name  = get_font('sans-bold', 96)
+    f_desc  = get_font('mono', 32)
+    f_stats = get_font('mono', 30)
+    f_tag   = get_font('mono', 26)
+
+    # "// OPEN SOURCE"
+    lw = text_width(LABEL, 'mono', 30)
+    draw.text(((W - lw) / 2, 90), LABEL, fill=TEAL, font=f_label)
+
+    # Project name
+    name = project.get('name', '')
+    nw = draw.textlength(name, font=f_name)
+    if nw > W - 120:
+        f_name = get_font('sans-bold', int(96 * (W - 120) / nw))
+        nw = draw.textlength(name, font=f_name)
+    name_y = 220
+    draw.text(((W - nw) / 2, name_y), name, fill=WHITE, font=f_name)
+
+    # Divider
+    div_y = name_y + 130
+    draw.rectangle([(W//2 - 200, div_y), (W//2 + 200, div_y + 2)], fill=TEAL)
+
+    # Description
+    desc = project.get('description', '')
+    if desc:
+        dy = div_y + 36
+        for line in textwrap.wrap(desc, width=65)[:2]:
+            lw = draw.textlength(line, font=f_desc)
+            draw.text(((W - lw) / 2, dy), line, fill=GRAY, font=f_desc)
+            dy += 50
+
+    # Stars / forks
+    stars    = project.get('stars', 0) or 0
+    forks    = project.get('forks', 0) or 0
+    language = project.get('language', '') or ''
+    topics   = project.get('topics',   []) or []
+
+    def fmt(n):
+        return f"{n/1000:.1f}k" if n >= 1000 else str(n)
+
+    sy = H - 175
+    draw.text((80,  sy), f"\u2605 {fmt(stars)} stars", fill=GOLD, font=f_stats)
+    draw.text((360, sy), f"\u2442 {fmt(forks)} forks", fill=GRAY, font=f_stats)
+
+    # Tag pills
+    tags = ([language] if language else []) + list(topics)[:3]
+    px, py = 80, sy + 58
+    for tag in tags:
+        tw  = int(draw.textlength(tag, font=f_tag))
+        pad = 14
+        pw  = tw + pad * 2
+        draw.rounded_rectangle([(px, py), (px + pw, py + 42)],
+                                radius=8, fill=(0, 40, 60), outline=TEAL, width=1)
+        draw.text((px + pad, py + 8), tag, fill=TEAL, font=f_tag)
+        px += pw + 12
+
+    out = Path(output_folder) / f"{project['id']}_title_card.png"
+    img.save(str(out))
+    return out
@@ -5,13 +5,22 @@ Pipeline:
   1. GitHub API: Fetches raw metadata + README (fast, free, deterministic)
   2. DeepSeek:   Enriches API data with structured insights (features, angles, differentiator)
   3. Claude:     Writes narration script from enriched data
+
+For URL lists the three stages run as an async pipeline across all URLs
+(see generate_scripts_pipelined), each stage with its own concurrency limit.
 """
 
+import asyncio
 import os
 import re
+import threading
 import requests
 import json
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from services.llm_cache import cached_completion, print_llm_cache_report
+from core.metrics import METRICS, bind_context, timed
 
 # Target word count for ~39-46 second narration (~150wpm speaking pace)
 MIN_WORDS = 100
@@ -19,6 +28,11 @@ MAX_WORDS = 115
 TARGET_WORDS = 107
 MIN_PROJECTS = 15  # Minimum projects per pipeline run
 
+# Per-stage concurrency for generate_scripts_pipelined
+FETCH_CONCURRENCY = 8   # GitHub API / README / ClickHouse requests
+ENRICH_CONCURRENCY = 4  # DeepSeek requests
+WRITE_CONCURRENCY = 4   # Claude requests
+
 
 def fetch_github_data(github_url: str) -> Optional[Dict]:
     """
@@ -62,6 +76,7 @@ def fetch_github_data(github_url: str) -> Optional[Dict]:
                 'created_at': data.get('created_at', ''),
                 'updated_at': data.get('updated_at', ''),
                 'license': (data.get('license') or {}).get('name', 'No license'),
+                'default_branch': data.get('default_branch', ''),
                 'github_url': github_url
             }
         elif response.status_code == 404:
@@ -160,13 +175,15 @@ def fetch_clickhouse_stats(owner: str, repo: str) -> Optional[str]:
 
 
 
-def fetch_readme(owner: str, repo: str) -> Optional[str]:
+def fetch_readme(owner: str, repo: str, branch: Optional[str] = None) -> Optional[str]:
     """
     Fetch README content from GitHub repository
     
     Args:
         owner: Repository owner
         repo: Repository name
+        branch: Default branch from the GitHub API; when unknown, 'main'
+                then 'master' are tried
         
     Returns:
         README content as string or None if not found
@@ -175,27 +192,21 @@ def fetch_readme(owner: str, repo: str) -> Optional[str]:
     
     # Try common README filenames
     readme_names = ['README.md', 'README.MD', 'readme.md', 'README', 'README.txt']
+    branches = [branch] if branch else ['main', 'master']
     
     for readme_name in readme_names:
-        try:
-            # Raw content URL
-            url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{readme_name}"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                print(f"✅ Found {readme_name}")
-                return response.text
-            
-            # Try 'master' branch if 'main' fails
-            url = f"https://raw.githubusercontent.com/{owner}/{repo}/master/{readme_name}"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                print(f"✅ Found {readme_name}")
-                return response.text
+        for ref in branches:
+            try:
+                # Raw content URL
+                url = f"https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{readme_name}"
+                response = requests.get(url, timeout=10)
                 
-        except Exception as e:
-            continue
+                if response.status_code == 200:
+                    print(f"✅ Found {readme_name}")
+                    return response.text
+                    
+            except Exception as e:
+                continue
     
     print("⚠️  README not found")
     return None
@@ -391,7 +402,9 @@ def generate_script_template(repo_data: Dict, readme_data: Dict) -> str:
     return script
 
 
-def generate_script_ai(repo_data: Dict, readme_data: Dict, enriched_data: Optional[Dict] = None) -> Optional[str]:
+@timed("script_gen")
+def generate_script_ai(repo_data: Dict, readme_data: Dict, enriched_data: Optional[Dict] = None,
+                       ch_stats_text: Optional[str] = None, use_cache: bool = True) -> Optional[str]:
     """
     Generate script using Claude, using enriched data from DeepSeek for richer context.
     
@@ -399,6 +412,8 @@ def generate_script_ai(repo_data: Dict, readme_data: Dict, enriched_data: Option
         repo_data: Repository metadata (from GitHub API)
         readme_data: Parsed README sections
         enriched_data: Optional structured insights from DeepSeek enricher
+        ch_stats_text: Pre-fetched ClickHouse velocity text (fetched here if None)
+        use_cache: Serve an identical prompt from the LLM response cache
         
     Returns:
         Generated script text or None if AI unavailable
@@ -442,10 +457,11 @@ ENRICHED ANALYSIS (DeepSeek):
             readme_content = readme_content[:8000]
             context_block = f"\nSource Content:\n{readme_content}\n"
         
-        # Fetch optional nuance stats from ClickHouse
-        ch_stats_text = ""
-        if 'owner' in repo_data and 'repo' in repo_data:
-            ch_stats_text = fetch_clickhouse_stats(repo_data['owner'], repo_data['repo'])
+        # Fetch optional nuance stats from ClickHouse (unless the fetch stage already did)
+        if ch_stats_text is None:
+            ch_stats_text = ""
+            if 'owner' in repo_data and 'repo' in repo_data:
+                ch_stats_text = fetch_clickhouse_stats(repo_data['owner'], repo_data['repo'])
             
         # Clean the project name of special characters before sending to AI
         cleaned_name = _clean_project_name(repo_data['name'])
@@ -473,15 +489,18 @@ ENRICHED ANALYSIS (DeepSeek):
         
         print("🤖 Claude: Writing script from enriched data...")
 
-        message = client.messages.create(
-            model="claude-haiku-4-5",
-            max_tokens=1024,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        script = message.content[0].text.strip()
+        def _call():
+            message = client.messages.create(
+                model="claude-haiku-4-5",
+                max_tokens=1024,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            return message.content[0].text, message.usage.input_tokens, message.usage.output_tokens
+
+        script = cached_completion("anthropic", "claude-haiku-4-5", prompt, {"max_tokens": 1024}, _call,
+                                   site="generate_script_ai", use_cache=use_cache).strip()
         
         # Post-process to aggressively catch any slipping first-person pronouns
         import re
@@ -512,13 +531,15 @@ ENRICHED ANALYSIS (DeepSeek):
         return None
 
 
-def generate_deep_dive_script(project: Dict) -> Optional[str]:
+@timed("script_gen", "deep_dive")
+def generate_deep_dive_script(project: Dict, use_cache: bool = True) -> Optional[str]:
     """
     Generate an extended narration script (~350-450 words, ~2-3 minutes) for deep dive videos.
     Falls back to repeating the short script if Claude is unavailable.
 
     Args:
         project: Project dict with at least 'name', 'github_url', 'script_text'
+        use_cache: Serve an identical prompt from the LLM response cache
 
     Returns:
         Extended script string, or None on failure
@@ -570,13 +591,16 @@ Rules:
 """
 
         print(f"🤖 Claude: Writing deep dive script for {name}...")
-        message = client.messages.create(
-            model="claude-haiku-4-5",
-            max_tokens=2048,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        def _call():
+            message = client.messages.create(
+                model="claude-haiku-4-5",
+                max_tokens=2048,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return message.content[0].text, message.usage.input_tokens, message.usage.output_tokens
 
-        script = message.content[0].text.strip()
+        script = cached_completion("anthropic", "claude-haiku-4-5", prompt, {"max_tokens": 2048}, _call,
+                                   site="deep_dive_script", use_cache=use_cache).strip()
 
         # Sanitise any accidental markdown that slipped through
         import re
@@ -597,10 +621,40 @@ Rules:
         return None
 
 
+_DEEPSEEK_ENRICHER = None
+_DEEPSEEK_LOCK = threading.Lock()
+
+
+def _get_deepseek_enricher():
+    """
+    Return a process-wide DeepSeekEnricher (shared HTTP session + on-disk
+    cache), or None if DeepSeek is unavailable.
+    """
+    global _DEEPSEEK_ENRICHER
+    with _DEEPSEEK_LOCK:
+        if _DEEPSEEK_ENRICHER is not None:
+            return _DEEPSEEK_ENRICHER
+
+        try:
+            from services.deepseek_enricher import DeepSeekEnricher
+        except ImportError:
+            print("⚠️  deepseek_enricher module not available, skipping enrichment")
+            return None
+
+        try:
+            _DEEPSEEK_ENRICHER = DeepSeekEnricher()
+        except ValueError as e:
+            print(f"⚠️  DeepSeek unavailable ({e}), skipping enrichment")
+            return None
+
+        return _DEEPSEEK_ENRICHER
+
+
 def _run_deepseek_enrichment(repo_data: Dict, readme_text: Optional[str]) -> Optional[Dict]:
     """
     Run DeepSeek enrichment on GitHub API data + README.
     Returns structured insights dict, or None if DeepSeek unavailable.
+    Re-runs for an unchanged repo/README are served from the enrichment cache.
     
     Args:
         repo_data: GitHub API metadata dict
@@ -609,16 +663,8 @@ def _run_deepseek_enrichment(repo_data: Dict, readme_text: Optional[str]) -> Opt
     Returns:
         Enriched insights dict or None
     """
-    try:
-        from services.deepseek_enricher import DeepSeekEnricher
-    except ImportError:
-        print("⚠️  deepseek_enricher module not available, skipping enrichment")
-        return None
-    
-    try:
-        enricher = DeepSeekEnricher()
-    except ValueError as e:
-        print(f"⚠️  DeepSeek unavailable ({e}), skipping enrichment")
+    enricher = _get_deepseek_enricher()
+    if enricher is None:
         return None
     
     print("🔍 DeepSeek: Enriching repo data...")
@@ -638,24 +684,13 @@ def _run_deepseek_enrichment(repo_data: Dict, readme_text: Optional[str]) -> Opt
         return None
 
 
-def generate_script(github_url: str) -> Optional[Dict]:
+def _fetch_stage(github_url: str) -> Optional[Tuple[Dict, Optional[str], str]]:
     """
-    Main function to generate script from GitHub URL.
-    
-    Pipeline:
-      1. GitHub API: Fetch raw metadata + README
-      2. DeepSeek:   Enrich with structured insights
-      3. Claude:     Write narration script from enriched data
-    
-    Falls back to template if any stage fails.
+    Pipeline stage 1: GitHub API metadata, README and ClickHouse velocity.
     
-    Args:
-        github_url: Full GitHub repository URL
-        
     Returns:
-        Dictionary with project data and generated script
+        (repo_data, readme_text, ch_stats_text) or None if no data at all
     """
-    # Step 1: Fetch GitHub API data
     repo_data = fetch_github_data(github_url)
     
     # Fallback to generic if GitHub fetch failed
@@ -669,21 +704,28 @@ def generate_script(github_url: str) -> Optional[Dict]:
     
     # Fetch README (raw content for DeepSeek analysis)
     readme_text = None
+    ch_stats_text = ""
     if 'owner' in repo_data and 'repo' in repo_data:
-        readme_text = fetch_readme(repo_data['owner'], repo_data['repo'])
+        readme_text = fetch_readme(repo_data['owner'], repo_data['repo'],
+                                   branch=repo_data.get('default_branch') or None)
+        ch_stats_text = fetch_clickhouse_stats(repo_data['owner'], repo_data['repo']) or ""
     else:
         print("ℹ️  Skipping README fetch as owner/repo not available from generic data.")
 
+    return repo_data, readme_text, ch_stats_text
+
+
+def _write_stage(github_url: str, repo_data: Dict, readme_text: Optional[str],
+                 enriched_data: Optional[Dict], ch_stats_text: Optional[str] = None) -> Dict:
+    """Pipeline stage 3: Claude writes the script (template fallback)."""
     readme_data = parse_readme_sections(readme_text) if readme_text else {}
     
     # Clean name of special characters for TTS-friendly output
     clean_name = _clean_project_name(repo_data['name'])
 
-    # Step 2: DeepSeek enrichment
-    enriched_data = _run_deepseek_enrichment(repo_data, readme_text)
-
-    # Step 3: Claude writes script (uses enriched data if available)
-    script = generate_script_ai(repo_data, readme_data, enriched_data=enriched_data)
+    # Claude writes script (uses enriched data if available)
+    script = generate_script_ai(repo_data, readme_data, enriched_data=enriched_data,
+                                ch_stats_text=ch_stats_text)
     
     # Fallback to template if AI fails
     if not script:
@@ -691,7 +733,7 @@ def generate_script(github_url: str) -> Optional[Dict]:
         script = generate_script_template(repo_data, readme_data)
     
     word_count = len(script.split())
-    print(f"✅ Script generated: {word_count} words (~{word_count/150:.1f} minutes)")
+    print(f"✅ Script generated for {clean_name}: {word_count} words (~{word_count/150:.1f} minutes)")
     
     return {
         'name': clean_name,
@@ -705,6 +747,94 @@ def generate_script(github_url: str) -> Optional[Dict]:
     }
 
 
+def generate_script(github_url: str) -> Optional[Dict]:
+    """
+    Main function to generate script from GitHub URL.
+    
+    Pipeline:
+      1. GitHub API: Fetch raw metadata + README
+      2. DeepSeek:   Enrich with structured insights
+      3. Claude:     Write narration script from enriched data
+    
+    Falls back to template if any stage fails.
+    
+    Args:
+        github_url: Full GitHub repository URL
+        
+    Returns:
+        Dictionary with project data and generated script
+    """
+    fetched = _fetch_stage(github_url)
+    if not fetched:
+        return None
+    repo_data, readme_text, ch_stats_text = fetched
+
+    enriched_data = _run_deepseek_enrichment(repo_data, readme_text)
+
+    return _write_stage(github_url, repo_data, readme_text, enriched_data, ch_stats_text)
+
+
+async def generate_scripts_pipelined(
+    urls: List[str],
+    fetch_limit: int = FETCH_CONCURRENCY,
+    enrich_limit: int = ENRICH_CONCURRENCY,
+    write_limit: int = WRITE_CONCURRENCY,
+) -> List[Optional[Dict]]:
+    """
+    Run generate_script for many URLs as an async fetch → enrich → write DAG.
+    
+    Each URL moves to the next stage as soon as its previous stage finishes,
+    so one repo can be in Claude while others are still fetching. Every stage
+    has its own concurrency limit; the blocking HTTP calls run in worker
+    threads.
+    
+    Args:
+        urls: GitHub URLs (already validated and deduplicated)
+        fetch_limit / enrich_limit / write_limit: Max in-flight per stage
+        
+    Returns:
+        One result per URL, in input order (None where no data could be fetched)
+    """
+    loop = asyncio.get_running_loop()
+    fetch_sem = asyncio.Semaphore(fetch_limit)
+    enrich_sem = asyncio.Semaphore(enrich_limit)
+    write_sem = asyncio.Semaphore(write_limit)
+    executor = ThreadPoolExecutor(max_workers=fetch_limit + enrich_limit + write_limit)
+
+    async def run_one(url: str) -> Optional[Dict]:
+        try:
+            async with fetch_sem:
+                fetched = await loop.run_in_executor(executor, bind_context(_fetch_stage), url)
+            if not fetched:
+                return None
+            repo_data, readme_text, ch_stats_text = fetched
+
+            async with enrich_sem:
+                enriched_data = await loop.run_in_executor(
+                    executor, bind_context(_run_deepseek_enrichment), repo_data, readme_text
+                )
+
+            async with write_sem:
+                return await loop.run_in_executor(
+                    executor, bind_context(_write_stage), url, repo_data, readme_text, enriched_data, ch_stats_text
+                )
+        except Exception as e:
+            print(f"❌ Script pipeline failed for {url}: {e}")
+            return None
+
+    with executor:
+        return await asyncio.gather(*(run_one(url) for url in urls))
+
+
+def _project_id(url: str, fallback: str) -> str:
+    """Stable project ID from a GitHub URL (owner_repo), or `fallback`."""
+    match = re.search(r'github\.com/([^/]+)/([^/]+)', url)
+    if match:
+        owner, repo = match.groups()
+        return f"{owner}_{repo.rstrip('/')}".lower().replace('-', '_')
+    return fallback
+
+
 def generate_from_url_list(filepath: str) -> list:
     """
     Generate scripts for all URLs in a file
@@ -737,14 +867,11 @@ def generate_from_url_list(filepath: str) -> list:
     
     print(f"Found {len(urls)} URLs\n")
     
-    projects = []
+    # Validate + dedup serially (cheap), then run the network-bound stages concurrently
+    pending = []  # (position, url)
     processed_full_names = set()  # Track owner/repo to skip actual forks, not same-named different projects
     
     for i, url in enumerate(urls, 1):
-        print(f"\n{'='*60}")
-        print(f"Processing {i}/{len(urls)}: {url}")
-        print('='*60)
-        
         # ERROR CHECK: Ensure it's a GitHub URL to prevent scraping personal blogs
         if 'github.com' not in url:
             print(f"⚠️  ERROR CHECK: Skipping non-GitHub URL to prevent scraping errors: {url}")
@@ -765,17 +892,17 @@ def generate_from_url_list(filepath: str) -> list:
         if full_name_lower:
             processed_full_names.add(full_name_lower)
         
-        result = generate_script(url)
+        pending.append((i, url))
+    
+    print(f"🚀 Generating {len(pending)} scripts "
+          f"(fetch×{FETCH_CONCURRENCY}, enrich×{ENRICH_CONCURRENCY}, write×{WRITE_CONCURRENCY})...")
+    results = asyncio.run(generate_scripts_pipelined([url for _, url in pending]))
+    
+    projects = []
+    for (i, url), result in zip(pending, results):
         if result:
-             # Generate unique ID from URL (e.g., owner_repo)
-            safe_id = re.sub(r'[^a-zA-Z0-9]', '_', result['name']).lower()
-            # If repo name is generic, prepend owner? But name usually unique enough for local list.
-            # Better: use full_name if available in result (it is not currently returned in root dict)
-            # Let's extract from URL: github.com/owner/repo
-            match = re.search(r'github\.com/([^/]+)/([^/]+)', result['github_url'])
-            if match:
-                owner, repo = match.groups()
-                safe_id = f"{owner}_{repo}".lower().replace('-', '_')
+            safe_id = _project_id(result['github_url'],
+                                  re.sub(r'[^a-zA-Z0-9]', '_', result['name']).lower())
             
             projects.append({
                 'id': safe_id,
@@ -789,12 +916,10 @@ def generate_from_url_list(filepath: str) -> list:
             # Fallback entry to ensure it's not skipped in blogs/social
             match = re.search(r'github\.com/([^/]+)/([^/]+)', url)
             if match:
-                owner, repo = match.groups()
-                name = repo
-                safe_id = f"{owner}_{repo}".lower().replace('-', '_')
+                name = match.group(2)
             else:
                 name = url.split('/')[-1] or "Unknown Project"
-                safe_id = f"unknown_{i}"
+            safe_id = _project_id(url, f"unknown_{i}")
                 
             projects.append({
                 'id': safe_id,
@@ -873,23 +998,25 @@ def _discover_additional_projects(existing_projects: list, needed: int) -> list:
     
     print(f"   Found {len(new_urls)} new URLs from discovery")
     
-    # Process new URLs
+    # Pipeline only as many URLs as are still missing, and top up from the
+    # rest (up to a few extra) when some fail, so no paid script is thrown away
+    candidates = new_urls[:needed + 5]
     additional_projects = []
-    for i, url in enumerate(new_urls[:needed + 5]):  # Process a few extra in case some fail
-        print(f"   Processing additional {i+1}/{min(len(new_urls), needed+5)}: {url}")
-        result = generate_script(url)
-        if result:
-            match = re.search(r'github\.com/([^/]+)/([^/]+)', result['github_url'])
-            if match:
-                owner, repo = match.groups()
-                safe_id = f"{owner}_{repo}".lower().replace('-', '_')
-            else:
-                safe_id = f"extra_{i}"
-            
+    attempted = 0
+    while len(additional_projects) < needed and attempted < len(candidates):
+        batch = candidates[attempted:attempted + needed - len(additional_projects)]
+        print(f"   Processing {len(batch)} additional URLs...")
+        results = asyncio.run(generate_scripts_pipelined(batch))
+
+        for i, result in enumerate(results, attempted):
+            if not result:
+                continue
+            safe_id = _project_id(result['github_url'], f"extra_{i}")
+
             # Skip if we already have this URL
             if result['github_url'].lower().rstrip('/') in existing_urls:
                 continue
-            
+
             existing_urls.add(result['github_url'].lower().rstrip('/'))
             additional_projects.append({
                 'id': safe_id,
@@ -898,10 +1025,8 @@ def _discover_additional_projects(existing_projects: list, needed: int) -> list:
                 'script_text': result['script_text']
             })
             print(f"   ✅ Added {result['name']} (ID: {safe_id})")
-            
-            if len(additional_projects) >= needed:
-                break
-    
+        attempted += len(batch)
+
     return additional_projects
 
 
@@ -916,6 +1041,9 @@ if __name__ == "__main__":
     parser.add_argument('--test', action='store_true', help='Run simple test')
     
     args = parser.parse_args()
+
+    from services.http_transport import install_from_env, print_transport_summary
+    install_from_env("script_gen")
     
     if args.test:
         print("🧪 Testing with sample URL...\n")
@@ -938,3 +1066,7 @@ if __name__ == "__main__":
             print(f"\n✅ Successfully saved {len(projects)} projects to {args.output}")
         else:
             print("\n❌ No projects generated")
+
+    print_llm_cache_report()
+    print("\n" + METRICS.summary())
+    print_transport_summary()
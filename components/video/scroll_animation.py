@@ -0,0 +1,113 @@
+"""
+GitHub screenshot scroll animation as a frame source.
+
+Zoom in → scroll top-to-bottom → zoom out over a screenshot pre-scaled to
+1920 wide. The pixels come from the capture's raw .npy artifact
+(services/github_screenshot.py), memory-mapped: repeat renders of a repo do
+no PNG decode or resize, full-scale scroll frames are slices of the page
+cache, and only the rows being shown are resident. Without numpy the PNG is
+decoded and pre-scaled in memory instead.
+
+ScrollAnimation is a plain picklable callable, fill(n, slot), so the same
+object drives the in-process RawFrameSink and the chunked encoder's worker
+processes (each worker re-opens the artifact on first use).
+"""
+
+from typing import Optional
+
+from services.frame_sink import frame_bytes
+from services.github_screenshot import (
+    FRAME_HEIGHT, MAX_SCROLL_PX, VIEWPORT_WIDTH, open_raw_artifact, prescale_screenshot,
+)
+
+W, H = VIEWPORT_WIDTH, FRAME_HEIGHT
+BG = (8, 12, 20)
+MIN_SCALE = 0.28
+
+
+class ScrollAnimation:
+    """
+    Args:
+        screenshot_path: Screenshot (any size; scaled to 1920 wide)
+        total_frames: Frames in the clip
+        zoom_frames: Frames for each of the zoom-in and zoom-out phases
+    """
+
+    def __init__(self, screenshot_path: str, total_frames: int, zoom_frames: int):
+        self.screenshot_path = str(screenshot_path)
+        self.total_frames = total_frames
+        self.zoom_frames = max(1, zoom_frames)
+        self.scroll_frames = total_frames - 2 * self.zoom_frames
+        self._pixels = None                    # (rows, W, 3) memmap, or None
+        self._src = None                       # Pillow fallback without numpy
+        self._rows: Optional[memoryview] = None
+        self._height = 0
+
+    def __getstate__(self):
+        # Workers re-open the screenshot rather than receiving it pickled
+        state = self.__dict__.copy()
+        state.update(_pixels=None, _src=None, _rows=None, _height=0)
+        return state
+
+    def prepare(self) -> None:
+        """Open (building if needed) the pre-scaled pixels; call before handing off to workers."""
+        if self._height:
+            return
+        self._pixels = open_raw_artifact(self.screenshot_path)
+        if self._pixels is not None:
+            self._height = self._pixels.shape[0]
+            return
+        self._src = prescale_screenshot(self.screenshot_path)
+        # Contiguous rgb24 rows: a full-width crop is a plain slice
+        self._rows = memoryview(self._src.tobytes())
+        self._height = self._src.size[1]
+
+    @property
+    def scaled_height(self) -> int:
+        self.prepare()
+        return self._height
+
+    def _region(self, top: int, rows: int):
+        """Full-width rows [top, top + rows) as a Pillow image."""
+        from PIL import Image
+
+        if self._pixels is not None:
+            return Image.fromarray(self._pixels[top:top + rows])
+        return self._src.crop((0, top, W, top + rows))
+
+    def position(self, n: int):
+        """(scale, scroll_y) for frame n."""
+        scaled_h = self.scaled_height
+        max_scroll = min(MAX_SCROLL_PX, max(0, scaled_h - H))
+        zoom_f, scroll_f = self.zoom_frames, self.scroll_frames
+        if n < zoom_f:
+            return MIN_SCALE + (1.0 - MIN_SCALE) * (n / zoom_f), 0
+        if n < zoom_f + scroll_f:
+            return 1.0, int(max_scroll * (n - zoom_f) / max(scroll_f, 1))
+        t = (n - zoom_f - scroll_f) / zoom_f
+        return 1.0 - (1.0 - MIN_SCALE) * t, max_scroll
+
+    def __call__(self, n: int, slot: bytearray):
+        from PIL import Image
+
+        scale, scroll_y = self.position(n)
+        scaled_h = self._height
+        cy = min(scroll_y, max(0, scaled_h - H))
+        ch = min(H, scaled_h - cy)
+        if scale >= 0.999 and ch == H:
+            # Sent as-is: a slice of the page cache (or of the decoded rows)
+            if self._pixels is not None:
+                return self._pixels[cy:cy + H]
+            row_bytes = W * 3
+            return self._rows[cy * row_bytes:(cy + H) * row_bytes]
+
+        frame = Image.new('RGB', (W, H), BG)
+        if scale >= 0.999:
+            frame.paste(self._region(cy, ch), (0, 0))
+        else:
+            dw = int(W * scale)
+            dh = int(H * scale)
+            if ch > 0 and dw > 0 and dh > 0:
+                region = self._region(cy, ch).resize((dw, int(ch * scale)), Image.LANCZOS)
+                frame.paste(region, ((W - dw) // 2, (H - int(ch * scale)) // 2))
+        return frame_bytes(frame)
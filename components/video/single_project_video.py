@@ -9,13 +9,15 @@ import json
 import subprocess
 from datetime import datetime
 from gtts import gTTS
-from components.graphics.branding import create_intro_card, create_outro_card
+from components.graphics.branding import cached_segment, create_intro_card, create_outro_card
+from services.still_segment import encode_still
 
 # Load configuration
 with open('config.json', 'r') as f:
     CONFIG = json.load(f)
 
 OUTPUT_FOLDER = "assets"
+STILL_FPS = 25  # ffmpeg's image2 default, which these segments have always used
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 
 # Organized delivery structure
@@ -40,6 +42,7 @@ def load_project_by_id(project_id):
 
 async def create_project_visual(project_name, github_url, output_path):
     """Create custom graphic using Code Stream branding"""
+    from components.graphics.batch_renderer import get_card_renderer
     from components.graphics.codestream_graphics import create_project_graphic
     
     if os.path.exists(output_path):
@@ -48,15 +51,8 @@ async def create_project_visual(project_name, github_url, output_path):
 
     print(f"🎨 Creating Code Stream graphic for: {project_name}")
     try:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            create_project_graphic,
-            project_name,
-            github_url,
-            output_path
-        )
+        await get_card_renderer().render_async(create_project_graphic, project_name,
+                                               github_url, output_path, label=project_name)
         return True
     except Exception as e:
         print(f"❌ Failed to create graphic: {e}")
@@ -134,21 +130,11 @@ def get_audio_duration(audio_path):
 def create_static_segment(image_path, duration, output_name, audio_path=None):
     """Create video segment from static image"""
     if audio_path and os.path.exists(audio_path):
-        duration = get_audio_duration(audio_path)
-        cmd = [
-            'ffmpeg', '-y', '-loop', '1', '-i', image_path,
-            '-i', audio_path, '-c:v', 'libx264', '-preset', 'ultrafast',
-            '-tune', 'stillimage', '-c:a', 'aac', '-b:a', '192k',
-            '-pix_fmt', 'yuv420p', '-t', str(duration), output_name
-        ]
+        encode_still(image_path, output_name, get_audio_duration(audio_path), fps=STILL_FPS,
+                     audio_path=audio_path, audio_args=('-c:a', 'aac', '-b:a', '192k'))
     else:
-        cmd = [
-            'ffmpeg', '-y', '-loop', '1', '-i', image_path,
-            '-c:v', 'libx264', '-preset', 'ultrafast',
-            '-pix_fmt', 'yuv420p', '-t', str(duration), output_name
-        ]
-    
-    subprocess.run(cmd, check=True, capture_output=True)
+        encode_still(image_path, output_name, duration, fps=STILL_FPS,
+                     video_args=('-c:v', 'libx264', '-preset', 'ultrafast'))
     return output_name
 
 async def create_segment(project):
@@ -179,14 +165,8 @@ async def create_segment(project):
     duration = get_audio_duration(audio_path)
     segment_name = f"seg_{project_id}.mp4"
     
-    cmd = [
-        'ffmpeg', '-y', '-loop', '1', '-i', graphic_path,
-        '-i', audio_path, '-c:v', 'libx264', '-preset', 'ultrafast',
-        '-tune', 'stillimage', '-c:a', 'aac', '-b:a', '192k',
-        '-pix_fmt', 'yuv420p', '-t', str(duration), segment_name
-    ]
-    
-    subprocess.run(cmd, check=True, capture_output=True)
+    encode_still(graphic_path, segment_name, duration, fps=STILL_FPS,
+                 audio_path=audio_path, audio_args=('-c:a', 'aac', '-b:a', '192k'))
     return segment_name
 
 async def create_single_project_video(project_id, output_filename=None, project=None):
@@ -235,7 +215,11 @@ async def create_single_project_video(project_id, output_filename=None, project=
     
     # 3. Outro
     if os.path.exists(outro_path):
-        segment_files.append(create_static_segment(outro_path, CONFIG['video_settings']['outro_duration'], "seg_outro_single.mp4"))
+        outro_duration = CONFIG['video_settings']['outro_duration']
+        segment_files.append(cached_segment(
+            'outro', outro_path, "seg_outro_single.mp4",
+            lambda: create_static_segment(outro_path, outro_duration, "seg_outro_single.mp4"),
+            duration=outro_duration, profile="single_project_video.static"))
     
     # 4. Concatenate segments
     print("\n🔗 Concatenating segments...")
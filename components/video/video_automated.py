@@ -15,7 +15,7 @@ from datetime import datetime
 from pathlib import Path
 
 from PIL import Image as _PILImage
-_PILImage.MAX_IMAGE_PIXELS = 300_000_000
+_PILImage.MAX_IMAGE_PIXELS = 300_000_000  # Legacy full-page captures; new ones are bounded
 from gtts import gTTS
 from typing import Optional, Dict
 
@@ -24,6 +24,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Import Seedream 5 Generator
 from services.seedream_generator import SeedreamGenerator
+from services.llm_cache import print_llm_cache_report
+from services.frame_sink import RawFrameSink, frame_bytes
+from services.chunked_encoder import encode_frames
+from services.still_segment import STILL_ARGS, encode_still
+from services.github_screenshot import (ensure_screenshot, prefetch, read_screenshot_meta,
+                                        screenshot_cache_summary)
+from components.graphics.fonts import get_font, text_width
+from components.video.scroll_animation import ScrollAnimation, W as SCROLL_W, H as SCROLL_H
+from core.metrics import METRICS, bind_context, record_cache_hit
 
 # Import content generators
 from content.generate_description import generate_description
@@ -119,6 +128,31 @@ class VideoSuiteAutomated:
         for p in self.deep_dive_selection:
             print(f"   - {p['name']}")
 
+    def _capture_screenshot(self, project: dict) -> str:
+        """
+        Current GitHub page screenshot for one project (sets and returns
+        project['screenshot_path'], '' on failure). Reuses the cached capture
+        unless the repo changed or it expired; recaptures run in a subprocess
+        to avoid sync_playwright conflicts with asyncio.
+        """
+        try:
+            path, status = ensure_screenshot(project['github_url'])
+            if path and path.exists():
+                project['screenshot_path'] = str(path)
+                meta = read_screenshot_meta(path)
+                if meta:
+                    project['screenshot_size'] = [meta['width'], meta['height']]
+                size = f"{meta['width']}x{meta['height']}, " if meta else ""
+                print(f"  ✅ [screenshot] {project['name']}: {path} "
+                      f"({status}, {size}{path.stat().st_size//1024}KB)")
+            else:
+                project['screenshot_path'] = ''
+                print(f"  ⚠️  Will use title card fallback for {project['name']}")
+        except Exception as e:
+            print(f"  ⚠️  [screenshot] Exception for {project['name']}: {e}")
+            project['screenshot_path'] = ''
+        return project['screenshot_path']
+
     async def prepare_assets(self):
         """Generate graphics and audio for projects"""
         tasks = []
@@ -126,53 +160,10 @@ class VideoSuiteAutomated:
         # 1. GitHub page screenshots for longform scroll segments
         # Run in a subprocess to avoid sync_playwright conflict with asyncio event loop
         print(f"\n📸 Capturing GitHub page screenshots...")
+        prefetch([p['github_url'] for p in self.projects])
         for project in self.projects:
-            try:
-                print(f"  [screenshot] Capturing {project['name']}...")
-                result = subprocess.run(
-                    [sys.executable, "services/github_screenshot.py", project['github_url']],
-                    capture_output=True, text=True, timeout=60,
-                    cwd=str(Path(__file__).parent.parent.parent)
-                )
-                
-                print(f"  [screenshot] Process output:")
-                print(f"      stdout preview: {result.stdout[-150:] if result.stdout else 'None'}")
-                print(f"      stderr preview: {result.stderr[-150:] if result.stderr else 'None'}")
-                
-                # Parse the output path from the script's stdout
-                screenshot_path = None
-                for line in result.stdout.splitlines():
-                    if line.startswith("Screenshot saved to:"):
-                        screenshot_path = line.split(":", 1)[1].strip()
-                        break
-                
-                if not screenshot_path:
-                    # Derive expected path the same way github_screenshot.py does
-                    import re as _re
-                    m = _re.search(r"github\.com/([^/]+)/([^/]+)", project['github_url'])
-                    if m:
-                        slug = f"{m.group(1)}_{m.group(2).rstrip('/')}".lower().replace("-", "_")
-                        screenshot_path = f"assets/screenshots/{slug}_github.png"
-                
-                print(f"  [screenshot] Derived path: {screenshot_path}")
-                print(f"  [screenshot] Path exists: {os.path.exists(screenshot_path) if screenshot_path else 'N/A'}")
-                
-                if screenshot_path and os.path.exists(screenshot_path):
-                    file_size = os.path.getsize(screenshot_path)
-                    project['screenshot_path'] = screenshot_path
-                    print(f"  ✅ [screenshot] {project['name']}: {screenshot_path} ({file_size//1024}KB)")
-                else:
-                    project['screenshot_path'] = ''
-                    print(f"  ❌ [screenshot] Failed: {result.returncode}")
-                    if result.stderr:
-                        print(f"      Error details: {result.stderr[-300:]}")
-                    print(f"  ⚠️  Will use title card fallback for {project['name']}")
-            except subprocess.TimeoutExpired:
-                print(f"  ⚠️  [screenshot] Timeout for {project['name']} - will use fallback")
-                project['screenshot_path'] = ''
-            except Exception as e:
-                print(f"  ⚠️  [screenshot] Exception for {project['name']}: {e}")
-                project['screenshot_path'] = ''
+            self._capture_screenshot(project)
+        print(screenshot_cache_summary())
 
         # 2. Prepare Main Video Assets (horizontal graphics for shorts/thumbnails)
         print(f"\n🎨 Generating Main Video Assets (Horizontal)...")
@@ -209,7 +200,11 @@ class VideoSuiteAutomated:
 
     async def generate_minimax_enhancement(self, project) -> Optional[str]:
         """Generate multiple unique MiniMax clips to fill the narration time exactly"""
-        if not self.use_minimax or not self.minimax_generator or not self.minimax_generator.enabled:
+        if not getattr(self, 'use_minimax', False):
+            return None
+        from services.minimax_jobs import ClipRequest, get_clip_job_manager
+        manager = get_clip_job_manager()
+        if not manager.enabled:
             return None
         
         print(f"🎬 Premium Cinematic Enhancement: {project['name']}")
@@ -235,7 +230,7 @@ class VideoSuiteAutomated:
                 loop = asyncio.get_event_loop()
                 screenshot_paths = await loop.run_in_executor(
                     None, 
-                    self.github_capture.take_multi_screenshots, 
+                    bind_context(self.github_capture.take_multi_screenshots), 
                     project_url, 
                     project_id,
                     num_clips_needed
@@ -244,35 +239,34 @@ class VideoSuiteAutomated:
                 screenshot_paths = []
 
             if not screenshot_paths:
-                print("   ⚠️  Capture failed, using fallback UI demo")
-                return self.minimax_generator.generate_ui_demonstration(
-                    f"A professional demonstration of {project['name']}.", 
-                    str(final_video_path)
-                )
+                print("   ⚠️  Capture failed, skipping cinematic enhancement")
+                return None
 
             # 3. Generate unique motions for each clip
-            # Choose unique motions from library, reusing if num_clips > library size
-            motions = random.sample(MOTION_LIBRARY, min(num_clips_needed, len(MOTION_LIBRARY)))
+            # Seeded per project so a re-run rebuilds the same prompts and resumes
+            # any MiniMax jobs a crashed run already submitted
+            rng = random.Random(project_id)
+            motions = rng.sample(MOTION_LIBRARY, min(num_clips_needed, len(MOTION_LIBRARY)))
             if num_clips_needed > len(motions):
                 extra_needed = num_clips_needed - len(motions)
-                motions.extend(random.choices(MOTION_LIBRARY, k=extra_needed))
-            
-            clip_paths = []
-            for i, (path, motion) in enumerate(zip(screenshot_paths, motions)):
-                segment_path = Path(OUTPUT_FOLDER) / f"{project_id}_enh_seg_{i}.mp4"
-                
-                # REUSE existing segments if they exist to save credits
-                if segment_path.exists() and segment_path.stat().st_size > 1000:
-                    print(f"   ♻️  Reusing existing segment {i+1}: {segment_path.name}")
-                    clip_paths.append(str(segment_path))
-                    continue
-                
-                prompt = f"{motion} Modern professional studio lighting. Clean interface for {project['name']}."
-                
-                print(f"   🪄  Animating segment {i+1}/{num_clips_needed}: {motion[:40]}...")
-                res = self.minimax_generator.generate_image_to_video(path, prompt, str(segment_path))
-                if res:
-                    clip_paths.append(res)
+                motions.extend(rng.choices(MOTION_LIBRARY, k=extra_needed))
+
+            # Submit every clip at once, then wait on the manager's single polling
+            # loop (existing segments are reused, pending jobs are resumed)
+            clip_requests = [
+                ClipRequest(
+                    project_id=project_id,
+                    clip_index=i,
+                    image_path=path,
+                    prompt=f"{motion} Modern professional studio lighting. Clean interface for {project['name']}.",
+                    output_path=str(Path(OUTPUT_FOLDER) / f"{project_id}_enh_seg_{i}.mp4"),
+                )
+                for i, (path, motion) in enumerate(zip(screenshot_paths, motions))
+            ]
+            print(f"   🪄  Animating {len(clip_requests)} segments...")
+            loop = asyncio.get_event_loop()
+            clip_paths = await loop.run_in_executor(None, bind_context(manager.generate_clips), clip_requests)
+            clip_paths = [p for p in clip_paths if p]
 
             # 4. Sequence clips
             if len(clip_paths) > 1:
@@ -306,209 +300,43 @@ class VideoSuiteAutomated:
     # ── PIL / FFmpeg renderers (main video rendering) ─────────
 
     def _render_title_card_image(self, project: dict) -> Path:
-        """Generate a 1920x1080 codestream-aesthetic title card PNG via PIL."""
-        from PIL import Image, ImageDraw, ImageFont
-        import textwrap
+        """Generate the 1920x1080 title card PNG in a card worker process."""
+        from components.graphics.batch_renderer import get_card_renderer
+        from components.graphics.title_card import render_title_card_image
 
-        W, H = 1920, 1080
-        BG    = (8,   12,  20)
-        TEAL  = (0,   212, 255)
-        GREEN = (0,   255, 136)
-        WHITE = (255, 255, 255)
-        GRAY  = (136, 153, 170)
-        GOLD  = (255, 215, 0)
-
-        img  = Image.new('RGB', (W, H), BG)
-        draw = ImageDraw.Draw(img)
-
-        # Subtle grid
-        grid = (*TEAL, 15)
-        overlay = Image.new('RGBA', (W, H), (0, 0, 0, 0))
-        od = ImageDraw.Draw(overlay)
-        for x in range(0, W, 60):
-            od.line([(x, 0), (x, H)], fill=grid, width=1)
-        for y in range(0, H, 60):
-            od.line([(0, y), (W, y)], fill=grid, width=1)
-        img.paste(Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB'))
-        draw = ImageDraw.Draw(img)
-
-        # Top bar
-        draw.rectangle([(0, 0), (W, 3)], fill=TEAL)
-
-        # Corner accents
-        s = 40
-        for cx, cy, dx, dy in [(0,0,1,1),(W-1,0,-1,1),(0,H-1,1,-1),(W-1,H-1,-1,-1)]:
-            draw.line([(cx, cy), (cx + dx*s, cy)], fill=GREEN, width=2)
-            draw.line([(cx, cy), (cx, cy + dy*s)], fill=GREEN, width=2)
-
-        def try_font(paths, size):
-            for p in paths:
-                try:
-                    return ImageFont.truetype(p, size)
-                except Exception:
-                    pass
-            return ImageFont.load_default()
-
-        mono  = ['/System/Library/Fonts/Menlo.ttc',
-                 '/System/Library/Fonts/Courier.ttc',
-                 '/Library/Fonts/Courier New.ttf']
-        bold  = ['/System/Library/Fonts/HelveticaNeue.ttc',
-                 '/System/Library/Fonts/Helvetica.ttc',
-                 '/Library/Fonts/Arial Bold.ttf',
-                 '/Library/Fonts/Arial.ttf']
-
-        f_label = try_font(mono, 30)
-        f_name  = try_font(bold, 96)
-        f_desc  = try_font(mono, 32)
-        f_stats = try_font(mono, 30)
-        f_tag   = try_font(mono, 26)
-
-        # "// OPEN SOURCE"
-        label = "// OPEN SOURCE"
-        lw = draw.textlength(label, font=f_label)
-        draw.text(((W - lw) / 2, 90), label, fill=TEAL, font=f_label)
-
-        # Project name
-        name = project.get('name', '')
-        nw = draw.textlength(name, font=f_name)
-        if nw > W - 120:
-            f_name = try_font(bold, int(96 * (W - 120) / nw))
-            nw = draw.textlength(name, font=f_name)
-        name_y = 220
-        draw.text(((W - nw) / 2, name_y), name, fill=WHITE, font=f_name)
-
-        # Divider
-        div_y = name_y + 130
-        draw.rectangle([(W//2 - 200, div_y), (W//2 + 200, div_y + 2)], fill=TEAL)
-
-        # Description
-        desc = project.get('description', '')
-        if desc:
-            dy = div_y + 36
-            for line in textwrap.wrap(desc, width=65)[:2]:
-                lw = draw.textlength(line, font=f_desc)
-                draw.text(((W - lw) / 2, dy), line, fill=GRAY, font=f_desc)
-                dy += 50
-
-        # Stars / forks
-        stars    = project.get('stars', 0) or 0
-        forks    = project.get('forks', 0) or 0
-        language = project.get('language', '') or ''
-        topics   = project.get('topics',   []) or []
-
-        def fmt(n):
-            return f"{n/1000:.1f}k" if n >= 1000 else str(n)
-
-        sy = H - 175
-        draw.text((80,  sy), f"\u2605 {fmt(stars)} stars", fill=GOLD, font=f_stats)
-        draw.text((360, sy), f"\u2442 {fmt(forks)} forks", fill=GRAY, font=f_stats)
-
-        # Tag pills
-        tags = ([language] if language else []) + list(topics)[:3]
-        px, py = 80, sy + 58
-        for tag in tags:
-            tw  = int(draw.textlength(tag, font=f_tag))
-            pad = 14
-            pw  = tw + pad * 2
-            draw.rounded_rectangle([(px, py), (px + pw, py + 42)],
-                                    radius=8, fill=(0, 40, 60), outline=TEAL, width=1)
-            draw.text((px + pad, py + 8), tag, fill=TEAL, font=f_tag)
-            px += pw + 12
-
-        out = Path(OUTPUT_FOLDER) / f"{project['id']}_title_card.png"
-        img.save(str(out))
-        return out
+        path = get_card_renderer().call(render_title_card_image, project, OUTPUT_FOLDER,
+                                        label=f"title:{project['id']}")
+        return Path(path)
 
     def _render_github_scroll_ffmpeg(self, screenshot_path: str,
                                       output_path: Path, duration: float = 38.0):
         """
         Zoom in (2s) → scroll top-to-bottom (duration-4s) → zoom out (2s).
-        Generates frames with Pillow and pipes to FFmpeg.
+        Generates frames with Pillow and pipes to FFmpeg; long scrolls are
+        split into chunks encoded in parallel worker processes.
         """
-        from PIL import Image
-
         FPS       = 30
-        W, H      = 1920, 1080
-        BG        = (8, 12, 20)
-        MIN_SCALE = 0.28
-        MAX_SCROLL_PX = 2200
         ZOOM_S    = 2.0
 
         # Limit maximum scroll duration to prevent excessive processing
         duration = min(duration, 30.0)  # Cap at 30 seconds max
 
-        zoom_in_f  = int(ZOOM_S * FPS)
-        zoom_out_f = int(ZOOM_S * FPS)
-        scroll_f   = int(duration * FPS) - zoom_in_f - zoom_out_f
-        total_f    = zoom_in_f + scroll_f + zoom_out_f
+        total_f   = int(duration * FPS)
+        animation = ScrollAnimation(screenshot_path, total_f, int(ZOOM_S * FPS))
 
-        src = Image.open(screenshot_path).convert('RGB')
-        sw, sh = src.size
-        scaled_h = int(sh * (W / sw))
-        src = src.resize((W, scaled_h), Image.LANCZOS)
-        max_scroll = min(MAX_SCROLL_PX, max(0, scaled_h - H))
-
-        cmd = [
-            'ffmpeg', '-y',
-            '-f', 'rawvideo', '-vcodec', 'rawvideo',
-            '-s', f'{W}x{H}', '-pix_fmt', 'rgb24', '-r', str(FPS),
-            '-i', 'pipe:0',
-            '-c:v', 'libx264', '-preset', 'fast', '-crf', '18',
-            '-pix_fmt', 'yuv420p',
-            str(output_path),
-        ]
-        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
-                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         try:
-            for n in range(total_f):
-                # Check if process is still alive before writing
-                if proc.poll() is not None:
-                    raise RuntimeError("FFmpeg process died during frame generation")
-                
-                if n < zoom_in_f:
-                    t = n / zoom_in_f
-                    scale    = MIN_SCALE + (1.0 - MIN_SCALE) * t
-                    scroll_y = 0
-                elif n < zoom_in_f + scroll_f:
-                    scale    = 1.0
-                    t        = (n - zoom_in_f) / max(scroll_f, 1)
-                    scroll_y = int(max_scroll * t)
-                else:
-                    t        = (n - zoom_in_f - scroll_f) / max(zoom_out_f, 1)
-                    scale    = 1.0 - (1.0 - MIN_SCALE) * t
-                    scroll_y = max_scroll
-
-                frame = Image.new('RGB', (W, H), BG)
-                if scale >= 0.999:
-                    cy = min(scroll_y, max(0, scaled_h - H))
-                    frame.paste(src.crop((0, cy, W, cy + H)), (0, 0))
-                else:
-                    dw = int(W * scale)
-                    dh = int(H * scale)
-                    cy = min(scroll_y, max(0, scaled_h - H))
-                    ch = min(H, scaled_h - cy)
-                    if ch > 0 and dw > 0 and dh > 0:
-                        region  = src.crop((0, cy, W, cy + ch))
-                        region  = region.resize((dw, int(ch * scale)), Image.LANCZOS)
-                        frame.paste(region, ((W - dw) // 2, (H - int(ch * scale)) // 2))
-                
-                try:
-                    proc.stdin.write(frame.tobytes())
-                except BrokenPipeError:
-                    raise RuntimeError("FFmpeg pipe broken - process likely crashed")
-
-            _, stderr = proc.communicate()
-            if proc.returncode != 0:
-                print(f"  ⚠️  Scroll encode failed: {stderr[-200:].decode(errors='replace')}")
+            animation.prepare()  # Builds the raw artifact once, before any chunk workers
+            encode_frames(animation, total_f, SCROLL_W, SCROLL_H, FPS, output_path, [
+                '-c:v', 'libx264', '-preset', 'fast', '-crf', '18',
+                '-pix_fmt', 'yuv420p',
+            ])
         except Exception as e:
-            if proc.poll() is None:
-                proc.kill()
             print(f"  ⚠️  Scroll render error: {e}")
 
     def _create_fallback_screenshot(self, project: dict) -> Optional[str]:
         """Create a fallback GitHub-style screenshot when capture fails."""
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
             
             fallback_path = Path(OUTPUT_FOLDER) / f"{project['id']}_fallback_github.png"
             if fallback_path.exists():
@@ -534,23 +362,9 @@ class VideoSuiteAutomated:
             stars = project.get('stars', 0) or 0
             forks = project.get('forks', 0) or 0
             
-            def try_font(size):
-                fonts = [
-                    "/System/Library/Fonts/Menlo.ttc",
-                    "/System/Library/Fonts/Helvetica.ttc", 
-                    "/Library/Fonts/Arial.ttf",
-                    "/System/Library/Fonts/Courier New.ttf"
-                ]
-                for font in fonts:
-                    try:
-                        return ImageFont.truetype(font, size)
-                    except:
-                        pass
-                return ImageFont.load_default()
-            
-            font_large = try_font(48)
-            font_medium = try_font(28)
-            font_small = try_font(20)
+            font_large = get_font('mono', 48)
+            font_medium = get_font('mono', 28)
+            font_small = get_font('mono', 20)
             
             # Repository name in header area
             draw.text((20, header_height + 20), repo_name, fill=BLACK, font=font_large)
@@ -583,40 +397,47 @@ class VideoSuiteAutomated:
             print(f"  ⚠️  Failed to create fallback screenshot: {e}")
             return None
 
-    def _render_segment_ffmpeg(self, project: dict, i: int, audio_path: str) -> Path:
-        """Render one project segment: title card (4s) + scroll (matched to audio)."""
-        FPS             = 30
-        title_dur       = 4
-        
-        # Calculate segment duration based on actual audio length
+    SEGMENT_FPS = 30
+    TITLE_DUR = 4
+    # Encode settings of the title/card clips inside a project segment
+    TITLE_ARGS = ('-c:v', 'libx264', '-preset', 'fast', '-crf', '18')
+    TITLE_VF = ('scale=1920:1080:force_original_aspect_ratio=decrease,'
+                'pad=1920:1080:(ow-iw)/2:(oh-ih)/2,format=yuv420p')
+
+    def _segment_durations(self, audio_path: str) -> tuple:
+        """(audio_dur, scroll_dur) for a segment: 4s title card + scroll matched to audio."""
         audio_dur = self._get_audio_duration(audio_path) if audio_path and os.path.exists(audio_path) else 42.0
         segment_dur = max(8.0, audio_dur)  # Minimum 8s total (4s title + 4s scroll)
-        scroll_dur = max(4.0, segment_dur - title_dur)  # Minimum 4s scroll
-        
-        pid             = project['id']
-        
-        # Check cache for existing segment (performance optimization)
-        cache_key = f"{pid}_seg_{int(audio_dur)}s"
+        scroll_dur = max(4.0, segment_dur - self.TITLE_DUR)  # Minimum 4s scroll
+        return audio_dur, scroll_dur
+
+    @staticmethod
+    def _cached_segment(i: int) -> Optional[Path]:
+        """Return seg_{i}.mp4 if a previous run already rendered it (performance optimization)."""
         cached_path = Path(OUTPUT_FOLDER) / f"seg_{i:03d}.mp4"
-        
         if cached_path.exists() and cached_path.stat().st_size > 100000:  # More than 100KB
-            print(f"  ♻️  Using cached segment: {cached_path.name}")
             return cached_path
+        return None
+
+    def _render_title_clip(self, project: dict) -> tuple:
+        """Render the title card PNG and its 4s clip. Returns (title_card, title_mp4)."""
+        FPS = self.SEGMENT_FPS
+        pid = project['id']
 
         print(f"  🖼️  Title card...")
         title_card = self._render_title_card_image(project)
 
         title_mp4 = Path(OUTPUT_FOLDER) / f"tmp_{pid}_title.mp4"
-        subprocess.run([
-            'ffmpeg', '-y', '-loop', '1', '-framerate', str(FPS),
-            '-i', str(title_card),
-            '-c:v', 'libx264', '-preset', 'fast', '-crf', '18',
-            '-t', str(title_dur), '-r', str(FPS),
-            '-vf', 'scale=1920:1080:force_original_aspect_ratio=decrease,'
-                   'pad=1920:1080:(ow-iw)/2:(oh-ih)/2,format=yuv420p',
-            str(title_mp4),
-        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        encode_still(title_card, title_mp4, self.TITLE_DUR, fps=FPS,
+                     video_args=self.TITLE_ARGS, vf=self.TITLE_VF)
+        return title_card, title_mp4
 
+    def _render_scroll_clip(self, project: dict, scroll_dur: float) -> Optional[Path]:
+        """
+        Render the screenshot scroll clip (or the fallback screenshot's).
+        Returns None when neither exists - the caller extends the title card.
+        """
+        pid         = project['id']
         scroll_mp4  = Path(OUTPUT_FOLDER) / f"tmp_{pid}_scroll.mp4"
         screenshot  = project.get('screenshot_path', '')
         
@@ -630,22 +451,27 @@ class VideoSuiteAutomated:
             print(f"      Size: {file_size} bytes ({file_size//1024}KB)")
             print(f"  📜 Scroll animation ({scroll_dur}s) using screenshot...")
             self._render_github_scroll_ffmpeg(screenshot, scroll_mp4, duration=scroll_dur)
-        else:
-            print(f"  ⚠️  No screenshot available — creating fallback...")
-            fallback_path = self._create_fallback_screenshot(project)
-            if fallback_path and os.path.exists(fallback_path):
-                print(f"  📜 Scroll animation ({scroll_dur}s) using fallback...")
-                self._render_github_scroll_ffmpeg(fallback_path, scroll_mp4, duration=scroll_dur)
-            else:
-                print(f"  ⚠️  No fallback available — extending title card")
-                subprocess.run([
-                    'ffmpeg', '-y', '-loop', '1', '-framerate', str(FPS),
-                    '-i', str(title_card),
-                    '-c:v', 'libx264', '-preset', 'fast', '-crf', '18',
-                    '-t', str(scroll_dur), '-r', str(FPS),
-                    '-vf', 'scale=1920:1080,format=yuv420p',
-                    str(scroll_mp4),
-                ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            return scroll_mp4
+
+        print(f"  ⚠️  No screenshot available — creating fallback...")
+        fallback_path = self._create_fallback_screenshot(project)
+        if fallback_path and os.path.exists(fallback_path):
+            print(f"  📜 Scroll animation ({scroll_dur}s) using fallback...")
+            self._render_github_scroll_ffmpeg(fallback_path, scroll_mp4, duration=scroll_dur)
+            return scroll_mp4
+        return None
+
+    def _mux_segment(self, project: dict, i: int, title_card: Path, title_mp4: Path,
+                     scroll_mp4: Optional[Path], scroll_dur: float, audio_path: str) -> Path:
+        """Join title + scroll clips, mux the narration and clean up temp files."""
+        FPS = self.SEGMENT_FPS
+        pid = project['id']
+
+        if scroll_mp4 is None:
+            print(f"  ⚠️  No fallback available — extending title card")
+            scroll_mp4 = Path(OUTPUT_FOLDER) / f"tmp_{pid}_scroll.mp4"
+            encode_still(title_card, scroll_mp4, scroll_dur, fps=FPS,
+                         video_args=self.TITLE_ARGS, vf='scale=1920:1080,format=yuv420p')
 
         concat_txt = Path(OUTPUT_FOLDER) / f"tmp_{pid}_concat.txt"
         videoonly  = Path(OUTPUT_FOLDER) / f"tmp_{pid}_vid.mp4"
@@ -690,6 +516,18 @@ class VideoSuiteAutomated:
 
         return seg_out
 
+    def _render_segment_ffmpeg(self, project: dict, i: int, audio_path: str) -> Path:
+        """Render one project segment: title card (4s) + scroll (matched to audio)."""
+        cached_path = self._cached_segment(i)
+        if cached_path:
+            print(f"  ♻️  Using cached segment: {cached_path.name}")
+            return cached_path
+
+        _, scroll_dur = self._segment_durations(audio_path)
+        title_card, title_mp4 = self._render_title_clip(project)
+        scroll_mp4 = self._render_scroll_clip(project, scroll_dur)
+        return self._mux_segment(project, i, title_card, title_mp4, scroll_mp4, scroll_dur, audio_path)
+
     def _render_intro_ffmpeg(self, episode_title: str,
                               audio_path: str, output_path: Path):
         """
@@ -699,7 +537,7 @@ class VideoSuiteAutomated:
         Audio is normalized to 48 kHz stereo to match all other segments.
         Falls back to static branding card if PIL fails.
         """
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
 
         FPS = 30
         W, H = 1920, 1080
@@ -712,23 +550,9 @@ class VideoSuiteAutomated:
 
         channel_name = CONFIG.get('branding', {}).get('channel_name', 'OpenSourceScribes')
 
-        def try_font(size):
-            candidates = [
-                "/System/Library/Fonts/HelveticaNeue.ttc",
-                "/System/Library/Fonts/Supplemental/Arial.ttf",
-                "/Library/Fonts/Arial.ttf",
-                "/System/Library/Fonts/Helvetica.ttc",
-            ]
-            for p in candidates:
-                try:
-                    return ImageFont.truetype(p, size)
-                except Exception:
-                    pass
-            return ImageFont.load_default()
-
-        f_channel = try_font(96)
-        f_title   = try_font(42)
-        f_logo    = try_font(28)
+        f_channel = get_font('sans', 96)
+        f_title   = get_font('sans', 42)
+        f_logo    = get_font('sans', 28)
 
         # Enhanced prominent particles (more, larger, brighter)
         import random as _rng
@@ -752,155 +576,139 @@ class VideoSuiteAutomated:
             '-c:v', 'libx264', '-preset', 'fast', '-crf', '18',
             '-pix_fmt', 'yuv420p', str(vid_only),
         ]
-        proc = subprocess.Popen(encode_cmd, stdin=subprocess.PIPE,
-                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-        animated_ok = True
-        try:
-            for n in range(total_f):
-                # Check process health
-                if proc.poll() is not None:
-                    raise RuntimeError("FFmpeg process died during intro animation")
-                
-                img  = Image.new('RGB', (W, H), BG)
-                draw = ImageDraw.Draw(img)
-
-                # More dramatic gradient with vibrant colors
-                for y in range(0, H, 2):
-                    t = y / H
-                    gradient_color = (
-                        int(5 + 25 * t),
-                        int(8 + 30 * t), 
-                        int(20 + 50 * t + 20 * (1 - abs(t - 0.5) * 2))
-                    )
-                    draw.line([(0, y), (W, y)], fill=gradient_color)
-
-                # Subtle tech grid background — animate slightly
-                for gx in range(0, W, 40):
-                    alpha = int(60 + 40 * (gx / W))
-                    draw.line([(gx, 0), (gx, H)], fill=(alpha, int(alpha * 1.5), alpha * 3))
-                for gy in range(0, H, 40):
-                    alpha = int(60 + 40 * (gy / H))
-                    draw.line([(0, gy), (W, gy)], fill=(alpha, int(alpha * 1.5), alpha * 3))
-
-                # Enhanced prominent particles — fade in faster and brighter
-                p_alpha = min(1.0, n / (FPS * 0.5))  # Faster fade-in
-                for px, py, pr, pop in particles:
-                    pa = pop * p_alpha
-                    # Brighter, vibrant colors
-                    base_c = (int(BG[0] + (200 - BG[0]) * pa),
-                              int(BG[1] + (220 - BG[1]) * pa),
-                              int(BG[2] + (255 - BG[2]) * pa))
-                    # Add glow effect
-                    glow_color = (min(255, base_c[0] + 30), min(255, base_c[1] + 30), min(255, base_c[2] + 30))
-                    draw.ellipse([(px - pr, py - pr), (px + pr, py + pr)], fill=base_c)
-                    
-                    # Outer glow for larger particles
-                    if pr > 50:
-                        draw.ellipse([(px - pr+8, py - pr+8), (px + pr+8, py + pr+8)], 
-                                    outline=glow_color, width=2)
-
-                # Channel name — enhanced reveal with scale effect
-                ch_t = min(1.0, n / (FPS * 1.2))  # Longer reveal
-                if ch_t > 0:
-                    scale = 0.8 + 0.2 * ch_t  # Scale up effect
-                    drift = int(60 * (1.0 - ch_t))
-                    ch_y  = int(H * 0.4 - 130 + drift)
-                    
-                    # Vibrant color gradient for text
-                    cr = int(100 + 150 * ch_t)
-                    cg = int(170 + 85 * ch_t)
-                    cb = 255
-                    
-                    try:
-                        cw_scaled = int(draw.textlength(channel_name, font=f_channel) * scale)
-                    except Exception:
-                        cw_scaled = int(len(channel_name) * 48 * scale)
-                    
-                    # Position with scaling effect
-                    ch_x = (W - cw_scaled) // 2
-                    
-                    # Enhanced shadow for depth
-                    try:
-                        draw.text(((W - cw_scaled) // 2, ch_y + 4), channel_name,
-                                  fill=(0, 0, 0), font=f_channel)
-                    except:
-                        pass
-                    
-                    draw.text((ch_x, ch_y), channel_name,
-                              fill=(cr, cg, cb), font=f_channel)
-                    
-                    # Enhanced underline with gradient effect
-                    uw = int(250 * ch_t)
-                    ul_c = (int(cr * 0.9), int(cg * 0.9), 240)
-                    draw.rectangle([(W//2 - uw//2, ch_y + 122),
-                                    (W//2 + uw//2, ch_y + 126)], fill=ul_c)
-
-                # Episode title — typing effect reveal
-                et_raw = max(0.0, n / FPS - 2.0)  # Start after channel name
-                et_t   = min(1.0, et_raw / 1.2)
-                if et_t > 0:
-                    # Typing effect - reveal characters progressively
-                    chars_to_show = int(len(episode_title) * et_t)
-                    visible_text = episode_title[:max(1, chars_to_show)]
-                    
-                    er, eg, eb = int(200 + 55 * et_t), int(210 + 45 * et_t), 255
-                    
-                    try:
-                        tw = int(draw.textlength(visible_text, font=f_title))
-                    except Exception:
-                        tw = int(len(visible_text) * 20)
-                    
-                    draw.text(((W - tw) // 2, int(H * 0.5 + 90)),
-                              visible_text, fill=(er, eg, eb), font=f_title)
-                    
-                    # Blinking cursor effect
-                    if chars_to_show < len(episode_title) and n % 20 < 10:
-                        cursor_x = ((W - tw) // 2) + tw + 8
-                        draw.rectangle([(cursor_x, int(H * 0.5 + 85)),
-                                      (cursor_x + 8, int(H * 0.5 + 125))], fill=(er, eg, eb))
-
-                # Logo/welcome text — fade in later
-                logo_raw = max(0.0, n / FPS - 3.5)
-                logo_t = min(1.0, logo_raw / 1.5)
-                if logo_t > 0:
-                    lr, lg, lb = int(180 * logo_t), int(190 * logo_t), 220
-                    
-                    try:
-                        lw = int(draw.textlength(welcome_text, font=f_logo))
-                    except Exception:
-                        lw = int(len(welcome_text) * 16)
-                    
-                    draw.text(((W - lw) // 2, H - 80), welcome_text,
-                              fill=(lr, lg, lb), font=f_logo)
 
+        def draw_frame(n, slot):
+            img  = Image.new('RGB', (W, H), BG)
+            draw = ImageDraw.Draw(img)
+
+            # More dramatic gradient with vibrant colors
+            for y in range(0, H, 2):
+                t = y / H
+                gradient_color = (
+                    int(5 + 25 * t),
+                    int(8 + 30 * t), 
+                    int(20 + 50 * t + 20 * (1 - abs(t - 0.5) * 2))
+                )
+                draw.line([(0, y), (W, y)], fill=gradient_color)
+
+            # Subtle tech grid background — animate slightly
+            for gx in range(0, W, 40):
+                alpha = int(60 + 40 * (gx / W))
+                draw.line([(gx, 0), (gx, H)], fill=(alpha, int(alpha * 1.5), alpha * 3))
+            for gy in range(0, H, 40):
+                alpha = int(60 + 40 * (gy / H))
+                draw.line([(0, gy), (W, gy)], fill=(alpha, int(alpha * 1.5), alpha * 3))
+
+            # Enhanced prominent particles — fade in faster and brighter
+            p_alpha = min(1.0, n / (FPS * 0.5))  # Faster fade-in
+            for px, py, pr, pop in particles:
+                pa = pop * p_alpha
+                # Brighter, vibrant colors
+                base_c = (int(BG[0] + (200 - BG[0]) * pa),
+                          int(BG[1] + (220 - BG[1]) * pa),
+                          int(BG[2] + (255 - BG[2]) * pa))
+                # Add glow effect
+                glow_color = (min(255, base_c[0] + 30), min(255, base_c[1] + 30), min(255, base_c[2] + 30))
+                draw.ellipse([(px - pr, py - pr), (px + pr, py + pr)], fill=base_c)
+                
+                # Outer glow for larger particles
+                if pr > 50:
+                    draw.ellipse([(px - pr+8, py - pr+8), (px + pr+8, py + pr+8)], 
+                                outline=glow_color, width=2)
+
+            # Channel name — enhanced reveal with scale effect
+            ch_t = min(1.0, n / (FPS * 1.2))  # Longer reveal
+            if ch_t > 0:
+                scale = 0.8 + 0.2 * ch_t  # Scale up effect
+                drift = int(60 * (1.0 - ch_t))
+                ch_y  = int(H * 0.4 - 130 + drift)
+                
+                # Vibrant color gradient for text
+                cr = int(100 + 150 * ch_t)
+                cg = int(170 + 85 * ch_t)
+                cb = 255
+                
                 try:
-                    proc.stdin.write(img.tobytes())
-                except BrokenPipeError:
-                    raise RuntimeError("FFmpeg pipe broken - process likely crashed")
+                    cw_scaled = int(text_width(channel_name, 'sans', 96) * scale)
+                except Exception:
+                    cw_scaled = int(len(channel_name) * 48 * scale)
+                
+                # Position with scaling effect
+                ch_x = (W - cw_scaled) // 2
+                
+                # Enhanced shadow for depth
+                try:
+                    draw.text(((W - cw_scaled) // 2, ch_y + 4), channel_name,
+                              fill=(0, 0, 0), font=f_channel)
+                except:
+                    pass
+                
+                draw.text((ch_x, ch_y), channel_name,
+                          fill=(cr, cg, cb), font=f_channel)
+                
+                # Enhanced underline with gradient effect
+                uw = int(250 * ch_t)
+                ul_c = (int(cr * 0.9), int(cg * 0.9), 240)
+                draw.rectangle([(W//2 - uw//2, ch_y + 122),
+                                (W//2 + uw//2, ch_y + 126)], fill=ul_c)
+
+            # Episode title — typing effect reveal
+            et_raw = max(0.0, n / FPS - 2.0)  # Start after channel name
+            et_t   = min(1.0, et_raw / 1.2)
+            if et_t > 0:
+                # Typing effect - reveal characters progressively
+                chars_to_show = int(len(episode_title) * et_t)
+                visible_text = episode_title[:max(1, chars_to_show)]
+                
+                er, eg, eb = int(200 + 55 * et_t), int(210 + 45 * et_t), 255
+                
+                try:
+                    tw = int(text_width(visible_text, 'sans', 42))
+                except Exception:
+                    tw = int(len(visible_text) * 20)
+                
+                draw.text(((W - tw) // 2, int(H * 0.5 + 90)),
+                          visible_text, fill=(er, eg, eb), font=f_title)
+                
+                # Blinking cursor effect
+                if chars_to_show < len(episode_title) and n % 20 < 10:
+                    cursor_x = ((W - tw) // 2) + tw + 8
+                    draw.rectangle([(cursor_x, int(H * 0.5 + 85)),
+                                  (cursor_x + 8, int(H * 0.5 + 125))], fill=(er, eg, eb))
+
+            # Logo/welcome text — fade in later
+            logo_raw = max(0.0, n / FPS - 3.5)
+            logo_t = min(1.0, logo_raw / 1.5)
+            if logo_t > 0:
+                lr, lg, lb = int(180 * logo_t), int(190 * logo_t), 220
+                
+                try:
+                    lw = int(text_width(welcome_text, 'sans', 28))
+                except Exception:
+                    lw = int(len(welcome_text) * 16)
+                
+                draw.text(((W - lw) // 2, H - 80), welcome_text,
+                          fill=(lr, lg, lb), font=f_logo)
+
+            return frame_bytes(img)
 
-            _, stderr = proc.communicate()
-            if proc.returncode != 0:
+        animated_ok = True
+        sink = RawFrameSink(encode_cmd, W, H)
+        try:
+            sink.run(total_f, draw_frame)
+            if sink.returncode != 0:
                 animated_ok = False
                 print(f"  ⚠️  Intro animation encode failed: "
-                      f"{stderr[-120:].decode(errors='replace')}")
+                      f"{sink.stderr_text[-120:]}")
         except Exception as exc:
-            if proc.poll() is None:
-                proc.kill()
             animated_ok = False
             print(f"  ⚠️  Intro animation failed ({exc}), using static card")
 
         if not animated_ok:
             from components.graphics.branding import create_intro_card
             card = create_intro_card(CONFIG)
-            subprocess.run([
-                'ffmpeg', '-y', '-loop', '1', '-framerate', str(FPS),
-                '-i', str(card),
-                '-c:v', 'libx264', '-preset', 'fast', '-crf', '18',
-                '-t', str(dur), '-r', str(FPS),
-                '-vf', 'scale=1920:1080:force_original_aspect_ratio=decrease,'
-                       'pad=1920:1080:(ow-iw)/2:(oh-ih)/2,format=yuv420p',
-                str(vid_only),
-            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            encode_still(card, vid_only, dur, fps=FPS,
+                         video_args=self.TITLE_ARGS, vf=self.TITLE_VF)
 
         # Merge audio — normalize to 48 kHz stereo so concat demuxer
         # never sees mismatched sample rates between segments.
@@ -973,6 +781,7 @@ class VideoSuiteAutomated:
                 os.remove(output_path)
                 print(f"⚠️  Removed invalid cached audio at {output_path}")
             else:
+                record_cache_hit()
                 return
 
         # 1. MiniMax T2A v2 — international platform (api.minimax.io)
@@ -985,26 +794,27 @@ class VideoSuiteAutomated:
                 speed    = CONFIG.get('voice', {}).get('minimax_speed', 1.0)
                 print(f"🎙️ MiniMax: {processed_text[:50]}...")
                 url = f"https://api.minimax.io/v1/t2a_v2?GroupId={minimax_group}"
-                resp = _req.post(url, headers={
-                    "Authorization": f"Bearer {minimax_key}",
-                    "Content-Type": "application/json",
-                }, json={
-                    "model": "speech-02-hd",
-                    "text": processed_text,
-                    "stream": False,
-                    "voice_setting": {
-                        "voice_id": voice_id,
-                        "speed": speed,
-                        "vol": 1.0,
-                        "pitch": 0,
-                    },
-                    "audio_setting": {
-                        "sample_rate": 32000,
-                        "bitrate": 128000,
-                        "format": "mp3",
-                        "channel": 1,
-                    },
-                }, timeout=60)
+                with METRICS.api_call("minimax_tts"):
+                    resp = _req.post(url, headers={
+                        "Authorization": f"Bearer {minimax_key}",
+                        "Content-Type": "application/json",
+                    }, json={
+                        "model": "speech-02-hd",
+                        "text": processed_text,
+                        "stream": False,
+                        "voice_setting": {
+                            "voice_id": voice_id,
+                            "speed": speed,
+                            "vol": 1.0,
+                            "pitch": 0,
+                        },
+                        "audio_setting": {
+                            "sample_rate": 32000,
+                            "bitrate": 128000,
+                            "format": "mp3",
+                            "channel": 1,
+                        },
+                    }, timeout=60)
                 if resp.status_code == 200:
                     data = resp.json()
                     if data.get("base_resp", {}).get("status_code") == 0:
@@ -1035,10 +845,11 @@ class VideoSuiteAutomated:
                 from hume.tts import PostedUtterance
                 print(f"🎙️ Hume: {processed_text[:50]}...")
                 client = HumeClient(api_key=hume_key)
-                audio_generator = client.tts.synthesize_file(
-                    utterances=[PostedUtterance(text=processed_text)]
-                )
-                audio_bytes = b''.join(chunk for chunk in audio_generator)
+                with METRICS.api_call("hume_tts"):
+                    audio_generator = client.tts.synthesize_file(
+                        utterances=[PostedUtterance(text=processed_text)]
+                    )
+                    audio_bytes = b''.join(chunk for chunk in audio_generator)
                 if len(audio_bytes) < 1000:
                     raise ValueError(f"Hume returned {len(audio_bytes)} bytes")
                 with open(output_path, 'wb') as f:
@@ -1054,7 +865,8 @@ class VideoSuiteAutomated:
         # 3. gTTS (last resort)
         print(f"🎙️ gTTS: {processed_text[:50]}...")
         tts = gTTS(text=processed_text, lang='en')
-        tts.save(output_path)
+        with METRICS.api_call("gtts"):
+            tts.save(output_path)
         try:
             self.trim_audio_silence(output_path)
         except Exception:
@@ -1079,106 +891,30 @@ class VideoSuiteAutomated:
     
     async def create_project_graphic(self, project_name, github_url, output_path):
         """Create horizontal graphic (1920x1080)"""
-        from components.graphics.codestream_graphics import CodeStreamGraphics
+        from components.graphics.batch_renderer import get_card_renderer
+        from components.graphics.codestream_graphics import create_project_graphic
         
         if os.path.exists(output_path):
             return
         
         print(f"   Horizontal: {project_name}")
         
-        graphics = CodeStreamGraphics(output_dir=Path(output_path).parent)
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            graphics.create_project_graphic,
-            project_name,
-            github_url,
-            output_path
-        )
+        # Pillow holds the GIL: render in a card worker process, not a thread
+        await get_card_renderer().render_async(create_project_graphic, project_name, github_url,
+                                               output_path, label=f"graphic:{project_name}")
     
     async def create_shorts_graphic(self, project_name, github_url, output_path):
          """Create vertical graphic (1080x1920)"""
-         from components.graphics.codestream_graphics import CodeStreamGraphics
+         from components.graphics.batch_renderer import get_card_renderer
+         from components.graphics.codestream_graphics import create_shorts_graphic
          
          if os.path.exists(output_path):
              return
          
          print(f"   Vertical: {project_name}")
          
-         graphics = CodeStreamGraphics(output_dir=Path(output_path).parent)
-         graphics.width = 1080
-         graphics.height = 1920
-         
-         loop = asyncio.get_event_loop()
-         await loop.run_in_executor(
-            None,
-            self._generate_vertical_image_sync,
-            graphics,
-            project_name,
-            github_url,
-            output_path
-        )
-
-    def _generate_vertical_image_sync(self, graphics, project_name, github_url, output_path):
-        """Synchronous part of vertical image generation"""
-        from components.graphics.codestream_graphics import COLORS
-        from PIL import Image, ImageDraw, ImageFont
-
-        img = graphics.create_base_image()
-        draw = ImageDraw.Draw(img)
-        stats = graphics.get_github_stats(github_url)
-        
-        margin = 80
-        title_y = 300
-        
-        try:
-            title_font = ImageFont.truetype("Arial Bold.ttf", 80)
-            desc_font = ImageFont.truetype("Arial.ttf", 48)
-            stats_font = ImageFont.truetype("Arial.ttf", 42)
-        except:
-            title_font = ImageFont.load_default()
-            desc_font = ImageFont.load_default()
-            stats_font = ImageFont.load_default()
-        
-        draw.text((margin, title_y), project_name, font=title_font, fill=COLORS['white'])
-        
-        if stats:
-            y_offset = title_y + 150
-            stats_text = f"⭐ {stats.get('stars', 'N/A')} | 🔄 {stats.get('forks', 'N/A')} forks"
-            draw.text((margin, y_offset), stats_text, font=stats_font, fill=COLORS['electric_teal'])
-            y_offset += 80
-            
-            if stats.get('description'):
-                desc = stats['description']
-                words = desc.split()
-                lines = []
-                current_line = []
-                
-                for word in words:
-                    current_line.append(word)
-                    test_line = ' '.join(current_line)
-                    bbox = draw.textbbox((0, 0), test_line, font=desc_font)
-                    if bbox[2] - bbox[0] > 1080 - 2 * margin:
-                        current_line.pop()
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                
-                if current_line:
-                    lines.append(' '.join(current_line))
-                
-                for i, line in enumerate(lines[:3]):
-                    draw.text((margin, y_offset + i * 70), line, font=desc_font, fill=COLORS['soft_gray'])
-        
-        img = graphics.add_grid_pattern(img)
-        img = graphics.add_data_flow_lines(img)
-        img = graphics.add_glow_accents(img)
-        
-        draw = ImageDraw.Draw(img)
-        branding_y = 1920 - 200
-        draw.text((margin, branding_y), "Open Source Scribes", font=desc_font, fill=COLORS['electric_green'])
-        draw.text((1080 - 250, branding_y), "#Shorts", font=stats_font, fill=COLORS['electric_teal'])
-        
-        img.save(output_path)
+         await get_card_renderer().render_async(create_shorts_graphic, project_name, github_url,
+                                                output_path, label=f"short_graphic:{project_name}")
 
     def create_segment(self, project, index, is_short=False):
         """Create video segment"""
@@ -1220,22 +956,14 @@ class VideoSuiteAutomated:
 
         # Full pipeline: Generate video segment
 
-        cmd = [
-            'ffmpeg', '-y',
-            '-loop', '1', '-framerate', '24',
-            '-i', str(Path(image_path).resolve()),
-            '-i', str(Path(audio_path).resolve()),
-            '-r', '24',
-            '-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'stillimage',
-            '-c:a', 'aac', '-b:a', '192k',
-            '-pix_fmt', 'yuv420p',
-            '-shortest',
-            str(Path(output_path).resolve())
-        ]
-
-        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
-        if result.returncode != 0:
-            print(f"⚠️  ffmpeg error (code {result.returncode}): {result.stderr[-500:]}")
+        try:
+            encode_still(Path(image_path).resolve(), Path(output_path).resolve(),
+                         self._get_audio_duration(audio_path), fps=24, video_args=STILL_ARGS,
+                         audio_path=str(Path(audio_path).resolve()),
+                         audio_args=('-c:a', 'aac', '-b:a', '192k'))
+        except subprocess.CalledProcessError as e:
+            print(f"⚠️  ffmpeg error (code {e.returncode}): "
+                  f"{(e.stderr or b'')[-500:].decode(errors='replace')}")
         return str(output_path)
     
     def _fetch_github_stats(self, project: dict) -> tuple:
@@ -1265,6 +993,14 @@ class VideoSuiteAutomated:
             pass
         return 0, 0, project.get('language', ''), project.get('topics', [])
 
+    def _apply_github_stats(self, project: dict) -> None:
+        """Refresh live GitHub stats directly onto the project dict for the title card."""
+        stars, forks, language, topics = self._fetch_github_stats(project)
+        project['stars']    = stars
+        project['forks']    = forks
+        project['language'] = language
+        project['topics']   = topics
+
     def _generate_episode_intro(self):
         """
         Build a unique per-episode intro narration script and title
@@ -1357,11 +1093,7 @@ class VideoSuiteAutomated:
             print(f"\n🎬 Segment {i + 1}/{len(self.projects)}: {project['name']}")
 
             # Refresh GitHub stats directly onto project dict for title card
-            stars, forks, language, topics = self._fetch_github_stats(project)
-            project['stars']    = stars
-            project['forks']    = forks
-            project['language'] = language
-            project['topics']   = topics
+            self._apply_github_stats(project)
 
             audio_path = project.get('audio_path', '')
             seg_out = self._render_segment_ffmpeg(project, i, audio_path)
@@ -1375,21 +1107,13 @@ class VideoSuiteAutomated:
 
             # Mid-roll subscribe card at ~1/3 through
             if i == subscribe_position:
-                sub_card  = Path(OUTPUT_FOLDER) / "subscribe_card.png"
-                sub_audio = Path(OUTPUT_FOLDER) / "subscribe_audio.mp3"
-                if not sub_card.exists():
-                    from components.graphics.branding import create_subscribe_card
-                    create_subscribe_card(CONFIG, str(sub_card))
-                if sub_card.exists() and sub_audio.exists():
-                    print(f"🎬 Mid-roll subscribe card...")
-                    segment_files.append(
-                        self.create_static_segment(str(sub_card), 0,
-                                                   "seg_subscribe.mp4",
-                                                   audio_path=str(sub_audio)))
+                sub_segment = self._subscribe_segment()
+                if sub_segment:
+                    segment_files.append(sub_segment)
 
         # ── Outro ─────────────────────────────────────────────────────────────
         if os.path.exists(outro_path):
-            segment_files.append(self.create_static_segment(outro_path, 5, "seg_outro.mp4"))
+            segment_files.append(self._outro_segment(outro_path))
 
         self.concatenate_segments(segment_files, LONGFORM_VIDEO)
 
@@ -1400,6 +1124,144 @@ class VideoSuiteAutomated:
             except Exception:
                 pass
                 
+    @staticmethod
+    def _scheduler_pools() -> dict:
+        """Per-resource concurrency for produce_longform (override via pipeline.pools in config.json)."""
+        cpu = os.cpu_count() or 4
+        pools = {"tts": 3, "network": 6, "graphics": 4, "ffmpeg": max(2, cpu // 2)}
+        pools.update(CONFIG.get('pipeline', {}).get('pools', {}))
+        return pools
+
+    async def produce_longform(self):
+        """
+        Prepare assets and render the longform video as one per-project
+        dependency graph instead of stage barriers:
+
+            tts ─────────────┬──────────────┐
+            screenshot ──→ scroll render ─→ segment encode ─→ concat
+            stats ──→ title card ─────────┘
+
+        plus the horizontal/vertical graphics, intro, transition, subscribe
+        and outro nodes. Each node starts as soon as its own inputs exist, so
+        early projects encode while later ones are still synthesizing.
+        """
+        from core.task_graph import TaskGraph
+        from components.graphics.branding import create_outro_card
+
+        print(f"\n🗺️  Building longform task graph for {len(self.projects)} projects...")
+        graph = TaskGraph(pools=self._scheduler_pools())
+        # Stale/missing screenshots recapture in the background from the start
+        prefetch([p['github_url'] for p in self.projects])
+
+        segment_nodes = []
+        for i, project in enumerate(self.projects):
+            pid = project['id']
+            project['img_path'] = str(Path(OUTPUT_FOLDER) / f"{pid}_screen.png")
+            project['audio_path'] = str(Path(OUTPUT_FOLDER) / f"{pid}_audio.mp3")
+
+            tts = graph.add(f"tts:{pid}", self.generate_audio,
+                            project['script_text'], project['audio_path'], pool="tts")
+            shot = graph.add(f"screenshot:{pid}", self._capture_screenshot, project, pool="network")
+            stats = graph.add(f"stats:{pid}", self._apply_github_stats, project, pool="network")
+            graph.add(f"graphic:{pid}", self.create_project_graphic,
+                      project['name'], project['github_url'], project['img_path'], pool="graphics")
+
+            def title_node(project=project, i=i):
+                if self._cached_segment(i):
+                    return None
+                return self._render_title_clip(project)
+
+            def scroll_node(project=project, i=i):
+                if self._cached_segment(i):
+                    return None
+                _, scroll_dur = self._segment_durations(project['audio_path'])
+                return self._render_scroll_clip(project, scroll_dur)
+
+            def segment_node(project=project, i=i):
+                cached_path = self._cached_segment(i)
+                if cached_path:
+                    print(f"  ♻️  Using cached segment: {cached_path.name}")
+                    record_cache_hit()
+                    return cached_path
+                title_card, title_mp4 = graph.result(f"title:{project['id']}")
+                scroll_mp4 = graph.result(f"scroll:{project['id']}")
+                _, scroll_dur = self._segment_durations(project['audio_path'])
+                return self._mux_segment(project, i, title_card, title_mp4,
+                                         scroll_mp4, scroll_dur, project['audio_path'])
+
+            title = graph.add(f"title:{pid}", title_node, deps=[stats], pool="ffmpeg")
+            scroll = graph.add(f"scroll:{pid}", scroll_node, deps=[shot, tts], pool="ffmpeg")
+            segment_nodes.append(graph.add(f"segment:{pid}", segment_node,
+                                           deps=[title, scroll, tts], pool="ffmpeg"))
+
+        for project in self.shorts_selection:
+            project['short_img_path'] = str(Path(SHORTS_FOLDER) / f"{project['id']}_short.png")
+            graph.add(f"short_graphic:{project['id']}", self.create_shorts_graphic,
+                      project['name'], project['github_url'], project['short_img_path'], pool="graphics")
+
+        # ── Intro / transition / subscribe / outro ───────────────────────────
+        # Use a dated filename so each run gets a fresh intro (avoids stale cache)
+        intro_audio  = Path(OUTPUT_FOLDER) / f"intro_audio_{current_date_mmdd}.mp3"
+        intro_output = Path(OUTPUT_FOLDER) / "seg_intro.mp4"
+        intro_script, episode_title = self._generate_episode_intro()
+        print(f"   Episode title: {episode_title}")
+        intro_tts = graph.add("tts:intro", self.generate_audio, intro_script, str(intro_audio), pool="tts")
+        graph.add("intro", self._render_intro_ffmpeg, episode_title, str(intro_audio), intro_output,
+                  deps=[intro_tts], pool="ffmpeg")
+
+        # Every dark-frame fade is identical, so render it once and reuse it
+        transition = Path(OUTPUT_FOLDER) / "trans_fade.mp4"
+        graph.add("transition", self._render_fade_transition, transition, 1.0, pool="ffmpeg")
+
+        def outro_node():
+            outro_path = create_outro_card(CONFIG)
+            if os.path.exists(outro_path):
+                return self._outro_segment(outro_path)
+            return None
+
+        graph.add("subscribe", self._subscribe_segment, pool="ffmpeg")
+        graph.add("outro", outro_node, pool="ffmpeg")
+
+        # ── Concat (same order as assemble_longform_video) ───────────────────
+        subscribe_position = max(0, len(self.projects) // 3)
+
+        def concat_node():
+            segment_files = [str(intro_output)]
+            for i, node in enumerate(segment_nodes):
+                segment_files.append(str(graph.result(node)))
+                if i < len(segment_nodes) - 1:
+                    segment_files.append(str(transition))
+                if i == subscribe_position and graph.result("subscribe"):
+                    segment_files.append(graph.result("subscribe"))
+            if graph.result("outro"):
+                segment_files.append(graph.result("outro"))
+
+            print(f"\n🎬 Assembling Longform Video...")
+            self.concatenate_segments(segment_files, LONGFORM_VIDEO)
+            for seg in set(segment_files):
+                try:
+                    if os.path.exists(seg):
+                        os.remove(seg)
+                except Exception:
+                    pass
+            return LONGFORM_VIDEO
+
+        graph.add("concat", concat_node,
+                  deps=["intro", "transition", "subscribe", "outro"] + segment_nodes, pool="ffmpeg")
+
+        await graph.run()
+        print("\n" + graph.report())
+        print(screenshot_cache_summary())
+
+        # Save project data AFTER assets are prepared to include asset paths
+        with open(DATA_OUTPUT_FILE, 'w') as f:
+            json.dump(self.projects, f, indent=4)
+        print(f"\n💾 Saved longform data with asset paths to {DATA_OUTPUT_FILE}")
+
+        if graph.nodes["concat"].status != "done":
+            raise RuntimeError("Longform assembly failed: "
+                               + ", ".join(n.name for n in graph.failed if n.status == "failed"))
+
     def assemble_shorts(self):
         """Assemble individual Shorts"""
         if not self.shorts_selection:
@@ -1445,34 +1307,40 @@ class VideoSuiteAutomated:
             
         print(f"✅ Created {len(self.deep_dive_selection)} Deep Dives in {DEEP_DIVES_FOLDER}/")
 
+    def _subscribe_segment(self):
+        """Mid-roll subscribe segment (card and encode come from the branding cache)."""
+        from components.graphics.branding import cached_segment, create_subscribe_card
+
+        sub_card  = Path(OUTPUT_FOLDER) / "subscribe_card.png"
+        sub_audio = Path(OUTPUT_FOLDER) / "subscribe_audio.mp3"
+        create_subscribe_card(CONFIG, str(sub_card))
+        if not (sub_card.exists() and sub_audio.exists()):
+            return None
+        print(f"🎬 Mid-roll subscribe card...")
+        return cached_segment(
+            'subscribe', sub_card, Path(OUTPUT_FOLDER) / "seg_subscribe.mp4",
+            lambda: self.create_static_segment(str(sub_card), 0, "seg_subscribe.mp4",
+                                               audio_path=str(sub_audio)),
+            audio_path=sub_audio, profile="video_automated.static")
+
+    def _outro_segment(self, outro_path, duration=5):
+        from components.graphics.branding import cached_segment
+
+        return cached_segment(
+            'outro', outro_path, Path(OUTPUT_FOLDER) / "seg_outro.mp4",
+            lambda: self.create_static_segment(outro_path, duration, "seg_outro.mp4"),
+            duration=duration, profile="video_automated.static")
+
     def create_static_segment(self, image_path, duration, output_name, audio_path=None):
-        """Create static video segment"""
+        """Create static video segment (stereo 48kHz audio to match segment format)"""
         output_path = Path(OUTPUT_FOLDER) / output_name
-        
-        cmd = [
-            'ffmpeg', '-y',
-            '-loop', '1', '-framerate', '24',
-            '-i', image_path
-        ]
-        
         if audio_path:
-            # Normalize audio to stereo 48kHz to match segment format
-            cmd.extend([
-                '-i', audio_path,
-                '-af', 'aresample=48000:aformat=channel_layouts=stereo',
-            ])
+            encode_still(image_path, output_path, self._get_audio_duration(audio_path), fps=24,
+                         video_args=STILL_ARGS, audio_path=audio_path,
+                         audio_args=('-af', 'aresample=48000,aformat=channel_layouts=stereo', '-c:a', 'aac'))
         else:
-            # Use stereo 48kHz silent audio to match segment format
-            cmd.extend(['-f', 'lavfi', '-i', 'anullsrc=channel_layout=stereo:sample_rate=48000', '-t', str(duration)])
-            
-        cmd.extend([
-            '-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'stillimage',
-            '-c:a', 'aac',
-            '-pix_fmt', 'yuv420p',
-            str(output_path)
-        ])
-        
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            encode_still(image_path, output_path, duration, fps=24,
+                         video_args=STILL_ARGS, silence_rate=48000)
         return str(output_path)
 
     def concatenate_segments(self, segment_files, output_name):
@@ -1517,38 +1385,62 @@ class VideoSuiteAutomated:
             
         self.auto_select()
         
-        await self.prepare_assets()
-        
-        # Save project data AFTER assets are prepared to include enhanced_video paths
-        with open(DATA_OUTPUT_FILE, 'w') as f:
-            json.dump(self.projects, f, indent=4)
-        print(f"\n💾 Saved longform data with asset paths to {DATA_OUTPUT_FILE}")
-        
-        self.assemble_longform_video()
-        self.assemble_shorts()
-        await self.generate_deep_dives()
+        await self.produce_longform()
+        with METRICS.span("shorts"):
+            self.assemble_shorts()
+        with METRICS.span("deep_dives"):
+            await self.generate_deep_dives()
         
         print("\n📝 Generating content suite (Description, Blog, Social)...")
-        try:
-            generate_description()
-            generate_medium_post()
-            generate_reddit_post()
+        await self.generate_content_suite()
+        
+        # Record published URLs so discovery tools never surface them again
+        self._mark_published(self.projects)
+
+        print("\n" + "="*60)
+        print("✅ WORKFLOW COMPLETE")
+        print("="*60)
+
+    async def generate_content_suite(self):
+        """
+        Run the description, Medium, Reddit and newsletter writers in parallel.
+        Their Claude calls share the global Anthropic slot pool in
+        content.content_engine; the Substack reformat runs once the
+        newsletter is written.
+        """
+        def newsletter_then_reformat():
             generate_newsletter()
             print("✨ Reformatting newsletter for Substack premium layout...")
             try:
                 reformat_newsletter()
             except Exception as re_e:
                 print(f"⚠️ Reformatting failed: {re_e}")
+
+        writers = {
+            "description": generate_description,
+            "medium": generate_medium_post,
+            "reddit": generate_reddit_post,
+            "newsletter": newsletter_then_reformat,
+        }
+
+        def measured(name, writer):
+            with METRICS.span("content", name):
+                return writer()
+
+        loop = asyncio.get_event_loop()
+        results = await asyncio.gather(
+            *[loop.run_in_executor(None, measured, name, writer) for name, writer in writers.items()],
+            return_exceptions=True
+        )
+
+        failed = [name for name, res in zip(writers, results) if isinstance(res, Exception)]
+        for name, res in zip(writers, results):
+            if isinstance(res, Exception):
+                print(f"⚠️ Failed to generate {name}: {res}")
+        if not failed:
             print("✅ Content suite generated successfully")
-        except Exception as e:
-            print(f"⚠️ Failed to generate content suite: {e}")
-        
-        # Record published URLs so discovery tools never surface them again
-        self._mark_published(self.projects)
 
-        print("\n" + "="*60)
-        print("✅ WORKFLOW COMPLETE")
-        print("="*60)
+        print_llm_cache_report()
 
     def _mark_published(self, projects: list, seen_file: str = "published_repos.txt") -> None:
         """Record each project's GitHub URL as published in SurrealDB (and txt fallback)."""
@@ -1588,6 +1480,13 @@ class VideoSuiteAutomated:
                 print(f"📋 Marked {len(new_urls)} repo(s) as published in {seen_file}")
 
 if __name__ == "__main__":
+    from services.http_transport import install_from_env, print_transport_summary
+    install_from_env("video_suite")
+
+    # --profile / PROFILE_STAGES=1: per-stage flamegraphs in the delivery folder
+    from core.profiling import finish_profiling, start_profiling
+    start_profiling()
+
     suite = VideoSuiteAutomated()
 
     # Log the pipeline run to SurrealDB
@@ -1602,6 +1501,9 @@ if __name__ == "__main__":
     import sys as _sys
     try:
         asyncio.run(suite.run())
+        print("\n" + METRICS.summary())
+        print_transport_summary()
+        finish_profiling(DELIVERY_FOLDER)
         if run_id:
             from core.db import DB
             with DB() as _db:
@@ -1611,12 +1513,16 @@ if __name__ == "__main__":
                     success_count=len(suite.projects),
                     error_count=0,
                 )
+                METRICS.flush(run_id, db=_db)
     except Exception as _e:
+        print("\n" + METRICS.summary())
+        finish_profiling(DELIVERY_FOLDER)
         if run_id:
             try:
                 from core.db import DB
                 with DB() as _db:
                     _db.finish_run(run_id, repos_count=0, success_count=0, error_count=1)
+                    METRICS.flush(run_id, db=_db)
             except Exception:
                 pass
         raise
@@ -3,12 +3,12 @@ Video Renderer - Concrete implementation of IVideoRenderer
 Renders video segments: intro, segments, outro, transitions.
 """
 import os
-import math
 from pathlib import Path
 from typing import Dict, Optional
 from PIL import Image, ImageDraw, ImageFont
 
 from interfaces.interfaces import IVideoRenderer, IGraphicsRenderer, IAudioGenerator, IFFmpegExecutor
+from components.video.scroll_animation import ScrollAnimation, W as SCROLL_W, H as SCROLL_H
 
 
 class VideoRenderer(IVideoRenderer):
@@ -284,10 +284,33 @@ class VideoRenderer(IVideoRenderer):
         ])
     
     def _render_scroll_animation(self, screenshot_path: str, output_path: Path, duration: float) -> None:
-        """Render scroll animation for a screenshot."""
-        # Simplified version - create a Ken Burns effect
-        # In production, implement full scroll animation with frame generation
-        self._create_static_video(Path(screenshot_path), output_path, duration)
+        """
+        Render scroll animation for a screenshot: zoom in → scroll → zoom out.
+        
+        Frames are generated on a producer thread and piped to FFmpeg while
+        it encodes; executors without frame piping get a static clip.
+        """
+        if not hasattr(self.ffmpeg_executor, 'execute_frames'):
+            self._create_static_video(Path(screenshot_path), output_path, duration)
+            return
+        
+        W, H = SCROLL_W, SCROLL_H
+        total_f = int(duration * self.fps)
+        animation = ScrollAnimation(screenshot_path, total_f, int(min(2.0, duration / 4) * self.fps))
+        
+        success, output = self.ffmpeg_executor.execute_frames([
+            'ffmpeg', '-y',
+            '-f', 'rawvideo', '-vcodec', 'rawvideo',
+            '-s', f'{W}x{H}', '-pix_fmt', 'rgb24', '-r', str(self.fps),
+            '-i', 'pipe:0',
+            '-c:v', 'libx264', '-preset', 'fast', '-crf', '18',
+            '-pix_fmt', 'yuv420p',
+            str(output_path)
+        ], W, H, total_f, animation)
+        
+        if not success:
+            print(f"    ⚠️  Scroll animation failed ({output[-200:]}), using static clip")
+            self._create_static_video(Path(screenshot_path), output_path, duration)
     
     def _concatenate_videos(self, video_paths: list, output_path: Path) -> None:
         """Concatenate multiple videos."""
@@ -0,0 +1,74 @@
+"""
+Shared async content-generation engine for the Medium, Reddit and newsletter writers.
+
+Each writer builds its prompts (intro, one per project, outro) and hands them
+to generate_sections(), which issues them all concurrently and returns the
+responses in prompt order. Every Anthropic call in the process goes through
+one global slot pool, so running the three writers side by side never puts
+more than ANTHROPIC_MAX_CONCURRENCY requests in flight.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from core.metrics import bind_context
+from core.settings import setting
+
+
+def _max_concurrency(default: int = 6) -> int:
+    """anthropic.max_concurrency from config.json (env ANTHROPIC_MAX_CONCURRENCY wins)."""
+    env = os.environ.get('ANTHROPIC_MAX_CONCURRENCY')
+    if env and env.isdigit():
+        return max(1, int(env))
+    try:
+        return max(1, int(setting('anthropic', 'max_concurrency', default)))
+    except (TypeError, ValueError):
+        return default
+
+
+ANTHROPIC_MAX_CONCURRENCY = _max_concurrency()
+
+# Process-wide: shared by every writer, thread and event loop
+_ANTHROPIC_SLOTS = threading.BoundedSemaphore(ANTHROPIC_MAX_CONCURRENCY)
+
+
+def call_with_slot(call: Callable[[str], str], prompt: str) -> str:
+    """Run one blocking LLM call while holding a global Anthropic slot."""
+    with _ANTHROPIC_SLOTS:
+        return call(prompt)
+
+
+async def generate_sections_async(call: Callable[[str], str], prompts: List[str]) -> List[str]:
+    """
+    Issue all prompts concurrently (bounded by the global slot pool).
+
+    Args:
+        call: Blocking function prompt -> text (e.g. a bound call_claude)
+        prompts: Prompts in output order
+
+    Returns:
+        Responses in the same order as `prompts`
+    """
+    if not prompts:
+        return []
+    loop = asyncio.get_running_loop()
+    workers = min(len(prompts), ANTHROPIC_MAX_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return await asyncio.gather(*[
+            loop.run_in_executor(executor, bind_context(call_with_slot), call, prompt)
+            for prompt in prompts
+        ])
+
+
+def generate_sections(call: Callable[[str], str], prompts: List[str], label: str = "sections") -> List[str]:
+    """Synchronous entry point for generate_sections_async (used by the writers' main())."""
+    started = time.perf_counter()
+    print(f"⚡ Generating {len(prompts)} {label} concurrently "
+          f"(max {ANTHROPIC_MAX_CONCURRENCY} Anthropic calls in flight)...")
+    results = asyncio.run(generate_sections_async(call, prompts))
+    print(f"   {label} ready in {time.perf_counter() - started:.1f}s")
+    return results
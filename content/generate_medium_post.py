@@ -1,6 +1,7 @@
 """
 Generate Medium blog post from project data using Claude API
-Processes projects individually to ensure none are skipped.
+Processes projects individually to ensure none are skipped; the intro,
+project sections and outro are generated concurrently.
 """
 
 import json
@@ -8,6 +9,9 @@ import os
 import datetime
 import anthropic
 
+from content.content_engine import call_with_slot, generate_sections
+from services.llm_cache import cached_completion, print_llm_cache_report
+
 # --- PROMPT TEMPLATES ---
 
 CLICHE_FILTER = """
@@ -98,15 +102,19 @@ def load_projects():
         projects = json.load(f)
     return projects
 
-def call_claude(client, prompt, model="claude-sonnet-4-6", max_tokens=2048):
-    """Helper to call Claude API"""
-    try:
+def call_claude(client, prompt, model="claude-sonnet-4-6", max_tokens=2048, use_cache=True):
+    """Helper to call Claude API (responses are served from the LLM cache when possible)"""
+    def _call():
         message = client.messages.create(
             model=model,
             max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}]
         )
-        return message.content[0].text
+        return message.content[0].text, message.usage.input_tokens, message.usage.output_tokens
+
+    try:
+        return cached_completion("anthropic", model, prompt, {"max_tokens": max_tokens}, _call,
+                                 site="medium_post", use_cache=use_cache)
     except Exception as e:
         print(f"⚠️ API Error: {e}")
         return ""
@@ -147,19 +155,33 @@ def generate_full_post(projects):
         "* [Firecrawl MCP Server](https://www.salishseaconsulting.com/blog/firecrawl-mcp-server/)\n"
     )
 
-    # 1. Introduction
-    print(f"🖋️  Generating Introduction for {n_projects} projects...")
-    intro = call_claude(client, INTRO_PROMPT.format(
+    # 1-3. Introduction, project sections and conclusion — all issued concurrently
+    print(f"🖋️  Generating Introduction, {n_projects} sections and Conclusion...")
+    prompts = [INTRO_PROMPT.format(
         n_projects=n_projects,
         project_summaries=project_summaries,
         cliche_filter=CLICHE_FILTER,
         promo_links=PROMO_LINKS
-    ))
+    )]
+    prompts += [
+        PROJECT_SECTION_PROMPT.format(
+            name=project['name'],
+            url=project['github_url'],
+            description=project.get('script_text', project.get('description', '')),
+            cliche_filter=CLICHE_FILTER
+        )
+        for project in projects
+    ]
+    prompts.append(OUTRO_PROMPT.format(project_names=project_summaries, cliche_filter=CLICHE_FILTER))
+
+    responses = generate_sections(lambda prompt: call_claude(client, prompt), prompts, label="Medium sections")
+    intro, sections, outro = responses[0], responses[1:-1], responses[-1]
+
     full_content.append(f"{n_projects} Open-Source Projects for Your Dev Stack\n")
     full_content.append(intro)
     full_content.append("\n---\n")
 
-    # 2. Project Sections — insert up to 3 images spread evenly across the post
+    # Project Sections — insert up to 3 images spread evenly across the post
     n = len(projects)
     image_slots = set()
     if n >= 1: image_slots.add(0)           # first project
@@ -168,14 +190,7 @@ def generate_full_post(projects):
     image_slots = sorted(image_slots)[:3]   # cap at 3, ascending order
 
     images_used = 0
-    for i, project in enumerate(projects):
-        print(f"📦 [{i+1}/{n_projects}] Generating section for: {project['name']}...")
-        section = call_claude(client, PROJECT_SECTION_PROMPT.format(
-            name=project['name'],
-            url=project['github_url'],
-            description=project.get('script_text', project.get('description', '')),
-            cliche_filter=CLICHE_FILTER
-        ))
+    for i, (project, section) in enumerate(zip(projects, sections)):
         full_content.append(section)
 
         # Insert image for designated slots — path relative to repo root
@@ -189,16 +204,16 @@ def generate_full_post(projects):
 
         full_content.append("\n---\n")
 
-    # 3. Conclusion
-    print("🏁 Generating Patterns & Conclusion...")
-    outro = call_claude(client, OUTRO_PROMPT.format(project_names=project_summaries, cliche_filter=CLICHE_FILTER))
     full_content.append(outro)
 
     # 4. Consistency pass — smooth register differences across sections
     # Use a high token limit since the full post can be 3k–6k words for 15+ projects
     print("✏️  Running consistency pass...")
     raw_text = "\n".join(full_content)
-    smoothed = call_claude(client, CONSISTENCY_PASS_PROMPT.format(content=raw_text), max_tokens=8192)
+    smoothed = call_with_slot(
+        lambda prompt: call_claude(client, prompt, max_tokens=8192),
+        CONSISTENCY_PASS_PROMPT.format(content=raw_text)
+    )
     if smoothed:
         raw_text = smoothed
 
@@ -239,3 +254,4 @@ def main():
 
 if __name__ == "__main__":
     main()
+    print_llm_cache_report()
@@ -1,6 +1,7 @@
 """
 Generate Substack newsletter from project data using Claude API.
 Outputs clean, Substack-native plain text — paste directly, no reformatting needed.
+The editorial, project spotlights and outro are generated concurrently.
 """
 
 import json
@@ -8,6 +9,9 @@ import os
 import datetime
 import anthropic
 
+from content.content_engine import generate_sections
+from services.llm_cache import cached_completion, print_llm_cache_report
+
 # --- PROMPT TEMPLATES ---
 
 CLICHE_FILTER = """
@@ -121,15 +125,19 @@ def load_projects():
                 return json.load(f)
     return None
 
-def call_claude(client, prompt, model="claude-sonnet-4-6"):
-    """Call Claude API and return text response."""
-    try:
+def call_claude(client, prompt, model="claude-sonnet-4-6", use_cache=True):
+    """Call Claude API and return text response (cached by prompt)."""
+    def _call():
         message = client.messages.create(
             model=model,
             max_tokens=4096,
             messages=[{"role": "user", "content": prompt}]
         )
-        return message.content[0].text.strip()
+        return message.content[0].text.strip(), message.usage.input_tokens, message.usage.output_tokens
+
+    try:
+        return cached_completion("anthropic", model, prompt, {"max_tokens": 4096}, _call,
+                                 site="newsletter", use_cache=use_cache)
     except Exception as e:
         print(f"  ⚠️  API Error: {e}")
         return ""
@@ -151,37 +159,42 @@ def generate_full_newsletter(projects):
     # Title — plain text, no markdown header
     sections.append(f"The Scribe's Digest: {n_projects} Open Source Discoveries\n")
 
-    # 1. Editorial
-    print("🖋️  Generating editorial...")
-    editorial = call_claude(client, EDITORIAL_PROMPT.format(
+    # Editorial, project spotlights and outro — all issued concurrently
+    print(f"🖋️  Generating editorial, {n_projects} spotlights and outro...")
+    prompts = [EDITORIAL_PROMPT.format(
         n_projects=n_projects,
         project_summaries=project_summaries,
         cliche_filter=CLICHE_FILTER
+    )]
+    prompts += [
+        PROJECT_SECTION_PROMPT.format(
+            name=project['name'],
+            url=project['github_url'],
+            description=project.get('script_text', project.get('description', '')),
+            cliche_filter=CLICHE_FILTER
+        )
+        for project in projects
+    ]
+    prompts.append(OUTRO_PROMPT.format(
+        project_names=project_names,
+        cliche_filter=CLICHE_FILTER
     ))
-    sections.append(editorial)
+
+    responses = generate_sections(lambda prompt: call_claude(client, prompt), prompts, label="newsletter sections")
+
+    # 1. Editorial
+    sections.append(responses[0])
 
     # 2. Promo links block (plain text, copy-paste friendly)
     sections.append(f"\n{PROMO_LINKS}\n")
 
     # 3. Project sections
-    for i, project in enumerate(projects):
-        print(f"📦  [{i+1}/{n_projects}] {project['name']}...")
-        section = call_claude(client, PROJECT_SECTION_PROMPT.format(
-            name=project['name'],
-            url=project['github_url'],
-            description=project.get('script_text', project.get('description', '')),
-            cliche_filter=CLICHE_FILTER
-        ))
+    for section in responses[1:-1]:
         sections.append(section)
         sections.append("")  # blank line between projects
 
     # 4. Outro
-    print("🏁  Generating outro...")
-    outro = call_claude(client, OUTRO_PROMPT.format(
-        project_names=project_names,
-        cliche_filter=CLICHE_FILTER
-    ))
-    sections.append(outro)
+    sections.append(responses[-1])
 
     full_text = "\n\n".join(sections).strip()
 
@@ -217,3 +230,4 @@ def main():
 
 if __name__ == "__main__":
     main()
+    print_llm_cache_report()
@@ -8,6 +8,9 @@ import os
 import datetime
 import anthropic
 
+from content.content_engine import generate_sections
+from services.llm_cache import cached_completion, print_llm_cache_report
+
 # --- PROMPT TEMPLATES ---
 
 CLICHE_FILTER = """
@@ -103,15 +106,19 @@ def load_projects():
         projects = json.load(f)
     return projects
 
-def call_claude(client, prompt, model="claude-sonnet-4-6"):
-    """Helper to call Claude API"""
-    try:
+def call_claude(client, prompt, model="claude-sonnet-4-6", use_cache=True):
+    """Helper to call Claude API (responses are served from the LLM cache when possible)"""
+    def _call():
         message = client.messages.create(
             model=model,
             max_tokens=2048,
             messages=[{"role": "user", "content": prompt}]
         )
-        return message.content[0].text
+        return message.content[0].text, message.usage.input_tokens, message.usage.output_tokens
+
+    try:
+        return cached_completion("anthropic", model, prompt, {"max_tokens": 2048}, _call,
+                                 site="reddit_post", use_cache=use_cache)
     except Exception as e:
         print(f"⚠️ API Error: {e}")
         return ""
@@ -140,35 +147,36 @@ def generate_full_post(projects):
         "* [Firecrawl MCP Server](https://www.salishseaconsulting.com/blog/firecrawl-mcp-server/)\n"
     )
 
-    # 1. Introduction
-    print(f"🖋️  Generating Reddit Intro...")
-    intro = call_claude(client, INTRO_PROMPT.format(
+    # 1-3. Intro, project snippets and outro — all issued concurrently
+    print(f"🖋️  Generating Reddit Intro, {n_projects} snippets and Outro...")
+    prompts = [INTRO_PROMPT.format(
         n_projects=n_projects, 
         month_year=month_year, 
         project_summaries=project_summaries, 
         cliche_filter=CLICHE_FILTER,
         promo_links=PROMO_LINKS
-    ))
-    full_content.append(intro)
-    full_content.append("\n")
-    
-    # 2. Project Sections
-    for i, project in enumerate(projects):
-        print(f"📦 [{i+1}/{n_projects}] Generating Reddit snippet for: {project['name']}...")
-        section = call_claude(client, PROJECT_SECTION_PROMPT.format(
+    )]
+    prompts += [
+        PROJECT_SECTION_PROMPT.format(
             name=project['name'],
             url=project['github_url'],
             description=project.get('script_text', project.get('description', '')),
             cliche_filter=CLICHE_FILTER
-        ))
+        )
+        for project in projects
+    ]
+    prompts.append(OUTRO_PROMPT.format(project_summaries=project_summaries, cliche_filter=CLICHE_FILTER))
+
+    responses = generate_sections(lambda prompt: call_claude(client, prompt), prompts, label="Reddit sections")
+
+    full_content.append(responses[0])
+    full_content.append("\n")
+    
+    for section in responses[1:-1]:
         full_content.append(section)
         full_content.append("\n")
         
-    # 3. Conclusion
-    print("🏁 Generating Reddit Outro...")
-    outro = call_claude(client, OUTRO_PROMPT.format(project_summaries=project_summaries, cliche_filter=CLICHE_FILTER))
-    full_content.append(outro)
-    
+    full_content.append(responses[-1])
     # 4. Final Cleanup: Remove bare hashtags or asterisks if they leaked into the body
     # but preserve the title's structure.
     raw_text = "\n".join(full_content)
@@ -206,3 +214,4 @@ def main():
 
 if __name__ == "__main__":
     main()
+    print_llm_cache_report()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Output writer for GitHub discovery results.
-Handles writing to github_urls.txt, repo_history.json, and run artifacts.
+Handles writing to github_urls.txt, repo_history.jsonl, and run artifacts.
 """
 
 import json
@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 from discovery.repo_filter import EnrichedRepo
+from discovery.repo_history import RepoHistoryStore, get_history_store
 from utils.mistral_scorer import ScoredRepo
 
 
@@ -17,12 +18,12 @@ class OutputWriter:
     """
     Writes discovery results to multiple output locations:
     - github_urls.txt: Active processing queue
-    - repo_history.json: Permanent dedup history
+    - repo_history.jsonl: Permanent dedup history (append-only)
     - discovery_runs/YYYY-MM-DD.json: Run artifacts
     """
     
     QUEUE_FILE = "github_urls.txt"
-    HISTORY_FILE = "repo_history.json"
+    HISTORY_FILE = RepoHistoryStore.HISTORY_FILE
     RUNS_DIR = "discovery_runs"
     
     def __init__(
@@ -39,16 +40,10 @@ class OutputWriter:
         # Ensure runs directory exists
         Path(self.runs_dir).mkdir(parents=True, exist_ok=True)
     
-    def _load_history(self) -> Dict:
-        """Load existing repo history."""
-        if not os.path.exists(self.history_file):
-            return {}
-        
-        try:
-            with open(self.history_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
+    @property
+    def history(self) -> RepoHistoryStore:
+        """Shared history store (index built once per process)."""
+        return get_history_store(self.history_file)
     
     def write_to_queue(self, repos: List[EnrichedRepo]) -> int:
         """
@@ -71,8 +66,9 @@ class OutputWriter:
     
     def update_history(self, repos: List[EnrichedRepo], run_id: str) -> int:
         """
-        Update repo_history.json with new entries.
-        This is append-only - history never shrinks.
+        Append new entries to repo_history.jsonl.
+        This is append-only - history never shrinks, and only the new
+        lines are written (existing history is never re-read or rewritten).
         
         Args:
             repos: List of repos to add to history
@@ -81,23 +77,10 @@ class OutputWriter:
         Returns:
             Number of entries added
         """
-        history = self._load_history()
-        added_count = 0
-        timestamp = datetime.now().isoformat() + "Z"
-        
-        for repo in repos:
-            # Only add if not already in history
-            if repo.full_name not in history:
-                history[repo.full_name] = {
-                    "url": repo.url,
-                    "added_at": timestamp,
-                    "run_id": run_id
-                }
-                added_count += 1
-        
-        # Write updated history
-        with open(self.history_file, 'w') as f:
-            json.dump(history, f, indent=2)
+        added_count = self.history.add_entries(
+            ({"full_name": repo.full_name, "url": repo.url} for repo in repos),
+            run_id
+        )
         
         print(f"  Added {added_count} entries to {self.history_file}")
         return added_count
@@ -258,7 +241,7 @@ def demo():
     print("\nPreparing to write outputs...")
     print("  Note: This will modify real files in your project!")
     print("  - github_urls.txt")
-    print("  - repo_history.json")
+    print("  - repo_history.jsonl")
     print("  - discovery_runs/<date>.json")
     print("\nTo actually write files, uncomment the write_all() call.")
     
@@ -8,6 +8,9 @@ import json
 import os
 import datetime
 from pathlib import Path
+
+from services.llm_cache import cached_completion, print_llm_cache_report
+
 try:
     from mistralai import Mistral
 except ImportError:
@@ -84,20 +87,29 @@ def find_latest_newsletter():
     
     return None
 
-def reformat_with_mistral(client, raw_content):
-    """Sends the raw content to Mistral with the system prompt"""
+def reformat_with_mistral(client, raw_content, use_cache=True):
+    """Sends the raw content to Mistral with the system prompt (cached by prompt)"""
     print("🤖 Reformatting newsletter with Mistral...")
-    try:
+    model = "mistral-medium-latest"
+    user_prompt = f"Reformat this newsletter:\n\n{raw_content}"
+
+    def _call():
         response = client.chat.complete(
-            model="mistral-medium-latest",
+            model=model,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user",   "content": f"Reformat this newsletter:\n\n{raw_content}"}
+                {"role": "user",   "content": user_prompt}
             ],
             max_tokens=4096,
             temperature=0.3
         )
-        return response.choices[0].message.content
+        usage = response.usage
+        return response.choices[0].message.content, usage.prompt_tokens, usage.completion_tokens
+
+    try:
+        return cached_completion("mistral", model, SYSTEM_PROMPT + "\n\n" + user_prompt,
+                                 {"max_tokens": 4096, "temperature": 0.3}, _call,
+                                 site="reformat_newsletter", use_cache=use_cache)
     except Exception as e:
         print(f"❌ Mistral API Error: {e}")
         return None
@@ -134,3 +146,4 @@ def main():
 
 if __name__ == "__main__":
     main()
+    print_llm_cache_report()
@@ -4,8 +4,12 @@ Generates 5 filled-in Instagram cards (1080x1080) from author pain point source
 All use Pillar 1 (Client Whisperer) brand: teal accent on deep navy.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from components.graphics.fonts import get_font  # noqa: E402
 
 # ── Brand Colors ──────────────────────────────────────────────────────────────
 DEEP_NAVY  = (10, 22, 40)
@@ -22,29 +26,17 @@ OUT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # ── Font Loader ───────────────────────────────────────────────────────────────
 def load_font(size, bold=True):
-    candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold else
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if bold else
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-        "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf" if bold else
-        "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
-    ]
-    for path in candidates:
-        if os.path.exists(path):
-            return ImageFont.truetype(path, size)
-    return ImageFont.load_default()
+    return get_font('sans-bold' if bold else 'sans', size)
 
 def load_mono(size):
-    candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf",
-    ]
-    for path in candidates:
-        if os.path.exists(path):
-            return ImageFont.truetype(path, size)
-    return load_font(size, bold=True)
+    return get_font('mono-bold', size)
 
+def preload_fonts():
+    """Open every font the cards use (card worker initializer)."""
+    for size, bold in [(62, True), (30, False), (26, False), (26, True)]:
+        load_font(size, bold=bold)
+    for size in (22,):
+        load_mono(size)
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 def draw_grid(draw, spacing=54):
@@ -219,12 +211,14 @@ POSTS = [
 
 # ── Run ───────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    for post in POSTS:
-        make_card(
-            filename=post["filename"],
-            headline=post["headline"],
-            sub=post["sub"],
-            body_lines=post["body"],
-            cta=post["cta"],
-        )
-    print("\n✅  All 5 Client Whisperer cards generated.")
+    from components.graphics.batch_renderer import CardJob, CardRenderer, card_summary
+
+    jobs = [CardJob(make_card, kwargs=dict(filename=post["filename"], headline=post["headline"],
+                                           sub=post["sub"], body_lines=post["body"], cta=post["cta"]),
+                    label=post["filename"])
+            for post in POSTS]
+    # Cards render in parallel worker processes, fonts loaded once per worker
+    results = CardRenderer(preload=(preload_fonts,)).render(jobs)
+    print(card_summary(results))
+    if all(r.ok for r in results):
+        print("\n✅  All 5 Client Whisperer cards generated.")
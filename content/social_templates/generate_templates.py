@@ -6,8 +6,12 @@ Generates 3 branded Instagram/Threads template images:
   3. Educational (Pillar 3) — green accent
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from components.graphics.fonts import get_font  # noqa: E402
 
 # ── Brand Colors ──────────────────────────────────────────────────────────────
 DEEP_NAVY     = (10, 22, 40)       # #0a1628
@@ -29,29 +33,17 @@ OUT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # ── Font Loader ───────────────────────────────────────────────────────────────
 def load_font(size, bold=True):
-    candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold else
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if bold else
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-        "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf" if bold else
-        "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
-    ]
-    for path in candidates:
-        if os.path.exists(path):
-            return ImageFont.truetype(path, size)
-    return ImageFont.load_default()
+    return get_font('sans-bold' if bold else 'sans', size)
 
 def load_mono(size):
-    candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf",
-        "/usr/share/fonts/truetype/freefont/FreeMonoBold.ttf",
-    ]
-    for path in candidates:
-        if os.path.exists(path):
-            return ImageFont.truetype(path, size)
-    return load_font(size, bold=True)
+    return get_font('mono-bold', size)
+
+def preload_fonts():
+    """Open every font the cards use (card worker initializer)."""
+    for size, bold in [(68, True), (34, False), (28, False), (26, False), (26, True)]:
+        load_font(size, bold=bold)
+    for size in (22, 20, 18):
+        load_mono(size)
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 def draw_grid(draw, color, alpha=30, spacing=60):
@@ -362,8 +354,14 @@ def make_educational():
 
 # ── Run ───────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
+    from components.graphics.batch_renderer import CardJob, CardRenderer, card_summary
+
     os.makedirs(OUT_DIR, exist_ok=True)
-    make_client_whisperer()
-    make_expose()
-    make_educational()
-    print("\n✅  All 3 templates generated.")
+    jobs = [CardJob(make_client_whisperer, label="client_whisperer"),
+            CardJob(make_expose, label="expose"),
+            CardJob(make_educational, label="educational")]
+    # Cards render in parallel worker processes, fonts loaded once per worker
+    results = CardRenderer(preload=(preload_fonts,)).render(jobs)
+    print(card_summary(results))
+    if all(r.ok for r in results):
+        print("\n✅  All 3 templates generated.")
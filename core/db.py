@@ -5,6 +5,9 @@ Schema:
   repo        — every GitHub repo ever seen, with full metadata and status
   discovery   — log of each discovery run (source, count, timestamp)
   run         — log of each video pipeline run
+  run_span    — per-stage timing/resource metrics, child records of a run
+  minimax_job — MiniMax image-to-video jobs (task IDs survive a crash so a
+                re-run resumes polling instead of paying for regeneration)
 
 Connection URL (config.json → surrealdb.url):
   surrealkv://./opensourcescribes.db   local file, no auth needed
@@ -116,6 +119,38 @@ class DB:
             DEFINE FIELD IF NOT EXISTS error_count   ON run TYPE int DEFAULT 0;
             DEFINE FIELD IF NOT EXISTS output_path   ON run TYPE option<string>;
         """)
+        self._conn.query("""
+            DEFINE TABLE IF NOT EXISTS run_span SCHEMAFULL;
+            DEFINE FIELD IF NOT EXISTS run          ON run_span TYPE record<run>;
+            DEFINE FIELD IF NOT EXISTS stage        ON run_span TYPE string;
+            DEFINE FIELD IF NOT EXISTS label        ON run_span TYPE string DEFAULT '';
+            DEFINE FIELD IF NOT EXISTS started_at   ON run_span TYPE float;
+            DEFINE FIELD IF NOT EXISTS wall_s       ON run_span TYPE float;
+            DEFINE FIELD IF NOT EXISTS cpu_s        ON run_span TYPE float;
+            DEFINE FIELD IF NOT EXISTS peak_rss_mb  ON run_span TYPE float;
+            DEFINE FIELD IF NOT EXISTS bytes_out    ON run_span TYPE int DEFAULT 0;
+            DEFINE FIELD IF NOT EXISTS cache_hits   ON run_span TYPE int DEFAULT 0;
+            DEFINE FIELD IF NOT EXISTS api_s        ON run_span TYPE float DEFAULT 0;
+            DEFINE FIELD IF NOT EXISTS apis         ON run_span FLEXIBLE TYPE object;
+            DEFINE FIELD IF NOT EXISTS ok           ON run_span TYPE bool DEFAULT true;
+            DEFINE FIELD IF NOT EXISTS error        ON run_span TYPE option<string>;
+            DEFINE INDEX IF NOT EXISTS run_span_run_idx ON run_span FIELDS run;
+        """)
+        self._conn.query("""
+            DEFINE TABLE IF NOT EXISTS minimax_job SCHEMAFULL;
+            DEFINE FIELD IF NOT EXISTS task_id      ON minimax_job TYPE string;
+            DEFINE FIELD IF NOT EXISTS project_id   ON minimax_job TYPE string;
+            DEFINE FIELD IF NOT EXISTS clip_index   ON minimax_job TYPE int;
+            DEFINE FIELD IF NOT EXISTS prompt       ON minimax_job TYPE string;
+            DEFINE FIELD IF NOT EXISTS image_path   ON minimax_job TYPE string;
+            DEFINE FIELD IF NOT EXISTS output_path  ON minimax_job TYPE string;
+            DEFINE FIELD IF NOT EXISTS status       ON minimax_job TYPE string DEFAULT 'submitted';
+            DEFINE FIELD IF NOT EXISTS file_id      ON minimax_job TYPE option<string>;
+            DEFINE FIELD IF NOT EXISTS error        ON minimax_job TYPE option<string>;
+            DEFINE FIELD IF NOT EXISTS submitted_at ON minimax_job TYPE string;
+            DEFINE FIELD IF NOT EXISTS updated_at   ON minimax_job TYPE option<string>;
+            DEFINE INDEX IF NOT EXISTS minimax_job_task_idx ON minimax_job FIELDS task_id UNIQUE;
+        """)
 
     # ------------------------------------------------------------------ #
     # Internal helpers
@@ -319,6 +354,153 @@ class DB:
             },
         )
 
+    def save_run_spans(self, run_id: str, spans: list) -> int:
+        """Store stage metrics (core.metrics.Span dicts) as children of `run_id`."""
+        for span in spans:
+            self._conn.query(
+                """
+                CREATE run_span SET
+                    run         = type::thing($run),
+                    stage       = $stage,
+                    label       = $label,
+                    started_at  = $started_at,
+                    wall_s      = $wall_s,
+                    cpu_s       = $cpu_s,
+                    peak_rss_mb = $peak_rss_mb,
+                    bytes_out   = $bytes_out,
+                    cache_hits  = $cache_hits,
+                    api_s       = $api_s,
+                    apis        = $apis,
+                    ok          = $ok,
+                    error       = $error
+                """,
+                {
+                    "run": run_id,
+                    "stage": span["stage"], "label": span.get("label", ""),
+                    "started_at": float(span.get("started_at", 0)),
+                    "wall_s": float(span.get("wall_s", 0)), "cpu_s": float(span.get("cpu_s", 0)),
+                    "peak_rss_mb": float(span.get("peak_rss_mb", 0)),
+                    "bytes_out": int(span.get("bytes_out", 0)), "cache_hits": int(span.get("cache_hits", 0)),
+                    "api_s": float(span.get("api_s", 0)), "apis": span.get("apis") or {},
+                    "ok": bool(span.get("ok", True)), "error": span.get("error"),
+                },
+            )
+        return len(spans)
+
+    def get_run_spans(self, run_id: str) -> list:
+        return self._rows(self._conn.query(
+            "SELECT * FROM run_span WHERE run = type::thing($run) ORDER BY started_at",
+            {"run": run_id},
+        ))
+
+    def slowest_stages(self, last_runs: int = 10, limit: int = 15) -> list:
+        """
+        Stages ranked by total wall time across the last `last_runs` runs.
+
+        Returns:
+            [{"stage", "runs", "spans", "total_wall", "avg_wall", "max_wall",
+              "total_cpu", "total_api", "cache_hits"}, ...]
+        """
+        # ORDER BY needs the sorted field in the projection, so no SELECT VALUE
+        recent = self._rows(self._conn.query(
+            "SELECT id, started_at FROM run ORDER BY started_at DESC LIMIT $n",
+            {"n": last_runs},
+        ))
+        run_ids = [r["id"] for r in recent if r.get("id")]
+        if not run_ids:
+            return []
+        rows = self._rows(self._conn.query(
+            """
+            SELECT
+                stage,
+                count()                 AS spans,
+                array::distinct(run)    AS run_ids,
+                math::sum(wall_s)       AS total_wall,
+                math::mean(wall_s)      AS avg_wall,
+                math::max(wall_s)       AS max_wall,
+                math::sum(cpu_s)        AS total_cpu,
+                math::sum(api_s)        AS total_api,
+                math::sum(cache_hits)   AS cache_hits
+            FROM run_span WHERE run IN $runs
+            GROUP BY stage ORDER BY total_wall DESC LIMIT $limit
+            """,
+            {"runs": run_ids, "limit": limit},
+        ))
+        for row in rows:
+            row["runs"] = len(row.pop("run_ids", None) or [])
+        return rows
+
+    # ------------------------------------------------------------------ #
+    # MiniMax clip jobs
+    # ------------------------------------------------------------------ #
+    def save_minimax_job(
+        self,
+        task_id: str,
+        project_id: str,
+        clip_index: int,
+        prompt: str,
+        image_path: str,
+        output_path: str,
+    ) -> str:
+        rows = self._rows(self._conn.query(
+            """
+            CREATE minimax_job SET
+                task_id      = $task_id,
+                project_id   = $project_id,
+                clip_index   = $clip_index,
+                prompt       = $prompt,
+                image_path   = $image_path,
+                output_path  = $output_path,
+                status       = 'submitted',
+                submitted_at = $now
+            """,
+            {
+                "task_id": task_id, "project_id": project_id, "clip_index": clip_index,
+                "prompt": prompt, "image_path": image_path, "output_path": output_path,
+                "now": _utcnow(),
+            },
+        ))
+        return str(rows[0]["id"]) if rows else ""
+
+    def update_minimax_job(
+        self,
+        task_id: str,
+        status: str,
+        file_id: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        """status: submitted | processing | downloaded | failed"""
+        self._conn.query(
+            """
+            UPDATE minimax_job SET
+                status     = $status,
+                file_id    = $file_id ?? file_id,
+                error      = $error,
+                updated_at = $now
+            WHERE task_id = $task_id
+            """,
+            {"task_id": task_id, "status": status, "file_id": file_id,
+             "error": error, "now": _utcnow()},
+        )
+
+    def find_minimax_job(self, output_path: str, prompt: str) -> Optional[dict]:
+        """Latest unfinished job that will produce `output_path` from `prompt`."""
+        rows = self._rows(self._conn.query(
+            """
+            SELECT * FROM minimax_job
+            WHERE output_path = $output_path AND prompt = $prompt
+              AND status IN ['submitted', 'processing']
+            ORDER BY submitted_at DESC LIMIT 1
+            """,
+            {"output_path": output_path, "prompt": prompt},
+        ))
+        return rows[0] if rows else None
+
+    def get_pending_minimax_jobs(self) -> list:
+        return self._rows(self._conn.query(
+            "SELECT * FROM minimax_job WHERE status IN ['submitted', 'processing'] ORDER BY submitted_at"
+        ))
+
     # ------------------------------------------------------------------ #
     # One-time migration from flat files
     # ------------------------------------------------------------------ #
@@ -0,0 +1,426 @@
+"""
+Per-stage timing and resource metrics.
+
+A span wraps one unit of work (a discovery source, an enrichment pass, a TTS
+call, one FFmpeg render, content generation, ...) and records:
+
+  wall_s        wall-clock time
+  cpu_s         CPU time of the calling thread plus that of the child
+                processes (FFmpeg) the span started
+  peak_rss_mb   highest process RSS sampled while the span was open, or the
+                peak RSS of its largest child process if that is higher
+  bytes_out     size of the files the span produced
+  cache_hits    cache hits attributed to the span (LLM, task cache, segments)
+  api_s         external API latency, broken down per API in `apis`
+
+    with METRICS.span("tts", "minimax") as s:
+        with METRICS.api_call("minimax_tts"):
+            resp = requests.post(...)
+        s.add_output(path)
+
+    @timed("script_gen")
+    def generate_script_ai(...): ...
+
+Spans are kept in memory for the process; METRICS.flush(run_id) stores them
+as run_span records linked to the SurrealDB `run`, and
+DB.slowest_stages(last_runs=N) ranks stages across recent runs:
+
+    python -m core.metrics --last 10
+
+Child processes are attributed through the span that was open when they
+were started: subprocess.Popen reaps with os.wait4 (installed on import,
+POSIX only), and each child's own rusage is added to that span, so
+concurrent FFmpeg spans never see each other's children. Children reaped
+only through poll(), and the long-lived process-pool workers, are not
+counted. RSS comes from /proc/self/statm (or psutil), read on span entry
+and exit and every RSS_SAMPLE_INTERVAL seconds while spans are open.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+RSS_SAMPLE_INTERVAL = 0.05
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_span_lock = threading.Lock()  # Spans are updated from reaping and sampling threads
+
+
+def _rss_mb() -> float:
+    """Current resident set size of this process in MB (0.0 if unknown)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 1048576
+    except (OSError, ValueError, IndexError):
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 1048576
+    return 0.0
+
+
+@dataclass
+class Span:
+    """One measured stage invocation."""
+    stage: str
+    label: str = ""
+    started_at: float = 0.0          # Unix time
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_mb: float = 0.0
+    bytes_out: int = 0
+    cache_hits: int = 0
+    api_s: float = 0.0
+    apis: Dict[str, Dict] = field(default_factory=dict)
+    ok: bool = True
+    error: Optional[str] = None
+
+    def add_output(self, path) -> None:
+        """Count a produced file towards bytes_out."""
+        try:
+            if path and os.path.isfile(str(path)):
+                self.bytes_out += os.path.getsize(str(path))
+        except OSError:
+            pass
+
+    def add_bytes(self, n: int) -> None:
+        self.bytes_out += int(n or 0)
+
+    def cache_hit(self, n: int = 1) -> None:
+        self.cache_hits += n
+
+    def add_api(self, name: str, seconds: float) -> None:
+        with _span_lock:
+            a = self.apis.setdefault(name, {"calls": 0, "seconds": 0.0})
+            a["calls"] += 1
+            a["seconds"] += seconds
+            self.api_s += seconds
+
+    def add_child(self, cpu_s: float, peak_rss_mb: float) -> None:
+        """Count one reaped child process (its own CPU time and peak RSS)."""
+        with _span_lock:
+            self.cpu_s += cpu_s
+            self.peak_rss_mb = max(self.peak_rss_mb, peak_rss_mb)
+
+    def sample_rss(self, rss_mb: float) -> None:
+        with _span_lock:
+            self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("metrics_span", default=None)
+
+
+class _RssSampler:
+    """One daemon thread raising peak_rss_mb of every open span while any are open."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._open: Dict[int, Span] = {}
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self._open[id(span)] = span
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="metrics-rss", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def remove(self, span: Span) -> None:
+        with self._lock:
+            self._open.pop(id(span), None)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            with self._lock:
+                spans = list(self._open.values())
+                if not spans:
+                    self._wake.clear()
+                    continue
+            rss = _rss_mb()
+            for span in spans:
+                span.sample_rss(rss)
+            time.sleep(self.interval)
+
+
+_RSS_SAMPLER = _RssSampler()
+
+
+def _install_child_accounting() -> None:
+    """
+    Make subprocess.Popen remember the span open at start-up and reap with
+    os.wait4, crediting the child's own rusage to that span.
+    """
+    if not hasattr(os, "wait4") or getattr(subprocess.Popen, "_metrics_installed", False):
+        return
+    popen_init = subprocess.Popen.__init__
+
+    def __init__(self, *args, **kwargs):
+        self._metrics_span = _current.get()
+        popen_init(self, *args, **kwargs)
+
+    def _try_wait(self, wait_flags):
+        # Same contract as the stdlib POSIX implementation, plus the rusage
+        try:
+            pid, sts, usage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            return self.pid, 0
+        span = getattr(self, "_metrics_span", None)
+        if pid == self.pid and span is not None:
+            # ru_maxrss is KB on Linux
+            span.add_child(usage.ru_utime + usage.ru_stime, usage.ru_maxrss / 1024)
+        return pid, sts
+
+    subprocess.Popen.__init__ = __init__
+    subprocess.Popen._try_wait = _try_wait
+    subprocess.Popen._metrics_installed = True
+
+
+_install_child_accounting()
+
+
+class MetricsRecorder:
+    """Thread-safe, process-wide collection of spans for one run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+        # Objects with on_enter(span) / on_exit(span), e.g. core.profiling.StageProfiler
+        self.listeners: List = []
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+    def span(self, stage: str, label: str = "", outputs=()):
+        """
+        Context manager measuring one stage. `outputs` are file paths counted
+        towards bytes_out on exit (missing files are ignored).
+        """
+        recorder = self
+
+        class _SpanContext:
+            def __enter__(self):
+                self.span = Span(stage=stage, label=label, started_at=time.time())
+                self.token = _current.set(self.span)
+                for listener in list(recorder.listeners):
+                    listener.on_enter(self.span)
+                self.span.sample_rss(_rss_mb())
+                _RSS_SAMPLER.add(self.span)
+                self.wall0 = time.perf_counter()
+                self.cpu0 = time.thread_time()
+                return self.span
+
+            def __exit__(self, exc_type, exc, tb):
+                s = self.span
+                s.wall_s = time.perf_counter() - self.wall0
+                _RSS_SAMPLER.remove(s)
+                s.sample_rss(_rss_mb())
+                with _span_lock:
+                    s.cpu_s += time.thread_time() - self.cpu0   # Children already added theirs
+                for path in outputs:
+                    s.add_output(path)
+                if exc_type is not None:
+                    s.ok = False
+                    s.error = f"{exc_type.__name__}: {exc}"[:500]
+                _current.reset(self.token)
+                for listener in list(recorder.listeners):
+                    listener.on_exit(s)
+                with recorder._lock:
+                    recorder.spans.append(s)
+                return False
+
+        return _SpanContext()
+
+    def api_call(self, name: str):
+        """Context manager timing one external API call, attributed to the open span."""
+
+        class _ApiContext:
+            def __enter__(self):
+                self.start = time.perf_counter()
+                return self
+
+            def __exit__(self, *exc):
+                record_api_latency(name, time.perf_counter() - self.start)
+                return False
+
+        return _ApiContext()
+
+    # ------------------------------------------------------------------ #
+    # Reporting / persistence
+    # ------------------------------------------------------------------ #
+    def stage_totals(self) -> Dict[str, Dict]:
+        """Aggregate spans per stage: count, wall, cpu, bytes, cache hits, api time."""
+        with self._lock:
+            spans = list(self.spans)
+        totals: Dict[str, Dict] = {}
+        for s in spans:
+            t = totals.setdefault(s.stage, {"count": 0, "wall_s": 0.0, "max_wall_s": 0.0, "cpu_s": 0.0,
+                                            "bytes_out": 0, "cache_hits": 0, "api_s": 0.0,
+                                            "peak_rss_mb": 0.0, "errors": 0})
+            t["count"] += 1
+            t["wall_s"] += s.wall_s
+            t["max_wall_s"] = max(t["max_wall_s"], s.wall_s)
+            t["cpu_s"] += s.cpu_s
+            t["bytes_out"] += s.bytes_out
+            t["cache_hits"] += s.cache_hits
+            t["api_s"] += s.api_s
+            t["peak_rss_mb"] = max(t["peak_rss_mb"], s.peak_rss_mb)
+            t["errors"] += 0 if s.ok else 1
+        return totals
+
+    def summary(self, limit: int = 15) -> str:
+        totals = self.stage_totals()
+        if not totals:
+            return "Stage metrics: no spans recorded"
+        lines = [f"Stage metrics ({sum(t['count'] for t in totals.values())} spans)",
+                 f"  {'stage':<18} {'n':>4} {'wall':>9} {'max':>8} {'cpu':>9} {'api':>8} "
+                 f"{'MB out':>8} {'hits':>5} {'rss MB':>7}"]
+        for stage, t in sorted(totals.items(), key=lambda kv: kv[1]["wall_s"], reverse=True)[:limit]:
+            err = f"  ⚠️ {t['errors']} failed" if t["errors"] else ""
+            lines.append(
+                f"  {stage:<18} {t['count']:>4} {t['wall_s']:>8.1f}s {t['max_wall_s']:>7.1f}s "
+                f"{t['cpu_s']:>8.1f}s {t['api_s']:>7.1f}s {t['bytes_out'] / 1e6:>8.1f} "
+                f"{t['cache_hits']:>5} {t['peak_rss_mb']:>7.0f}{err}"
+            )
+        return "\n".join(lines)
+
+    def flush(self, run_id: str, db=None) -> int:
+        """
+        Store this run's spans as run_span records under `run_id` and clear
+        them. Opens its own DB connection unless one is passed.
+
+        Returns:
+            Number of spans written (0 if the DB is unavailable)
+        """
+        with self._lock:
+            spans = [asdict(s) for s in self.spans]
+        if not run_id or not spans:
+            return 0
+        try:
+            if db is None:
+                from core.db import DB
+                with DB() as _db:
+                    _db.save_run_spans(run_id, spans)
+            else:
+                db.save_run_spans(run_id, spans)
+        except Exception as e:
+            print(f"[db] Warning: could not store stage metrics ({e})")
+            return 0
+        self.reset()
+        return len(spans)
+
+
+METRICS = MetricsRecorder()
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def bind_context(fn: Callable) -> Callable:
+    """
+    Wrap fn to run in a copy of the caller's context. loop.run_in_executor
+    and ThreadPoolExecutor.submit do not carry contextvars into the worker
+    thread, so without this the work records into no span (API latency
+    becomes an orphan 'api' span):
+
+        await loop.run_in_executor(executor, bind_context(call), prompt)
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        # A Context can only be entered by one thread at a time
+        return context.copy().run(fn, *args, **kwargs)
+    return run
+
+
+def record_cache_hit(n: int = 1) -> None:
+    """Attribute a cache hit to the open span (no-op outside a span)."""
+    s = _current.get()
+    if s is not None:
+        s.cache_hit(n)
+
+
+def record_api_latency(name: str, seconds: float) -> None:
+    """
+    Attribute external API latency to the open span. Calls made outside any
+    span are recorded as their own 'api' span so the time is not lost.
+    """
+    s = _current.get()
+    if s is not None:
+        s.add_api(name, seconds)
+        return
+    orphan = Span(stage="api", label=name, started_at=time.time() - seconds, wall_s=seconds)
+    orphan.add_api(name, seconds)
+    with METRICS._lock:
+        METRICS.spans.append(orphan)
+
+
+def timed(stage: str, label: Optional[str] = None, recorder: Optional[MetricsRecorder] = None) -> Callable:
+    """
+    Decorator wrapping each call in a span. Works on sync and async
+    functions; a returned file path counts towards bytes_out.
+    """
+    def decorator(fn):
+        name = label or fn.__name__
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with (recorder or METRICS).span(stage, name) as s:
+                    result = await fn(*args, **kwargs)
+                    if isinstance(result, (str, os.PathLike)):
+                        s.add_output(result)
+                    return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with (recorder or METRICS).span(stage, name) as s:
+                result = fn(*args, **kwargs)
+                if isinstance(result, (str, os.PathLike)):
+                    s.add_output(result)
+                return result
+        return wrapper
+    return decorator
+
+
+def main():
+    """Print the slowest stages across the last N pipeline runs."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Slowest pipeline stages across recent runs")
+    parser.add_argument('--last', type=int, default=10, help='Number of recent runs (default: 10)')
+    parser.add_argument('--limit', type=int, default=15, help='Stages to show (default: 15)')
+    args = parser.parse_args()
+
+    from core.db import DB
+    with DB() as db:
+        rows = db.slowest_stages(last_runs=args.last, limit=args.limit)
+
+    if not rows:
+        print("No stage metrics recorded yet")
+        return
+    print(f"Slowest stages over the last {args.last} run(s)")
+    print(f"  {'stage':<18} {'runs':>4} {'spans':>6} {'total':>9} {'avg':>8} {'max':>8} {'cpu':>9} {'api':>8}")
+    for r in rows:
+        print(f"  {r['stage']:<18} {r.get('runs', 0):>4} {r['spans']:>6} {r['total_wall']:>8.1f}s "
+              f"{r['avg_wall']:>7.1f}s {r['max_wall']:>7.1f}s {r['total_cpu']:>8.1f}s {r['total_api']:>7.1f}s")
+
+
+if __name__ == "__main__":
+    main()
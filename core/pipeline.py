@@ -28,6 +28,14 @@ from prefect import flow, task, get_run_logger
 from prefect.concurrency.sync import concurrency
 from prefect.task_runners import ThreadPoolTaskRunner
 
+from core.metrics import METRICS
+from core.profiling import finish_profiling, start_profiling
+from core.stage_timeline import gantt, pipeline_max_workers, timed_stage
+from core.task_cache import (
+    CACHE_STATS, RENDERER_VERSION, cached_task_options, file_digest, record_artifact,
+)
+from services.still_segment import encode_still
+
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -45,17 +53,70 @@ LONGFORM_VIDEO = os.path.join(DELIVERY_FOLDER, "longform_github_roundup.mp4")
 for d in [OUTPUT_FOLDER, DELIVERY_FOLDER, SHORTS_FOLDER, DEEP_DIVES_FOLDER]:
     os.makedirs(d, exist_ok=True)
 
+# Task runner size: pipeline.max_workers in config.json (env PIPELINE_MAX_WORKERS wins)
+MAX_WORKERS = pipeline_max_workers()
+
+
+# ── Cache keys ────────────────────────────────────────────────────────────────
+# Each task is cached on the inputs that determine its output file
+# (see core/task_cache.py); a re-run skips every unit whose key is unchanged.
+
+def _voice_key_config() -> dict:
+    """Voice settings + which TTS backends are configured (decides the fallback chain)."""
+    return {
+        "voice": CONFIG.get("voice", {}),
+        "minimax_tts": bool(CONFIG.get("minimax", {}).get("api_key")),
+        "hume": bool(CONFIG.get("hume_ai", {}).get("api_key")),
+    }
+
+
+def _audio_key(params: dict) -> dict:
+    return {"text": params["text"], "output": params["output_path"], "voice": _voice_key_config()}
+
+
+def _graphic_key(params: dict) -> dict:
+    return {
+        "name": params["project_name"],
+        "url": params["github_url"],
+        "output": params["output_path"],
+        "skipped": bool(params.get("enhanced_video")),
+        "renderer": RENDERER_VERSION,
+    }
+
+
+def _minimax_key(params: dict) -> dict:
+    project = params["project"]
+    # Non-secret MiniMax settings (model, enabled, ...) - never hash the API key
+    minimax = {k: v for k, v in CONFIG.get("minimax", {}).items() if k not in ("api_key", "group_id")}
+    return {
+        "id": project["id"],
+        "name": project.get("name"),
+        "url": project.get("github_url"),
+        "audio": file_digest(project.get("audio_path")),
+        "minimax": minimax,
+    }
+
+
+def _segment_key(params: dict) -> dict:
+    return {
+        "index": params["index"],
+        "name": params["project"].get("name"),
+        "audio": file_digest(params["audio_path"]),
+        "enhanced": file_digest(params.get("enhanced_video")),
+        "image": file_digest(params.get("img_path")),
+        "renderer": RENDERER_VERSION,
+    }
+
 
 # ── Tasks: Audio ──────────────────────────────────────────────────────────────
 
-@task(name="generate-audio", retries=2, retry_delay_seconds=10, log_prints=True)
+@task(name="generate-audio", retries=2, retry_delay_seconds=10, log_prints=True,
+      **cached_task_options("audio", _audio_key))
+@timed_stage("audio")
+@record_artifact("audio", _audio_key)
 def generate_audio_task(text: str, output_path: str) -> str:
     """Generate audio using EnhancedVoiceGenerator with full fallback chain"""
     logger = get_run_logger()
-    
-    if os.path.exists(output_path):
-        logger.info(f"✅ Audio already exists: {output_path}")
-        return output_path
 
     try:
         from components.audio.enhanced_audio_generator import EnhancedVoiceGenerator
@@ -106,20 +167,28 @@ def _trim_silence(path: str) -> None:
 
 # ── Tasks: Graphics ───────────────────────────────────────────────────────────
 
-@task(name="generate-graphic", retries=1, retry_delay_seconds=5, log_prints=True)
-def generate_graphic_task(project_name: str, github_url: str, output_path: str) -> str:
-    """Render a PIL project graphic. Retries once on failure."""
+@task(name="generate-graphic", retries=1, retry_delay_seconds=5, log_prints=True,
+      **cached_task_options("graphic", _graphic_key))
+@timed_stage("graphics")
+@record_artifact("graphic", _graphic_key)
+def generate_graphic_task(project_name: str, github_url: str, output_path: str,
+                          enhanced_video: Optional[str] = None) -> Optional[str]:
+    """
+    Render a PIL project graphic. Retries once on failure.
+    Skipped (returns None) when the project already has a MiniMax clip.
+    """
     logger = get_run_logger()
 
-    if os.path.exists(output_path):
-        logger.info(f"✅ Graphic exists: {output_path}")
-        return output_path
+    if enhanced_video:
+        return None
 
     logger.info(f"🎨 Rendering graphic: {project_name}")
-    from components.graphics.codestream_graphics import CodeStreamGraphics
+    from components.graphics.batch_renderer import get_card_renderer
+    from components.graphics.codestream_graphics import create_project_graphic
 
-    graphics = CodeStreamGraphics(output_dir=Path(output_path).parent)
-    graphics.create_project_graphic(project_name, github_url, output_path)
+    # Card worker process: parallel graphics tasks don't serialize on the GIL
+    get_card_renderer().call(create_project_graphic, project_name, github_url, output_path,
+                             label=f"graphic:{project_name}")
     return output_path
 
 
@@ -149,11 +218,17 @@ MOTION_LIBRARY = [
     retries=3,
     retry_delay_seconds=30,
     log_prints=True,
+    **cached_task_options("minimax", _minimax_key),
 )
+@timed_stage("minimax")
+@record_artifact("minimax", _minimax_key)
 def minimax_enhancement_task(project: dict) -> Optional[str]:
     """
     Generate cinematic MiniMax clips for a project.
-    Rate-limited to 2 concurrent calls via the 'minimax' concurrency slot.
+    All of the project's clips are submitted at once inside the 'minimax'
+    concurrency slot; polling and downloads then happen on the shared job
+    manager's loop outside the slot, so the slot only gates submissions.
+    Job IDs are persisted, so a retry or re-run resumes instead of resubmitting.
     Retries 3× with 30s back-off.
     """
     logger = get_run_logger()
@@ -161,68 +236,65 @@ def minimax_enhancement_task(project: dict) -> Optional[str]:
     audio_path = project.get("audio_path", "")
     final_path = str(Path(OUTPUT_FOLDER) / f"{project_id}_minimax_enhanced.mp4")
 
-    if os.path.exists(final_path):
-        logger.info(f"✅ MiniMax clip exists: {final_path}")
-        return final_path
-
     try:
-        from services.minimax_integration import get_minimax_generator
+        from services.minimax_jobs import ClipRequest, get_clip_job_manager
         from services.github_page_capture import GitHubPageCapture
     except ImportError:
         logger.warning("MiniMax modules not available — skipping enhancement")
         return None
 
-    generator = get_minimax_generator()
-    if not generator or not generator.enabled:
+    manager = get_clip_job_manager()
+    if not manager.enabled:
         logger.warning("MiniMax disabled in config — skipping")
         return None
 
-    # Concurrency limit: only N simultaneous MiniMax calls
-    with concurrency("minimax", occupy=1):
-        logger.info(f"🎬 MiniMax: {project['name']}")
+    duration = _get_audio_duration(audio_path)
+    num_clips = max(1, math.ceil(duration / 6))
+    logger.info(f"🎬 MiniMax: {project['name']} — audio {duration:.1f}s → {num_clips} clips needed")
 
-        duration = _get_audio_duration(audio_path)
-        num_clips = max(1, math.ceil(duration / 6))
-        logger.info(f"   ⏱ Audio {duration:.1f}s → {num_clips} clips needed")
+    capture = GitHubPageCapture()
+    screenshots = capture.take_multi_screenshots(
+        project.get("github_url"), project_id, num_clips
+    )
+    if not screenshots:
+        logger.warning("   ⚠️ Screenshot capture failed — skipping enhancement")
+        return None
 
-        capture = GitHubPageCapture()
-        screenshots = capture.take_multi_screenshots(
-            project.get("github_url"), project_id, num_clips
+    # Seeded per project so a re-run builds the same prompts and can match
+    # the jobs a crashed run already paid for
+    rng = random.Random(project_id)
+    motions = rng.sample(MOTION_LIBRARY, min(num_clips, len(MOTION_LIBRARY)))
+    if num_clips > len(motions):
+        motions += rng.choices(MOTION_LIBRARY, k=num_clips - len(motions))
+
+    requests_ = [
+        ClipRequest(
+            project_id=project_id,
+            clip_index=i,
+            image_path=shot,
+            prompt=(f"{motion} Modern professional studio lighting. "
+                    f"Clean interface for {project['name']}."),
+            output_path=str(Path(OUTPUT_FOLDER) / f"{project_id}_enh_seg_{i}.mp4"),
         )
+        for i, (shot, motion) in enumerate(zip(screenshots, motions))
+    ]
 
-        if not screenshots:
-            logger.warning("   ⚠️ Screenshot capture failed — using UI demo fallback")
-            return generator.generate_ui_demonstration(
-                f"A professional demonstration of {project['name']}.", final_path
-            )
-
-        motions = random.sample(MOTION_LIBRARY, min(num_clips, len(MOTION_LIBRARY)))
-        if num_clips > len(motions):
-            motions += random.choices(MOTION_LIBRARY, k=num_clips - len(motions))
+    # Concurrency limit applies to submission only
+    with concurrency("minimax", occupy=1):
+        jobs = manager.submit(requests_)
 
-        clip_paths = []
-        for i, (shot, motion) in enumerate(zip(screenshots, motions)):
-            seg_path = str(Path(OUTPUT_FOLDER) / f"{project_id}_enh_seg_{i}.mp4")
-            prompt = (
-                f"{motion} Modern professional studio lighting. "
-                f"Clean interface for {project['name']}."
-            )
-            logger.info(f"   🪄 Clip {i+1}/{num_clips}: {motion[:45]}…")
-            result = generator.generate_image_to_video(shot, prompt, seg_path)
-            if result:
-                clip_paths.append(result)
-
-        if len(clip_paths) > 1:
-            concat_list = Path(OUTPUT_FOLDER) / f"{project_id}_concat.txt"
-            concat_list.write_text("\n".join(f"file '{p}'" for p in clip_paths))
-            subprocess.run(
-                ["ffmpeg", "-y", "-f", "concat", "-safe", "0",
-                 "-i", str(concat_list), "-c", "copy", final_path],
-                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
-            )
-            return final_path
-        elif clip_paths:
-            return clip_paths[0]
+    clip_paths = [p for p in manager.wait(jobs) if p]
+    if len(clip_paths) > 1:
+        concat_list = Path(OUTPUT_FOLDER) / f"{project_id}_concat.txt"
+        concat_list.write_text("\n".join(f"file '{p}'" for p in clip_paths))
+        subprocess.run(
+            ["ffmpeg", "-y", "-f", "concat", "-safe", "0",
+             "-i", str(concat_list), "-c", "copy", final_path],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        return final_path
+    elif clip_paths:
+        return clip_paths[0]
 
     return None
 
@@ -243,21 +315,30 @@ def _get_audio_duration(audio_path: str) -> float:
 
 # ── Tasks: FFmpeg Segments ─────────────────────────────────────────────────────
 
-@task(name="render-segment", retries=1, retry_delay_seconds=5, log_prints=True)
-def render_segment_task(project: dict, index: int) -> str:
-    """Render a single project video segment."""
+@task(name="render-segment", retries=1, retry_delay_seconds=5, log_prints=True,
+      **cached_task_options("segment", _segment_key))
+@timed_stage("render")
+@record_artifact("segment", _segment_key)
+def render_segment_task(project: dict, index: int, audio_path: str,
+                        enhanced_video: Optional[str] = None, img_path: Optional[str] = None) -> str:
+    """
+    Render a single project video segment.
+
+    audio_path / enhanced_video / img_path are usually upstream futures, so
+    this task starts as soon as *this* project's inputs are ready.
+    """
     logger = get_run_logger()
     output_path = str(Path(OUTPUT_FOLDER) / f"segment_{index:03d}.mp4")
     
-    audio_dur = _get_audio_duration(project["audio_path"])
+    audio_dur = _get_audio_duration(audio_path)
 
     # Enhanced (MiniMax) path
-    if "enhanced_video" in project:
+    if enhanced_video:
         logger.info(f"🎬 Merging MiniMax + audio: {project['name']}")
         subprocess.run(
             ["ffmpeg", "-y",
-             "-stream_loop", "-1", "-i", project["enhanced_video"],
-             "-i", project["audio_path"],
+             "-stream_loop", "-1", "-i", enhanced_video,
+             "-i", audio_path,
              "-c:v", "libx264", "-preset", "ultrafast",
              "-c:a", "aac", "-b:a", "192k",
              "-pix_fmt", "yuv420p",
@@ -269,41 +350,41 @@ def render_segment_task(project: dict, index: int) -> str:
 
     # Static image path
     logger.info(f"🎬 Rendering segment: {project['name']}")
-    subprocess.run(
-        ["ffmpeg", "-y",
-         "-loop", "1", "-framerate", "24", "-i", project["img_path"],
-         "-i", project["audio_path"],
-         "-r", "24",
-         "-c:v", "libx264", "-preset", "ultrafast", "-tune", "stillimage",
-         "-c:a", "aac", "-b:a", "192k",
-         "-pix_fmt", "yuv420p",
-         "-t", str(audio_dur), output_path],
-        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
-    )
-    return output_path
+    return encode_still(img_path, output_path, audio_dur, fps=24, audio_path=audio_path,
+                        audio_args=("-c:a", "aac", "-b:a", "192k"))
+
+
+def _encode_static_segment(image_path: str, duration: int, output_path: str,
+                           audio_path: Optional[str] = None) -> str:
+    if audio_path:
+        return encode_still(image_path, output_path, _get_audio_duration(audio_path), fps=24,
+                            audio_path=audio_path)
+    return encode_still(image_path, output_path, duration, fps=24, silence_rate=44100)
 
 
 @task(name="render-static-segment", retries=1, log_prints=True)
+@timed_stage("static-render")
 def render_static_segment_task(
-    image_path: str, duration: int, output_name: str, audio_path: Optional[str] = None
+    image_path: str, duration: int, output_name: str, audio_path: Optional[str] = None,
+    cache_kind: Optional[str] = None,
 ) -> str:
-    """Render an intro/outro/subscribe static segment."""
+    """
+    Render an intro/outro/subscribe static segment. With cache_kind, the
+    encode is reused from the branding cache when card, audio and duration match.
+    """
     output_path = str(Path(OUTPUT_FOLDER) / output_name)
+    if not cache_kind:
+        return _encode_static_segment(image_path, duration, output_path, audio_path)
 
-    cmd = ["ffmpeg", "-y", "-loop", "1", "-framerate", "24", "-i", image_path]
-    if audio_path:
-        cmd += ["-i", audio_path, "-shortest"]
-    else:
-        cmd += ["-f", "lavfi", "-i", "anullsrc=channel_layout=stereo:sample_rate=44100",
-                "-t", str(duration)]
-    cmd += ["-c:v", "libx264", "-preset", "ultrafast", "-tune", "stillimage",
-            "-c:a", "aac", "-pix_fmt", "yuv420p", output_path]
-
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    return output_path
+    from components.graphics.branding import cached_segment
+    return cached_segment(
+        cache_kind, image_path, output_path,
+        lambda: _encode_static_segment(image_path, duration, output_path, audio_path),
+        duration=duration, audio_path=audio_path, profile="pipeline.static")
 
 
 @task(name="concatenate-segments", retries=1, log_prints=True)
+@timed_stage("concat")
 def concatenate_task(segment_files: list[str], output_path: str) -> str:
     """Concatenate all segments into the final video."""
     logger = get_run_logger()
@@ -333,138 +414,149 @@ def concatenate_task(segment_files: list[str], output_path: str) -> str:
 @flow(
     name="opensourcescribes-pipeline",
     description="Full video production pipeline: audio → graphics → MiniMax → assemble",
+    task_runner=ThreadPoolTaskRunner(max_workers=MAX_WORKERS),
     log_prints=True,
 )
 def run_pipeline(data_file: str = DATA_FILE):
+    """
+    Build the episode as a dataflow graph: every task is submitted up front
+    and receives its inputs as upstream futures, so a project's segment
+    renders as soon as its own audio and visuals exist instead of waiting
+    for every project to clear each stage.
+    """
     logger = get_run_logger()
+    METRICS.reset()
+    CACHE_STATS.reset()
+    start_profiling()
+    try:
+        # 1. Load projects
+        with open(data_file, "r") as f:
+            projects: list[dict] = json.load(f)
+
+        for i, p in enumerate(projects):
+            if "id" not in p:
+                p["id"] = f"p{i+1}"
 
-    # 1. Load projects
-    with open(data_file, "r") as f:
-        projects: list[dict] = json.load(f)
-
-    for i, p in enumerate(projects):
-        if "id" not in p:
-            p["id"] = f"p{i+1}"
-
-    logger.info(f"📋 Loaded {len(projects)} projects from {data_file}")
-
-    # 2. Generate all audio in parallel (ThreadPool handles sync tasks)
-    logger.info("🎙️ Generating audio for all projects…")
-    audio_futures = []
-    for p in projects:
-        audio_path = str(Path(OUTPUT_FOLDER) / f"{p['id']}_audio.mp3")
-        p["audio_path"] = audio_path
-        audio_futures.append(generate_audio_task.submit(p["script_text"], audio_path))
-
-    # Shared audio clips — dated filename prevents stale cache across runs
-    intro_audio = str(Path(OUTPUT_FOLDER) / f"intro_audio_{current_date_mmdd}.mp3")
-    sub_audio = str(Path(OUTPUT_FOLDER) / "subscribe_audio.mp3")
-
-    # Build dynamic intro script from actual project names in this run
-    import re as _re
-    _project_names = [_re.sub(r'[^a-zA-Z0-9 \-\.]', '', p.get('name', '')).strip('-.')
-                      for p in projects if p.get('name')]
-    _n = len(_project_names)
-    if _n == 0:
-        _intro_script = "Welcome to OpenSourceScribes. Let's explore some new open source projects. Let's get into it."
-    else:
-        import random as _rng
-        _sample_size = min(_n, _rng.randint(2, 3))
-        _selected = _rng.sample(_project_names, _sample_size)
-        if _sample_size == 1:
-            _name_list = _selected[0]
-        elif _sample_size == 2:
-            _name_list = f"{_selected[0]} and {_selected[1]}"
+        logger.info(f"📋 Loaded {len(projects)} projects from {data_file} "
+                    f"({MAX_WORKERS} task runner workers)")
+
+        # 2. Audio for every project
+        audio_futures = {}
+        for p in projects:
+            audio_path = str(Path(OUTPUT_FOLDER) / f"{p['id']}_audio.mp3")
+            p["audio_path"] = audio_path
+            audio_futures[p["id"]] = generate_audio_task.submit(p["script_text"], audio_path)
+
+        # Shared audio clips — dated filename prevents stale cache across runs
+        intro_audio = str(Path(OUTPUT_FOLDER) / f"intro_audio_{current_date_mmdd}.mp3")
+        sub_audio = str(Path(OUTPUT_FOLDER) / "subscribe_audio.mp3")
+
+        # Build dynamic intro script from actual project names in this run
+        import re as _re
+        _project_names = [_re.sub(r'[^a-zA-Z0-9 \-\.]', '', p.get('name', '')).strip('-.')
+                          for p in projects if p.get('name')]
+        _n = len(_project_names)
+        if _n == 0:
+            _intro_script = "Welcome to OpenSourceScribes. Let's explore some new open source projects. Let's get into it."
         else:
-            _name_list = f"{_selected[0]}, {_selected[1]}, and {_selected[2]}"
-        _intro_script = (
-            f"Welcome to OpenSourceScribes. "
-            f"Today we have {_n} open source project{'s' if _n != 1 else ''}. "
-            f"Including {_name_list}, among others. "
-            f"Let's get into it."
-        )
+            import random as _rng
+            _sample_size = min(_n, _rng.randint(2, 3))
+            _selected = _rng.sample(_project_names, _sample_size)
+            if _sample_size == 1:
+                _name_list = _selected[0]
+            elif _sample_size == 2:
+                _name_list = f"{_selected[0]} and {_selected[1]}"
+            else:
+                _name_list = f"{_selected[0]}, {_selected[1]}, and {_selected[2]}"
+            _intro_script = (
+                f"Welcome to OpenSourceScribes. "
+                f"Today we have {_n} open source project{'s' if _n != 1 else ''}. "
+                f"Including {_name_list}, among others. "
+                f"Let's get into it."
+            )
 
-    intro_audio_future = generate_audio_task.submit(
-        _intro_script,
-        intro_audio,
-    )
-    sub_audio_future = generate_audio_task.submit(
-        "If you're finding these tools useful, please subscribe for more open source discoveries.",
-        sub_audio,
-    )
+        intro_audio_future = generate_audio_task.submit(
+            _intro_script,
+            intro_audio,
+        )
+        sub_audio_future = generate_audio_task.submit(
+            "If you're finding these tools useful, please subscribe for more open source discoveries.",
+            sub_audio,
+        )
 
-    # Wait for all audio
-    for f in audio_futures:
-        f.result()
-    intro_audio_future.result()
-    sub_audio_future.result()
-    logger.info("✅ All audio ready")
-
-    # 3. MiniMax enhancement (concurrency-limited via 'minimax' slot)
-    use_minimax = CONFIG.get("video_settings", {}).get("use_minimax", True)
-    if use_minimax:
-        logger.info("🎬 Running MiniMax enhancements…")
-        minimax_futures = {
-            p["id"]: minimax_enhancement_task.submit(p) for p in projects
-        }
+        # 3. MiniMax enhancement (concurrency-limited via 'minimax' slot);
+        #    each clip only waits for its own project's audio (clip count = duration / 6s)
+        use_minimax = CONFIG.get("video_settings", {}).get("use_minimax", True)
+        minimax_futures = {}
+        if use_minimax:
+            for p in projects:
+                minimax_futures[p["id"]] = minimax_enhancement_task.submit(
+                    p, wait_for=[audio_futures[p["id"]]]
+                )
+
+        # 4. Static graphics — the task no-ops when the MiniMax clip came back
+        graphic_futures = {}
         for p in projects:
-            result = minimax_futures[p["id"]].result()
-            if result:
-                p["enhanced_video"] = result
-
-    # 4. Generate static graphics for any project without a MiniMax clip
-    logger.info("🎨 Generating static graphics for remaining projects…")
-    graphic_futures = []
-    for p in projects:
-        if "enhanced_video" not in p:
             img_path = str(Path(OUTPUT_FOLDER) / f"{p['id']}_screen.png")
             p["img_path"] = img_path
-            graphic_futures.append(generate_graphic_task.submit(p["name"], p["github_url"], img_path))
-    for f in graphic_futures:
-        f.result()
-
-    # 5. Render intro/outro/subscribe cards
-    logger.info("🎬 Rendering intro / outro / subscribe segments…")
-    from components.graphics.branding import create_intro_card, create_outro_card, create_subscribe_card
-
-    # Dynamic episode title from actual project names
-    from datetime import datetime as _dt
-    _title_names = [p.get('name', '') for p in projects if p.get('name')]
-    if not _title_names:
-        _episode_label = "Open Source Projects"
-    elif len(_title_names) <= 2:
-        _episode_label = " & ".join(_title_names)
-    else:
-        _episode_label = f"{_title_names[0]}, {_title_names[1]} & {len(_title_names) - 2} More"
-    _date_str = _dt.now().strftime("%B %d")
-    _intro_card_title = f"{_date_str} — {_episode_label}"
-
-    intro_img = create_intro_card(CONFIG, _intro_card_title)
-    outro_img = create_outro_card(CONFIG)
-    sub_img = create_subscribe_card(CONFIG)
-
-    intro_seg = render_static_segment_task(intro_img, 0, "seg_intro.mp4", audio_path=intro_audio)
-    outro_seg = render_static_segment_task(outro_img, CONFIG["video_settings"]["outro_duration"], "seg_outro.mp4")
-    sub_seg = render_static_segment_task(sub_img, 0, "seg_subscribe.mp4", audio_path=sub_audio)
-
-    # 6. Render project segments
-    logger.info("🎬 Rendering project segments…")
-    segment_files = [intro_seg]
-    midpoint = len(projects) // 2
-
-    for i, p in enumerate(projects):
-        seg = render_segment_task(p, i)
-        segment_files.append(seg)
-        if i == midpoint - 1:
-            segment_files.append(sub_seg)
-
-    segment_files.append(outro_seg)
-
-    # 7. Concatenate
-    concatenate_task(segment_files, LONGFORM_VIDEO)
-
-    logger.info(f"\n🎉 Pipeline complete → {LONGFORM_VIDEO}")
-    return LONGFORM_VIDEO
+            graphic_futures[p["id"]] = generate_graphic_task.submit(
+                p["name"], p["github_url"], img_path,
+                enhanced_video=minimax_futures.get(p["id"]),
+            )
+
+        # 5. Intro/outro/subscribe cards and their segments (content-cached, see branding.py)
+        from components.graphics.branding import create_intro_card, create_outro_card, create_subscribe_card
+
+        # Dynamic episode title from actual project names
+        from datetime import datetime as _dt
+        _title_names = [p.get('name', '') for p in projects if p.get('name')]
+        if not _title_names:
+            _episode_label = "Open Source Projects"
+        elif len(_title_names) <= 2:
+            _episode_label = " & ".join(_title_names)
+        else:
+            _episode_label = f"{_title_names[0]}, {_title_names[1]} & {len(_title_names) - 2} More"
+        _date_str = _dt.now().strftime("%B %d")
+        _intro_card_title = f"{_date_str} — {_episode_label}"
+
+        intro_img = create_intro_card(CONFIG, _intro_card_title)
+        outro_img = create_outro_card(CONFIG)
+        sub_img = create_subscribe_card(CONFIG)
+
+        intro_seg = render_static_segment_task.submit(intro_img, 0, "seg_intro.mp4", audio_path=intro_audio_future)
+        outro_seg = render_static_segment_task.submit(outro_img, CONFIG["video_settings"]["outro_duration"], "seg_outro.mp4",
+                                                      cache_kind="outro")
+        sub_seg = render_static_segment_task.submit(sub_img, 0, "seg_subscribe.mp4", audio_path=sub_audio_future,
+                                                    cache_kind="subscribe")
+
+        # 6. Project segments — each starts when its own inputs resolve
+        segment_futures = [intro_seg]
+        midpoint = len(projects) // 2
+
+        for i, p in enumerate(projects):
+            seg = render_segment_task.submit(
+                p, i,
+                audio_path=audio_futures[p["id"]],
+                enhanced_video=minimax_futures.get(p["id"]),
+                img_path=graphic_futures[p["id"]],
+            )
+            segment_futures.append(seg)
+            if i == midpoint - 1:
+                segment_futures.append(sub_seg)
+
+        segment_futures.append(outro_seg)
+
+        # 7. Concatenate (resolves the whole segment list)
+        final = concatenate_task.submit(segment_futures, LONGFORM_VIDEO).result()
+
+        logger.info(gantt())
+        logger.info(CACHE_STATS.summary())
+        logger.info(METRICS.summary())
+    finally:
+        # Write the flamegraphs even when a task fails
+        finish_profiling(DELIVERY_FOLDER)
+    logger.info(f"\n🎉 Pipeline complete → {final}")
+    return final
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
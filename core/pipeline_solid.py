@@ -19,6 +19,11 @@ os.environ.setdefault('PREFECT_API_URL', 'http://127.0.0.1:4200/api')
 from prefect import flow, task, get_run_logger
 from prefect.task_runners import ThreadPoolTaskRunner
 
+from core.metrics import METRICS
+from core.profiling import finish_profiling, start_profiling
+from services.github_screenshot import reset_screenshot_cache_stats, screenshot_cache_summary
+from core.stage_timeline import gantt, pipeline_max_workers, stage_span, timed_stage
+
 # Import SOLID architecture
 from interfaces.dependency_injection import CompositionRoot
 from interfaces.interfaces import IVideoPipeline, IProjectProvider, IAudioGenerator, IGraphicsRenderer, IVideoRenderer
@@ -29,6 +34,7 @@ from interfaces.interfaces import IVideoPipeline, IProjectProvider, IAudioGenera
 # ═══════════════════════════════════════════════════════════════════════
 
 @task(name="load-projects", retries=2, retry_delay_seconds=5, log_prints=True)
+@timed_stage("load")
 def load_projects_task(project_provider: IProjectProvider) -> List[Dict]:
     """
     Load projects using SOLID ProjectProvider.
@@ -52,6 +58,7 @@ def load_projects_task(project_provider: IProjectProvider) -> List[Dict]:
 
 
 @task(name="auto-select-projects", retries=1, log_prints=True)
+@timed_stage("auto-select")
 def auto_select_task(project_provider: IProjectProvider) -> tuple:
     """
     Auto-select projects for Shorts and Deep Dives.
@@ -72,6 +79,7 @@ def auto_select_task(project_provider: IProjectProvider) -> tuple:
 
 
 @task(name="generate-audio", retries=3, retry_delay_seconds=10, log_prints=True)
+@timed_stage("audio")
 def generate_audio_task(
     audio_generator: IAudioGenerator,
     project: Dict,
@@ -120,6 +128,7 @@ def generate_audio_task(
 
 
 @task(name="capture-screenshot", retries=2, retry_delay_seconds=5, log_prints=True)
+@timed_stage("screenshot")
 def capture_screenshot_task(
     graphics_renderer: IGraphicsRenderer,
     project: Dict
@@ -160,11 +169,13 @@ def capture_screenshot_task(
 
 
 @task(name="render-segment", retries=2, retry_delay_seconds=10, log_prints=True)
+@timed_stage("render")
 def render_segment_task(
     video_renderer: IVideoRenderer,
     project: Dict,
     index: int,
-    audio_path: str
+    audio_path: str,
+    screenshot_path: Optional[str] = None
 ) -> str:
     """
     Render video segment using SOLID VideoRenderer.
@@ -173,7 +184,8 @@ def render_segment_task(
         video_renderer: Injected video renderer
         project: Project dictionary
         index: Segment index
-        audio_path: Path to audio file
+        audio_path: Path to audio file (usually the upstream audio future)
+        screenshot_path: Captured screenshot (usually the upstream screenshot future)
         
     Returns:
         Path to rendered segment
@@ -183,6 +195,8 @@ def render_segment_task(
     
     logger.info(f"🎬 Rendering segment {index + 1}: {project_name}")
     
+    project = {**project, 'audio_path': audio_path, 'screenshot_path': screenshot_path or ''}
+    
     try:
         segment_path = video_renderer.render_segment(project, index, audio_path)
         logger.info(f"✅ Segment rendered: {segment_path}")
@@ -193,7 +207,28 @@ def render_segment_task(
         raise
 
 
+@task(name="generate-intro-audio", retries=3, retry_delay_seconds=10, log_prints=True)
+@timed_stage("audio")
+def generate_intro_audio_task(
+    audio_generator: IAudioGenerator,
+    script: str,
+    audio_path: str
+) -> str:
+    """
+    Generate the episode intro narration (always regenerated - the script
+    names this run's projects).
+    
+    Returns:
+        Path to intro audio
+    """
+    logger = get_run_logger()
+    logger.info("🎙️ Generating intro audio")
+    audio_generator.generate_audio(script, audio_path)
+    return audio_path
+
+
 @task(name="render-intro", retries=2, log_prints=True)
+@timed_stage("render-intro")
 def render_intro_task(
     video_renderer: IVideoRenderer,
     episode_title: str,
@@ -228,6 +263,7 @@ def render_intro_task(
 
 
 @task(name="assemble-video", retries=2, log_prints=True)
+@timed_stage("assemble")
 def assemble_video_task(segment_files: List[str], output_path: str) -> str:
     """
     Note: Video assembly is handled by VideoPipeline internally.
@@ -247,6 +283,7 @@ def assemble_video_task(segment_files: List[str], output_path: str) -> str:
 
 
 @task(name="mark-published", retries=2, log_prints=True)
+@timed_stage("mark-published")
 def mark_published_task(
     project_provider: IProjectProvider,
     projects: List[Dict]
@@ -274,7 +311,7 @@ def mark_published_task(
 
 @flow(
     name="video-generation-solid",
-    task_runner=ThreadPoolTaskRunner(max_workers=4),
+    task_runner=ThreadPoolTaskRunner(max_workers=pipeline_max_workers()),
     log_prints=True
 )
 async def video_generation_flow(config_path: str = "config.json") -> str:
@@ -284,7 +321,9 @@ async def video_generation_flow(config_path: str = "config.json") -> str:
     This flow uses the Composition Root to create all SOLID components
     and then executes them with Prefect's orchestration capabilities:
     - Automatic retries on failures
-    - Concurrency control (4 parallel workers)
+    - Concurrency control (pipeline.max_workers parallel workers)
+    - True fan-out: tasks receive upstream futures, so each project's
+      segment renders as soon as its own audio and screenshot are ready
     - Monitoring UI at localhost:4200
     - Persistent job state
     
@@ -295,113 +334,101 @@ async def video_generation_flow(config_path: str = "config.json") -> str:
         Path to final generated video
     """
     logger = get_run_logger()
-    
-    logger.info("="*60)
-    logger.info("🎬 SOLID Video Generation Pipeline with Prefect")
-    logger.info("="*60)
-    
-    # Load configuration
-    with open(config_path, 'r') as f:
-        config = json.load(f)
-    
-    # Create SOLID pipeline through composition root
-    logger.info("🏗️  Creating SOLID components via Composition Root...")
-    pipeline = CompositionRoot.create_video_pipeline(config)
-    
-    # Setup directories
-    output_folder = "assets"
+    METRICS.reset()
+    reset_screenshot_cache_stats()
     delivery_folder = os.path.join("deliveries", datetime.now().strftime("%m-%d"))
-    os.makedirs(output_folder, exist_ok=True)
-    os.makedirs(delivery_folder, exist_ok=True)
-    
-    # ═══════════════════════════════════════════════════════════════
-    # STEP 1: Load Projects
-    # ═══════════════════════════════════════════════════════════════
-    projects = load_projects_task(pipeline.project_provider)
-    auto_select_task(pipeline.project_provider)
-    
-    # ═══════════════════════════════════════════════════════════════
-    # STEP 2: Generate Audio (Parallel)
-    # ═══════════════════════════════════════════════════════════════
-    logger.info("🎙️ Generating audio for all projects...")
-    
-    audio_paths = []
-    for project in projects:
-        audio_path = generate_audio_task.submit(
+    start_profiling()
+    try:
+        logger.info("="*60)
+        logger.info("🎬 SOLID Video Generation Pipeline with Prefect")
+        logger.info("="*60)
+    
+        # Load configuration
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+    
+        # Create SOLID pipeline through composition root
+        logger.info("🏗️  Creating SOLID components via Composition Root...")
+        pipeline = CompositionRoot.create_video_pipeline(config)
+    
+        # Setup directories
+        output_folder = "assets"
+        os.makedirs(output_folder, exist_ok=True)
+        os.makedirs(delivery_folder, exist_ok=True)
+    
+        # ═══════════════════════════════════════════════════════════════
+        # STEP 1: Load Projects (everything below fans out from this list)
+        # ═══════════════════════════════════════════════════════════════
+        projects = load_projects_task(pipeline.project_provider)
+        auto_select_future = auto_select_task.submit(pipeline.project_provider)
+    
+        # ═══════════════════════════════════════════════════════════════
+        # STEP 2: Audio + Screenshots (independent, submitted together)
+        # ═══════════════════════════════════════════════════════════════
+        logger.info("🎙️📸 Submitting audio and screenshot tasks...")
+    
+        audio_futures = [
+            generate_audio_task.submit(pipeline.audio_generator, project, output_folder)
+            for project in projects
+        ]
+        screenshot_futures = [
+            capture_screenshot_task.submit(pipeline.graphics_renderer, project)
+            for project in projects
+        ]
+    
+        episode_title = generate_episode_title(projects)
+        intro_audio_future = generate_intro_audio_task.submit(
             pipeline.audio_generator,
-            project,
-            output_folder
-        )
-        audio_paths.append(audio_path)
-    
-    # Wait for all audio generation to complete
-    audio_results = [ap.result() for ap in audio_paths]
-    
-    # Update projects with audio paths
-    for i, project in enumerate(projects):
-        project['audio_path'] = audio_results[i]
-    
-    # ═══════════════════════════════════════════════════════════════
-    # STEP 3: Capture Screenshots (Parallel)
-    # ═══════════════════════════════════════════════════════════════
-    logger.info("📸 Capturing screenshots...")
-    
-    for project in projects:
-        screenshot_path = capture_screenshot_task.submit(
-            pipeline.graphics_renderer,
-            project
+            generate_intro_script(projects),
+            os.path.join(output_folder, "intro_audio.mp3")
         )
-        project['screenshot_path'] = screenshot_path.result() or ''
-    
-    # ═══════════════════════════════════════════════════════════════
-    # STEP 4: Render Video Segments (Parallel)
-    # ═══════════════════════════════════════════════════════════════
-    logger.info("🎬 Rendering video segments...")
     
-    segment_futures = []
-    
-    # Render intro
-    episode_title = generate_episode_title(projects)
-    intro_audio_path = os.path.join(output_folder, "intro_audio.mp3")
-    pipeline.audio_generator.generate_audio(
-        generate_intro_script(projects),
-        intro_audio_path
-    )
-    
-    intro_future = render_intro_task.submit(
-        pipeline.video_renderer,
-        episode_title,
-        intro_audio_path,
-        output_folder
-    )
-    segment_futures.append(intro_future)
-    
-    # Render project segments
-    for i, project in enumerate(projects):
-        segment_future = render_segment_task.submit(
+        # ═══════════════════════════════════════════════════════════════
+        # STEP 3: Render Video Segments (each waits only on its own inputs)
+        # ═══════════════════════════════════════════════════════════════
+        intro_future = render_intro_task.submit(
             pipeline.video_renderer,
-            project,
-            i,
-            project['audio_path']
+            episode_title,
+            intro_audio_future,
+            output_folder
         )
-        segment_futures.append(segment_future)
-    
-    # Wait for all segments
-    segment_files = [sf.result() for sf in segment_futures]
-    
-    # ═══════════════════════════════════════════════════════════════
-    # STEP 5: Assemble Final Video
-    # ═══════════════════════════════════════════════════════════════
-    final_video = os.path.join(delivery_folder, "longform_github_roundup.mp4")
-    
-    # Use VideoAssembler to concatenate
-    pipeline.video_assembler.concatenate_segments(segment_files, final_video)
-    
-    # ═══════════════════════════════════════════════════════════════
-    # STEP 6: Mark Published
-    # ═══════════════════════════════════════════════════════════════
-    mark_published_task(pipeline.project_provider, projects)
-    
+        segment_futures = [intro_future]
+    
+        for i, project in enumerate(projects):
+            segment_futures.append(render_segment_task.submit(
+                pipeline.video_renderer,
+                project,
+                i,
+                audio_futures[i],
+                screenshot_futures[i]
+            ))
+    
+        # ═══════════════════════════════════════════════════════════════
+        # STEP 4: Assemble Final Video
+        # ═══════════════════════════════════════════════════════════════
+        segment_files = [sf.result() for sf in segment_futures]
+        for project, audio_future, screenshot_future in zip(projects, audio_futures, screenshot_futures):
+            project['audio_path'] = audio_future.result()
+            project['screenshot_path'] = screenshot_future.result() or ''
+        auto_select_future.wait()
+    
+        final_video = os.path.join(delivery_folder, "longform_github_roundup.mp4")
+    
+        # Use VideoAssembler to concatenate
+        with stage_span("concat"):
+            pipeline.video_assembler.concatenate_segments(segment_files, final_video)
+    
+        # ═══════════════════════════════════════════════════════════════
+        # STEP 5: Mark Published
+        # ═══════════════════════════════════════════════════════════════
+        mark_published_task(pipeline.project_provider, projects)
+    
+        logger.info(gantt())
+        logger.info(METRICS.summary())
+        logger.info(screenshot_cache_summary())
+    finally:
+        # Write the flamegraphs even when a task fails
+        finish_profiling(delivery_folder)
     logger.info("="*60)
     logger.info("✅ PIPELINE COMPLETE")
     logger.info("="*60)
@@ -0,0 +1,338 @@
+"""
+Opt-in sampling profiler with per-stage flamegraphs.
+
+When enabled, a background thread samples every thread's Python stack
+(sys._current_frames) every few milliseconds. Each sample is attributed to
+the core.metrics stage open on that thread (TaskGraph nodes, @timed_stage
+Prefect tasks, discovery/content spans), so a slow run shows whether frame
+generation, Pillow drawing, JSON I/O or subprocess waits dominate each stage.
+
+With PROFILE_TRACEMALLOC=1, frame-rendering stages also get tracemalloc
+snapshots on entry and exit and the top allocators by growth are written
+alongside the flamegraphs. tracemalloc is process-wide, so a snapshot diff
+holds every thread's allocations: spans are only measured while no other
+frame stage is open (overlapping spans are skipped and counted in the
+report), but non-frame work running at the same time is still included.
+Tracing also slows every allocation, so it is off by default.
+
+Outputs (in <delivery folder>/profile/):
+    <stage>.collapsed          Brendan Gregg collapsed stacks ("a;b;c 42")
+    <stage>.svg                flamegraph
+    all.collapsed / all.svg    every stage, rooted at the stage name
+    tracemalloc_<stage>.txt    top allocators (PROFILE_TRACEMALLOC=1 only)
+
+Enable with PROFILE_STAGES=1 (or --profile on the CLI). PROFILE_INTERVAL_MS
+sets the sampling interval (default 5 ms). Samples taken while a coroutine
+stage awaits are attributed to whatever stage the event loop thread is in.
+
+Only this process is sampled, so while profiling is enabled the card
+renderer (components/graphics/batch_renderer.py) and the chunked encoder
+(services/chunked_encoder.py) render in-process instead of in worker
+processes; otherwise the card and scroll stages would show nothing but
+future.result() waits. Expect those stages to run slower under --profile.
+"""
+
+import html
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.metrics import METRICS, Span
+
+# Frame-rendering stages whose allocations are tracked with tracemalloc
+# (TaskGraph node prefixes in video_automated, @timed_stage names in the flows)
+FRAME_STAGES = {"scroll", "intro", "title", "segment", "graphic", "short_graphic", "transition",
+                "render", "render-intro", "static-render", "graphics"}
+
+_TRACEMALLOC_FRAMES = 10
+_TOP_ALLOCATORS = 25
+_MIN_ALLOC_BYTES = 64 * 1024
+
+
+def profiling_enabled(argv: Optional[List[str]] = None) -> bool:
+    """True if PROFILE_STAGES is set or --profile is on the command line."""
+    argv = sys.argv if argv is None else argv
+    return os.environ.get("PROFILE_STAGES", "").lower() in ("1", "true", "yes") or "--profile" in argv
+
+
+class StageProfiler:
+    """
+    Sampling profiler keyed by metrics stage. Register with start(), which
+    hooks METRICS span enter/exit; stop() + write() produce the outputs.
+    """
+
+    def __init__(self, interval: float = 0.005, frame_stages=FRAME_STAGES, max_depth: int = 64,
+                 trace_allocations: bool = False):
+        self.interval = interval
+        self.frame_stages = set(frame_stages) if trace_allocations else set()
+        self.max_depth = max_depth
+        self.samples: Dict[str, Counter] = {}
+        self.sample_count = 0
+
+        self._lock = threading.Lock()
+        self._thread_stages: Dict[int, List[str]] = {}
+        self._snapshots: Dict[int, Tuple[str, tracemalloc.Snapshot]] = {}
+        self._alloc_stats: Dict[str, Counter] = {}
+        self._alloc_skipped: Counter = Counter()
+        self._open_frame_spans = 0
+        self._frame_epoch = 0
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+
+    # ------------------------------------------------------------------ #
+    # METRICS listener
+    # ------------------------------------------------------------------ #
+    def on_enter(self, span: Span) -> None:
+        ident = threading.get_ident()
+        tracked = span.stage in self.frame_stages and tracemalloc.is_tracing()
+        with self._lock:
+            self._thread_stages.setdefault(ident, []).append(span.stage)
+            if not tracked:
+                return
+            self._open_frame_spans += 1
+            self._frame_epoch += 1
+            epoch = self._frame_epoch
+            if self._open_frame_spans > 1:
+                # Another frame stage is open: neither diff would be its own
+                for other in self._snapshots:
+                    self._alloc_skipped[self._snapshots[other][0]] += 1
+                self._snapshots.clear()
+                self._alloc_skipped[span.stage] += 1
+                return
+        snapshot = self._snapshot()
+        with self._lock:
+            if self._frame_epoch == epoch:
+                self._snapshots[id(span)] = (span.stage, snapshot)
+            else:
+                self._alloc_skipped[span.stage] += 1
+
+    def on_exit(self, span: Span) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            stack = self._thread_stages.get(ident, [])
+            # Async spans on the event loop thread can close out of order
+            for i in range(len(stack) - 1, -1, -1):
+                if stack[i] == span.stage:
+                    del stack[i]
+                    break
+            if not stack:
+                self._thread_stages.pop(ident, None)
+            if span.stage not in self.frame_stages or not self._open_frame_spans:
+                return
+            self._open_frame_spans -= 1
+            entry = self._snapshots.pop(id(span), None)
+            epoch = self._frame_epoch
+        if entry is not None and tracemalloc.is_tracing():
+            after = self._snapshot()
+            with self._lock:
+                if self._frame_epoch != epoch:
+                    self._alloc_skipped[span.stage] += 1
+                    return
+            diff = after.compare_to(entry[1], "traceback")
+            with self._lock:
+                stats = self._alloc_stats.setdefault(span.stage, Counter())
+                for stat in diff:
+                    if stat.size_diff > 0:
+                        stats[self._format_traceback(stat.traceback)] += stat.size_diff
+
+    # ------------------------------------------------------------------ #
+    # Sampling
+    # ------------------------------------------------------------------ #
+    def start(self) -> "StageProfiler":
+        if self.frame_stages and not tracemalloc.is_tracing():
+            tracemalloc.start(_TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        METRICS.listeners.append(self)
+        self._sampler = threading.Thread(target=self._sample_loop, name="stage-profiler", daemon=True)
+        self._sampler.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join(timeout=2)
+        if self in METRICS.listeners:
+            METRICS.listeners.remove(self)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+    def _sample_loop(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                stages = {ident: stack[-1] for ident, stack in self._thread_stages.items() if stack}
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                stage = stages.get(ident)
+                if stage is None:
+                    continue
+                stack = self._collapse(frame)
+                with self._lock:
+                    self.samples.setdefault(stage, Counter())[stack] += 1
+                    self.sample_count += 1
+
+    def _collapse(self, frame) -> str:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        # Leave out the profiler's own bookkeeping
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    @staticmethod
+    def _format_traceback(traceback) -> str:
+        frame = traceback[-1] if len(traceback) else None
+        if frame is None:
+            return "<unknown>"
+        return f"{frame.filename}:{frame.lineno}"
+
+    # ------------------------------------------------------------------ #
+    # Output
+    # ------------------------------------------------------------------ #
+    def write(self, output_dir) -> List[Path]:
+        """Write collapsed stacks, flamegraphs and allocator reports; returns the paths."""
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        written = []
+        with self._lock:
+            samples = {stage: Counter(c) for stage, c in self.samples.items()}
+            allocs = {stage: Counter(c) for stage, c in self._alloc_stats.items()}
+            skipped = Counter(self._alloc_skipped)
+
+        combined = Counter()
+        for stage, stacks in samples.items():
+            written += self._write_stacks(out, stage, stacks)
+            for stack, count in stacks.items():
+                combined[f"{stage};{stack}"] += count
+        if combined:
+            written += self._write_stacks(out, "all", combined)
+
+        for stage in sorted(set(allocs) | set(skipped)):
+            stats = allocs.get(stage, Counter())
+            path = out / f"tracemalloc_{stage}.txt"
+            lines = [f"Top allocators during '{stage}' (net growth per span, summed)"]
+            if skipped[stage]:
+                lines.append(f"({skipped[stage]} span(s) overlapping another frame stage not measured)")
+            for location, size in stats.most_common(_TOP_ALLOCATORS):
+                if size < _MIN_ALLOC_BYTES:
+                    break
+                lines.append(f"{size / 1024 / 1024:10.2f} MB  {location}")
+            path.write_text("\n".join(lines) + "\n")
+            written.append(path)
+        return written
+
+    def _write_stacks(self, out: Path, name: str, stacks: Counter) -> List[Path]:
+        safe = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in name)
+        collapsed = out / f"{safe}.collapsed"
+        collapsed.write_text("".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items())))
+        svg = out / f"{safe}.svg"
+        svg.write_text(render_flamegraph(stacks, title=f"{name} — {sum(stacks.values())} samples "
+                                                       f"@ {self.interval * 1000:.0f} ms"))
+        return [collapsed, svg]
+
+    def summary(self) -> str:
+        with self._lock:
+            totals = {stage: sum(c.values()) for stage, c in self.samples.items()}
+        if not totals:
+            return "Profiler: no samples"
+        parts = ", ".join(f"{stage} {n}" for stage, n in sorted(totals.items(), key=lambda kv: -kv[1]))
+        return f"Profiler: {self.sample_count} samples ({parts})"
+
+
+# ---------------------------------------------------------------------- #
+# Flamegraph SVG
+# ---------------------------------------------------------------------- #
+def render_flamegraph(stacks: Counter, title: str = "", width: int = 1200, row_h: int = 16,
+                      min_width: float = 0.5) -> str:
+    """Render collapsed stacks as a self-contained flamegraph SVG (root at the bottom)."""
+    root: Dict = {"n": 0, "c": {}}
+    for stack, count in stacks.items():
+        node = root
+        node["n"] += count
+        for name in stack.split(";"):
+            node = node["c"].setdefault(name, {"n": 0, "c": {}})
+            node["n"] += count
+
+    def depth(node) -> int:
+        return 1 + max((depth(c) for c in node["c"].values()), default=0)
+
+    levels = depth(root) - 1
+    top = 30
+    height = top + levels * row_h + 10
+    total = root["n"] or 1
+    scale = (width - 20) / total
+    rects = []
+
+    def walk(node, x: float, level: int) -> None:
+        for name, child in sorted(node["c"].items()):
+            w = child["n"] * scale
+            if w >= min_width:
+                y = height - 10 - (level + 1) * row_h
+                hue = (hash(name.split(" (")[0]) % 55) + 5
+                label = html.escape(name)
+                pct = 100.0 * child["n"] / total
+                text = html.escape(name[: int(w / 7)]) if w > 28 else ""
+                rects.append(
+                    f'<g><title>{label} — {child["n"]} samples ({pct:.1f}%)</title>'
+                    f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{row_h - 1}" '
+                    f'fill="hsl({hue},85%,60%)" rx="2"/>'
+                    f'<text x="{x + 3:.1f}" y="{y + row_h - 4}">{text}</text></g>'
+                )
+                walk(child, x, level + 1)
+            x += w
+
+    walk(root, 10.0, 0)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="monospace" font-size="11">'
+        f'<rect width="100%" height="100%" fill="#fdfdf6"/>'
+        f'<text x="10" y="20" font-size="14">{html.escape(title)}</text>'
+        + "".join(rects) + "</svg>\n"
+    )
+
+
+# ---------------------------------------------------------------------- #
+# Entry-point helpers
+# ---------------------------------------------------------------------- #
+_ACTIVE: Optional[StageProfiler] = None
+
+
+def start_profiling() -> Optional[StageProfiler]:
+    """Start the process-wide profiler if enabled (env/CLI); returns it or None."""
+    global _ACTIVE
+    if _ACTIVE is None and profiling_enabled():
+        interval = float(os.environ.get("PROFILE_INTERVAL_MS", "5")) / 1000
+        trace = os.environ.get("PROFILE_TRACEMALLOC", "").lower() in ("1", "true", "yes")
+        _ACTIVE = StageProfiler(interval=max(0.001, interval), trace_allocations=trace).start()
+        print(f"🔬 Stage profiler on ({interval * 1000:.0f} ms sampling"
+              f"{', tracemalloc on frame stages' if trace else ''})")
+    return _ACTIVE
+
+
+def finish_profiling(output_dir) -> List[Path]:
+    """Stop the profiler (if running) and write its outputs into output_dir/profile."""
+    global _ACTIVE
+    if _ACTIVE is None:
+        return []
+    profiler, _ACTIVE = _ACTIVE, None
+    profiler.stop()
+    paths = profiler.write(Path(output_dir) / "profile")
+    print(profiler.summary())
+    if paths:
+        print(f"🔥 Flamegraphs written to {Path(output_dir) / 'profile'}")
+    return paths
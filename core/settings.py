@@ -0,0 +1,61 @@
+"""
+Per-process cached access to config.json.
+
+Render hot paths look up a single setting on every call (the still-segment
+fast path on each encode, the motion engine on each effect, the chunk count
+on each long render, the screenshot height on each prescale). load_config()
+parses a config file once per process and path; setting() reads one key of
+one section from it. Environment overrides stay with the callers.
+
+A relative path is looked up in the working directory first, then in the
+project root, so every module sees the same file whichever directory a
+script is started from.
+
+    from core.settings import setting
+    workers = setting('pipeline', 'card_workers', 4)
+
+The parsed dict is shared: treat it as read-only. reload_config() drops the
+cache (e.g. after the file is rewritten by a long-running process).
+"""
+
+import functools
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path: str) -> Dict:
+    try:
+        with open(path, 'r') as f:
+            config = json.load(f)
+        return config if isinstance(config, dict) else {}
+    except Exception:
+        return {}
+
+
+def _resolve(config_path: str) -> str:
+    if os.path.isabs(config_path) or os.path.exists(config_path):
+        return os.path.abspath(config_path)
+    return str(PROJECT_ROOT / config_path)
+
+
+def load_config(config_path: str = "config.json") -> Dict:
+    """Parsed config ({} if missing or invalid), cached per absolute path."""
+    return _read(_resolve(config_path))
+
+
+def setting(section: str, key: str, default: Any = None, config_path: str = "config.json") -> Any:
+    """config[section][key], or default when the file, section or key is missing."""
+    values = load_config(config_path).get(section)
+    if not isinstance(values, dict):
+        return default
+    return values.get(key, default)
+
+
+def reload_config() -> None:
+    """Forget every cached config file."""
+    _read.cache_clear()
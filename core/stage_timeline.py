@@ -0,0 +1,121 @@
+"""
+Stage timeline for the Prefect flows.
+
+Tasks are wrapped with @timed_stage("audio") (under @task), which measures
+each call as a core.metrics span and marks its stage as a flow stage. At the
+end of a flow, gantt() renders one bar per flow stage from METRICS.spans on a
+shared time axis, so the achieved overlap between audio, graphics, MiniMax
+and render work is visible directly in the flow log. Spans opened inside a
+task (API calls, frame rendering) stay in METRICS.summary() only, so task
+time is not counted twice.
+
+Both flows run tasks on a ThreadPoolTaskRunner in this process, so the
+process-wide METRICS recorder sees every task.
+"""
+
+import functools
+import os
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from core.metrics import METRICS, MetricsRecorder
+from core.settings import setting
+
+
+def pipeline_max_workers(config_path: str = "config.json", default: int = 4) -> int:
+    """
+    Task runner worker count: env PIPELINE_MAX_WORKERS, else
+    pipeline.max_workers in config.json, else `default`.
+    """
+    env = os.environ.get('PIPELINE_MAX_WORKERS')
+    if env and env.isdigit():
+        return max(1, int(env))
+    try:
+        return max(1, int(setting('pipeline', 'max_workers', default, config_path)))
+    except (TypeError, ValueError):
+        return default
+
+
+# Stages drawn by gantt(): everything opened through stage_span()/@timed_stage
+FLOW_STAGES: Set[str] = set()
+
+
+def stage_span(stage: str, label: str = "", recorder: Optional[MetricsRecorder] = None):
+    """METRICS.span() that also shows up on the Gantt: `with stage_span("concat"): ...`"""
+    FLOW_STAGES.add(stage)
+    return (recorder or METRICS).span(stage, label)
+
+
+def stage_summary(recorder: Optional[MetricsRecorder] = None,
+                  stages: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+    """
+    Per-stage aggregates of the recorder's spans, in order of first start.
+
+    Args:
+        stages: Stages to include (default: FLOW_STAGES)
+
+    Returns:
+        {stage: {"count", "first", "last", "busy"}} with offsets in seconds
+        from the first span's start and busy = summed task time
+    """
+    recorder = recorder or METRICS
+    wanted = set(FLOW_STAGES if stages is None else stages)
+    with recorder._lock:
+        spans = [s for s in recorder.spans if s.stage in wanted]
+    if not spans:
+        return {}
+
+    origin = min(s.started_at for s in spans)
+    summary: Dict[str, Dict] = {}
+    for span in sorted(spans, key=lambda s: s.started_at):
+        start = span.started_at - origin
+        end = start + span.wall_s
+        s = summary.setdefault(span.stage, {"count": 0, "first": start, "last": end, "busy": 0.0})
+        s["count"] += 1
+        s["last"] = max(s["last"], end)
+        s["busy"] += span.wall_s
+    return summary
+
+
+def gantt(recorder: Optional[MetricsRecorder] = None, stages: Optional[Iterable[str]] = None,
+          width: int = 48) -> str:
+    """Render the per-stage Gantt chart plus overall parallelism."""
+    summary = stage_summary(recorder, stages)
+    if not summary:
+        return "Stage timeline: no tasks recorded"
+
+    wall = max(s["last"] for s in summary.values()) or 1e-9
+    busy_total = sum(s["busy"] for s in summary.values())
+    scale = width / wall
+
+    lines = [f"Stage timeline (wall {wall:.1f}s, one column = {wall / width:.2f}s)"]
+    for stage, s in summary.items():
+        start_col = int(s["first"] * scale)
+        end_col = max(start_col + 1, int(round(s["last"] * scale)))
+        bar = " " * start_col + "█" * (end_col - start_col)
+        span = s["last"] - s["first"]
+        lines.append(
+            f"  {stage:<14} |{bar:<{width}}| {s['first']:6.1f}s → {s['last']:6.1f}s  "
+            f"{s['count']:>3} task(s)  busy {s['busy']:.1f}s"
+            + (f"  (x{s['busy'] / span:.1f})" if span > 0 else "")
+        )
+    lines.append(f"  Parallelism: {busy_total:.1f}s of task time in {wall:.1f}s wall "
+                 f"(x{busy_total / wall:.1f})")
+    return "\n".join(lines)
+
+
+def timed_stage(stage: str, recorder: Optional[MetricsRecorder] = None) -> Callable:
+    """
+    Decorator measuring each call as a core.metrics span of `stage` (wall,
+    CPU, RSS, bytes out) drawn on the Gantt. Apply beneath @task so retries
+    and cache hits are timed as the task body sees them.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage_span(stage, fn.__name__, recorder) as metrics_span:
+                result = fn(*args, **kwargs)
+                if isinstance(result, str):
+                    metrics_span.add_output(result)
+                return result
+        return wrapper
+    return decorator
@@ -0,0 +1,190 @@
+"""
+Input-hash caching for Prefect tasks that produce files.
+
+Each cached task gets a cache_key_fn built from a `build_key(parameters)`
+function returning the inputs that determine its output (script text, voice
+config, screenshot/audio digests, RENDERER_VERSION, output path). Results are
+persisted to RESULTS_DIR, so re-running a flow after a partial failure skips
+every completed unit.
+
+A cached result is only a path, so the key function also checks the artifact
+itself: after each successful run the task records a manifest (path, size,
+mtime) for its key, and a record whose artifact was deleted or overwritten
+since is dropped before Prefect looks it up. Hits are therefore always real.
+
+    @task(**cached_task_options("audio", audio_key))
+    @record_artifact("audio", audio_key)
+    def generate_audio_task(text, output_path): ...
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+# Bump when a renderer changes its output so cached renders are rebuilt
+RENDERER_VERSION = "2026.10.1"
+
+RESULTS_DIR = Path("assets/cache/prefect")
+MANIFEST_DIR = RESULTS_DIR / "artifacts"
+
+_digest_cache: Dict[Tuple[str, int, int], str] = {}
+_digest_lock = threading.Lock()
+
+
+def file_digest(path: Optional[str]) -> Optional[str]:
+    """sha256 of a file's contents (memoized by path/size/mtime), None if missing."""
+    if not path or not os.path.exists(path):
+        return None
+    st = os.stat(path)
+    memo_key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    with _digest_lock:
+        if memo_key in _digest_cache:
+            return _digest_cache[memo_key]
+
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    digest = h.hexdigest()
+    with _digest_lock:
+        _digest_cache[memo_key] = digest
+    return digest
+
+
+def compute_key(kind: str, material: Dict) -> str:
+    payload = json.dumps({"kind": kind, "material": material}, sort_keys=True, default=str)
+    return f"{kind}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+# ---------------------------------------------------------------------- #
+# Artifact manifests
+# ---------------------------------------------------------------------- #
+def _manifest_path(key: str) -> Path:
+    return MANIFEST_DIR / f"{key}.json"
+
+
+def _write_manifest(key: str, result) -> None:
+    entry = {"path": None}
+    if isinstance(result, str) and os.path.exists(result):
+        st = os.stat(result)
+        entry = {"path": result, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    MANIFEST_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = _manifest_path(key).with_suffix(".tmp")
+    tmp.write_text(json.dumps(entry))
+    os.replace(tmp, _manifest_path(key))
+
+
+def _artifact_valid(key: str) -> bool:
+    try:
+        entry = json.loads(_manifest_path(key).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    path = entry.get("path")
+    if path is None:
+        return True  # Task legitimately produced no file (e.g. MiniMax disabled)
+    if not os.path.exists(path):
+        return False
+    st = os.stat(path)
+    return st.st_size == entry.get("size") and st.st_mtime_ns == entry.get("mtime_ns")
+
+
+# ---------------------------------------------------------------------- #
+# Hit / miss accounting
+# ---------------------------------------------------------------------- #
+class CacheStats:
+    """Per-task-kind hit/miss/stale counts for the flow summary."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+    def add(self, kind: str, outcome: str) -> None:
+        with self._lock:
+            c = self.counts.setdefault(kind, {"hit": 0, "miss": 0, "stale": 0})
+            c[outcome] += 1
+
+    def summary(self) -> str:
+        with self._lock:
+            counts = {k: dict(v) for k, v in self.counts.items()}
+        if not counts:
+            return "Task cache: no cached tasks ran"
+        lines = ["Task cache (hits / lookups):"]
+        total_hits = total = 0
+        for kind, c in sorted(counts.items()):
+            lookups = c["hit"] + c["miss"] + c["stale"]
+            total_hits += c["hit"]
+            total += lookups
+            stale = f", {c['stale']} stale dropped" if c["stale"] else ""
+            lines.append(f"  {kind:<10} {c['hit']:>3} / {lookups}{stale}")
+        lines.append(f"  {'total':<10} {total_hits:>3} / {total} "
+                     f"({100 * total_hits / total if total else 0:.0f}% reused)")
+        return "\n".join(lines)
+
+
+CACHE_STATS = CacheStats()
+
+
+# ---------------------------------------------------------------------- #
+# Prefect wiring
+# ---------------------------------------------------------------------- #
+def make_cache_key_fn(kind: str, build_key: Callable[[Dict], Dict]) -> Callable:
+    """
+    Build a Prefect cache_key_fn(context, parameters) for one task kind.
+    Drops the persisted record when its artifact is no longer valid, so the
+    task re-runs and re-persists under the same key.
+    """
+    def cache_key_fn(context, parameters: Dict) -> str:
+        key = compute_key(kind, build_key(parameters))
+        record = RESULTS_DIR / key
+        if record.exists():
+            if _artifact_valid(key):
+                CACHE_STATS.add(kind, "hit")
+            else:
+                record.unlink(missing_ok=True)
+                CACHE_STATS.add(kind, "stale")
+        else:
+            CACHE_STATS.add(kind, "miss")
+        return key
+
+    cache_key_fn.__name__ = f"{kind}_cache_key"
+    return cache_key_fn
+
+
+def record_artifact(kind: str, build_key: Callable[[Dict], Dict]) -> Callable:
+    """
+    Decorator (beneath @task) that records the artifact manifest for the
+    call's cache key once the task body succeeds.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            result = fn(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            _write_manifest(compute_key(kind, build_key(dict(bound.arguments))), result)
+            return result
+        return wrapper
+    return decorator
+
+
+def cached_task_options(kind: str, build_key: Callable[[Dict], Dict]) -> Dict:
+    """@task keyword arguments enabling input-hash caching with local result persistence."""
+    from prefect.filesystems import LocalFileSystem
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    return {
+        "cache_key_fn": make_cache_key_fn(kind, build_key),
+        "persist_result": True,
+        "result_storage": LocalFileSystem(basepath=str(RESULTS_DIR.resolve())),
+    }
@@ -0,0 +1,255 @@
+"""
+Event-driven task graph scheduler.
+
+Replaces stage barriers ("all audio, then all graphics, then all renders")
+with a per-node dependency graph: a node starts the moment its own
+dependencies finish and a slot in its resource pool is free, so project 1's
+segment can be encoding while project 12's narration is still synthesizing.
+
+    graph = TaskGraph(pools={"tts": 3, "ffmpeg": 4})
+    graph.add("tts:p1", generate_audio, text, path, pool="tts")
+    graph.add("segment:p1", render, deps=["tts:p1"], pool="ffmpeg")
+    results = await graph.run()
+    print(graph.report())
+
+Nodes are plain callables (run in a thread pool) or coroutine functions
+(awaited directly). A failed node marks everything downstream as skipped.
+Every node runs inside a core.metrics span named after its prefix
+("segment:p3" → stage "segment").
+After a run, report() prints the critical path - the chain of
+last-finishing dependencies that actually determined the makespan.
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from core.metrics import METRICS
+
+
+@dataclass
+class TaskNode:
+    """One unit of work in a TaskGraph."""
+    name: str
+    fn: Callable
+    args: tuple = ()
+    kwargs: Dict = field(default_factory=dict)
+    deps: List[str] = field(default_factory=list)
+    pool: str = "default"
+
+    status: str = "pending"        # pending → running → done | failed | skipped
+    ready_at: Optional[float] = None
+    start: Optional[float] = None
+    end: Optional[float] = None
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def duration(self) -> float:
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+    @property
+    def queued(self) -> float:
+        """Time spent waiting for a pool slot after dependencies were met."""
+        if self.ready_at is None or self.start is None:
+            return 0.0
+        return self.start - self.ready_at
+
+
+class TaskGraph:
+    """
+    Dependency graph executed by an event-driven asyncio scheduler.
+
+    Args:
+        pools: Max concurrent nodes per resource pool (unknown pools get 1 slot)
+        max_threads: Thread pool size for blocking nodes (default: sum of pools)
+    """
+
+    def __init__(self, pools: Optional[Dict[str, int]] = None, max_threads: Optional[int] = None):
+        self.pools = dict(pools or {})
+        self.max_threads = max_threads or max(4, sum(self.pools.values()))
+        self.nodes: Dict[str, TaskNode] = {}
+        self._origin: Optional[float] = None
+
+    def add(self, name: str, fn: Callable, *args, deps=(), pool: str = "default", **kwargs) -> str:
+        """Register a node; returns its name so callers can chain deps."""
+        if name in self.nodes:
+            raise ValueError(f"Duplicate task name: {name}")
+        self.nodes[name] = TaskNode(name=name, fn=fn, args=args, kwargs=kwargs,
+                                    deps=list(deps), pool=pool)
+        return name
+
+    def result(self, name: str, default: Any = None) -> Any:
+        node = self.nodes.get(name)
+        return node.result if node and node.status == "done" else default
+
+    @property
+    def failed(self) -> List[TaskNode]:
+        return [n for n in self.nodes.values() if n.status in ("failed", "skipped")]
+
+    def _validate(self) -> None:
+        for node in self.nodes.values():
+            for dep in node.deps:
+                if dep not in self.nodes:
+                    raise ValueError(f"{node.name} depends on unknown task {dep}")
+
+        # Kahn's algorithm - anything left over is part of a cycle
+        indegree = {name: len(node.deps) for name, node in self.nodes.items()}
+        dependents = self._dependents()
+        ready = [name for name, d in indegree.items() if d == 0]
+        seen = 0
+        while ready:
+            name = ready.pop()
+            seen += 1
+            for child in dependents[name]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        if seen != len(self.nodes):
+            cyclic = sorted(name for name, d in indegree.items() if d > 0)
+            raise ValueError(f"Task graph has a cycle involving: {', '.join(cyclic)}")
+
+    def _dependents(self) -> Dict[str, List[str]]:
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for dep in node.deps:
+                dependents[dep].append(node.name)
+        return dependents
+
+    async def _execute(self, node: TaskNode, semaphores: Dict[str, asyncio.Semaphore],
+                       executor: ThreadPoolExecutor) -> TaskNode:
+        node.ready_at = time.perf_counter()
+        async with semaphores[node.pool]:
+            node.status = "running"
+            node.start = time.perf_counter()
+            try:
+                if asyncio.iscoroutinefunction(node.fn):
+                    with METRICS.span(node.name.split(":")[0], node.name) as span:
+                        node.result = await node.fn(*node.args, **node.kwargs)
+                        span.add_output(node.result if isinstance(node.result, (str, Path)) else None)
+                else:
+                    loop = asyncio.get_running_loop()
+                    node.result = await loop.run_in_executor(
+                        executor, functools.partial(self._run_measured, node)
+                    )
+                node.status = "done"
+            except Exception as e:
+                node.error = e
+                node.status = "failed"
+                print(f"⚠️  Task {node.name} failed: {e}")
+            finally:
+                node.end = time.perf_counter()
+        return node
+
+    @staticmethod
+    def _run_measured(node: TaskNode) -> Any:
+        """Run a blocking node in its worker thread, inside a metrics span."""
+        with METRICS.span(node.name.split(":")[0], node.name) as span:
+            result = node.fn(*node.args, **node.kwargs)
+            span.add_output(result if isinstance(result, (str, Path)) else None)
+            return result
+
+    def _skip_downstream(self, name: str, dependents: Dict[str, List[str]]) -> None:
+        for child in dependents[name]:
+            node = self.nodes[child]
+            if node.status == "pending":
+                node.status = "skipped"
+                self._skip_downstream(child, dependents)
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Execute the graph. Each completion immediately releases the nodes
+        that were only waiting on it.
+
+        Returns:
+            {name: result} for every node that completed
+        """
+        self._validate()
+        self._origin = time.perf_counter()
+
+        dependents = self._dependents()
+        waiting = {name: len(node.deps) for name, node in self.nodes.items()}
+        semaphores = {
+            pool: asyncio.Semaphore(max(1, self.pools.get(pool, 1)))
+            for pool in {node.pool for node in self.nodes.values()}
+        }
+
+        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+            running = {
+                asyncio.ensure_future(self._execute(self.nodes[name], semaphores, executor))
+                for name, count in waiting.items() if count == 0
+            }
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    node = future.result()
+                    if node.status != "done":
+                        self._skip_downstream(node.name, dependents)
+                        continue
+                    for child in dependents[node.name]:
+                        waiting[child] -= 1
+                        if waiting[child] == 0 and self.nodes[child].status == "pending":
+                            running.add(asyncio.ensure_future(
+                                self._execute(self.nodes[child], semaphores, executor)
+                            ))
+
+        return {name: node.result for name, node in self.nodes.items() if node.status == "done"}
+
+    # ------------------------------------------------------------------ #
+    # Reporting
+    # ------------------------------------------------------------------ #
+    def critical_path(self) -> List[TaskNode]:
+        """
+        Walk back from the last node to finish, always following the
+        dependency that finished last (the one that actually gated it).
+        """
+        finished = [n for n in self.nodes.values() if n.end is not None]
+        if not finished:
+            return []
+
+        path = [max(finished, key=lambda n: n.end)]
+        while True:
+            deps = [self.nodes[d] for d in path[-1].deps if self.nodes[d].end is not None]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda n: n.end))
+        path.reverse()
+        return path
+
+    def report(self) -> str:
+        """Makespan, total work, per-pool busy time and the critical path."""
+        finished = [n for n in self.nodes.values() if n.end is not None]
+        if not finished or self._origin is None:
+            return "Task graph: nothing ran"
+
+        makespan = max(n.end for n in finished) - self._origin
+        work = sum(n.duration for n in finished)
+
+        pools: Dict[str, List[float]] = {}
+        for n in finished:
+            pools.setdefault(n.pool, []).append(n.duration)
+
+        lines = [
+            f"Task graph: {len(finished)} tasks, makespan {makespan:.1f}s, "
+            f"{work:.1f}s of work (x{work / makespan if makespan else 0:.1f} overlap)"
+        ]
+        for pool, durations in sorted(pools.items()):
+            lines.append(f"  pool {pool:<10} {len(durations):>3} tasks  busy {sum(durations):7.1f}s  "
+                         f"(limit {self.pools.get(pool, 1)})")
+        if self.failed:
+            lines.append(f"  ⚠️  {len(self.failed)} failed/skipped: "
+                         + ", ".join(n.name for n in self.failed[:8])
+                         + (" ..." if len(self.failed) > 8 else ""))
+
+        path = self.critical_path()
+        lines.append(f"  Critical path ({sum(n.duration + n.queued for n in path):.1f}s incl. queueing):")
+        for n in path:
+            wait = f", queued {n.queued:.1f}s" if n.queued >= 0.05 else ""
+            lines.append(f"    {n.start - self._origin:7.1f}s  {n.name:<28} {n.duration:6.1f}s{wait}")
+        return "\n".join(lines)
@@ -511,6 +511,9 @@ if __name__ == "__main__":
     p.add_argument("--api-key", default="")
     args = p.parse_args()
 
+    from services.http_transport import install_from_env, print_transport_summary
+    install_from_env("exa_discovery")
+
     api_key = args.api_key or EXA_API_KEY
     if not api_key:
         print("ERROR: No Exa API key. Add to config.json under exa.api_key")
@@ -521,3 +524,4 @@ if __name__ == "__main__":
         count=args.count,
         discover_only=args.discover_only,
     )
+    print_transport_summary()
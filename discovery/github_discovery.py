@@ -18,7 +18,7 @@ Configuration:
     
 Output:
     - github_urls.txt: 15 new URLs appended
-    - repo_history.json: Permanent dedup history
+    - repo_history.jsonl: Permanent dedup history
     - discovery_runs/YYYY-MM-DD.json: Detailed run artifact
 """
 
@@ -35,6 +35,9 @@ try:
     from discovery.repo_filter import RepoFilter, EnrichedRepo
     from utils.mistral_scorer import MistralScorer
     from content.output_writer import OutputWriter
+    from services.llm_cache import print_llm_cache_report
+    from core.metrics import METRICS
+    from services.http_transport import install_from_env, print_transport_summary
 except ImportError as e:
     print(f"Error importing modules: {e}")
     print("Ensure you're running from the opensourcescribes directory.")
@@ -123,15 +126,16 @@ class GitHubDiscoveryPipeline:
             
             try:
                 if hasattr(source, 'fetch'):
-                    if isinstance(source, GitHubSearchAPISource):
-                        # Search API needs parameters
-                        candidates = source.fetch(
-                            per_page=self.SEARCH_RESULTS_PER_QUERY,
-                            days_back=self.SEARCH_DAYS_BACK
-                        )
-                    else:
-                        # Trending uses default
-                        candidates = source.fetch()
+                    with METRICS.span("discovery", source_name):
+                        if isinstance(source, GitHubSearchAPISource):
+                            # Search API needs parameters
+                            candidates = source.fetch(
+                                per_page=self.SEARCH_RESULTS_PER_QUERY,
+                                days_back=self.SEARCH_DAYS_BACK
+                            )
+                        else:
+                            # Trending uses default
+                            candidates = source.fetch()
                     
                     print(f"  {source_name}: found {len(candidates)} candidates")
                     all_candidates.extend(candidates)
@@ -300,7 +304,7 @@ class GitHubDiscoveryPipeline:
             print("DRY RUN MODE - Skipping output writes")
             print("\nWould write:")
             print(f"  - {len(selected_repos)} URLs to github_urls.txt")
-            print(f"  - {len(selected_repos)} entries to repo_history.json")
+            print(f"  - {len(selected_repos)} entries to repo_history.jsonl")
             print(f"  - Run artifact to discovery_runs/")
             return
         
@@ -326,7 +330,8 @@ class GitHubDiscoveryPipeline:
             return
         
         # Phase 2: Enrichment
-        pre_filter_repos = self.enrich_candidates(candidates)
+        with METRICS.span("enrichment"):
+            pre_filter_repos = self.enrich_candidates(candidates)
         if not pre_filter_repos:
             print("\nNo repos could be enriched. Exiting.")
             return
@@ -338,7 +343,8 @@ class GitHubDiscoveryPipeline:
             return
         
         # Phase 4: Scoring
-        top_repos = self.score_and_rank(filtered_repos)
+        with METRICS.span("scoring"):
+            top_repos = self.score_and_rank(filtered_repos)
         if not top_repos:
             print("\nNo repos scored successfully. Exiting.")
             return
@@ -416,6 +422,9 @@ Examples:
     
     # Headless mode
     headless = not args.no_headless
+
+    # Optional record/replay of every HTTP call (HTTP_CASSETTE_MODE)
+    install_from_env("discovery")
     
     try:
         pipeline = GitHubDiscoveryPipeline(
@@ -426,6 +435,9 @@ Examples:
         )
         
         pipeline.run()
+        print_llm_cache_report()
+        print("\n" + METRICS.summary())
+        print_transport_summary()
         
     except KeyboardInterrupt:
         print("\n\nPipeline interrupted by user.")
@@ -11,6 +11,7 @@ from typing import List, Dict, Set, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from discovery.discovery_sources import RepoCandidate
+from discovery.repo_history import RepoHistoryStore, get_history_store
 
 
 @dataclass
@@ -43,7 +44,7 @@ class RepoFilter:
     """
     
     STALE_DAYS = 30
-    HISTORY_FILE = "repo_history.json"
+    HISTORY_FILE = RepoHistoryStore.HISTORY_FILE
     QUEUE_FILE = "github_urls.txt"
     
     def __init__(self, history_file: Optional[str] = None, queue_file: Optional[str] = None):
@@ -62,17 +63,9 @@ class RepoFilter:
             if len(parts) >= 2:
                 self._queued_repo_names.add(parts[-1].lower())
     
-    def _load_history(self) -> Dict:
-        """Load repo history JSON file."""
-        if not os.path.exists(self.history_file):
-            return {}
-        
-        try:
-            with open(self.history_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            print(f"Warning: Could not load {self.history_file}")
-            return {}
+    def _load_history(self) -> RepoHistoryStore:
+        """Load the shared repo history index (migrates repo_history.json on first use)."""
+        return get_history_store(self.history_file)
     
     def _load_queue(self) -> Set[str]:
         """Load currently queued URLs from github_urls.txt."""
@@ -181,7 +174,7 @@ class RepoFilter:
                 # Invalid date, skip
                 return False
         
-        # Filter 5: Already covered (in repo_history.json)
+        # Filter 5: Already covered (in repo_history.jsonl)
         if enriched_repo.full_name in self._history_data:
             return False
         
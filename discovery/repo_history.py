@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Append-only repo history store for discovery dedup.
+
+History lives in repo_history.jsonl, one JSON record per line:
+    {"full_name": "owner/repo", "url": "...", "added_at": "...", "run_id": "..."}
+
+The store keeps a compact in-memory index (set of full names) that is built
+once per process and then only extended by reading bytes appended since the
+last read, so a discovery run no longer re-parses the whole history.
+The legacy repo_history.json dict is migrated automatically on first use.
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set
+
+
+class RepoHistoryStore:
+    """
+    JSONL-backed, append-only history of every repo ever queued.
+
+    Usage:
+        store = get_history_store()
+        if "owner/repo" in store: ...
+        store.add_entries([{"full_name": "owner/repo", "url": "..."}], run_id)
+    """
+
+    HISTORY_FILE = "repo_history.jsonl"
+    LEGACY_HISTORY_FILE = "repo_history.json"
+
+    def __init__(self, history_file: Optional[str] = None, legacy_file: Optional[str] = None):
+        """Initialize store with custom paths (legacy file is only read during migration)."""
+        self.history_file = history_file or self.HISTORY_FILE
+        self.legacy_file = legacy_file or self.LEGACY_HISTORY_FILE
+
+        self._index: Set[str] = set()
+        self._offset = 0  # Bytes of history_file already folded into the index
+
+        self.migrate_legacy()
+        self.refresh()
+
+    # ------------------------------------------------------------------ #
+    # Index
+    # ------------------------------------------------------------------ #
+    def refresh(self) -> int:
+        """
+        Fold any lines appended since the last read into the index.
+
+        Returns:
+            Number of new full names indexed
+        """
+        if not os.path.exists(self.history_file):
+            self._index.clear()
+            self._offset = 0
+            return 0
+
+        size = os.path.getsize(self.history_file)
+        if size < self._offset:
+            # File was replaced by something shorter (e.g. restored backup) - rebuild
+            self._index.clear()
+            self._offset = 0
+        if size == self._offset:
+            return 0
+
+        added = 0
+        with open(self.history_file, 'rb') as f:
+            f.seek(self._offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    # Partially written trailing line - pick it up on the next refresh
+                    # (add_entries terminates it, and it is then skipped as corrupt)
+                    break
+                self._offset += len(raw)
+                full_name = self._parse_full_name(raw)
+                if full_name and full_name not in self._index:
+                    self._index.add(full_name)
+                    added += 1
+        return added
+
+    @staticmethod
+    def _parse_full_name(raw: bytes) -> Optional[str]:
+        """Extract full_name from one JSONL record, skipping blank or corrupt lines."""
+        line = raw.strip()
+        if not line:
+            return None
+        try:
+            return json.loads(line).get("full_name")
+        except (json.JSONDecodeError, AttributeError, UnicodeDecodeError):
+            return None
+
+    def __contains__(self, full_name: str) -> bool:
+        return full_name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    # ------------------------------------------------------------------ #
+    # Writes
+    # ------------------------------------------------------------------ #
+    def add_entries(self, entries: Iterable[Dict], run_id: str) -> int:
+        """
+        Append entries that are not yet in history.
+
+        All new lines are written with a single append so a crash can at worst
+        leave one partial trailing line. Readers ignore it, and the next append
+        terminates it first so it cannot swallow the first new record.
+
+        Args:
+            entries: Dicts with at least 'full_name' and 'url'
+            run_id: Run identifier (usually date)
+
+        Returns:
+            Number of entries added
+        """
+        self.refresh()
+        timestamp = datetime.now().isoformat() + "Z"
+
+        lines = []
+        pending: Set[str] = set()
+        for entry in entries:
+            full_name = entry["full_name"]
+            if full_name in self._index or full_name in pending:
+                continue
+            pending.add(full_name)
+            lines.append(json.dumps({
+                "full_name": full_name,
+                "url": entry.get("url", ""),
+                "added_at": entry.get("added_at", timestamp),
+                "run_id": entry.get("run_id", run_id),
+            }) + "\n")
+
+        if not lines:
+            return 0
+
+        Path(self.history_file).parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(lines).encode()
+        with open(self.history_file, 'ab+') as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    data = b'\n' + data  # Close the fragment of an interrupted append
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.refresh()
+        return len(lines)
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Yield every history record (full scan - for audits and compaction only)."""
+        if not os.path.exists(self.history_file):
+            return
+        with open(self.history_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def compact(self) -> int:
+        """
+        Rewrite the history without duplicate or corrupt lines (temp file + rename).
+
+        Returns:
+            Number of records kept
+        """
+        seen: Set[str] = set()
+        records = []
+        for record in self.iter_records():
+            full_name = record.get("full_name")
+            if full_name and full_name not in seen:
+                seen.add(full_name)
+                records.append(record)
+
+        self._atomic_write(records)
+        self._index.clear()
+        self._offset = 0
+        self.refresh()
+        return len(records)
+
+    def _atomic_write(self, records: Iterable[Dict]) -> None:
+        """Write a full JSONL file next to the target and rename it into place."""
+        target = Path(self.history_file)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(target.parent), prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # ------------------------------------------------------------------ #
+    # One-time migration from repo_history.json
+    # ------------------------------------------------------------------ #
+    def migrate_legacy(self) -> int:
+        """
+        Convert the legacy repo_history.json dict into JSONL.
+
+        Only runs when the JSONL file does not exist yet. The legacy file is
+        left in place untouched so the migration can be audited or re-run.
+
+        Returns:
+            Number of records migrated
+        """
+        if os.path.exists(self.history_file) or not os.path.exists(self.legacy_file):
+            return 0
+
+        try:
+            with open(self.legacy_file, 'r') as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            print(f"Warning: Could not load {self.legacy_file} for migration")
+            return 0
+
+        if not isinstance(legacy, dict):
+            return 0
+
+        records = [
+            {
+                "full_name": full_name,
+                "url": (meta or {}).get("url", f"https://github.com/{full_name}"),
+                "added_at": (meta or {}).get("added_at", ""),
+                "run_id": (meta or {}).get("run_id", "migration"),
+            }
+            for full_name, meta in legacy.items()
+        ]
+        self._atomic_write(records)
+        print(f"  Migrated {len(records)} entries from {self.legacy_file} to {self.history_file}")
+        return len(records)
+
+
+_STORES: Dict[str, RepoHistoryStore] = {}
+
+
+def get_history_store(history_file: Optional[str] = None,
+                      legacy_file: Optional[str] = None) -> RepoHistoryStore:
+    """
+    Return the process-wide store for a history path.
+
+    RepoFilter and OutputWriter share one instance, so the index is built
+    once per run and later appends only touch the new lines.
+    """
+    path = os.path.abspath(history_file or RepoHistoryStore.HISTORY_FILE)
+    store = _STORES.get(path)
+    if store is None:
+        store = RepoHistoryStore(history_file=history_file, legacy_file=legacy_file)
+        _STORES[path] = store
+    else:
+        store.refresh()
+    return store
+
+
+def main():
+    """Migrate repo_history.json and report history size."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Migrate / compact repo history")
+    parser.add_argument('--history', default=RepoHistoryStore.HISTORY_FILE, help='JSONL history file')
+    parser.add_argument('--legacy', default=RepoHistoryStore.LEGACY_HISTORY_FILE, help='Legacy JSON history file')
+    parser.add_argument('--compact', action='store_true', help='Drop duplicate/corrupt lines')
+    args = parser.parse_args()
+
+    store = RepoHistoryStore(history_file=args.history, legacy_file=args.legacy)
+    if args.compact:
+        kept = store.compact()
+        print(f"Compacted {args.history}: {kept} records")
+    print(f"{args.history}: {len(store)} repos in history")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Chunked parallel encoding of long animated renders.
+
+One Pillow producer feeding one libx264 process tops out at roughly a core
+and a half. For long renders, encode_frames() splits the frame range into K
+time chunks. Each chunk is rendered by its own worker process, which runs its
+own RawFrameSink and encoder. The chunks are closed-GOP, start on an IDR
+frame and use identical encoder settings, so the concat demuxer stitches
+them with stream copy (no re-encode), and the result drops into the
+concat-based assembler like a single-pass clip.
+
+The frame source must be picklable: fill(n, slot) with n the absolute frame
+index (e.g. components.video.scroll_animation.ScrollAnimation).
+
+Chunk count: env RENDER_CHUNKS, else video_settings.render_chunks in
+config.json, else "auto" (about one chunk per two cores, each at least
+CHUNK_MIN_SECONDS long). 0 or 1 disables chunking, and so does profiling
+(PROFILE_STAGES=1 / --profile), which only samples this process.
+"""
+
+import multiprocessing
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from core.profiling import profiling_enabled
+from core.settings import setting
+from services.frame_sink import RawFrameSink
+
+CHUNK_MIN_SECONDS = 5.0
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _configured_chunks(config_path: str = "config.json") -> Optional[int]:
+    """Explicit chunk count from env/config, or None for auto."""
+    value = os.environ.get('RENDER_CHUNKS', '').strip().lower()
+    if not value:
+        value = str(setting('video_settings', 'render_chunks', 'auto', config_path)).lower()
+    return int(value) if value.isdigit() else None
+
+
+def plan_chunks(frame_count: int, fps: int, chunks: Optional[int] = None) -> List[range]:
+    """Split [0, frame_count) into contiguous frame ranges, one per worker."""
+    if profiling_enabled():
+        # Render in this process, where the stage profiler can sample it
+        chunks = 1
+    if chunks is None:
+        chunks = _configured_chunks()
+    if chunks is None:
+        by_cores = max(1, (os.cpu_count() or 2) // 2)
+        by_length = int(frame_count / (CHUNK_MIN_SECONDS * fps))
+        chunks = min(by_cores, by_length)
+    chunks = max(1, min(chunks, frame_count))
+    bounds = [round(i * frame_count / chunks) for i in range(chunks + 1)]
+    return [range(bounds[i], bounds[i + 1]) for i in range(chunks)]
+
+
+def _raw_input_args(width: int, height: int, fps: int) -> List[str]:
+    return ['-f', 'rawvideo', '-vcodec', 'rawvideo',
+            '-s', f'{width}x{height}', '-pix_fmt', 'rgb24', '-r', str(fps),
+            '-i', 'pipe:0']
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # Segments render on Prefect/asyncio worker threads, and forking a
+            # multithreaded process can copy a lock another thread holds
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _POOL = ProcessPoolExecutor(max_workers=max(workers, os.cpu_count() or 1), mp_context=ctx)
+        return _POOL
+
+
+def _encode_chunk(fill: Callable, frames: range, cmd: List[str], width: int, height: int):
+    """Worker: render frames[start:end] (absolute indices) into one chunk file."""
+    start = frames.start
+    sink = RawFrameSink(cmd, width, height)
+    sink.run(len(frames), lambda n, slot: fill(start + n, slot))
+    return sink.returncode, sink.stderr_text[-300:]
+
+
+def encode_frames(fill: Callable, frame_count: int, width: int, height: int, fps: int,
+                  output_path, encode_args: List[str], chunks: Optional[int] = None) -> bool:
+    """
+    Render fill(0..frame_count-1) and encode to output_path with encode_args
+    (codec/quality/pix_fmt output options), in parallel chunks when the
+    render is long enough.
+
+    Returns:
+        True on success (failures are printed)
+    """
+    output_path = Path(output_path)
+    plan = plan_chunks(frame_count, fps, chunks)
+
+    if len(plan) == 1:
+        cmd = ['ffmpeg', '-y', *_raw_input_args(width, height, fps), *encode_args, str(output_path)]
+        sink = RawFrameSink(cmd, width, height)
+        sink.run(frame_count, fill)
+        if sink.returncode != 0:
+            print(f"  ⚠️  Encode failed: {sink.stderr_text[-200:]}")
+        return sink.returncode == 0
+
+    chunk_dir = output_path.with_name(output_path.stem + '.chunks')
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    threads = max(1, (os.cpu_count() or 2) // len(plan))
+    chunk_files = [chunk_dir / f"chunk_{i:03d}.mp4" for i in range(len(plan))]
+
+    try:
+        pool = _get_pool(len(plan))
+        futures = []
+        for frames, chunk in zip(plan, chunk_files):
+            cmd = ['ffmpeg', '-y', *_raw_input_args(width, height, fps), *encode_args,
+                   # Closed GOPs, no B-frame reordering across the cut: each
+                   # chunk is independently decodable and stream-copy joinable
+                   '-flags', '+cgop', '-bf', '0', '-threads', str(threads),
+                   str(chunk)]
+            futures.append(pool.submit(_encode_chunk, fill, frames, cmd, width, height))
+
+        for i, future in enumerate(futures):
+            returncode, stderr = future.result()
+            if returncode != 0:
+                print(f"  ⚠️  Chunk {i + 1}/{len(plan)} encode failed: {stderr}")
+                return False
+
+        concat_txt = chunk_dir / "chunks.txt"
+        with open(concat_txt, 'w') as f:
+            for chunk in chunk_files:
+                f.write(f"file '{chunk.resolve()}'\n")
+        result = subprocess.run([
+            'ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', str(concat_txt),
+            '-c', 'copy', str(output_path),
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            print(f"  ⚠️  Chunk stitch failed: {result.stderr[-200:].decode(errors='replace')}")
+            return False
+        print(f"  🧩 {frame_count} frames encoded in {len(plan)} parallel chunks")
+        return True
+    finally:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
@@ -11,13 +11,27 @@ Pipeline role: Enrichment (between GitHub API ingestion and Claude writing)
 - GitHub API fetches the raw data (fast, free, deterministic)
 - DeepSeek enriches it with deeper analysis
 - Claude writes the narration script from the enriched data
+
+The script generator enriches repos from concurrent worker threads; one
+shared enricher keeps at most max_in_flight requests outstanding, retries
+429/5xx with jitter, and caches every successful enrichment on disk, keyed
+by (model, prompt hash, README digest), so re-running the same repos costs
+zero API calls.
 """
 
+import hashlib
 import json
 import os
+import random
+import tempfile
+import threading
+import time
 import requests
+from pathlib import Path
 from typing import Dict, Optional, List
 
+from core.settings import setting
+
 
 REPO_ENRICHMENT_SCHEMA = {
     "type": "object",
@@ -48,6 +62,55 @@ REPO_ENRICHMENT_SCHEMA = {
 }
 
 
+SYSTEM_PROMPT = (
+    "You are a technical content analyst. Always respond with valid JSON only. "
+    "No markdown, no code fences, just the raw JSON object."
+)
+
+
+class EnrichmentCache:
+    """
+    Persistent on-disk cache of DeepSeek enrichments.
+
+    One JSON file per entry, keyed by sha256 of (model, prompt hash, README
+    digest). Writes go through a temp file + rename so concurrent workers
+    never read a half-written entry.
+    """
+
+    def __init__(self, cache_dir: str = "assets/cache/deepseek"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(model: str, prompt: str, readme_content: str) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        readme_digest = hashlib.sha256((readme_content or "").encode('utf-8')).hexdigest()
+        return hashlib.sha256(f"{model}:{prompt_hash}:{readme_digest}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+
+    def set(self, key: str, value: Dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
 class DeepSeekEnricher:
     """
     DeepSeek-based content enricher for repository analysis.
@@ -57,26 +120,30 @@ class DeepSeekEnricher:
     directly into Claude for script writing.
     """
 
-    def __init__(self, model: str = "deepseek-chat", api_base: str = "https://api.deepseek.com"):
+    MAX_IN_FLIGHT = 4
+    MAX_RETRIES = 4
+    BACKOFF_BASE = 1.5   # seconds; doubled per attempt, plus jitter
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+
+    def __init__(self, model: str = "deepseek-chat", api_base: str = "https://api.deepseek.com",
+                 cache_dir: Optional[str] = None, max_in_flight: Optional[int] = None):
         self.model = model
         self.api_base = api_base
         self.api_key = self._load_api_key()
         self.timeout = 60
+        self.max_in_flight = max_in_flight or setting('deepseek', 'max_in_flight', self.MAX_IN_FLIGHT)
+        self.cache = EnrichmentCache(cache_dir or setting('deepseek', 'cache_dir', 'assets/cache/deepseek'))
+        self.api_calls = 0
+        self.cache_hits = 0
+        self._session = requests.Session()
+        self._stats_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(self.max_in_flight)
 
     def _load_api_key(self) -> str:
         """Load DeepSeek API key from config.json or environment."""
-        try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                'config.json'
-            )
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            key = config.get('deepseek', {}).get('api_key')
-            if key:
-                return key
-        except Exception:
-            pass
+        key = setting('deepseek', 'api_key')
+        if key:
+            return key
 
         key = os.environ.get('DEEPSEEK_API_KEY')
         if key:
@@ -126,8 +193,49 @@ BANNED WORDS: robust, seamless, game-changer, revolutionary, cutting-edge, lever
 Return ONLY valid JSON matching this schema:
 {json.dumps(REPO_ENRICHMENT_SCHEMA, indent=2)}"""
 
+    def _post_with_retry(self, payload: Dict) -> Optional[requests.Response]:
+        """
+        POST to the chat completions endpoint, retrying 429/5xx and network
+        errors with exponential backoff + full jitter (honours Retry-After).
+        """
+        url = f"{self.api_base}/v1/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                with self._stats_lock:
+                    self.api_calls += 1
+                with self._in_flight:
+                    response = self._session.post(url, headers=headers, json=payload, timeout=self.timeout)
+                if response.status_code not in self.RETRY_STATUS:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                reason = f"HTTP {response.status_code}"
+            except (requests.Timeout, requests.ConnectionError) as e:
+                response = None
+                reason = type(e).__name__
+
+            if attempt == self.MAX_RETRIES:
+                print(f"  DeepSeek giving up after {attempt + 1} attempts ({reason})")
+                return response
+
+            try:
+                delay = float(retry_after) if retry_after else None
+            except ValueError:
+                delay = None
+            if delay is None:
+                delay = random.uniform(0, self.BACKOFF_BASE * (2 ** attempt))
+            print(f"  DeepSeek {reason}, retrying in {delay:.1f}s ({attempt + 1}/{self.MAX_RETRIES})")
+            time.sleep(delay)
+
+        return None
+
     def enrich_repo(self, repo_data: Dict, readme_content: str,
-                     velocity_data: str = "") -> Optional[Dict]:
+                     velocity_data: str = "", use_cache: bool = True) -> Optional[Dict]:
         """
         Enrich GitHub API data with DeepSeek analysis.
 
@@ -135,34 +243,35 @@ Return ONLY valid JSON matching this schema:
             repo_data: GitHub API metadata dict
             readme_content: Raw README text
             velocity_data: Optional velocity/momentum stats string
+            use_cache: Read/write the on-disk enrichment cache
 
         Returns:
             Structured dict with enriched content, or None if failed
         """
         prompt = self._build_enrichment_prompt(repo_data, readme_content, velocity_data)
+        cache_key = EnrichmentCache.make_key(self.model, prompt, readme_content)
+
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                with self._stats_lock:
+                    self.cache_hits += 1
+                return cached
 
         try:
-            response = requests.post(
-                f"{self.api_base}/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a technical content analyst. Always respond with valid JSON only. No markdown, no code fences, just the raw JSON object."
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 2048,
-                    "response_format": {"type": "json_object"}
-                },
-                timeout=self.timeout
-            )
+            response = self._post_with_retry({
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.3,
+                "max_tokens": 2048,
+                "response_format": {"type": "json_object"}
+            })
+
+            if response is None:
+                return None
 
             if response.status_code != 200:
                 print(f"  DeepSeek HTTP {response.status_code}: {response.text[:200]}")
@@ -184,6 +293,9 @@ Return ONLY valid JSON matching this schema:
                     else:
                         parsed[f] = ""
 
+            if use_cache:
+                self.cache.set(cache_key, parsed)
+
             return parsed
 
         except json.JSONDecodeError as e:
@@ -208,6 +320,7 @@ Return ONLY valid JSON matching this schema:
         """
         results = []
         total = len(repos)
+        calls_before, hits_before = self.api_calls, self.cache_hits
 
         for i, repo_info in enumerate(repos, 1):
             name = repo_info.get('repo_data', {}).get('name', 'unknown')
@@ -226,5 +339,6 @@ Return ONLY valid JSON matching this schema:
             else:
                 print(f"    Skipped {name} — enrichment failed")
 
-        print(f"\n  DeepSeek enriched {len(results)}/{total} repos successfully")
+        print(f"\n  DeepSeek enriched {len(results)}/{total} repos successfully "
+              f"({self.api_calls - calls_before} API calls, {self.cache_hits - hits_before} cache hits)")
         return results
@@ -3,9 +3,10 @@ FFmpeg Executor - Concrete implementation of IFFmpegExecutor
 Centralized FFmpeg command execution with error handling and logging.
 """
 import subprocess
-from typing import List, Tuple, Optional
+from typing import Callable, List, Tuple, Optional
 
 from interfaces.interfaces import IFFmpegExecutor
+from services.frame_sink import RawFrameSink
 
 
 class FFmpegExecutor(IFFmpegExecutor):
@@ -139,6 +140,48 @@ class FFmpegExecutor(IFFmpegExecutor):
             error_msg = f"FFmpeg execution error: {str(e)}"
             return False, error_msg
     
+    def execute_frames(
+        self,
+        args: List[str],
+        width: int,
+        height: int,
+        frame_count: int,
+        fill: Callable,
+    ) -> Tuple[bool, str]:
+        """
+        Execute FFmpeg reading rawvideo rgb24 frames from stdin (pipe:0).
+        
+        Frames are produced by fill(n, slot) on a producer thread while
+        earlier frames are written to the pipe (see services.frame_sink).
+        
+        Args:
+            args: FFmpeg command arguments (input must be pipe:0)
+            width, height: Frame size
+            frame_count: Number of frames to render
+            fill: fill(n, slot) writes frame n into the bytearray slot, or
+                  returns a bytes-like frame to send instead
+            
+        Returns:
+            Tuple of (success: bool, output: str)
+        """
+        if not args:
+            return False, "No arguments provided"
+        
+        if args[0] != 'ffmpeg':
+            args = ['ffmpeg'] + args
+        
+        sink = RawFrameSink(args, width, height)
+        try:
+            sink.run(frame_count, fill)
+        except FileNotFoundError:
+            error_msg = "FFmpeg not found. Please install FFmpeg."
+            print(f"❌ {error_msg}")
+            return False, error_msg
+        except Exception as e:
+            return False, f"FFmpeg frame pipe error: {str(e)}"
+        
+        return sink.returncode == 0, sink.stderr_text
+    
     def get_video_info(self, video_path: str) -> Optional[dict]:
         """
         Get video information using ffprobe.
@@ -0,0 +1,184 @@
+"""
+Double-buffered raw-frame sink for FFmpeg rawvideo pipes.
+
+The Pillow animators used to alternate between drawing a frame and blocking
+on proc.stdin.write(frame.tobytes()): FFmpeg idled while Python drew, and
+Python idled while the pipe drained. RawFrameSink overlaps the two:
+
+  producer thread   fill(n, slot) renders frame n into one of `depth`
+                    preallocated slots (or returns a buffer to send as-is,
+                    e.g. a memoryview slice of a pre-scaled screenshot)
+  calling thread    writes filled slots to FFmpeg via memoryview, unbuffered,
+                    then hands the slot back to the producer
+
+The pipe buffer is enlarged (Linux F_SETPIPE_SZ) so FFmpeg can pull most of
+a frame per read, and stderr is drained in the background so a chatty
+encoder can never fill its pipe and deadlock the writer.
+
+    sink = RawFrameSink(cmd, W, H)
+    sink.run(total_frames, lambda n, slot: frame_bytes(draw(n)))
+    if sink.returncode != 0:
+        print(sink.stderr_text[-200:])
+"""
+
+import queue
+import subprocess
+import threading
+from collections import deque
+from typing import Callable, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+F_SETPIPE_SZ = 1031          # Linux fcntl; not exported by the fcntl module before 3.10
+DEFAULT_DEPTH = 4            # Slots in the ring (frames in flight)
+_STDERR_TAIL = 8192
+
+# fill(frame_index, slot) -> None (slot was filled) or a bytes-like to write instead
+FrameFill = Callable[[int, bytearray], Optional[object]]
+
+
+def frame_bytes(img) -> bytes:
+    """
+    Raw bytes of a Pillow image (mode matching the pipe's pix_fmt), for fill
+    to return. Pillow keeps RGB as 4 bytes per pixel internally, so packing
+    it costs one copy either way; returning that buffer avoids a second
+    copy into the slot.
+    """
+    return img.tobytes()
+
+
+def _pipe_max_size() -> int:
+    try:
+        with open("/proc/sys/fs/pipe-max-size") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return 1 << 20
+
+
+class _Failed:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+_DONE = object()
+
+
+class RawFrameSink:
+    """
+    Feeds `frame_count` raw frames to an FFmpeg command reading from pipe:0.
+
+    Args:
+        cmd: FFmpeg command (must read rawvideo from pipe:0)
+        width, height: Frame size in pixels
+        bytes_per_pixel: 3 for rgb24, 4 for rgba
+        depth: Number of preallocated frame slots
+    """
+
+    def __init__(self, cmd: List[str], width: int, height: int,
+                 bytes_per_pixel: int = 3, depth: int = DEFAULT_DEPTH):
+        self.cmd = cmd
+        self.frame_bytes = width * height * bytes_per_pixel
+        self.depth = max(2, depth)
+        self.returncode: Optional[int] = None
+        self.stderr = b""
+        self.frames_written = 0
+
+    @property
+    def stderr_text(self) -> str:
+        return self.stderr.decode(errors="replace")
+
+    def _grow_pipe(self, fd: int) -> None:
+        if fcntl is None:
+            return
+        size = min(_pipe_max_size(), max(self.frame_bytes, 1 << 16))
+        try:
+            fcntl.fcntl(fd, F_SETPIPE_SZ, size)
+        except OSError:
+            pass  # Not Linux, or above the unprivileged limit - keep the default
+
+    def run(self, frame_count: int, fill: FrameFill) -> int:
+        """
+        Render and encode every frame. Raises RuntimeError if FFmpeg dies
+        mid-stream, or re-raises whatever fill() raised; the encoder is
+        killed in both cases.
+
+        Returns:
+            FFmpeg's return code (also on self.returncode; stderr tail on self.stderr)
+        """
+        proc = subprocess.Popen(self.cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, bufsize=0)
+        self._grow_pipe(proc.stdin.fileno())
+
+        tail = deque(maxlen=_STDERR_TAIL)
+
+        def drain():
+            for chunk in iter(lambda: proc.stderr.read(4096), b""):
+                tail.extend(chunk)
+
+        drainer = threading.Thread(target=drain, name="ffmpeg-stderr", daemon=True)
+        drainer.start()
+
+        free: "queue.Queue" = queue.Queue()
+        ready: "queue.Queue" = queue.Queue()
+        for _ in range(self.depth):
+            free.put(bytearray(self.frame_bytes))
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for n in range(frame_count):
+                    slot = free.get()
+                    if stop.is_set() or slot is None:
+                        return
+                    out = fill(n, slot)
+                    ready.put((slot, slot if out is None else out))
+                ready.put(_DONE)
+            except BaseException as e:
+                ready.put(_Failed(e))
+
+        producer = threading.Thread(target=produce, name="frame-producer", daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = ready.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _Failed):
+                    raise item.exc
+                slot, buf = item
+                self._write_frame(proc, buf)
+                free.put(slot)
+            proc.stdin.close()
+            proc.wait()
+        except BaseException:
+            stop.set()
+            free.put(None)  # Wake the producer if it is waiting for a slot
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            raise
+        finally:
+            producer.join(timeout=5)
+            drainer.join(timeout=5)
+            self.stderr = bytes(tail)
+            self.returncode = proc.returncode
+        return proc.returncode
+
+    def _write_frame(self, proc: subprocess.Popen, buf) -> None:
+        if proc.poll() is not None:
+            raise RuntimeError("FFmpeg process died during frame generation")
+        view = memoryview(buf).cast("B")
+        if len(view) != self.frame_bytes:
+            raise ValueError(f"Frame is {len(view)} bytes, expected {self.frame_bytes}")
+        try:
+            # Unbuffered pipe: a write may be partial if interrupted
+            while view:
+                written = proc.stdin.write(view)
+                view = view[written:]
+        except BrokenPipeError:
+            raise RuntimeError("FFmpeg pipe broken - process likely crashed")
+        self.frames_written += 1
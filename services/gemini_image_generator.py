@@ -16,8 +16,10 @@ Fallback chain on failure:
 import os
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -146,6 +148,34 @@ class GeminiImageGenerator:
             print(f"  GeminiImageGen: generation failed for {project.get('name')} — {e}")
             return fallback_path
 
+    def generate_project_images(self, projects: List[dict], fallback_paths: Optional[List[Optional[str]]] = None,
+                                max_workers: int = 4) -> List[Optional[str]]:
+        """
+        Generate backgrounds for a whole episode concurrently.
+
+        Imagen calls are synchronous, so up to max_workers projects are in
+        flight at once on the client's shared connection pool.
+
+        Args:
+            projects: Project dicts (same shape as generate_project_image)
+            fallback_paths: Per-project fallback (defaults to each project's img_path)
+            max_workers: Concurrent Imagen requests
+
+        Returns:
+            Image paths in project order (fallback where generation failed)
+        """
+        if fallback_paths is None:
+            fallback_paths = [p.get('img_path') for p in projects]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            results = list(pool.map(self.generate_project_image, projects, fallback_paths))
+
+        generated = sum(1 for r, fb in zip(results, fallback_paths) if r and r != fb)
+        print(f"  GeminiImageGen: {generated}/{len(projects)} backgrounds in "
+              f"{time.perf_counter() - start:.1f}s wall")
+        return results
+
     # ---------------------------------------------------------------------------
     # Internal helpers
     # ---------------------------------------------------------------------------
@@ -181,6 +211,12 @@ def generate_project_image(project: dict, fallback_path: Optional[str] = None) -
     return get_gemini_generator().generate_project_image(project, fallback_path)
 
 
+def generate_project_images(projects: List[dict], fallback_paths: Optional[List[Optional[str]]] = None,
+                            max_workers: int = 4) -> List[Optional[str]]:
+    """Module-level convenience wrapper for batch generation."""
+    return get_gemini_generator().generate_project_images(projects, fallback_paths, max_workers)
+
+
 # ---------------------------------------------------------------------------
 # CLI test
 # ---------------------------------------------------------------------------
@@ -1,25 +1,181 @@
 #!/usr/bin/env python3
 """
-github_screenshot.py - Captures full-page screenshots of GitHub repo pages.
+github_screenshot.py - Captures screenshots of GitHub repo pages.
 
-Uses Playwright headless Chromium. Output is a tall PNG (1920 x ~4000px)
-representing the complete rendered repo page, used by SegmentScene for the
-zoom + scroll animation.
+Uses Playwright headless Chromium. By default the capture is clipped to the
+height the scroll animation can actually show (the 2200px maximum scroll plus
+one 1080px frame), at the 1920px width the renderer uses, so it needs no
+resize and far less PNG encode/decode. Set screenshots.full_page in
+config.json (or pass --full-page) for the whole page.
+
+Each PNG gets a sidecar <name>.json with its dimensions, the full page
+height and the capture mode, plus <name>.npy: the same pixels pre-scaled to
+1920 wide as raw RGB, which the scroll renderer memory-maps (needs numpy;
+skipped without it).
+
+Captures are cached per repo. The metadata also records the repo's
+pushed_at and README blob SHA at capture time; an entry is reused until
+either changes or it is older than screenshots.ttl_hours. prefetch(urls)
+checks a whole episode up front and recaptures only stale/missing entries in
+background threads; ensure_screenshot(url) then returns the fresh capture
+(waiting on its prefetch if one is running). Hits, stale entries and misses
+are counted per run (screenshot_cache_summary()).
+
+Config (config.json):
+    "screenshots": {"max_height": 3280, "full_page": false,
+                    "ttl_hours": 72, "prefetch_workers": 2}
 
 Usage:
     from github_screenshot import capture_github_page
     path = capture_github_page("https://github.com/owner/repo", "assets/screenshots/owner_repo.png")
+
+    from services.github_screenshot import prefetch, ensure_screenshot
+    prefetch(urls)                                # background refresh of stale entries
+    path, status = ensure_screenshot(urls[0])     # 'hit' | 'stale' | 'miss'
 """
 
+import json
 import os
 import re
+import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 
+from core.settings import load_config
 
 SCREENSHOT_DIR = Path("assets/screenshots")
 VIEWPORT_WIDTH = 1920
+# Scroll animation geometry, shared with components/video/scroll_animation.py
+FRAME_HEIGHT = 1080
+MAX_SCROLL_PX = 2200
+SCROLL_REACH = MAX_SCROLL_PX + FRAME_HEIGHT   # rows the scroll can ever show
+DEFAULT_MAX_HEIGHT = SCROLL_REACH
+DEFAULT_TTL_HOURS = 72
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+HIT, STALE, MISS = "hit", "stale", "miss"
+
+
+def _capture_settings(config_path: str = "config.json") -> Dict:
+    """screenshots.max_height / screenshots.full_page from config.json."""
+    settings = load_config(config_path).get('screenshots') or {}
+    return {
+        "max_height": int(settings.get('max_height', DEFAULT_MAX_HEIGHT)),
+        "full_page": bool(settings.get('full_page', False)),
+        "ttl_hours": float(settings.get('ttl_hours', DEFAULT_TTL_HOURS)),
+        "prefetch_workers": int(settings.get('prefetch_workers', 2)),
+    }
+
+
+def _github_token(config_path: str = "config.json") -> str:
+    token = os.environ.get('GITHUB_TOKEN', '')
+    if token:
+        return token
+    return (load_config(config_path).get('github') or {}).get('api_key', '')
+
+
+def metadata_path(screenshot_path) -> Path:
+    return Path(screenshot_path).with_suffix(".json")
+
+
+def read_screenshot_meta(screenshot_path) -> Optional[Dict]:
+    """Sidecar metadata for a capture (None for legacy captures without one)."""
+    try:
+        with open(metadata_path(screenshot_path), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(screenshot_path, meta: Dict) -> None:
+    with open(metadata_path(screenshot_path), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+
+# ---------------------------------------------------------------------- #
+# Raw pre-scaled artifact
+# ---------------------------------------------------------------------- #
+def raw_artifact_path(screenshot_path) -> Path:
+    return Path(screenshot_path).with_suffix(".npy")
+
+
+def prescale_screenshot(screenshot_path):
+    """
+    Decode a capture as a 1920-wide RGB Pillow image holding only the rows
+    a capture would keep (screenshots.max_height, at most SCROLL_REACH).
+    Bounded captures need no resize.
+    """
+    from PIL import Image
+
+    src = Image.open(screenshot_path)
+    sw, sh = src.size
+    rows = min(_capture_settings()["max_height"], SCROLL_REACH)
+    needed = -(-rows * sw // VIEWPORT_WIDTH)  # ceil
+    if sh > needed:
+        src = src.crop((0, 0, sw, needed))
+        sh = needed
+    src = src.convert('RGB')
+    if sw == VIEWPORT_WIDTH:
+        return src
+    return src.resize((VIEWPORT_WIDTH, int(sh * (VIEWPORT_WIDTH / sw))), Image.LANCZOS)
+
+
+def build_raw_artifact(screenshot_path) -> Optional[Path]:
+    """
+    Write the pre-scaled capture as an uncompressed (rows, 1920, 3) uint8
+    .npy next to the PNG, unless an up-to-date one exists. Renderers
+    memory-map it instead of decoding and resizing the PNG each time.
+
+    Returns:
+        Path to the .npy, or None if numpy is unavailable or the PNG is unreadable
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    png = Path(screenshot_path)
+    raw = raw_artifact_path(png)
+    try:
+        if raw.exists() and raw.stat().st_mtime >= png.stat().st_mtime:
+            return raw
+        pixels = np.asarray(prescale_screenshot(png), dtype=np.uint8)
+        tmp = raw.with_name(f"{raw.name}.{os.getpid()}.part")
+        with open(tmp, 'wb') as f:
+            np.save(f, pixels)
+        os.replace(tmp, raw)
+    except Exception as e:
+        print(f"  [screenshot] Warning: could not write raw artifact for {png.name} ({e})")
+        return None
+
+    meta = read_screenshot_meta(png)
+    if meta is not None:
+        meta["raw"] = {"path": raw.name, "shape": list(pixels.shape), "dtype": "uint8"}
+        _write_meta(png, meta)
+    return raw
+
+
+def open_raw_artifact(screenshot_path):
+    """
+    Memory-mapped (rows, 1920, 3) uint8 view of a capture, building the
+    artifact on first use. Slices come straight from the page cache.
+
+    Returns:
+        numpy.memmap, or None when numpy is unavailable (callers decode the PNG)
+    """
+    raw = build_raw_artifact(screenshot_path)
+    if raw is None:
+        return None
+    import numpy as np
+    try:
+        return np.load(raw, mmap_mode='r')
+    except (OSError, ValueError) as e:
+        print(f"  [screenshot] Warning: unreadable raw artifact {raw.name} ({e})")
+        return None
 
 
 def _repo_id_from_url(github_url: str) -> str:
@@ -31,36 +187,239 @@ def _repo_id_from_url(github_url: str) -> str:
     return f"{owner}_{repo.rstrip('/')}".lower().replace("-", "_")
 
 
+def screenshot_path_for(github_url: str) -> Path:
+    """Default cache location of a repo's capture."""
+    return SCREENSHOT_DIR / f"{_repo_id_from_url(github_url)}_github.png"
+
+
+# ---------------------------------------------------------------------- #
+# Repo-state-aware cache
+# ---------------------------------------------------------------------- #
+_STATE_CACHE: Dict[str, Dict] = {}
+_STATS = {HIT: 0, STALE: 0, MISS: 0, "failed": 0}
+_LOCK = threading.Lock()
+_PREFETCH: Dict[str, Future] = {}
+_PREFETCH_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def fetch_repo_state(github_url: str) -> Dict:
+    """
+    {'pushed_at', 'readme_sha'} from the GitHub API (once per repo per
+    process). Missing fields are left out, so an unreachable API falls back
+    to TTL-only invalidation.
+    """
+    with _LOCK:
+        if github_url in _STATE_CACHE:
+            return _STATE_CACHE[github_url]
+
+    import requests
+
+    state: Dict = {}
+    match = re.search(r"github\.com/([^/]+)/([^/]+)", github_url)
+    if match:
+        owner, repo = match.group(1), match.group(2).rstrip('/')
+        token = _github_token()
+        headers = {'Authorization': f'token {token}'} if token else {}
+        base = f"https://api.github.com/repos/{owner}/{repo}"
+        try:
+            resp = requests.get(base, headers=headers, timeout=10)
+            if resp.status_code == 200:
+                state['pushed_at'] = resp.json().get('pushed_at') or ''
+            resp = requests.get(f"{base}/readme", headers=headers, timeout=10)
+            if resp.status_code == 200:
+                state['readme_sha'] = resp.json().get('sha') or ''
+        except Exception as e:
+            print(f"  [screenshot] Warning: repo state unavailable for {owner}/{repo} ({e})")
+
+    with _LOCK:
+        _STATE_CACHE[github_url] = state
+    return state
+
+
+def cache_status(github_url: str, output_path=None, repo_state: Optional[Dict] = None,
+                 ttl_hours: Optional[float] = None) -> str:
+    """
+    HIT if the cached capture matches the repo's current state and is within
+    the TTL, STALE if it exists but is outdated (or predates cache metadata),
+    MISS if there is none.
+    """
+    path = Path(output_path) if output_path else screenshot_path_for(github_url)
+    if not path.exists():
+        return MISS
+    meta = read_screenshot_meta(path)
+    if not meta:
+        return STALE
+    if ttl_hours is None:
+        ttl_hours = _capture_settings()["ttl_hours"]
+    if ttl_hours > 0 and time.time() - meta.get('captured_at', 0) > ttl_hours * 3600:
+        return STALE
+    if repo_state is None:
+        repo_state = fetch_repo_state(github_url)
+    for key in ('pushed_at', 'readme_sha'):
+        if repo_state.get(key) and meta.get(key) != repo_state[key]:
+            return STALE
+    return HIT
+
+
+def _count(outcome: str) -> None:
+    with _LOCK:
+        _STATS[outcome] += 1
+
+
+def reset_screenshot_cache_stats() -> None:
+    """Start a new run's hit/stale/miss counts."""
+    with _LOCK:
+        for key in _STATS:
+            _STATS[key] = 0
+        _STATE_CACHE.clear()
+
+
+def screenshot_cache_stats() -> Dict[str, int]:
+    with _LOCK:
+        return dict(_STATS)
+
+
+def screenshot_cache_summary() -> str:
+    s = screenshot_cache_stats()
+    failed = f" ({s['failed']} recapture(s) failed, previous capture used)" if s['failed'] else ""
+    return f"Screenshot cache: {s[HIT]} hit, {s[STALE]} stale, {s[MISS]} miss{failed}"
+
+
+def capture_in_subprocess(github_url: str, repo_state: Optional[Dict] = None,
+                          timeout: int = 90) -> Optional[Path]:
+    """
+    Capture in a separate Python process (sync_playwright cannot run inside
+    an asyncio event loop). Returns the PNG path, or None on failure.
+    """
+    cmd = [sys.executable, str(Path(__file__).resolve()), github_url]
+    for key in ('pushed_at', 'readme_sha'):
+        if repo_state and repo_state.get(key):
+            cmd += [f"--{key.replace('_', '-')}", repo_state[key]]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
+                                cwd=str(PROJECT_ROOT))
+    except subprocess.TimeoutExpired:
+        print(f"  ⚠️  [screenshot] Timeout capturing {github_url}")
+        return None
+
+    for line in result.stdout.splitlines():
+        if line.startswith("Screenshot saved to:"):
+            path = Path(line.split(":", 1)[1].strip())
+            path = path if path.is_absolute() else PROJECT_ROOT / path
+            if path.exists():
+                return path
+    print(f"  ❌ [screenshot] Capture failed for {github_url} (exit {result.returncode})")
+    if result.stderr:
+        print(f"      Error details: {result.stderr[-300:]}")
+    return None
+
+
+def _refresh(github_url: str, repo_state: Optional[Dict], timeout: int) -> Tuple[str, Optional[Path]]:
+    path = screenshot_path_for(github_url)
+    if repo_state is None:
+        repo_state = fetch_repo_state(github_url)
+    status = cache_status(github_url, path, repo_state)
+    _count(status)
+    if status == HIT:
+        return status, path
+    captured = capture_in_subprocess(github_url, repo_state, timeout)
+    if captured:
+        return status, captured
+    if path.exists():
+        _count("failed")
+        return status, path
+    return status, None
+
+
+def prefetch(urls: Iterable[str], max_workers: Optional[int] = None,
+             timeout: int = 90) -> Dict[str, Future]:
+    """
+    Check every URL's cache entry and recapture the stale/missing ones in
+    background threads. Returns immediately; ensure_screenshot(url) waits
+    for the URL's result.
+
+    Returns:
+        url -> Future[(status, path)]
+    """
+    global _PREFETCH_POOL
+    with _LOCK:
+        if _PREFETCH_POOL is None:
+            workers = max_workers or _capture_settings()["prefetch_workers"]
+            _PREFETCH_POOL = ThreadPoolExecutor(max_workers=max(1, workers),
+                                                thread_name_prefix="screenshot-prefetch")
+        futures = {}
+        for url in dict.fromkeys(urls):
+            if not url or not re.search(r"github\.com/[^/]+/[^/]+", url):
+                continue
+            if url not in _PREFETCH:
+                _PREFETCH[url] = _PREFETCH_POOL.submit(_refresh, url, None, timeout)
+            futures[url] = _PREFETCH[url]
+    return futures
+
+
+def ensure_screenshot(github_url: str, repo_state: Optional[Dict] = None,
+                      timeout: int = 90) -> Tuple[Optional[Path], str]:
+    """
+    Current capture for a repo: the cached one if it is fresh, otherwise a
+    recapture (waiting on a running prefetch when there is one). A failed
+    recapture falls back to the previous capture.
+
+    Returns:
+        (path or None, 'hit' | 'stale' | 'miss')
+    """
+    with _LOCK:
+        future = _PREFETCH.pop(github_url, None)
+    if future is not None:
+        status, path = future.result()
+    else:
+        status, path = _refresh(github_url, repo_state, timeout)
+    return path, status
+
+
 def capture_github_page(
     github_url: str,
     output_path: Optional[str] = None,
     force: bool = False,
+    max_height: Optional[int] = None,
+    full_page: Optional[bool] = None,
+    repo_state: Optional[Dict] = None,
 ) -> Path:
     """
-    Capture a full-page screenshot of a GitHub repository page.
+    Capture a screenshot of a GitHub repository page, 1920px wide.
 
     Args:
         github_url:   Full GitHub URL e.g. https://github.com/owner/repo
         output_path:  Where to save the PNG. Defaults to assets/screenshots/{owner_repo}.png
         force:        Re-capture even if cached screenshot exists
+        max_height:   Clip height in px (default: screenshots.max_height, 3280)
+        full_page:    Capture the whole page instead (default: screenshots.full_page)
+        repo_state:   pushed_at/readme_sha to record (fetched when omitted)
 
     Returns:
         Path to the saved PNG file
     """
     SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    settings = _capture_settings()
+    if max_height is None:
+        max_height = settings["max_height"]
+    if full_page is None:
+        full_page = settings["full_page"]
 
-    if output_path is None:
-        slug = _repo_id_from_url(github_url)
-        output_path = SCREENSHOT_DIR / f"{slug}_github.png"
-    else:
-        output_path = Path(output_path)
+    output_path = Path(output_path) if output_path else screenshot_path_for(github_url)
+    if repo_state is None:
+        repo_state = fetch_repo_state(github_url)
 
-    # Return cached version if available
-    if not force and output_path.exists():
-        print(f"  [screenshot] Using cached: {output_path.name}")
-        return output_path
+    # Return cached version if the repo has not changed since
+    if not force:
+        status = cache_status(github_url, output_path, repo_state)
+        if status == HIT:
+            print(f"  [screenshot] Using cached: {output_path.name}")
+            return output_path
+        if status == STALE:
+            print(f"  [screenshot] Cached capture is stale: {output_path.name}")
 
     print(f"  [screenshot] Capturing {github_url} ...")
+    start = time.perf_counter()
 
     from playwright.sync_api import sync_playwright
 
@@ -108,22 +467,55 @@ def capture_github_page(
             });
         }""")
 
-        # Take full-page screenshot
+        page_height = int(page.evaluate("() => document.documentElement.scrollHeight"))
+        height = page_height if full_page else max(1, min(page_height, max_height))
+
+        # Clip to the renderer's width (and the needed height) so nothing
+        # past what the scroll shows is rasterised or encoded
         page.screenshot(
             path=str(output_path),
             full_page=True,
+            clip={"x": 0, "y": 0, "width": VIEWPORT_WIDTH, "height": height},
             type="png",
         )
 
         browser.close()
 
-    print(f"  [screenshot] Saved: {output_path.name} "
-          f"({output_path.stat().st_size // 1024}KB)")
+    meta = {
+        "url": github_url,
+        "width": VIEWPORT_WIDTH,
+        "height": height,
+        "page_height": page_height,
+        "mode": "full_page" if full_page else "bounded",
+        "pushed_at": repo_state.get('pushed_at', ''),
+        "readme_sha": repo_state.get('readme_sha', ''),
+        "captured_at": time.time(),
+        "capture_s": round(time.perf_counter() - start, 2),
+    }
+    _write_meta(output_path, meta)
+    build_raw_artifact(output_path)
+
+    print(f"  [screenshot] Saved: {output_path.name} {VIEWPORT_WIDTH}x{height} "
+          f"(page {page_height}px, {output_path.stat().st_size // 1024}KB, {meta['capture_s']}s)")
     return output_path
 
 
 if __name__ == "__main__":
-    import sys
-    url = sys.argv[1] if len(sys.argv) > 1 else "https://github.com/langchain-ai/open-swe"
-    path = capture_github_page(url, force=True)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Capture a GitHub repo page screenshot")
+    parser.add_argument('url', nargs='?', default="https://github.com/langchain-ai/open-swe")
+    parser.add_argument('--full-page', action='store_true', help='Capture the whole page')
+    parser.add_argument('--pushed-at', default=None, help='Repo pushed_at to record (skips the API call)')
+    parser.add_argument('--readme-sha', default=None, help='README blob SHA to record')
+    args = parser.parse_args()
+
+    state = None
+    if args.pushed_at or args.readme_sha:
+        state = {k: v for k, v in (('pushed_at', args.pushed_at), ('readme_sha', args.readme_sha)) if v}
+    path = capture_github_page(args.url, force=True, full_page=True if args.full_page else None,
+                               repo_state=state)
     print(f"Screenshot saved to: {path}")
+    meta = read_screenshot_meta(path)
+    if meta:
+        print(f"Screenshot size: {meta['width']}x{meta['height']}")
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Record/replay transport for every external HTTP call.
+
+Discovery (Exa, ClickHouse, GitHub), enrichment (DeepSeek), scoring and
+newsletter reformatting (Mistral), TTS and the Claude content writers reach
+the network through either `requests` (directly or inside exa_py) or `httpx`
+(inside the anthropic and mistralai SDKs). install_transport() hooks both at
+their lowest send() layer, so no call site changes:
+
+  record   real calls, every response appended to the cassette
+  replay   responses served from the cassette; a miss raises a connection
+           error, exactly as an unreachable host would
+  auto     replay when recorded, otherwise call and record
+
+Cassettes are JSONL files under assets/cassettes/<name>.jsonl. Requests are
+keyed by method, URL and body, with API-key style query params dropped and
+ISO dates normalised (search windows like "created:>2026-10-12" change
+daily). Repeated calls with the same key replay in recording order,
+independent of thread interleaving, so concurrent stages replay
+deterministically. Replay sleeps the recorded latency times a factor, so
+concurrency changes can be measured against realistic latencies (0 serves
+everything instantly).
+
+Browser-driven sources (the Selenium GitHub Trending scraper) are not
+covered; run discovery with --no-trending when replaying.
+
+Environment (read by install_from_env(), called from each entry point):
+    HTTP_CASSETTE_MODE=record|replay|auto   (unset = transport not installed)
+    HTTP_CASSETTE=discovery                 cassette name
+    HTTP_CASSETTE_DIR=assets/cassettes
+    HTTP_REPLAY_LATENCY=1.0                 recorded-latency multiplier
+
+    HTTP_CASSETTE_MODE=record HTTP_CASSETTE=discovery python discovery/github_discovery.py
+    HTTP_CASSETTE_MODE=replay HTTP_CASSETTE=discovery python discovery/github_discovery.py
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+MODES = ("record", "replay", "auto")
+
+# Whole parameter names only: "monkey" or "tokenizer" stay part of the request key
+_SECRET_PARAM = re.compile(
+    r"^(?:api_?key|key|access_token|token|client_secret|secret|signature|sig|password|auth)$",
+    re.IGNORECASE,
+)
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ][\d:.]+(?:Z|[+-]\d{2}:?\d{2})?)?")
+_DROP_RESPONSE_HEADERS = {"set-cookie", "content-encoding", "transfer-encoding", "content-length"}
+
+
+class CassetteMiss(Exception):
+    """Replay mode found no recorded response for a request."""
+
+
+def _redact_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _SECRET_PARAM.match(k)]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(query)), ""))
+
+
+def _body_material(body: Optional[bytes]) -> str:
+    if not body:
+        return ""
+    try:
+        # Key-order independent for JSON bodies
+        return json.dumps(json.loads(body), sort_keys=True)
+    except (ValueError, UnicodeDecodeError):
+        return hashlib.sha256(body).hexdigest()
+
+
+def request_key(method: str, url: str, body: Optional[bytes]) -> str:
+    material = "\n".join([method.upper(), _redact_url(url), _body_material(body)])
+    material = _ISO_DATE.sub("<date>", material)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+class Cassette:
+    """
+    Append-only JSONL store of recorded responses with per-key replay order.
+    """
+
+    def __init__(self, path: Path, mode: str = "replay", latency_factor: float = 1.0):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r} (expected one of {MODES})")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_factor = max(0.0, latency_factor)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict]] = {}
+        self._cursor: Dict[str, int] = {}
+        self.stats = {"replayed": 0, "recorded": 0, "missed": 0}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._entries.setdefault(entry["key"], []).append(entry)
+
+    def lookup(self, method: str, url: str, body: Optional[bytes]) -> Optional[Dict]:
+        """Next recorded response for this request (None if not recorded / exhausted)."""
+        key = request_key(method, url, body)
+        with self._lock:
+            entries = self._entries.get(key, [])
+            index = self._cursor.get(key, 0)
+            if index < len(entries):
+                self._cursor[key] = index + 1
+                self.stats["replayed"] += 1
+                return entries[index]
+            if entries and self.mode == "replay":
+                # Called more often than recorded - keep serving the last response
+                self.stats["replayed"] += 1
+                return entries[-1]
+        return None
+
+    def miss(self, method: str, url: str) -> CassetteMiss:
+        with self._lock:
+            self.stats["missed"] += 1
+        return CassetteMiss(f"No recorded response for {method.upper()} {_redact_url(url)} in {self.path}")
+
+    def record(self, method: str, url: str, body: Optional[bytes], status: int,
+               headers: Dict[str, str], content: bytes, elapsed: float) -> None:
+        key = request_key(method, url, body)
+        entry = {
+            "key": key,
+            "method": method.upper(),
+            "url": _redact_url(url),
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _DROP_RESPONSE_HEADERS},
+            "body_b64": base64.b64encode(content).decode("ascii"),
+            "elapsed": round(elapsed, 4),
+            "recorded_at": time.time(),
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._entries.setdefault(key, []).append(entry)
+            self._cursor[key] = len(self._entries[key])
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(line)
+            self.stats["recorded"] += 1
+
+    def simulate_latency(self, entry: Dict) -> None:
+        delay = entry.get("elapsed", 0) * self.latency_factor
+        if delay > 0:
+            time.sleep(delay)
+
+    def summary(self) -> str:
+        s = self.stats
+        return (f"HTTP cassette {self.path.name} ({self.mode}): {s['replayed']} replayed, "
+                f"{s['recorded']} recorded, {s['missed']} missed")
+
+
+# ---------------------------------------------------------------------- #
+# requests
+# ---------------------------------------------------------------------- #
+def _patch_requests(cassette: Cassette) -> None:
+    import io
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    real_send = HTTPAdapter.send
+
+    def send(self, request, *args, **kwargs):
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        if not isinstance(body, bytes):
+            body = None  # Streamed/file uploads are keyed on method + URL only
+        if cassette.mode in ("replay", "auto"):
+            entry = cassette.lookup(request.method, request.url, body)
+            if entry is not None:
+                cassette.simulate_latency(entry)
+                content = base64.b64decode(entry["body_b64"])
+                response = requests.Response()
+                response.status_code = entry["status"]
+                response.headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+                response._content = content
+                response._content_consumed = True
+                response.raw = io.BytesIO(content)
+                response.url = request.url
+                response.request = request
+                response.reason = ""
+                response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+                return response
+            if cassette.mode == "replay":
+                raise requests.exceptions.ConnectionError(str(cassette.miss(request.method, request.url)),
+                                                          request=request)
+
+        start = time.perf_counter()
+        response = real_send(self, request, *args, **kwargs)
+        content = response.content  # Buffers streamed bodies so they can be stored
+        cassette.record(request.method, request.url, body, response.status_code,
+                        dict(response.headers), content, time.perf_counter() - start)
+        return response
+
+    HTTPAdapter.send = send
+
+
+# ---------------------------------------------------------------------- #
+# httpx (anthropic / mistralai SDKs)
+# ---------------------------------------------------------------------- #
+def _patch_httpx(cassette: Cassette) -> None:
+    try:
+        import httpx
+    except ImportError:
+        return
+
+    real_send = httpx.Client.send
+    real_async_send = httpx.AsyncClient.send
+
+    def _replayed(request, entry):
+        return httpx.Response(status_code=entry["status"], headers=entry["headers"],
+                              content=base64.b64decode(entry["body_b64"]), request=request)
+
+    def send(self, request, *args, **kwargs):
+        body = request.read()
+        if cassette.mode in ("replay", "auto"):
+            entry = cassette.lookup(request.method, str(request.url), body)
+            if entry is not None:
+                cassette.simulate_latency(entry)
+                return _replayed(request, entry)
+            if cassette.mode == "replay":
+                raise httpx.ConnectError(str(cassette.miss(request.method, str(request.url))), request=request)
+
+        start = time.perf_counter()
+        response = real_send(self, request, *args, **kwargs)
+        content = response.read()
+        cassette.record(request.method, str(request.url), body, response.status_code,
+                        dict(response.headers), content, time.perf_counter() - start)
+        return response
+
+    async def async_send(self, request, *args, **kwargs):
+        body = request.read()
+        if cassette.mode in ("replay", "auto"):
+            entry = cassette.lookup(request.method, str(request.url), body)
+            if entry is not None:
+                import asyncio
+                delay = entry.get("elapsed", 0) * cassette.latency_factor
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                return _replayed(request, entry)
+            if cassette.mode == "replay":
+                raise httpx.ConnectError(str(cassette.miss(request.method, str(request.url))), request=request)
+
+        start = time.perf_counter()
+        response = await real_async_send(self, request, *args, **kwargs)
+        content = await response.aread()
+        cassette.record(request.method, str(request.url), body, response.status_code,
+                        dict(response.headers), content, time.perf_counter() - start)
+        return response
+
+    httpx.Client.send = send
+    httpx.AsyncClient.send = async_send
+
+
+# ---------------------------------------------------------------------- #
+# Installation
+# ---------------------------------------------------------------------- #
+_INSTALLED: Optional[Cassette] = None
+_INSTALL_LOCK = threading.Lock()
+
+
+def install_transport(name: str, mode: str = "replay", cassette_dir: str = "assets/cassettes",
+                      latency_factor: float = 1.0) -> Cassette:
+    """
+    Route all requests/httpx traffic in this process through a cassette.
+    Idempotent: a second call returns the already-installed cassette.
+    """
+    global _INSTALLED
+    with _INSTALL_LOCK:
+        if _INSTALLED is not None:
+            return _INSTALLED
+        cassette = Cassette(Path(cassette_dir) / f"{name}.jsonl", mode=mode, latency_factor=latency_factor)
+        _patch_requests(cassette)
+        _patch_httpx(cassette)
+        _INSTALLED = cassette
+        print(f"📼 HTTP {mode} via {cassette.path}")
+        return cassette
+
+
+def install_from_env(default_name: str = "pipeline") -> Optional[Cassette]:
+    """Install the transport if HTTP_CASSETTE_MODE is set; no-op otherwise."""
+    mode = os.environ.get("HTTP_CASSETTE_MODE", "").strip().lower()
+    if not mode:
+        return None
+    return install_transport(
+        name=os.environ.get("HTTP_CASSETTE", default_name),
+        mode=mode,
+        cassette_dir=os.environ.get("HTTP_CASSETTE_DIR", "assets/cassettes"),
+        latency_factor=float(os.environ.get("HTTP_REPLAY_LATENCY", "1.0")),
+    )
+
+
+def print_transport_summary() -> None:
+    """Print replay/record counts (no-op if the transport is not installed)."""
+    if _INSTALLED is not None:
+        print(_INSTALLED.summary())
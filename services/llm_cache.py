@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Prompt-level response cache for Claude and Mistral content calls.
+
+Every content writer (Medium, Reddit, newsletter, narration scripts, deep
+dives, newsletter reformatting, Mistral repo scoring) routes its raw API call
+through cached_completion(). Responses are stored on disk, one JSON file per
+entry, keyed by sha256 of (provider, model, generation params, prompt hash),
+so regenerating an episode from unchanged inputs costs zero API calls.
+
+Config (config.json, all optional):
+    "llm_cache": {
+        "enabled": true,
+        "ttl_hours": 168,
+        "max_mb": 256,
+        "opt_out": ["generate_script_ai"],
+        "pricing": {"claude-sonnet-4-6": [3.0, 15.0]}
+    }
+
+LLM_CACHE_DISABLE=1 turns the cache off for a single run. Individual call
+sites can also pass use_cache=False or be listed under "opt_out".
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from core.metrics import record_api_latency, record_cache_hit
+from core.settings import setting
+
+
+# USD per million tokens: (input, output). Overridable via llm_cache.pricing.
+DEFAULT_PRICING = {
+    "claude-sonnet-4-6": (3.0, 15.0),
+    "claude-haiku-4-5": (1.0, 5.0),
+    "mistral-medium-latest": (0.4, 2.0),
+    "mistral-small": (0.1, 0.3),
+}
+
+# A raw call returns (text, input_tokens, output_tokens)
+RawCall = Callable[[], Tuple[str, int, int]]
+
+
+class LLMResponseCache:
+    """
+    Disk-backed cache of LLM text responses with TTL and size-bounded eviction.
+
+    Entries older than ttl_hours are treated as misses and removed. When the
+    cache directory grows past max_mb, the least recently used entries (file
+    mtime is bumped on every hit) are evicted down to 90% of the budget.
+    """
+
+    def __init__(self, cache_dir: str = "assets/cache/llm", ttl_hours: float = 168,
+                 max_mb: float = 256, enabled: bool = True, opt_out=None, pricing: Optional[Dict] = None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = float(ttl_hours) * 3600
+        self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        self.enabled = enabled
+        self.opt_out = set(opt_out or [])
+        self.pricing = dict(DEFAULT_PRICING)
+        for model, rates in (pricing or {}).items():
+            self.pricing[model] = tuple(rates)
+
+        self._lock = threading.Lock()
+        self._size = self._scan_size()
+        self.stats: Dict[str, Dict] = {}
+
+    # ------------------------------------------------------------------ #
+    # Keys and storage
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def make_key(provider: str, model: str, params: Dict, prompt: str) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        material = json.dumps(
+            {"provider": provider, "model": model, "params": params or {}, "prompt": prompt_hash},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _scan_size(self) -> int:
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json'):
+                try:
+                    total += entry.stat().st_size
+                except OSError:
+                    pass
+        return total
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a fresh entry or None (expired entries are deleted)."""
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, IOError):
+            return None
+
+        if self.ttl_seconds and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path, None)  # LRU bookkeeping
+        except OSError:
+            pass
+        return entry
+
+    def set(self, key: str, entry: Dict) -> None:
+        """Write an entry atomically, then evict if over the size budget."""
+        data = json.dumps(entry)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            print(f"⚠️  LLM cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._size += len(data.encode('utf-8'))
+            over_budget = self.max_bytes and self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def _remove(self, path: Path) -> int:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return 0
+        with self._lock:
+            self._size = max(0, self._size - size)
+        return size
+
+    def evict(self) -> int:
+        """
+        Drop least recently used entries until the cache is under 90% of max_mb.
+
+        Returns:
+            Number of entries removed
+        """
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json'):
+                try:
+                    st = entry.stat()
+                    files.append((st.st_mtime, st.st_size, Path(entry.path)))
+                except OSError:
+                    pass
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+
+        with self._lock:
+            self._size = total
+        if removed:
+            print(f"🧹 LLM cache: evicted {removed} entries ({total / 1024 / 1024:.1f} MB kept)")
+        return removed
+
+    # ------------------------------------------------------------------ #
+    # Cached calls
+    # ------------------------------------------------------------------ #
+    def _cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        in_rate, out_rate = self.pricing.get(model, (0.0, 0.0))
+        return (input_tokens * in_rate + output_tokens * out_rate) / 1_000_000
+
+    def _record(self, site: str, hit: bool, entry: Dict) -> None:
+        with self._lock:
+            s = self.stats.setdefault(site, {"hits": 0, "misses": 0, "tokens_saved": 0, "usd_saved": 0.0})
+            if hit:
+                s["hits"] += 1
+                s["tokens_saved"] += entry.get("input_tokens", 0) + entry.get("output_tokens", 0)
+                s["usd_saved"] += self._cost(entry.get("model", ""),
+                                             entry.get("input_tokens", 0), entry.get("output_tokens", 0))
+            else:
+                s["misses"] += 1
+
+    @staticmethod
+    def _timed_call(provider: str, call: RawCall) -> Tuple[str, int, int]:
+        """Run the raw call, reporting its latency to the open metrics span."""
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            record_api_latency(provider, time.perf_counter() - start)
+
+    def call(self, provider: str, model: str, prompt: str, params: Dict, call: RawCall,
+             site: str, use_cache: bool = True) -> str:
+        """
+        Return the cached response for this prompt, or run `call` and cache it.
+
+        Args:
+            provider: "anthropic" or "mistral"
+            model: Model name (part of the key and used for pricing)
+            prompt: Full prompt text (system + user where applicable)
+            params: Generation params that affect output (max_tokens, temperature, ...)
+            call: Zero-arg function doing the real API call -> (text, input_tokens, output_tokens)
+            site: Call-site name, used for opt-out and the savings report
+            use_cache: Per-call opt-out
+
+        Exceptions from `call` propagate; empty responses are never cached.
+        """
+        if not (self.enabled and use_cache) or site in self.opt_out:
+            text, _, _ = self._timed_call(provider, call)
+            return text
+
+        key = self.make_key(provider, model, params, prompt)
+        entry = self.get(key)
+        if entry is not None and entry.get("text"):
+            self._record(site, True, entry)
+            record_cache_hit()
+            return entry["text"]
+
+        text, input_tokens, output_tokens = self._timed_call(provider, call)
+        self._record(site, False, {})
+        if text:
+            self.set(key, {
+                "provider": provider,
+                "model": model,
+                "site": site,
+                "created_at": time.time(),
+                "input_tokens": int(input_tokens or 0),
+                "output_tokens": int(output_tokens or 0),
+                "text": text,
+            })
+        return text
+
+    def report(self) -> None:
+        """Print per-site hits/misses and the tokens and dollars saved this run."""
+        with self._lock:
+            stats = {site: dict(s) for site, s in self.stats.items()}
+        if not stats:
+            return
+
+        print("\n💾 LLM response cache")
+        total_hits = total_tokens = 0
+        total_usd = 0.0
+        for site, s in sorted(stats.items()):
+            print(f"   {site:<28} {s['hits']:>3} hit / {s['misses']:>3} miss   "
+                  f"{s['tokens_saved']:>8,} tokens   ${s['usd_saved']:.4f} saved")
+            total_hits += s['hits']
+            total_tokens += s['tokens_saved']
+            total_usd += s['usd_saved']
+        print(f"   {'total':<28} {total_hits:>3} hit{'':>12}{total_tokens:>8,} tokens   ${total_usd:.4f} saved")
+
+
+_CACHE: Optional[LLMResponseCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Return the process-wide cache configured from config.json."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            enabled = setting('llm_cache', 'enabled', True) and os.environ.get('LLM_CACHE_DISABLE') != '1'
+            _CACHE = LLMResponseCache(
+                cache_dir=setting('llm_cache', 'cache_dir', "assets/cache/llm"),
+                ttl_hours=setting('llm_cache', 'ttl_hours', 168),
+                max_mb=setting('llm_cache', 'max_mb', 256),
+                enabled=enabled,
+                opt_out=setting('llm_cache', 'opt_out', []),
+                pricing=setting('llm_cache', 'pricing'),
+            )
+        return _CACHE
+
+
+def cached_completion(provider: str, model: str, prompt: str, params: Dict, call: RawCall,
+                      site: str, use_cache: bool = True) -> str:
+    """Module-level shortcut for get_llm_cache().call(...)."""
+    return get_llm_cache().call(provider, model, prompt, params, call, site, use_cache=use_cache)
+
+
+def print_llm_cache_report() -> None:
+    """Print this run's cache savings (no-op if the cache was never used)."""
+    if _CACHE is not None:
+        _CACHE.report()
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+MiniMax clip job manager.
+
+MiniMax image-to-video is asynchronous: a POST returns a task_id, the clip
+renders for 1-3 minutes, then it is downloaded via a file_id. Generating clips
+one at a time (submit, block until done, next clip) leaves the API idle and
+makes a 15-project episode take hours.
+
+The manager instead:
+  1. submits every clip for every project up front (callers wrap submit()
+     in the Prefect 'minimax' concurrency slot),
+  2. polls every outstanding job from one asyncio loop with per-job
+     exponential backoff,
+  3. streams each finished clip to its output path, and
+  4. persists task IDs to SurrealDB (minimax_job table), so a crashed run
+     resumes polling/downloading existing jobs instead of paying again.
+
+    manager = get_clip_job_manager()
+    jobs = manager.submit(requests)      # returns once all are submitted
+    paths = manager.wait(jobs)           # clip paths (None for failures)
+
+CLI: python services/minimax_jobs.py --resume   (finish all pending jobs)
+"""
+
+import asyncio
+import base64
+import mimetypes
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+try:
+    from core.settings import load_config
+except ImportError:  # Run as python services/minimax_jobs.py
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.settings import load_config
+
+
+@dataclass
+class ClipRequest:
+    """One image-to-video clip to generate."""
+    project_id: str
+    clip_index: int
+    image_path: str
+    prompt: str
+    output_path: str
+
+
+@dataclass
+class ClipJob:
+    """A submitted (or resumed) MiniMax task and its completion future."""
+    request: ClipRequest
+    task_id: Optional[str] = None
+    status: str = "submitted"
+    origin: str = "new"            # new | resumed | reused
+    file_id: Optional[str] = None
+    polls: int = 0
+    next_poll: float = 0.0
+    submitted_at: float = field(default_factory=time.time)
+    future: Optional[asyncio.Future] = None
+
+
+class _JobStore:
+    """
+    Thin wrapper over core.db.DB for job persistence. If SurrealDB is not
+    available the manager still works, it just can't resume after a crash.
+    """
+
+    def __init__(self):
+        self._db = None
+        self._lock = threading.Lock()
+        try:
+            from core.db import DB
+            self._db = DB()
+            self._db.connect()
+        except Exception as e:
+            print(f"[minimax] Warning: job persistence disabled ({e})")
+            self._db = None
+
+    def _call(self, method: str, *args, **kwargs):
+        if not self._db:
+            return None
+        with self._lock:
+            try:
+                return getattr(self._db, method)(*args, **kwargs)
+            except Exception as e:
+                print(f"[minimax] Warning: {method} failed ({e})")
+                return None
+
+    def save(self, job: ClipJob) -> None:
+        r = job.request
+        self._call("save_minimax_job", job.task_id, r.project_id, r.clip_index,
+                   r.prompt, r.image_path, r.output_path)
+
+    def update(self, job: ClipJob, error: Optional[str] = None) -> None:
+        self._call("update_minimax_job", job.task_id, job.status, job.file_id, error)
+
+    def find(self, request: ClipRequest) -> Optional[Dict]:
+        return self._call("find_minimax_job", request.output_path, request.prompt)
+
+    def pending(self) -> List[Dict]:
+        return self._call("get_pending_minimax_jobs") or []
+
+
+class MiniMaxClipJobManager:
+    """Batch submit + single-loop polling of MiniMax image-to-video jobs."""
+
+    BASE_URL = "https://api.minimax.io"
+    DEFAULT_MODEL = "I2V-01"
+
+    POLL_INITIAL = 10.0     # First status check after submit (seconds)
+    POLL_FACTOR = 1.5       # Per-job exponential backoff
+    POLL_MAX = 60.0
+    JOB_TIMEOUT = 20 * 60   # Give up on a job after this long
+    SUBMIT_CONCURRENCY = 4  # Parallel POSTs inside one submit() call
+
+    def __init__(self, config: Optional[Dict] = None, store: Optional[_JobStore] = None):
+        cfg = config if config is not None else (load_config().get('minimax') or {})
+        self.api_key = cfg.get('api_key', '')
+        self.group_id = cfg.get('group_id', '')
+        self.model = cfg.get('video_model', self.DEFAULT_MODEL)
+        self.enabled = bool(self.api_key) and cfg.get('enabled', True)
+        self.store = store if store is not None else _JobStore()
+
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
+
+        self._jobs: Dict[str, ClipJob] = {}
+        self._poller: Optional[asyncio.Task] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name="minimax-jobs", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------ #
+    # Public, thread-safe API (blocking)
+    # ------------------------------------------------------------------ #
+    def submit(self, requests_: List[ClipRequest]) -> List[ClipJob]:
+        """Submit (or resume) every request; returns once each has a task ID or result."""
+        return asyncio.run_coroutine_threadsafe(self._submit_all(requests_), self._loop).result()
+
+    def wait(self, jobs: List[ClipJob]) -> List[Optional[str]]:
+        """Block until every job is downloaded or failed; returns output paths in order."""
+        return asyncio.run_coroutine_threadsafe(self._wait_all(jobs), self._loop).result()
+
+    def generate_clips(self, requests_: List[ClipRequest]) -> List[Optional[str]]:
+        return self.wait(self.submit(requests_))
+
+    def resume_pending(self) -> List[Optional[str]]:
+        """Re-attach to every unfinished job recorded in the DB and finish it."""
+        rows = self.store.pending()
+        if not rows:
+            print("[minimax] No pending jobs to resume")
+            return []
+        print(f"[minimax] Resuming {len(rows)} pending job(s)...")
+        requests_ = [
+            ClipRequest(row["project_id"], row["clip_index"], row["image_path"],
+                        row["prompt"], row["output_path"])
+            for row in rows
+        ]
+        return self.generate_clips(requests_)
+
+    def poll_and_download(self, task_id: str, output_path: str) -> Optional[str]:
+        """Finish a single known task ID (used by utils/check_task_status.py)."""
+        request = ClipRequest("manual", 0, "", "", output_path)
+        job = ClipJob(request=request, task_id=task_id)
+
+        async def _one():
+            self._register(job)
+            return await job.future
+
+        return asyncio.run_coroutine_threadsafe(_one(), self._loop).result()
+
+    # ------------------------------------------------------------------ #
+    # Submission
+    # ------------------------------------------------------------------ #
+    async def _submit_all(self, requests_: List[ClipRequest]) -> List[ClipJob]:
+        semaphore = asyncio.Semaphore(self.SUBMIT_CONCURRENCY)
+
+        async def _one(request: ClipRequest) -> ClipJob:
+            async with semaphore:
+                return await self._submit_one(request)
+
+        jobs = await asyncio.gather(*[_one(r) for r in requests_])
+        origins = {o: sum(1 for j in jobs if j.origin == o) for o in ("new", "resumed", "reused")}
+        print(f"[minimax] {len(jobs)} clip(s): {origins['new']} submitted, "
+              f"{origins['resumed']} resumed, {origins['reused']} on disk; "
+              f"{len(self._jobs)} job(s) outstanding")
+        return jobs
+
+    async def _submit_one(self, request: ClipRequest) -> ClipJob:
+        job = ClipJob(request=request)
+        job.future = self._loop.create_future()
+
+        # 1. Already on disk (previous run finished it)
+        out = Path(request.output_path)
+        if out.exists() and out.stat().st_size > 1000:
+            print(f"   ♻️  Reusing existing clip: {out.name}")
+            job.status, job.origin = "downloaded", "reused"
+            job.future.set_result(str(out))
+            return job
+
+        # 2. Same clip already submitted by a crashed run - resume polling it
+        existing = self.store.find(request)
+        if existing:
+            job.task_id = existing["task_id"]
+            job.file_id = existing.get("file_id")
+            job.origin = "resumed"
+            print(f"   🔁 Resuming MiniMax task {job.task_id} for {out.name}")
+            self._register(job, future=job.future)
+            return job
+
+        # 3. New submission
+        if not self.enabled:
+            job.status = "failed"
+            job.future.set_result(None)
+            return job
+
+        try:
+            loop = asyncio.get_running_loop()
+            job.task_id = await loop.run_in_executor(None, self._create_task, request)
+        except Exception as e:
+            print(f"   ⚠️  MiniMax submit failed for {out.name}: {e}")
+            job.status = "failed"
+            job.future.set_result(None)
+            return job
+
+        self.store.save(job)
+        self._register(job, future=job.future)
+        return job
+
+    def _create_task(self, request: ClipRequest) -> str:
+        mime = mimetypes.guess_type(request.image_path)[0] or "image/png"
+        with open(request.image_path, 'rb') as f:
+            image_b64 = base64.b64encode(f.read()).decode('ascii')
+
+        resp = self.session.post(
+            f"{self.BASE_URL}/v1/video_generation",
+            json={
+                "model": self.model,
+                "prompt": request.prompt,
+                "first_frame_image": f"data:{mime};base64,{image_b64}",
+            },
+            timeout=60,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        task_id = data.get("task_id")
+        if not task_id:
+            raise RuntimeError(f"no task_id in response: {data.get('base_resp')}")
+        return task_id
+
+    # ------------------------------------------------------------------ #
+    # Polling (one loop for every outstanding job)
+    # ------------------------------------------------------------------ #
+    def _register(self, job: ClipJob, future: Optional[asyncio.Future] = None) -> None:
+        job.future = future or job.future or self._loop.create_future()
+        job.next_poll = time.monotonic() + (0 if job.file_id else self.POLL_INITIAL)
+        self._jobs[job.task_id] = job
+        if self._poller is None or self._poller.done():
+            self._poller = self._loop.create_task(self._poll_loop())
+
+    async def _wait_all(self, jobs: List[ClipJob]) -> List[Optional[str]]:
+        return list(await asyncio.gather(*[job.future for job in jobs]))
+
+    async def _poll_loop(self) -> None:
+        while self._jobs:
+            now = time.monotonic()
+            due = [job for job in self._jobs.values() if job.next_poll <= now]
+            if due:
+                await asyncio.gather(*[self._poll_one(job) for job in due])
+            if not self._jobs:
+                break
+            wake = min(job.next_poll for job in self._jobs.values())
+            await asyncio.sleep(max(1.0, wake - time.monotonic()))
+
+    async def _poll_one(self, job: ClipJob) -> None:
+        loop = asyncio.get_running_loop()
+        job.polls += 1
+        try:
+            if not job.file_id:
+                status, file_id = await loop.run_in_executor(None, self._query_task, job.task_id)
+                if status == "Success" and file_id:
+                    job.file_id = file_id
+                elif status == "Fail":
+                    self._finish(job, None, error="MiniMax reported Fail")
+                    return
+                else:
+                    if job.status != "processing":
+                        job.status = "processing"
+                        self.store.update(job)
+                    self._backoff(job)
+                    return
+
+            path = await loop.run_in_executor(None, self._download, job.file_id, job.request.output_path)
+            self._finish(job, path)
+        except Exception as e:
+            if time.time() - job.submitted_at > self.JOB_TIMEOUT:
+                self._finish(job, None, error=str(e))
+            else:
+                print(f"   ⚠️  MiniMax poll error for {job.task_id}: {e}")
+                self._backoff(job)
+
+    def _backoff(self, job: ClipJob) -> None:
+        if time.time() - job.submitted_at > self.JOB_TIMEOUT:
+            self._finish(job, None, error="timed out")
+            return
+        delay = min(self.POLL_MAX, self.POLL_INITIAL * (self.POLL_FACTOR ** job.polls))
+        job.next_poll = time.monotonic() + delay
+
+    def _finish(self, job: ClipJob, path: Optional[str], error: Optional[str] = None) -> None:
+        job.status = "downloaded" if path else "failed"
+        self.store.update(job, error=error)
+        self._jobs.pop(job.task_id, None)
+        if path:
+            print(f"   ✅ MiniMax clip ready: {Path(path).name}")
+        else:
+            print(f"   ❌ MiniMax task {job.task_id} failed: {error}")
+        if job.future and not job.future.done():
+            job.future.set_result(path)
+
+    def _query_task(self, task_id: str) -> tuple:
+        resp = self.session.get(
+            f"{self.BASE_URL}/v1/query/video_generation",
+            params={"task_id": task_id},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        return data.get("status"), data.get("file_id")
+
+    def _download(self, file_id: str, output_path: str) -> str:
+        resp = self.session.get(
+            f"{self.BASE_URL}/v1/files/retrieve",
+            params={"GroupId": self.group_id, "file_id": file_id},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        url = resp.json().get("file", {}).get("download_url")
+        if not url:
+            raise RuntimeError(f"no download_url for file {file_id}")
+
+        out = Path(output_path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        tmp = out.with_suffix(out.suffix + ".part")
+        with requests.get(url, stream=True, timeout=120) as r:
+            r.raise_for_status()
+            with open(tmp, 'wb') as f:
+                for chunk in r.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+        os.replace(tmp, out)
+        return str(out)
+
+
+_MANAGER: Optional[MiniMaxClipJobManager] = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def get_clip_job_manager() -> MiniMaxClipJobManager:
+    """Return the process-wide manager (one polling loop for the whole run)."""
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = MiniMaxClipJobManager()
+        return _MANAGER
+
+
+def main():
+    """Resume and download every unfinished MiniMax job recorded in the DB."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="MiniMax clip job manager")
+    parser.add_argument('--resume', action='store_true', help='Finish all pending jobs from the DB')
+    args = parser.parse_args()
+
+    if args.resume:
+        paths = get_clip_job_manager().resume_pending()
+        done = sum(1 for p in paths if p)
+        print(f"[minimax] Resumed {len(paths)} job(s): {done} downloaded, {len(paths) - done} failed")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
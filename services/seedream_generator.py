@@ -11,8 +11,9 @@ import os
 import time
 import hashlib
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class SeedreamGenerator:
@@ -23,8 +24,11 @@ class SeedreamGenerator:
     
     DEFAULT_WIDTH = 1920
     DEFAULT_HEIGHT = 1080
-    POLL_INTERVAL = 15
-    MAX_POLL_ATTEMPTS = 20
+    POLL_INITIAL = 2.0     # First status check after submit (seconds)
+    POLL_FACTOR = 1.6      # Exponential backoff per poll
+    POLL_MAX = 15.0        # Cap between polls (the old fixed interval)
+    POLL_TIMEOUT = 300     # Give up on a task after this long
+    MAX_IN_FLIGHT = 8      # Concurrent HTTP calls during a batch
 
     def __init__(self, config: Optional[Dict] = None):
         if config is None:
@@ -43,6 +47,13 @@ class SeedreamGenerator:
         self.API_ENDPOINT = f"{api_base}/{self.model}"
         self.output_dir = Path(ws.get('output_dir', 'assets/wavespeed'))
         self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # One pooled session for submit, poll and download calls
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.MAX_IN_FLIGHT)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
     
     def _get_cache_key(self, project: Dict) -> str:
         """
@@ -120,18 +131,13 @@ class SeedreamGenerator:
         Returns:
             API response with task ID
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "prompt": prompt,
             "width": self.DEFAULT_WIDTH,
             "height": self.DEFAULT_HEIGHT,
         }
 
-        response = requests.post(self.API_ENDPOINT, headers=headers, json=payload)
+        response = self.session.post(self.API_ENDPOINT, json=payload, timeout=60)
         if not response.ok:
             print(f"  ✗ Seedream API error {response.status_code}: {response.text[:300]}")
         response.raise_for_status()
@@ -139,49 +145,72 @@ class SeedreamGenerator:
         # Response shape: {"code":200, "data": {"id": "...", "urls": {"get": "..."}, ...}}
         return response.json().get('data', {})
 
-    def _poll_task_status(self, poll_url: str) -> Dict:
-        """Poll the result URL until succeeded/failed or timeout."""
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+    def _check_task_status(self, poll_url: str) -> Optional[Dict]:
+        """
+        One status check. Returns the result data when finished, None while
+        still running; raises on failure.
+        """
+        response = self.session.get(poll_url, timeout=30)
+        response.raise_for_status()
+        data = response.json().get('data', {})
 
-        for attempt in range(self.MAX_POLL_ATTEMPTS):
-            try:
-                response = requests.get(poll_url, headers=headers)
-                response.raise_for_status()
-                data = response.json().get('data', {})
+        status = data.get('status', '').lower()
+        if status in ('succeeded', 'completed'):
+            return data
+        elif status == 'failed':
+            raise RuntimeError(f"Seedream generation failed: {data.get('error', 'Unknown error')}")
+        return None
+
+    def _next_delay(self, polls: int) -> float:
+        return min(self.POLL_MAX, self.POLL_INITIAL * (self.POLL_FACTOR ** polls))
 
-                status = data.get('status', '').lower()
+    def _poll_task_status(self, poll_url: str) -> Dict:
+        """Poll the result URL with exponential backoff until succeeded/failed or timeout."""
+        deadline = time.monotonic() + self.POLL_TIMEOUT
+        polls = 0
+        while time.monotonic() < deadline:
+            time.sleep(self._next_delay(polls))
+            polls += 1
+            try:
+                result = self._check_task_status(poll_url)
+                if result is not None:
+                    return result
+            except requests.RequestException as e:
+                print(f"  Poll attempt {polls} failed: {e}")
 
-                if status in ('succeeded', 'completed'):
-                    return data
-                elif status == 'failed':
-                    raise RuntimeError(f"Seedream generation failed: {data.get('error', 'Unknown error')}")
+        raise TimeoutError(f"Seedream generation timeout after {self.POLL_TIMEOUT}s")
 
-                print(f"  Polling ({attempt + 1}/{self.MAX_POLL_ATTEMPTS}): status={status}")
-                time.sleep(self.POLL_INTERVAL)
+    @staticmethod
+    def _image_url(result: Dict) -> str:
+        # outputs is a list of image URLs (strings)
+        outputs = result.get('outputs', [])
+        if not outputs:
+            raise RuntimeError("No outputs in API response")
 
-            except requests.RequestException as e:
-                if attempt == self.MAX_POLL_ATTEMPTS - 1:
-                    raise
-                print(f"  Poll attempt {attempt + 1} failed: {e}")
-                time.sleep(self.POLL_INTERVAL)
+        image_url = outputs[0] if isinstance(outputs[0], str) else outputs[0].get('url')
+        if not image_url:
+            raise RuntimeError("No image URL in API response")
+        return image_url
 
-        raise TimeoutError(f"Seedream generation timeout after {self.MAX_POLL_ATTEMPTS} attempts")
-    
     def _download_image(self, image_url: str, output_path: Path):
         """
-        Download the generated image to local cache.
+        Stream the generated image into the local cache. Writes to a .part
+        file first so an interrupted download never leaves a cached stub.
         
         Args:
             image_url: URL of generated image
             output_path: Local path to save image
         """
-        response = requests.get(image_url, stream=True)
-        response.raise_for_status()
-        
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-    
+        tmp_path = output_path.with_suffix(output_path.suffix + '.part')
+        # Result URLs are pre-signed CDN links - don't send our API key there
+        with self.session.get(image_url, stream=True, timeout=120,
+                              headers={"Authorization": None}) as response:
+            response.raise_for_status()
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+        os.replace(tmp_path, output_path)
+
     def generate(self, project: Dict, force_refresh: bool = False) -> Path:
         """
         Generate or retrieve a cached Seedream image for a project.
@@ -220,15 +249,8 @@ class SeedreamGenerator:
             print("  Waiting for generation...")
             result = self._poll_task_status(poll_url)
 
-            # outputs is a list of image URLs (strings)
-            outputs = result.get('outputs', [])
-            if not outputs:
-                raise RuntimeError("No outputs in API response")
+            image_url = self._image_url(result)
 
-            image_url = outputs[0] if isinstance(outputs[0], str) else outputs[0].get('url')
-            if not image_url:
-                raise RuntimeError("No image URL in API response")
-            
             # Download image
             print(f"  Downloading image to {cache_path.name}...")
             self._download_image(image_url, cache_path)
@@ -240,6 +262,101 @@ class SeedreamGenerator:
             print(f"  ✗ Seedream generation failed: {e}")
             raise
 
+    def generate_batch(self, projects: List[Dict], force_refresh: bool = False) -> List[Optional[Path]]:
+        """
+        Generate backgrounds for a whole episode at once.
+
+        Every uncached prompt is submitted up front, then all outstanding
+        tasks are polled together (each with its own exponential backoff)
+        and finished images are streamed straight into the md5 cache path.
+        HTTP calls share one pooled session, at most MAX_IN_FLIGHT at a time.
+
+        Args:
+            projects: Project dicts (same shape as generate())
+            force_refresh: Force regeneration even if cached
+
+        Returns:
+            Image paths in project order (None where generation failed)
+        """
+        start = time.perf_counter()
+        results: List[Optional[Path]] = [None] * len(projects)
+        pending = []  # (index, cache_path)
+
+        for i, project in enumerate(projects):
+            cache_path = self._get_cache_path(project)
+            if not force_refresh and cache_path.exists():
+                results[i] = cache_path
+            else:
+                pending.append((i, cache_path))
+        cached = len(projects) - len(pending)
+
+        print(f"  Seedream batch: {len(projects)} images ({cached} cached, {len(pending)} to generate)")
+
+        with ThreadPoolExecutor(max_workers=self.MAX_IN_FLIGHT) as pool:
+            # 1. Submit everything
+            def _submit(item):
+                i, cache_path = item
+                try:
+                    data = self._submit_generation_request(self._build_prompt(projects[i]))
+                    poll_url = data.get('urls', {}).get('get')
+                    if not data.get('id') or not poll_url:
+                        raise RuntimeError(f"Unexpected API response: {data}")
+                    return i, cache_path, poll_url
+                except Exception as e:
+                    print(f"  ✗ Seedream submit failed for {projects[i].get('name', 'Unknown')}: {e}")
+                    return None
+
+            now = time.monotonic()
+            tasks = {
+                i: {"path": cache_path, "poll_url": poll_url, "polls": 0,
+                    "next_poll": now + self._next_delay(0), "deadline": now + self.POLL_TIMEOUT}
+                for i, cache_path, poll_url in filter(None, pool.map(_submit, pending))
+            }
+
+            # 2. Poll all outstanding tasks together; download as each finishes
+            def _advance(i):
+                task = tasks[i]
+                task["polls"] += 1
+                try:
+                    result = self._check_task_status(task["poll_url"])
+                except requests.RequestException as e:
+                    print(f"  Poll failed for {projects[i].get('name', 'Unknown')}: {e}")
+                    result = None
+                except Exception as e:
+                    print(f"  ✗ {projects[i].get('name', 'Unknown')}: {e}")
+                    return i, "failed"
+                if result is None:
+                    return i, "running"
+                try:
+                    self._download_image(self._image_url(result), task["path"])
+                except Exception as e:
+                    print(f"  ✗ Download failed for {projects[i].get('name', 'Unknown')}: {e}")
+                    return i, "failed"
+                return i, "done"
+
+            while tasks:
+                now = time.monotonic()
+                due = [i for i, t in tasks.items() if t["next_poll"] <= now]
+                for i, outcome in pool.map(_advance, due):
+                    task = tasks[i]
+                    if outcome == "done":
+                        results[i] = task["path"]
+                        print(f"  ✓ {projects[i].get('name', 'Unknown')} → {task['path'].name}")
+                    elif outcome == "running" and time.monotonic() < task["deadline"]:
+                        task["next_poll"] = time.monotonic() + self._next_delay(task["polls"])
+                        continue
+                    elif outcome == "running":
+                        print(f"  ✗ {projects[i].get('name', 'Unknown')}: timed out after {self.POLL_TIMEOUT}s")
+                    del tasks[i]
+                if tasks:
+                    wake = min(t["next_poll"] for t in tasks.values())
+                    time.sleep(max(0.0, wake - time.monotonic()))
+
+        generated = sum(1 for i, _ in pending if results[i] is not None)
+        print(f"  Seedream batch done in {time.perf_counter() - start:.1f}s wall: "
+              f"{generated}/{len(pending)} generated, {cached} cached")
+        return results
+
 
 def demo():
     """Demo function to test Seedream generator."""
@@ -259,6 +376,12 @@ def demo():
         
         print(f"\nGenerated image: {image_path}")
         print(f"Image exists: {image_path.exists()}")
+
+        # Whole-episode backgrounds in one batch (reuses the cache above)
+        if os.path.exists('posts_data.json'):
+            with open('posts_data.json', 'r') as f:
+                projects = json.load(f)
+            generator.generate_batch(projects)
         
     except Exception as e:
         print(f"\nDemo failed: {e}")
@@ -0,0 +1,154 @@
+"""
+Fast encoder for still-image segments (title cards, branding cards,
+static project graphics).
+
+`ffmpeg -loop 1 -i card.png -t 30 ...` decodes, scales, converts and encodes
+the same picture 900 times at 30 fps; -tune stillimage only makes the
+encoder's share slightly cheaper. encode_still() encodes the picture once as
+a closed GOP of at most UNIT_SECONDS, plus one shorter GOP for the remainder,
+and builds the full duration by repeating the unit through the concat
+demuxer with stream copy. The audio track (a narration file, silence, or
+none) is muxed in the same pass.
+
+The caller's encode settings are applied unchanged (codec, preset, CRF,
+tune, filter chain, frame rate, yuv420p), so the segment drops into the
+same concat as a -loop 1 encode. The frame count matches round(duration *
+fps), and timestamps are continuous because the concat demuxer offsets each
+copy by its duration.
+
+    encode_still(card, "assets/seg_outro.mp4", 5, fps=24,
+                 video_args=STILL_ARGS, silence_rate=48000)
+
+If the fast path fails, it falls back to the -loop 1 command
+(still_command()), which is also the benchmark baseline
+(python -m benchmarks.still_bench). Disable the fast path with
+video_settings.still_fast_path: false in config.json or STILL_FAST_PATH=0.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from core.settings import setting
+
+UNIT_SECONDS = 2
+
+# The -tune stillimage settings the static segments have always used
+STILL_ARGS = ('-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'stillimage')
+
+
+def fast_path_enabled(config_path: str = "config.json") -> bool:
+    env = os.environ.get('STILL_FAST_PATH', '').strip().lower()
+    if env:
+        return env not in ('0', 'false', 'no')
+    return bool(setting('video_settings', 'still_fast_path', True, config_path))
+
+
+def _audio_inputs(duration: float, audio_path: Optional[str], silence_rate: Optional[int]) -> List[str]:
+    if audio_path:
+        return ['-i', str(audio_path)]
+    if silence_rate:
+        return ['-f', 'lavfi', '-t', f"{duration:.3f}",
+                '-i', f'anullsrc=channel_layout=stereo:sample_rate={silence_rate}']
+    return []
+
+
+def still_command(image_path, output_path, duration: float, fps: int = 30,
+                  video_args: Sequence[str] = STILL_ARGS, vf: Optional[str] = None,
+                  audio_path: Optional[str] = None, audio_args: Sequence[str] = ('-c:a', 'aac'),
+                  silence_rate: Optional[int] = None) -> List[str]:
+    """The classic -loop 1 encode of every frame (fallback and benchmark baseline)."""
+    cmd = ['ffmpeg', '-y', '-loop', '1', '-framerate', str(fps), '-i', str(image_path),
+           *_audio_inputs(duration, audio_path, silence_rate)]
+    if vf:
+        cmd += ['-vf', vf]
+    cmd += [*video_args, '-r', str(fps), '-pix_fmt', 'yuv420p']
+    if audio_path or silence_rate:
+        cmd += ['-map', '0:v:0', '-map', '1:a:0', *audio_args]
+    cmd += ['-t', f"{duration:.3f}", str(output_path)]
+    return cmd
+
+
+def _encode_unit(image_path, path: Path, frames: int, fps: int,
+                 video_args: Sequence[str], vf: Optional[str]) -> None:
+    cmd = ['ffmpeg', '-y', '-loop', '1', '-framerate', str(fps), '-i', str(image_path)]
+    if vf:
+        cmd += ['-vf', vf]
+    cmd += [*video_args, '-r', str(fps), '-pix_fmt', 'yuv420p',
+            # One closed GOP per unit without B-frames, so copies join by stream copy
+            '-g', str(frames), '-keyint_min', str(frames), '-sc_threshold', '0',
+            '-bf', '0', '-flags', '+cgop',
+            '-frames:v', str(frames), '-an', str(path)]
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+
+def _encode_fast(image_path, output_path: Path, duration: float, fps: int,
+                 video_args: Sequence[str], vf: Optional[str], audio_path: Optional[str],
+                 audio_args: Sequence[str], silence_rate: Optional[int]) -> None:
+    frames = max(1, round(duration * fps))
+    unit_frames = min(frames, UNIT_SECONDS * fps)
+    repeats, tail_frames = divmod(frames, unit_frames)
+
+    work = output_path.with_name(output_path.stem + '.still')
+    work.mkdir(parents=True, exist_ok=True)
+    try:
+        unit = work / "unit.mp4"
+        _encode_unit(image_path, unit, unit_frames, fps, video_args, vf)
+        parts = [unit] * repeats
+        if tail_frames:
+            tail = work / "tail.mp4"
+            _encode_unit(image_path, tail, tail_frames, fps, video_args, vf)
+            parts.append(tail)
+
+        concat_txt = work / "parts.txt"
+        with open(concat_txt, 'w') as f:
+            for part in parts:
+                f.write(f"file '{part.resolve()}'\n")
+
+        cmd = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', str(concat_txt),
+               *_audio_inputs(duration, audio_path, silence_rate), '-map', '0:v:0', '-c:v', 'copy']
+        if audio_path or silence_rate:
+            cmd += ['-map', '1:a:0', *audio_args]
+        cmd += ['-t', f"{frames / fps:.3f}", str(output_path)]
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def encode_still(image_path, output_path, duration: float, fps: int = 30,
+                 video_args: Sequence[str] = STILL_ARGS, vf: Optional[str] = None,
+                 audio_path: Optional[str] = None, audio_args: Sequence[str] = ('-c:a', 'aac'),
+                 silence_rate: Optional[int] = None, fast: Optional[bool] = None) -> str:
+    """
+    Encode a still image as a `duration`-second segment.
+
+    Args:
+        video_args: Codec options of the segment profile (e.g. STILL_ARGS,
+            or libx264 fast/CRF 18 for the title clips)
+        vf: Filter chain applied to the picture (scale/pad)
+        audio_path: Narration to mux (duration should be its length)
+        audio_args: Audio output options when there is an audio track
+        silence_rate: Add a silent stereo track at this sample rate
+        fast: Force (True) or skip (False) the GOP-repeat path; default from config
+
+    Returns:
+        output_path (raises CalledProcessError if the -loop 1 fallback also fails)
+    """
+    output_path = Path(output_path)
+    if fast is None:
+        fast = fast_path_enabled()
+    if fast:
+        try:
+            _encode_fast(image_path, output_path, duration, fps, video_args, vf,
+                         audio_path, audio_args, silence_rate)
+            return str(output_path)
+        except subprocess.CalledProcessError as e:
+            detail = (e.stderr or b"")[-160:].decode(errors='replace')
+            print(f"  ⚠️  Still fast path failed, encoding every frame: {detail}")
+
+    subprocess.run(still_command(image_path, output_path, duration, fps, video_args, vf,
+                                 audio_path, audio_args, silence_rate),
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    return str(output_path)
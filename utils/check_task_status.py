@@ -1,64 +1,59 @@
 """
-Check and download completed MiniMax video task
+Check and download completed MiniMax video tasks
+
+    python utils/check_task_status.py <task_id> [output_path]
+    python utils/check_task_status.py --resume     # finish every pending job in the DB
 """
 
-import time
-import json
-from minimax_integration import get_minimax_generator
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.minimax_jobs import get_clip_job_manager
 
 
-def download_completed_task(task_id: str = None):
+def download_completed_task(task_id: str = None, output_path: str = "assets/completed_minimax_video.mp4"):
     """Check task status and download if complete"""
-    
-    # Get generator
-    generator = get_minimax_generator()
-    
+
     # Use provided task ID or ask for it
     if not task_id:
         task_id = input("Enter MiniMax task ID: ").strip()
         if not task_id:
             print("❌ No task ID provided")
             return
-    
+
     print(f"\n📡 Checking task: {task_id}")
     print("   (This may take 60-180 seconds for completion)")
-    
-    # Poll for completion
-    video_url = generator._poll_task_completion(task_id, max_wait=300)
-    
-    if video_url:
-        print(f"\n✅ Video is ready!")
-        print(f"   Download URL: {video_url}")
-        
-        # Download
-        output_path = "assets/completed_minimax_video.mp4"
-        success = generator._download_video(video_url, output_path)
-        
-        if success:
-            import os
-            size_mb = os.path.getsize(output_path) / (1024 * 1024)
-            print(f"\n🎉 Video downloaded successfully!")
-            print(f"   File: {output_path}")
-            print(f"   Size: {size_mb:.2f} MB")
-        else:
-            print("❌ Failed to download video")
+
+    # Polls with backoff, then streams the clip to output_path
+    result = get_clip_job_manager().poll_and_download(task_id, output_path)
+
+    if result:
+        size_mb = os.path.getsize(result) / (1024 * 1024)
+        print(f"\n🎉 Video downloaded successfully!")
+        print(f"   File: {result}")
+        print(f"   Size: {size_mb:.2f} MB")
     else:
-        print("\n❌ Task failed or is still processing")
+        print("\n❌ Task failed or timed out")
         print("   Try again in a few minutes")
 
 
+def resume_pending_jobs():
+    """Resume polling/downloading every job a crashed run left behind"""
+    paths = get_clip_job_manager().resume_pending()
+    done = sum(1 for p in paths if p)
+    if paths:
+        print(f"\n✅ {done}/{len(paths)} pending clips downloaded")
+
+
 if __name__ == "__main__":
-    # Check if we have the task ID from the previous test
     print("MiniMax Video Task Status Checker")
     print("="*50)
-    
-    # Use the task ID from the earlier test
-    task_id = "367622429188378"
-    
-    print(f"Using task ID: {task_id}")
-    confirm = input("Press Enter to check, or type a different task ID: ").strip()
-    
-    if confirm:
-        task_id = confirm
-    
-    download_completed_task(task_id)
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--resume":
+        resume_pending_jobs()
+    elif len(sys.argv) > 1:
+        download_completed_task(*sys.argv[1:3])
+    else:
+        download_completed_task()
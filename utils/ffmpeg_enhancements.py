@@ -1,145 +1,409 @@
 """
 FFmpeg-based video enhancements - FREE alternative to MiniMax
 Provides Ken Burns effect, smooth transitions, and professional motion
+
+Effects are rendered by a frame engine instead of FFmpeg's zoompan filter.
+zoompan is single-threaded, re-scales the full-resolution source for every
+output frame, and rounds the crop window to whole pixels (visible jitter on
+slow zooms). Instead, MotionEffect:
+
+  1. scales the source once to a canvas that covers 1920x1080 at the
+     preset's deepest zoom
+  2. renders each frame as one Pillow crop+scale of that canvas
+     (resize with a sub-pixel box, so slow zooms stay smooth)
+  3. streams frames through RawFrameSink, with drawing and pipe writes
+     overlapped, into libx264; long clips are split into parallel chunks
+     by services/chunked_encoder
+
+Every preset is a camera path: frame index -> (zoom, x, y), with x and y
+given as fractions of the free travel inside the canvas (0.5 = centered).
+The public functions keep their names and signatures and render PRESETS
+entries. get_random_effect() still picks one per segment.
+
+Set video_settings.motion_engine to "zoompan" in config.json (or
+MOTION_ENGINE=zoompan) for the original filter graphs. They are also the
+baseline of python -m benchmarks.effects_bench.
 """
 
+import math
 import os
-import subprocess
 import random
+import subprocess
+import sys
 from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional
 
+try:
+    from core.settings import setting
+    from services.chunked_encoder import encode_frames
+    from services.frame_sink import frame_bytes
+except ImportError:  # Run from utils/ (e.g. hybrid_enhancements.py)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from core.settings import setting
+    from services.chunked_encoder import encode_frames
+    from services.frame_sink import frame_bytes
 
-# Ken Burns motion presets (smooth pan/zoom effects)
-KEN_BURNS_PRESETS = [
-    {"zoom": "1.0:1.2", "x": "iw/2-iw/2*(in/200)", "y": "ih/2-ih/2*(in/200)"},  # Slow zoom in center
-    {"zoom": "1.2:1.0", "x": "iw/2-iw/2*(1-in/200)", "y": "ih/2-ih/2*(1-in/200)"},  # Slow zoom out center
-    {"zoom": "1.0:1.15", "x": "0", "y": "ih-(ih*in/200)"},  # Pan down with zoom
-    {"zoom": "1.0:1.15", "x": "0", "y": "0+(ih*in/200)"},  # Pan up with zoom
-    {"zoom": "1.0:1.1", "x": "iw-(iw*in/200)", "y": "ih/2"},  # Pan left with zoom
-    {"zoom": "1.0:1.1", "x": "0+(iw*in/200)", "y": "ih/2"},  # Pan right with zoom
-]
 
+FPS = 24
+FRAME_SIZE = (1920, 1080)
+# These clips are re-encoded when segments are concatenated, so favour speed
+ENCODE_ARGS = ["-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p"]
+CANVAS_MAX_ZOOM = 1.5        # Deeper zooms upscale per frame rather than pre-scale a huge canvas
+PAN_ZOOM = 1.15              # Pans travel across a canvas this much larger than the frame
 
-def apply_ken_burns(input_image: str, output_video: str, duration: float = 6.0) -> str:
+
+# ============================================================
+# CAMERA PATHS: (n, frames, rng) -> (zoom, x, y)
+# ============================================================
+
+def _progress(n: int, frames: int) -> float:
+    return n / max(frames - 1, 1)
+
+
+def _ken_burns(n, frames, rng):
+    return min(1.0 + 0.0015 * n, 1.2), 0.5, 0.5
+
+
+def _zoom_in(n, frames, rng):
+    return 1.0 + 0.2 * n / 200, 0.5, 0.5
+
+
+def _zoom_out(n, frames, rng):
+    return max(1.0, 1.2 - 0.2 * n / 200), 0.5, 0.5
+
+
+def _zoom_pulse(n, frames, rng):
+    return max(1.0, 1.0 + 0.1 * math.sin(n / 50)), 0.5, 0.5
+
+
+def _pan_left(n, frames, rng):
+    return PAN_ZOOM, 1.0 - _progress(n, frames), 0.5
+
+
+def _pan_right(n, frames, rng):
+    return PAN_ZOOM, _progress(n, frames), 0.5
+
+
+def _pan_up(n, frames, rng):
+    return PAN_ZOOM, 0.5, 1.0 - _progress(n, frames)
+
+
+def _pan_down(n, frames, rng):
+    return PAN_ZOOM, 0.5, _progress(n, frames)
+
+
+def _cinematic_reveal(n, frames, rng):
+    return max(1.0, 1.5 - 0.5 * n / frames), 0.5, 0.5
+
+
+def _parallax(n, frames, rng):
+    return 1.08 + 0.05 * math.sin(n / 100), 0.5 + 0.5 * math.sin(n / 80), 0.5 + 0.5 * math.cos(n / 60)
+
+
+def _spotlight(n, frames, rng):
+    return 1.1, 0.5 + 0.5 * math.sin(n / 50), 0.5
+
+
+def _glitch(n, frames, rng):
+    return 1.05 + 0.05 * rng.random(), 0.5, 0.5
+
+
+def _motion_blur(n, frames, rng):
+    return 1.0 + 0.15 * n / frames, 0.5, 0.5
+
+
+def _still(n, frames, rng):
+    return 1.0, 0.5, 0.5
+
+
+# ============================================================
+# FRAME OVERLAYS: (frame, n, frames) -> frame
+# ============================================================
+
+def _spotlight_box(frame, n, frames):
+    """White 10% box over the centre (the drawbox of the zoompan graph)."""
+    from PIL import Image
+
+    w, h = frame.size
+    box = (w // 2 - 300, h // 2 - 200, w // 2 + 300, h // 2 + 200)
+    region = frame.crop(box)
+    frame.paste(Image.blend(region, Image.new('RGB', region.size, (255, 255, 255)), 0.1), box)
+    return frame
+
+
+def _wipe(frame, n, frames):
+    """Left-to-right reveal: black right of the scan line."""
+    from PIL import Image
+
+    w, h = frame.size
+    edge = int(w * n / frames)
+    if edge < w:
+        frame.paste(Image.new('RGB', (w - edge, h)), (edge, 0))
+    return frame
+
+
+class Preset(NamedTuple):
+    camera: Callable
+    overlay: Optional[Callable] = None
+
+
+PRESETS: Dict[str, Preset] = {
+    "ken_burns": Preset(_ken_burns),
+    "zoom_in": Preset(_zoom_in),
+    "zoom_out": Preset(_zoom_out),
+    "zoom_pulse": Preset(_zoom_pulse),
+    "pan_left": Preset(_pan_left),
+    "pan_right": Preset(_pan_right),
+    "pan_up": Preset(_pan_up),
+    "pan_down": Preset(_pan_down),
+    "cinematic_reveal": Preset(_cinematic_reveal),
+    "parallax": Preset(_parallax),
+    "spotlight": Preset(_spotlight, _spotlight_box),
+    "glitch": Preset(_glitch),
+    "motion_blur": Preset(_motion_blur),
+    "typewriter": Preset(_still, _wipe),
+}
+
+
+# ============================================================
+# FRAME ENGINE
+# ============================================================
+
+class MotionEffect:
     """
-    Apply Ken Burns effect (smooth pan/zoom) to static image
-    Uses FFmpeg zoompan filter - completely FREE
-    
+    Picklable fill(n, slot) for one preset, usable by RawFrameSink and the
+    chunked encoder's workers (each worker re-scales the canvas on first use).
+
     Args:
-        input_image: Path to input image
-        output_video: Path to output video
-        duration: Duration in seconds
-        
+        image_path: Source image (any size; cover-fitted to the frame)
+        preset: Key of PRESETS
+        frames: Frames in the clip
+        seed: Seed for presets with per-frame randomness (glitch)
+    """
+
+    def __init__(self, image_path: str, preset: str, frames: int, seed: int = 0):
+        if preset not in PRESETS:
+            raise ValueError(f"Unknown motion preset '{preset}' (known: {', '.join(PRESETS)})")
+        self.image_path = str(image_path)
+        self.preset = preset
+        self.frames = max(1, frames)
+        self.seed = seed
+        self._canvas = None
+        self._last_box = None
+        self._last_frame = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(_canvas=None, _last_box=None, _last_frame=None)
+        return state
+
+    def camera(self, n: int):
+        """(zoom, x, y) for frame n; deterministic, so chunks agree at their seams."""
+        return PRESETS[self.preset].camera(n, self.frames, random.Random(self.seed * 1_000_003 + n))
+
+    def canvas_zoom(self) -> float:
+        deepest = max(self.camera(n)[0] for n in range(self.frames))
+        return min(max(1.0, deepest), CANVAS_MAX_ZOOM)
+
+    def prepare(self) -> None:
+        """Scale the source to the canvas once."""
+        if self._canvas is not None:
+            return
+        from PIL import Image, ImageOps
+
+        zoom = self.canvas_zoom()
+        size = (round(FRAME_SIZE[0] * zoom), round(FRAME_SIZE[1] * zoom))
+        with Image.open(self.image_path) as src:
+            self._canvas = ImageOps.fit(src.convert('RGB'), size, Image.LANCZOS)
+
+    def _window(self, n: int):
+        zoom, fx, fy = self.camera(n)
+        cw, ch = self._canvas.size
+        w, h = cw / max(zoom, 1.0), ch / max(zoom, 1.0)
+        x0 = min(max(fx, 0.0), 1.0) * (cw - w)
+        y0 = min(max(fy, 0.0), 1.0) * (ch - h)
+        if abs(w - FRAME_SIZE[0]) < 0.5 and abs(h - FRAME_SIZE[1]) < 0.5:
+            # 1:1 window (pans, a held zoom): a plain crop at whole pixels
+            x0, y0 = round(x0), round(y0)
+            return (x0, y0, x0 + FRAME_SIZE[0], y0 + FRAME_SIZE[1]), True
+        return (x0, y0, x0 + w, y0 + h), False
+
+    def render(self, n: int):
+        """Frame n as a Pillow image."""
+        from PIL import Image
+
+        self.prepare()
+        box, exact = self._window(n)
+        if exact:
+            frame = self._canvas.crop(box)
+        else:
+            frame = self._canvas.resize(FRAME_SIZE, Image.BILINEAR, box=box)
+        overlay = PRESETS[self.preset].overlay
+        return overlay(frame, n, self.frames) if overlay else frame
+
+    def __call__(self, n: int, slot: bytearray):
+        self.prepare()
+        if PRESETS[self.preset].overlay is None:
+            box = self._window(n)[0]
+            if box == self._last_box and self._last_frame is not None:
+                return self._last_frame       # Camera at rest: resend the previous frame
+            frame = frame_bytes(self.render(n))
+            # Keep the frame only when the next one will reuse it
+            if n + 1 < self.frames and self._window(n + 1)[0] == box:
+                self._last_box, self._last_frame = box, frame
+            else:
+                self._last_box = self._last_frame = None
+            return frame
+        return frame_bytes(self.render(n))
+
+
+def motion_engine(config_path: str = "config.json") -> str:
+    """'frames' (MotionEffect) or 'zoompan' (the original filter graphs)."""
+    env = os.environ.get('MOTION_ENGINE', '').strip().lower()
+    if env:
+        return env
+    return str(setting('video_settings', 'motion_engine', 'frames', config_path)).lower()
+
+
+def render_effect(preset: str, input_image: str, output_video: str, duration: float = 6.0,
+                  engine: Optional[str] = None, seed: Optional[int] = None) -> str:
+    """
+    Render one preset of `duration` seconds to output_video (no audio).
+
     Returns:
-        Path to generated video
+        output_video (raises RuntimeError / CalledProcessError on failure)
     """
-    # Random Ken Burns preset
-    preset = random.choice(KEN_BURNS_PRESETS)
-    
-    fps = 24
-    frames = int(duration * fps)
-    
-    # FFmpeg zoompan filter for Ken Burns effect
-    # d=duration in frames, z=zoom factor, x/y=pan position
+    frames = int(duration * FPS)
+    if (engine or motion_engine()) == 'zoompan':
+        return _render_zoompan(preset, input_image, output_video, duration, frames)
+
+    effect = MotionEffect(input_image, preset, frames,
+                          seed=random.randrange(1 << 30) if seed is None else seed)
+    effect.prepare()
+    if not encode_frames(effect, frames, FRAME_SIZE[0], FRAME_SIZE[1], FPS, output_video, ENCODE_ARGS):
+        raise RuntimeError(f"Motion effect '{preset}' encode failed: {output_video}")
+    return output_video
+
+
+# ============================================================
+# ORIGINAL ZOOMPAN GRAPHS (engine "zoompan")
+# ============================================================
+
+def _zoompan(z: str, x: str, y: str, frames: int) -> str:
+    return f"zoompan=z='{z}':x='{x}':y='{y}':d={frames}:s=1920x1080:fps={FPS}"
+
+
+def _zoompan_filter(preset: str, frames: int) -> str:
+    centred = ("iw/2-(iw/zoom/2)", "ih/2-(ih/zoom/2)")
+    pans = {
+        "pan_left": f"x='min(0,iw-iw*on/{frames})':y='ih/2'",
+        "pan_right": f"x='max(iw-iw,iw*on/{frames}-iw)':y='ih/2'",
+        "pan_up": f"x='iw/2':y='max(0,ih*on/{frames}-ih)'",
+        "pan_down": f"x='iw/2':y='min(ih,ih-ih*on/{frames})'",
+    }
+    if preset in pans:
+        return f"crop=1920:1080:{pans[preset]},scale=1920:1080,fps={FPS}"
+    if preset == "typewriter":
+        return f"format=yuva444p,geq='if(lt(X,W*on/{frames}),p(X,Y),0)':a='if(lt(X,W*on/{frames}),255,0)',fps={FPS}"
+    graphs = {
+        "ken_burns": _zoompan("min(zoom+0.0015,1.2)", *centred, frames),
+        "zoom_in": _zoompan("1.0+0.2*on/200", *centred, frames),
+        "zoom_out": _zoompan("1.2-0.2*on/200", *centred, frames),
+        "zoom_pulse": _zoompan("1.0+0.1*sin(on/50)", *centred, frames),
+        "cinematic_reveal": _zoompan(f"max(1.0,1.5-0.5*on/{frames})", *centred, frames),
+        "parallax": _zoompan("1.0+0.1*sin(on/100)", "iw/2-iw/2+50*sin(on/80)", "ih/2-ih/2+30*cos(on/60)", frames),
+        "spotlight": _zoompan("1.1", "iw/2-iw/zoom/2+100*sin(on/50)", "ih/2-ih/zoom/2", frames)
+                     + ",drawbox=x='iw/2-300':y='ih/2-200':w=600:h=400:color=white@0.1:t=fill",
+        "glitch": _zoompan("1.05+0.05*random(0)", "iw/2-iw/zoom/2", "ih/2-ih/zoom/2", frames) + ",format=yuv420p",
+        "motion_blur": _zoompan(f"1.0+0.15*on/{frames}", *centred, frames)
+                       + f",minterpolate='mi_mode=mci:mc_mode=aobmc:vsbmc=1:fps={FPS}'",
+    }
+    return graphs[preset]
+
+
+def _render_zoompan(preset: str, input_image: str, output_video: str, duration: float, frames: int) -> str:
     cmd = [
         "ffmpeg", "-y",
         "-loop", "1", "-i", input_image,
-        "-vf", f"zoompan=z='min(zoom+0.0015,1.2)':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d={frames}:s=1920x1080:fps={fps}",
+        "-vf", _zoompan_filter(preset, frames),
         "-t", str(duration),
+    ]
+    if preset == "typewriter":
+        cmd += ["-frames:v", str(frames)]
+    cmd += [
         "-c:v", "libx264", "-preset", "medium", "-crf", "23",
         "-pix_fmt", "yuv420p",
         output_video
     ]
-    
+
     subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     return output_video
 
 
+# ============================================================
+# EFFECTS
+# ============================================================
+
+def apply_ken_burns(input_image: str, output_video: str, duration: float = 6.0) -> str:
+    """
+    Apply Ken Burns effect (smooth pan/zoom) to static image
+    Centered zoom from 1.0x to 1.2x - completely FREE
+
+    Args:
+        input_image: Path to input image
+        output_video: Path to output video
+        duration: Duration in seconds
+
+    Returns:
+        Path to generated video
+    """
+    return render_effect("ken_burns", input_image, output_video, duration)
+
+
 def apply_smooth_zoom(input_image: str, output_video: str, duration: float = 6.0, style: str = "in") -> str:
     """
     Apply smooth zoom effect to static image
-    
+
     Args:
         input_image: Path to input image
         output_video: Path to output video
         duration: Duration in seconds
         style: "in", "out", or "center"
-        
+
     Returns:
         Path to generated video
     """
-    fps = 24
-    frames = int(duration * fps)
-    
-    if style == "in":
-        zoom_expr = "1.0+0.2*on/200"  # Zoom from 1.0 to 1.2
-    elif style == "out":
-        zoom_expr = "1.2-0.2*on/200"  # Zoom from 1.2 to 1.0
-    else:
-        zoom_expr = "1.0+0.1*sin(on/50)"  # Gentle pulse
-    
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", input_image,
-        "-vf", f"zoompan=z='{zoom_expr}':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d={frames}:s=1920x1080:fps={fps}",
-        "-t", str(duration),
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        output_video
-    ]
-    
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    return output_video
+    preset = {"in": "zoom_in", "out": "zoom_out"}.get(style, "zoom_pulse")
+    return render_effect(preset, input_image, output_video, duration)
 
 
 def apply_pan_effect(input_image: str, output_video: str, duration: float = 6.0, direction: str = "left") -> str:
     """
     Apply smooth pan effect across image
-    
+
     Args:
         input_image: Path to input image
         output_video: Path to output video
         duration: Duration in seconds
         direction: "left", "right", "up", or "down"
-        
+
     Returns:
         Path to generated video
     """
-    fps = 24
-    frames = int(duration * fps)
-    
-    pan_expressions = {
-        "left": f"x='min(0,iw-iw*on/{frames})':y='ih/2'",
-        "right": f"x='max(iw-iw,iw*on/{frames}-iw)':y='ih/2'",
-        "up": f"x='iw/2':y='max(0,ih*on/{frames}-ih)'",
-        "down": f"x='iw/2':y='min(ih,ih-ih*on/{frames})'"    }
-    
-    pan_expr = pan_expressions.get(direction, pan_expressions["left"])
-    
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", input_image,
-        "-vf", f"crop=1920:1080:{pan_expr},scale=1920:1080,fps={fps}",
-        "-t", str(duration),
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        output_video
-    ]
-    
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    return output_video
+    preset = f"pan_{direction}" if f"pan_{direction}" in PRESETS else "pan_left"
+    return render_effect(preset, input_image, output_video, duration)
 
 
 def create_animated_segment(image_path: str, audio_path: str, output_path: str) -> str:
     """
     Create animated video segment with Ken Burns effect + audio
     Complete replacement for MiniMax - 100% FREE
-    
+
     Args:
         image_path: Path to project screenshot
         audio_path: Path to audio narration
         output_path: Path to output video segment
-        
+
     Returns:
         Path to generated video segment
     """
@@ -150,28 +414,28 @@ def create_animated_segment(image_path: str, audio_path: str, output_path: str)
         capture_output=True, text=True, check=True
     )
     duration = float(result.stdout.strip())
-    
+
     # Create Ken Burns animated video
     animated_video = output_path.replace(".mp4", "_animated.mp4")
     apply_ken_burns(image_path, animated_video, duration)
-    
-    # Combine with audio
+
+    # Combine with audio (the video was just encoded - copy it)
     cmd = [
         "ffmpeg", "-y",
         "-i", animated_video, "-i", audio_path,
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
+        "-map", "0:v:0", "-map", "1:a:0",
+        "-c:v", "copy",
         "-c:a", "aac", "-b:a", "192k",
-        "-pix_fmt", "yuv420p",
         "-t", str(duration),
         output_path
     ]
-    
+
     subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    
+
     # Cleanup temp file
     if os.path.exists(animated_video):
         os.remove(animated_video)
-    
+
     return output_path
 
 
@@ -180,13 +444,13 @@ def get_enhanced_video(project_id: str, image_path: str, audio_path: str, output
     """
     Drop-in replacement for MiniMax - creates enhanced video with Ken Burns effect
     Completely FREE using FFmpeg
-    
+
     Args:
         project_id: Project identifier
         image_path: Path to screenshot
         audio_path: Path to audio
         output_folder: Output directory
-        
+
     Returns:
         Path to enhanced video segment
     """
@@ -194,19 +458,6 @@ def get_enhanced_video(project_id: str, image_path: str, audio_path: str, output
     return create_animated_segment(image_path, audio_path, output_path)
 
 
-if __name__ == "__main__":
-    # Test with a sample image
-    test_image = "test_graphic.png"
-    test_output = "test_ken_burns.mp4"
-    
-    if os.path.exists(test_image):
-        print("Testing Ken Burns effect...")
-        result = apply_ken_burns(test_image, test_output, duration=6.0)
-        print(f"✅ Created: {result}")
-    else:
-        print(f"Test image {test_image} not found")
-
-
 # ============================================================
 # ADDITIONAL ENHANCED EFFECTS
 # ============================================================
@@ -214,46 +465,16 @@ if __name__ == "__main__":
 def apply_parallax_scroll(input_image: str, output_video: str, duration: float = 6.0) -> str:
     """
     Create 3D parallax effect - makes screenshots look like layered 3D scenes
-    Requires ImageMagick for layer separation, falls back to smooth pan if unavailable
+    Simulated with a breathing zoom and drifting camera
     """
-    fps = 24
-    frames = int(duration * fps)
-    
-    # Simulated parallax with aggressive foreground/background motion
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", input_image,
-        "-vf", f"zoompan=z='1.0+0.1*sin(on/100)':x='iw/2-iw/2+50*sin(on/80)':y='ih/2-ih/2+30*cos(on/60)':d={frames}:s=1920x1080:fps={fps}",
-        "-t", str(duration),
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        output_video
-    ]
-    
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    return output_video
+    return render_effect("parallax", input_image, output_video, duration)
 
 
 def apply_cinematic_reveal(input_image: str, output_video: str, duration: float = 6.0) -> str:
     """
     Cinematic reveal - starts zoomed in, pulls back to reveal full image
     """
-    fps = 24
-    frames = int(duration * fps)
-    
-    # Start at 1.5x zoom, pull back to 1.0x
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", input_image,
-        "-vf", f"zoompan=z='max(1.0,1.5-0.5*on/{frames})':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d={frames}:s=1920x1080:fps={fps}",
-        "-t", str(duration),
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        output_video
-    ]
-    
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    return output_video
+    return render_effect("cinematic_reveal", input_image, output_video, duration)
 
 
 def apply_spotlight_effect(input_image: str, output_video: str, duration: float = 6.0) -> str:
@@ -261,22 +482,7 @@ def apply_spotlight_effect(input_image: str, output_video: str, duration: float
     Spotlight/vignette effect - creates focused spotlight that moves across image
     Great for highlighting specific features
     """
-    fps = 24
-    frames = int(duration * fps)
-    
-    # Moving spotlight effect using drawbox filter
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", input_image,
-        "-vf", f"zoompan=z='1.1':x='iw/2-iw/zoom/2+100*sin(on/50)':y='ih/2-ih/zoom/2':d={frames}:s=1920x1080:fps={fps},drawbox=x='iw/2-300':y='ih/2-200':w=600:h=400:color=white@0.1:t=fill",
-        "-t", str(duration),
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        output_video
-    ]
-    
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    return output_video
+    return render_effect("spotlight", input_image, output_video, duration)
 
 
 def apply_typewriter_reveal(input_image: str, output_video: str, duration: float = 6.0) -> str:
@@ -284,26 +490,10 @@ def apply_typewriter_reveal(input_image: str, output_video: str, duration: float
     Left-to-right reveal - simulates scanning across the image
     Good for code screenshots or text-heavy content
     """
-    fps = 24
-    frames = int(duration * fps)
-    
-    # Horizontal wipe effect
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", input_image,
-        "-vf", f"format=yuva444p,geq='if(lt(X,W*on/{frames}),p(X,Y),0)':a='if(lt(X,W*on/{frames}),255,0)',fps={fps}",
-        "-t", str(duration),
-        "-frames:v", str(frames),
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        output_video
-    ]
-    
     try:
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-        return output_video
-    except:
-        # Fallback to simple pan if geq fails
+        return render_effect("typewriter", input_image, output_video, duration)
+    except Exception:
+        # Fallback to simple pan if the reveal fails
         return apply_pan_effect(input_image, output_video, duration, "left")
 
 
@@ -312,22 +502,7 @@ def apply_glitch_transition(input_image: str, output_video: str, duration: float
     Digital glitch effect - adds modern tech aesthetic
     Great for developer tools and tech content
     """
-    fps = 24
-    frames = int(duration * fps)
-    
-    # Simulated glitch using random color shifts
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", input_image,
-        "-vf", f"zoompan=z='1.05+0.05*random(0)':x='iw/2-iw/zoom/2':y='ih/2-ih/zoom/2':d={frames}:s=1920x1080:fps={fps},format=yuv420p",
-        "-t", str(duration),
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        output_video
-    ]
-    
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-    return output_video
+    return render_effect("glitch", input_image, output_video, duration)
 
 
 # Enhanced selection with all effects
@@ -345,7 +520,7 @@ def get_random_effect(input_image: str, output_video: str, duration: float = 6.0
         # apply_spotlight_effect,  # Optional - can be subtle
         # apply_glitch_transition,  # Optional - modern tech look
     ]
-    
+
     selected_effect = random.choice(effects)
     return selected_effect(input_image, output_video, duration)
 
@@ -355,22 +530,21 @@ def apply_motion_blur(input_image: str, output_video: str, duration: float = 6.0
     Motion blur effect - smooths transitions with professional blur
     Makes movement look more cinematic
     """
-    fps = 24
-    frames = int(duration * fps)
-    
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", input_image,
-        "-vf", f"zoompan=z='1.0+0.15*on/{frames}':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d={frames}:s=1920x1080:fps={fps},minterpolate='mi_mode=mci:mc_mode=aobmc:vsbmc=1:fps={fps}'",
-        "-t", str(duration),
-        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        output_video
-    ]
-    
     try:
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-        return output_video
-    except:
-        # Fallback if minterpolate fails
+        return render_effect("motion_blur", input_image, output_video, duration)
+    except Exception:
+        # Fallback if the render fails
         return apply_ken_burns(input_image, output_video, duration)
+
+
+if __name__ == "__main__":
+    # Test with a sample image
+    test_image = "test_graphic.png"
+    test_output = "test_ken_burns.mp4"
+
+    if os.path.exists(test_image):
+        print("Testing Ken Burns effect...")
+        result = apply_ken_burns(test_image, test_output, duration=6.0)
+        print(f"✅ Created: {result}")
+    else:
+        print(f"Test image {test_image} not found")
@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 from discovery.repo_filter import EnrichedRepo
+from services.llm_cache import cached_completion
 
 
 # Mistral schema for structured output
@@ -118,12 +119,13 @@ Please return valid JSON for each repository in this exact format:
 
 Score all the repositories above. Return valid JSON array with objects for each repo.""".replace("{{repo_summaries}}", "\n".join(repo_summaries))
     
-    def score_repos(self, repos: List[EnrichedRepo]) -> List[ScoredRepo]:
+    def score_repos(self, repos: List[EnrichedRepo], use_cache: bool = True) -> List[ScoredRepo]:
         """
         Score a list of repositories using Mistral with structured output.
         
         Args:
             repos: List of enriched repos to score
+            use_cache: Serve an identical batch prompt from the LLM response cache
             
         Returns:
             List of ScoredRepo objects
@@ -135,31 +137,40 @@ Score all the repositories above. Return valid JSON array with objects for each
         
         prompt = self._build_batch_prompt(repos)
         
-        try:
+        response_format = {
+            "type": "json_object",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "scores": {
+                        "type": "array",
+                        "items": SCORING_SCHEMA
+                    }
+                },
+                "required": ["scores"],
+                "additionalProperties": False
+            }
+        }
+        
+        def _call():
             response = self.client.chat.complete(
                 model=self.model,
                 messages=[
                     {"role": "user", "content": prompt}
                 ],
-                response_format={
-                    "type": "json_object",
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "scores": {
-                                "type": "array",
-                                "items": SCORING_SCHEMA
-                            }
-                        },
-                        "required": ["scores"],
-                        "additionalProperties": False
-                    }
-                },
+                response_format=response_format,
                 temperature=0.3,
                 max_tokens=8192
             )
-            
-            content = response.choices[0].message.content
+            usage = response.usage
+            return response.choices[0].message.content, usage.prompt_tokens, usage.completion_tokens
+        
+        try:
+            content = cached_completion(
+                "mistral", self.model, prompt,
+                {"response_format": response_format, "temperature": 0.3, "max_tokens": 8192},
+                _call, site="mistral_scorer", use_cache=use_cache
+            )
             
             # Parse JSON response
             try: